@@ -2,13 +2,17 @@
 """Analyze survey responses question by question."""
 
 import json
-import pandas as pd
+import sys
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 from rich.console import Console
 from rich.table import Table
 
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import read_excel_snapshot
+
 console = Console()
 
 def analyze_questions_individually():
@@ -16,7 +20,7 @@ def analyze_questions_individually():
     
     # Load survey data
     survey_path = Path("data/raw/ACME_Community_Survey.xlsx")
-    df = pd.read_excel(survey_path)
+    df = read_excel_snapshot(survey_path)
     
     console.print(f"[blue]Loaded {len(df)} survey responses[/]")
     
@@ -2,19 +2,23 @@
 """Re-analyze themes specifically focused on Cultural Funding."""
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Tuple
 
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import read_excel_snapshot
+
 def load_survey_responses():
     """Load original survey responses for cultural funding analysis."""
     # Load from the NEW_Data Excel file
     survey_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Community_Survey.xlsx")
-    df = pd.read_excel(survey_path)
+    df = read_excel_snapshot(survey_path)
     
     # Find columns related to cultural funding
     funding_columns = []
@@ -71,7 +75,7 @@ def analyze_working_document_themes():
     working_doc_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Working_Document.xlsx")
     
     # Load Database sheet which contains recommendations
-    df = pd.read_excel(working_doc_path, sheet_name='Database')
+    df = read_excel_snapshot(working_doc_path, sheet_name='Database')
     
     theme_counts = Counter()
     theme_examples = {
@@ -2,25 +2,29 @@
 """Analyze top 3 themes per cultural program."""
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
-from collections import Counter, defaultdict
+from collections import defaultdict
 import pandas as pd
 
-# Target programs as specified in NEW_ASK.md
-TARGET_PROGRAMS = [
-    "Nexus",
-    "Thrive", 
-    "Elevate",
-    "Austin Live Music Fund",
-    "Art in Public Places",
-    "Creative Space Assistance Program"
-]
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import read_excel_snapshot
+from src.tagging import KeywordTagger
+
+# Target programs as specified in NEW_ASK.md, with the ways they are
+# mentioned in survey responses (src/tagging/taxonomy.json)
+PROGRAM_TAGGER = KeywordTagger.from_taxonomy('target_program_mentions')
+TARGET_PROGRAMS = PROGRAM_TAGGER.tags
+
+# Theme keywords for cultural funding
+THEME_TAGGER = KeywordTagger.from_taxonomy('program_themes')
 
 def load_working_document_by_program():
     """Load and categorize recommendations by program."""
     working_doc_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Working_Document.xlsx")
-    df = pd.read_excel(working_doc_path, sheet_name='Database')
+    df = read_excel_snapshot(working_doc_path, sheet_name='Database')
     
     print(f"Loaded {len(df)} recommendations from working document")
     print(f"Columns: {list(df.columns)}")
@@ -52,41 +56,27 @@ def load_working_document_by_program():
 def analyze_themes_for_program(recommendations, program_name):
     """Extract top 3 themes for a specific program."""
     
-    # Theme keywords for cultural funding
-    theme_keywords = {
-        'Increase Funding': ['increase', 'expand', 'more fund', 'additional', 'raise', 'boost'],
-        'Simplify Process': ['simplif', 'streamline', 'easier', 'reduce barrier', 'accessible', 'user-friendly'],
-        'Equity & Access': ['equit', 'inclusive', 'divers', 'access', 'underserved', 'marginalized'],
-        'Artist Support': ['artist', 'creative', 'individual', 'practitioner', 'performer', 'musician'],
-        'Small Org Support': ['small', 'emerging', 'grassroot', 'startup', 'new org'],
-        'Multi-Year Funding': ['multi-year', 'sustain', 'long-term', 'ongoing', 'recurring'],
-        'Transparency': ['transparen', 'clear', 'understand', 'communicate', 'information'],
-        'Community Engagement': ['community', 'engage', 'outreach', 'connect', 'participate'],
-        'Infrastructure': ['space', 'venue', 'facility', 'equipment', 'resource'],
-        'Collaboration': ['collaborat', 'partner', 'network', 'collective', 'together']
-    }
-    
-    theme_counts = Counter()
-    theme_examples = defaultdict(list)
+    tag_matrix = THEME_TAGGER.tag_texts(recommendations)
+    theme_counts = tag_matrix.counts()
     
-    for rec in recommendations:
-        rec_lower = rec.lower()
-        
-        # Check each theme
-        for theme, keywords in theme_keywords.items():
-            if any(keyword in rec_lower for keyword in keywords):
-                theme_counts[theme] += 1
-                if len(theme_examples[theme]) < 3:  # Collect up to 3 examples
-                    theme_examples[theme].append(rec[:200])  # First 200 chars
+    # Rank like Counter.most_common: ties keep the order themes were first seen
+    first_seen = {}
+    for order, theme in enumerate(THEME_TAGGER.tags):
+        rows = tag_matrix.rows(theme)
+        if len(rows):
+            first_seen[theme] = (rows[0], order)
+    ranked = sorted(first_seen, key=lambda t: (-theme_counts[t], first_seen[t]))
     
     # Get top 3 themes
     top_themes = []
-    for theme, count in theme_counts.most_common(3):
+    for theme in ranked[:3]:
+        count = theme_counts[theme]
         top_themes.append({
             'theme': theme,
             'count': count,
             'percentage': round((count / len(recommendations)) * 100, 1) if recommendations else 0,
-            'examples': theme_examples[theme]
+            # Collect up to 3 examples, first 200 chars each
+            'examples': [recommendations[row][:200] for row in tag_matrix.rows(theme)[:3]]
         })
     
     return top_themes
@@ -94,7 +84,7 @@ def analyze_themes_for_program(recommendations, program_name):
 def analyze_survey_for_programs():
     """Check survey data for program-specific mentions."""
     survey_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Community_Survey.xlsx")
-    df = pd.read_excel(survey_path)
+    df = read_excel_snapshot(survey_path)
     
     program_mentions = defaultdict(list)
     
@@ -102,30 +92,16 @@ def analyze_survey_for_programs():
     text_columns = [col for col in df.columns if df[col].dtype == 'object']
     
     for col in text_columns:
-        for response in df[col].dropna():
-            response_str = str(response)
-            response_lower = response_str.lower()
-            
-            # Check for each program
-            for program in TARGET_PROGRAMS:
-                program_lower = program.lower()
-                
-                # Various ways programs might be mentioned
-                if program_lower in response_lower:
-                    program_mentions[program].append({
-                        'column': col,
-                        'response': response_str[:300]
-                    })
-                elif program == "Art in Public Places" and ('aipp' in response_lower or 'public art' in response_lower):
-                    program_mentions[program].append({
-                        'column': col,
-                        'response': response_str[:300]
-                    })
-                elif program == "Austin Live Music Fund" and ('music fund' in response_lower or 'live music' in response_lower):
-                    program_mentions[program].append({
-                        'column': col,
-                        'response': response_str[:300]
-                    })
+        responses = df[col].dropna().astype(str)
+        tag_matrix = PROGRAM_TAGGER.tag_texts(responses.tolist())
+        
+        # Various ways programs might be mentioned are keywords of the same tag
+        for program in TARGET_PROGRAMS:
+            for idx in tag_matrix.rows(program):
+                program_mentions[program].append({
+                    'column': col,
+                    'response': responses.iloc[idx][:300]
+                })
     
     return program_mentions
 
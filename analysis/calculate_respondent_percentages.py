@@ -5,34 +5,31 @@ This script analyzes the ACME Community Survey data to provide accurate responde
 """
 
 import pandas as pd
-import numpy as np
 import json
+import sys
 from pathlib import Path
 import re
 from datetime import datetime
 
-# Define the cultural funding themes to search for
-FUNDING_THEMES = {
-    'public_art': ['public art', 'murals', 'sculptures', 'installations', 'street art'],
-    'arts_education': ['arts education', 'art education', 'teaching', 'workshops', 'classes', 'youth programs'],
-    'cultural_events': ['cultural events', 'festivals', 'performances', 'concerts', 'exhibitions'],
-    'community_spaces': ['community spaces', 'art spaces', 'galleries', 'studios', 'creative spaces'],
-    'artist_support': ['artist support', 'grants', 'residencies', 'stipends', 'artist funding'],
-    'cultural_preservation': ['cultural preservation', 'heritage', 'traditions', 'history', 'archives'],
-    'digital_arts': ['digital arts', 'digital art', 'technology', 'multimedia', 'virtual', 'online'],
-    'accessibility': ['accessibility', 'accessible', 'inclusive', 'disability', 'adaptive']
-}
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import ExcelSnapshotCache
+from src.tagging import KeywordTagger
+
+# Cultural funding themes to search for (src/tagging/taxonomy.json)
+THEME_TAGGER = KeywordTagger.from_taxonomy('cultural_funding_themes')
+FUNDING_THEMES = THEME_TAGGER.keywords
 
 def load_survey_data(file_path):
     """Load the survey data from Excel file."""
     print(f"Loading survey data from: {file_path}")
     try:
-        # Read all sheets to understand structure
-        xl_file = pd.ExcelFile(file_path)
-        print(f"Found sheets: {xl_file.sheet_names}")
+        # Parsed once, then served from the Parquet snapshot
+        snapshots = ExcelSnapshotCache()
+        print(f"Found sheets: {snapshots.sheet_names(file_path)}")
         
         # Load the main data sheet (usually the first one)
-        df = pd.read_excel(file_path, sheet_name=0)
+        df = snapshots.read_excel(file_path, sheet_name=0)
         print(f"Loaded {len(df)} responses")
         print(f"Columns: {list(df.columns)}")
         
@@ -63,14 +60,6 @@ def identify_text_columns(df):
     
     return text_columns
 
-def search_theme_in_text(text, theme_keywords):
-    """Search for theme keywords in text, case-insensitive."""
-    if pd.isna(text):
-        return False
-    
-    text_lower = str(text).lower()
-    return any(keyword in text_lower for keyword in theme_keywords)
-
 def calculate_theme_percentages(df, text_columns):
     """Calculate percentage of respondents mentioning each theme."""
     results = {}
@@ -78,18 +67,11 @@ def calculate_theme_percentages(df, text_columns):
     
     print(f"\nAnalyzing {total_respondents} total respondents...")
     
-    for theme_name, keywords in FUNDING_THEMES.items():
-        # Track unique respondents who mentioned this theme
-        respondent_mentioned = np.zeros(len(df), dtype=bool)
-        
-        # Check each text column for theme mentions
-        for col in text_columns:
-            for idx, response in enumerate(df[col]):
-                if search_theme_in_text(response, keywords):
-                    respondent_mentioned[idx] = True
-        
+    # Tag all text columns at once; each respondent counts once per theme
+    theme_counts = THEME_TAGGER.tag_columns(df, text_columns).counts()
+    
+    for theme_name, count in theme_counts.items():
         # Calculate statistics
-        count = respondent_mentioned.sum()
         percentage = (count / total_respondents) * 100 if total_respondents > 0 else 0
         
         results[theme_name] = {
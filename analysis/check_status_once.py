@@ -1,78 +1,36 @@
 #!/usr/bin/env python3
 """Check analysis status once."""
 
-import json
-from pathlib import Path
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
+
+from rich.console import Console
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent))
 
-# Define expected totals
-question_response_counts = {
-    "q1_org_support": 862,
-    "q2_opportunities": 746,
-    "q3_improvements": 595,
-    "q4_barriers": 596,
-    "q5_new_programs": 620, 
-    "q6_feedback": 859
-}
-total_expected = sum(question_response_counts.values())
+from src.validation.progress import ProgressState, progress_table
 
-print("ACME Deep Analysis Progress")
-print("=" * 60)
+console = Console()
 
-# Count cached responses
-features_dir = Path("data/features/responses")
-total_cached = 0
-question_progress = {}
+console.print("ACME Deep Analysis Progress")
+console.print("=" * 60)
 
-if features_dir.exists():
-    for q_id, expected_count in question_response_counts.items():
-        q_dir = features_dir / q_id
-        if q_dir.exists():
-            cache_files = list(q_dir.glob("*.json"))
-            count = len(cache_files)
-            total_cached += count
-            question_progress[q_id] = {
-                "cached": count,
-                "expected": expected_count,
-                "percent": (count / expected_count * 100) if expected_count > 0 else 0
-            }
+state = ProgressState.load()
+console.print(f"\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-# Display progress
-print(f"\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-print(f"Total Progress: {total_cached}/{total_expected} ({total_cached/total_expected*100:.1f}%)")
-print("-" * 60)
+if not state.run:
+    console.print("No pipeline run has reported progress yet.")
+    sys.exit(0)
 
-for q_id, progress in question_progress.items():
-    bar_length = 30
-    filled = int(bar_length * progress["percent"] / 100)
-    bar = "█" * filled + "░" * (bar_length - filled)
-    print(f"{q_id:<20} [{bar}] {progress['cached']:>4}/{progress['expected']:<4} ({progress['percent']:>5.1f}%)")
+console.print(progress_table(state))
+console.print(f"\nAnalysis started: {state.run.get('timestamp')}")
+console.print(f"Last update: {state.last_event}")
 
-# Get timing info from first cache file
-if total_cached > 0:
-    first_file_time = None
-    last_file_time = None
-    
-    for q_dir in features_dir.glob("q*"):
-        for cache_file in q_dir.glob("*.json"):
-            mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if first_file_time is None or mtime < first_file_time:
-                first_file_time = mtime
-            if last_file_time is None or mtime > last_file_time:
-                last_file_time = mtime
-    
-    if first_file_time and last_file_time:
-        duration = last_file_time - first_file_time
-        if duration.total_seconds() > 0:
-            rate = total_cached / duration.total_seconds()
-            print(f"\nAnalysis started: {first_file_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Last update: {last_file_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Duration so far: {duration}")
-            print(f"Average rate: {rate:.3f} responses/second")
-            
-            if rate > 0:
-                remaining = total_expected - total_cached
-                eta_seconds = remaining / rate
-                eta = timedelta(seconds=int(eta_seconds))
-                print(f"\nEstimated time remaining: {eta}")
-                print(f"Estimated completion: {(datetime.now() + eta).strftime('%Y-%m-%d %H:%M:%S')}")
\ No newline at end of file
+for stage in state.stages.values():
+    if stage.get("status") == "running" and stage.get("eta_seconds") is not None:
+        eta = timedelta(seconds=int(stage["eta_seconds"]))
+        console.print(f"\n{stage['stage']}: {stage.get('items_per_second', 0):.3f} items/second")
+        console.print(f"Estimated time remaining: {eta}")
+        console.print(f"Estimated completion: {(datetime.now() + eta).strftime('%Y-%m-%d %H:%M:%S')}")
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Extract transportation-related comments as a separate 'Parking Lot' item."""
 
-import pandas as pd
+import numpy as np
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
 
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import read_excel_snapshot
+from src.tagging import KeywordTagger
+
 def extract_transportation_comments():
     """Extract all transportation-related comments from survey data."""
     
@@ -14,15 +20,12 @@ def extract_transportation_comments():
     
     # Load survey data
     survey_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Community_Survey.xlsx")
-    df = pd.read_excel(survey_path)
+    df = read_excel_snapshot(survey_path)
     
-    # Transportation keywords
-    transportation_keywords = [
-        'transport', 'parking', 'bus', 'transit', 'traffic', 'commute', 
-        'drive', 'driving', 'car', 'uber', 'lyft', 'ride', 'access',
-        'distance', 'location', 'venue location', 'get to', 'getting there',
-        'travel', 'metro', 'rail', 'bike', 'walk', 'pedestrian'
-    ]
+    # Transportation keywords and issue categories (src/tagging/taxonomy.json);
+    # the first tag selects transportation comments, the others categorize them
+    tagger = KeywordTagger.from_taxonomy('transportation_comments')
+    transportation_tag = tagger.tags[0]
     
     # Store all transportation-related comments
     transportation_comments = []
@@ -32,42 +35,25 @@ def extract_transportation_comments():
     text_columns = [col for col in df.columns if df[col].dtype == 'object']
     
     for col in text_columns:
-        for idx, response in enumerate(df[col].dropna()):
-            response_str = str(response)
-            response_lower = response_str.lower()
+        responses = df[col].dropna()
+        tag_matrix = tagger.tag_texts(responses.tolist())
+        
+        for idx in np.flatnonzero(tag_matrix.has(transportation_tag)):
+            # Categorize the type of transportation issue
+            categories = [tag for tag in tag_matrix.row_tags(idx) if tag != transportation_tag]
             
-            # Check if transportation-related
-            is_transportation = any(keyword in response_lower for keyword in transportation_keywords)
+            if not categories:
+                categories = ['General Transportation']
             
-            if is_transportation:
-                # Categorize the type of transportation issue
-                categories = []
-                
-                if any(word in response_lower for word in ['parking', 'park']):
-                    categories.append('Parking')
-                if any(word in response_lower for word in ['bus', 'transit', 'metro', 'rail', 'public transport']):
-                    categories.append('Public Transit')
-                if any(word in response_lower for word in ['distance', 'far', 'location', 'venue location']):
-                    categories.append('Distance/Location')
-                if any(word in response_lower for word in ['cost', 'expensive', 'afford', 'uber', 'lyft']):
-                    categories.append('Cost of Transportation')
-                if any(word in response_lower for word in ['traffic', 'congestion']):
-                    categories.append('Traffic')
-                if any(word in response_lower for word in ['bike', 'walk', 'pedestrian']):
-                    categories.append('Alternative Transportation')
-                
-                if not categories:
-                    categories = ['General Transportation']
-                
-                for category in categories:
-                    comment_categories[category] += 1
-                
-                transportation_comments.append({
-                    'response_id': idx,
-                    'column': col,
-                    'comment': response_str,
-                    'categories': categories
-                })
+            for category in categories:
+                comment_categories[category] += 1
+            
+            transportation_comments.append({
+                'response_id': int(idx),
+                'column': col,
+                'comment': str(responses.iloc[idx]),
+                'categories': categories
+            })
     
     # Analyze themes within transportation comments
     print(f"Found {len(transportation_comments)} transportation-related comments\n")
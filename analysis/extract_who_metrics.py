@@ -3,16 +3,21 @@
 
 import pandas as pd
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 import numpy as np
 
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import read_excel_snapshot
+
 def extract_survey_metrics():
     """Extract quantitative metrics from ACME Community Survey."""
     
     # Load the survey data
     survey_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Community_Survey.xlsx")
-    df = pd.read_excel(survey_path)
+    df = read_excel_snapshot(survey_path)
     
     print(f"Total survey responses: {len(df)}")
     
@@ -119,7 +124,7 @@ def check_working_document():
     working_doc_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Working_Document.xlsx")
     
     # Load all sheets
-    all_sheets = pd.read_excel(working_doc_path, sheet_name=None)
+    all_sheets = read_excel_snapshot(working_doc_path, sheet_name=None)
     
     print("\n=== WORKING DOCUMENT ANALYSIS ===")
     print(f"Sheets found: {list(all_sheets.keys())}")
@@ -2,6 +2,7 @@
 """Generate sophisticated visualizations for the comprehensive report."""
 
 import json
+import sys
 from pathlib import Path
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -14,6 +15,12 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.append(str(Path(__file__).parent))
+from src.visualization.cache import CHART_MANIFEST
+from src.visualization.export import ImageExporter, link_or_copy
+from src.visualization.plotly_html import write_dashboard
+from src.visualization.render import RenderFarm, RenderJob
+
 # Modern color palette
 COLORS = {
     'primary': '#1E3A8A',      # Deep blue
@@ -635,66 +642,60 @@ def save_all_visualizations():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Skip image export for now - just generate HTML
-    can_export_images = False
+    # PNG and SVG images need kaleido; without it only HTML is generated
+    can_export_images = ImageExporter.available()
     print("Generating interactive HTML visualizations...")
     
-    # Generate all visualizations
-    print("Creating sentiment overview...")
-    fig1 = create_sentiment_overview(data)
-    fig1.write_html(output_dir / f"sentiment_overview_{timestamp}.html")
-    if can_export_images:
-        fig1.write_image(output_dir / f"sentiment_overview_{timestamp}.png", width=1200, height=600, scale=2)
-    
-    print("Creating urgency heatmap...")
-    fig2 = create_urgency_heatmap(data)
-    fig2.write_html(output_dir / f"urgency_heatmap_{timestamp}.html")
-    if can_export_images:
-        fig2.write_image(output_dir / f"urgency_heatmap_{timestamp}.png", width=1400, height=700, scale=2)
-    
-    print("Creating theme network...")
-    fig3 = create_theme_network(data)
-    fig3.write_html(output_dir / f"theme_network_{timestamp}.html")
-    if can_export_images:
-        fig3.write_image(output_dir / f"theme_network_{timestamp}.png", width=1200, height=900, scale=2)
-    
-    print("Creating stakeholder sunburst...")
-    fig4 = create_stakeholder_sunburst(data)
-    fig4.write_html(output_dir / f"stakeholder_sunburst_{timestamp}.html")
-    if can_export_images:
-        fig4.write_image(output_dir / f"stakeholder_sunburst_{timestamp}.png", width=800, height=800, scale=2)
-    
-    print("Creating program radar...")
-    fig5 = create_program_impact_radar(data)
-    fig5.write_html(output_dir / f"program_radar_{timestamp}.html")
-    if can_export_images:
-        fig5.write_image(output_dir / f"program_radar_{timestamp}.png", width=1000, height=700, scale=2)
-    
-    print("Creating funding flow...")
-    fig6 = create_funding_flow_sankey(data)
-    fig6.write_html(output_dir / f"funding_flow_{timestamp}.html")
-    if can_export_images:
-        fig6.write_image(output_dir / f"funding_flow_{timestamp}.png", width=1200, height=700, scale=2)
-    
-    print("Creating executive dashboard...")
-    fig7 = create_executive_dashboard(data)
-    fig7.write_html(output_dir / f"executive_dashboard_{timestamp}.html")
-    if can_export_images:
-        fig7.write_image(output_dir / f"executive_dashboard_{timestamp}.png", width=1400, height=900, scale=2)
-    
-    # Also save as latest
-    for fig, name in [
-        (fig1, 'sentiment_overview'),
-        (fig2, 'urgency_heatmap'),
-        (fig3, 'theme_network'),
-        (fig4, 'stakeholder_sunburst'),
-        (fig5, 'program_radar'),
-        (fig6, 'funding_flow'),
-        (fig7, 'executive_dashboard')
-    ]:
-        fig.write_html(output_dir / f"{name}_LATEST.html")
+    # (name, figure function, image width, image height)
+    charts = [
+        ('sentiment_overview', 'create_sentiment_overview', 1200, 600),
+        ('urgency_heatmap', 'create_urgency_heatmap', 1400, 700),
+        ('theme_network', 'create_theme_network', 1200, 900),
+        ('stakeholder_sunburst', 'create_stakeholder_sunburst', 800, 800),
+        ('program_radar', 'create_program_impact_radar', 1000, 700),
+        ('funding_flow', 'create_funding_flow_sankey', 1200, 700),
+        ('executive_dashboard', 'create_executive_dashboard', 1400, 900)
+    ]
+    
+    # Figures are built in worker processes and their images exported in one
+    # kaleido batch; the _LATEST files are links to the timestamped ones.
+    # HTML pages share one plotly.js file in the output directory, and the
+    # JSON specs feed the combined dashboard
+    jobs = []
+    for name, function, width, height in charts:
+        outputs = [
+            output_dir / f"{name}_{version}.{document_format}"
+            for version in (timestamp, 'LATEST')
+            for document_format in ('html', 'json')
+        ]
         if can_export_images:
-            fig.write_image(output_dir / f"{name}_LATEST.png", width=1200, height=700, scale=2)
+            outputs += [
+                output_dir / f"{name}_{version}.{image_format}"
+                for version in (timestamp, 'LATEST')
+                for image_format in ('png', 'svg')
+            ]
+        jobs.append(RenderJob(
+            chart_id=name,
+            renderer=f"generate_report_visuals:{function}",
+            kwargs={'data': data},
+            outputs=outputs,
+            options={'width': width, 'height': height, 'scale': 2}
+        ))
+    with ImageExporter() as image_exporter:
+        results = RenderFarm(image_exporter=image_exporter).render(jobs, manifest=output_dir / CHART_MANIFEST)
+    
+    # All charts on one page that loads plotly.js once
+    print("Creating combined dashboard...")
+    dashboard = write_dashboard(
+        output_dir / f"all_charts_{timestamp}.html",
+        [
+            (name.replace('_', ' ').title(), output_dir / f"{name}_{timestamp}.json")
+            for (name, *_), result in zip(charts, results)
+            if not result.error
+        ],
+        title='ACME Cultural Funding Analysis - All Charts'
+    )
+    link_or_copy(dashboard, output_dir / "all_charts_LATEST.html")
     
     print(f"\n✓ All visualizations saved to {output_dir}")
     print("\nGenerated visualizations:")
@@ -705,6 +706,7 @@ def save_all_visualizations():
     print("5. program_radar - Program performance analysis")
     print("6. funding_flow - Sankey diagram of needs to outcomes")
     print("7. executive_dashboard - Comprehensive overview dashboard")
+    print("8. all_charts - All of the above on one page")
 
 if __name__ == "__main__":
     save_all_visualizations()
\ No newline at end of file
@@ -2,6 +2,7 @@
 """Generate static matplotlib visualizations for the report."""
 
 import json
+import sys
 from pathlib import Path
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -13,6 +14,10 @@ from matplotlib.patches import Rectangle
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.append(str(Path(__file__).parent))
+from src.visualization.cache import CHART_MANIFEST
+from src.visualization.render import RenderFarm, RenderJob
+
 # Modern color palette
 COLORS = {
     'primary': '#1E3A8A',
@@ -460,36 +465,27 @@ def save_all_static_visuals():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Generate visualizations
-    print("Creating sentiment overview...")
-    fig1 = create_sentiment_overview_static(data)
-    fig1.savefig(output_dir / f"sentiment_overview_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig1.savefig(output_dir / "sentiment_overview_LATEST.png", dpi=300, bbox_inches='tight')
-    plt.close(fig1)
-    
-    print("Creating theme frequency chart...")
-    fig2 = create_theme_frequency_chart(data)
-    fig2.savefig(output_dir / f"theme_frequency_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig2.savefig(output_dir / "theme_frequency_LATEST.png", dpi=300, bbox_inches='tight')
-    plt.close(fig2)
-    
-    print("Creating urgency matrix...")
-    fig3 = create_urgency_matrix(data)
-    fig3.savefig(output_dir / f"urgency_matrix_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig3.savefig(output_dir / "urgency_matrix_LATEST.png", dpi=300, bbox_inches='tight')
-    plt.close(fig3)
-    
-    print("Creating program comparison...")
-    fig4 = create_program_comparison(data)
-    fig4.savefig(output_dir / f"program_comparison_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig4.savefig(output_dir / "program_comparison_LATEST.png", dpi=300, bbox_inches='tight')
-    plt.close(fig4)
-    
-    print("Creating executive summary visual...")
-    fig5 = create_executive_summary_visual(data)
-    fig5.savefig(output_dir / f"executive_summary_visual_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig5.savefig(output_dir / "executive_summary_visual_LATEST.png", dpi=300, bbox_inches='tight')
-    plt.close(fig5)
+    # Figures are drawn and saved in worker processes; the _LATEST files
+    # are links to the timestamped ones
+    print("Creating static visualizations...")
+    charts = [
+        ('sentiment_overview', 'create_sentiment_overview_static'),
+        ('theme_frequency', 'create_theme_frequency_chart'),
+        ('urgency_matrix', 'create_urgency_matrix'),
+        ('program_comparison', 'create_program_comparison'),
+        ('executive_summary_visual', 'create_executive_summary_visual')
+    ]
+    RenderFarm().render([
+        RenderJob(
+            # Distinct from the interactive charts of the same name
+            chart_id=f"{name}_static",
+            renderer=f"generate_static_visuals:{function}",
+            kwargs={'data': data},
+            outputs=[output_dir / f"{name}_{timestamp}.png", output_dir / f"{name}_LATEST.png"],
+            options={'dpi': 300, 'bbox_inches': 'tight'}
+        )
+        for name, function in charts
+    ], manifest=output_dir / CHART_MANIFEST)
     
     print(f"\n✓ All static visualizations saved to {output_dir}")
     print("\nGenerated static visualizations:")
@@ -2,9 +2,24 @@
 """Insert visualizations into the comprehensive report at appropriate locations."""
 
 import re
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).parent))
+from src.visualization.cache import CHART_MANIFEST, resolve_chart
+
+VISUALIZATIONS_DIR = Path("data/results/reports/visualizations")
+
+
+def figure_path(name: str) -> str:
+    """Report-relative path of a static chart from generate_static_visuals.py."""
+    # Charts are looked up by id in the chart manifest; charts rendered
+    # before it existed are found by their _LATEST name
+    resolved = resolve_chart(VISUALIZATIONS_DIR / CHART_MANIFEST, f"{name}_static", ".png")
+    return f"visualizations/{resolved or f'{name}_LATEST.png'}"
+
+
 def insert_visualizations():
     """Insert visualization references into the report."""
     
@@ -16,30 +31,30 @@ def insert_visualizations():
     # Visualization insertion points
     visualizations = {
         # After Executive Summary section
-        "**Community Sentiment Overview:**": """
+        "**Community Sentiment Overview:**": f"""
 
-![Community Sentiment by Question](visualizations/sentiment_overview_LATEST.png)
+![Community Sentiment by Question]({figure_path('sentiment_overview')})
 *Figure 1: Sentiment distribution across all survey questions reveals predominantly negative sentiment for barriers-related questions and positive sentiment for opportunities.*
 
 """,
         # After Cross-Question Synthesis header
-        "## Cross-Question Synthesis": """## Cross-Question Synthesis
+        "## Cross-Question Synthesis": f"""## Cross-Question Synthesis
 
-![Executive Summary Visual](visualizations/executive_summary_visual_LATEST.png)
+![Executive Summary Visual]({figure_path('executive_summary_visual')})
 *Figure 2: Comprehensive executive overview showing key metrics, critical issues, sentiment distribution, and priority actions.*
 
 """,
         # After Recurring Themes section
-        "### Recurring Themes": """### Recurring Themes
+        "### Recurring Themes": f"""### Recurring Themes
 
-![Theme Frequency Chart](visualizations/theme_frequency_LATEST.png)
+![Theme Frequency Chart]({figure_path('theme_frequency')})
 *Figure 3: Top 10 recurring themes across all questions, showing the most pressing issues facing Austin's cultural community.*
 
 """,
         # After theme list
-        "- Questions: {', '.join(info.get('question_ids', []))}": """
+        "- Questions: {', '.join(info.get('question_ids', []))}": f"""
 
-![Urgency Matrix](visualizations/urgency_matrix_LATEST.png)
+![Urgency Matrix]({figure_path('urgency_matrix')})
 *Figure 4: Theme priority matrix plotting urgency against frequency. Themes in the upper-right quadrant require immediate attention.*
 
 """,
@@ -50,9 +65,9 @@ def insert_visualizations():
 
 """,
         # After Program-Specific Analysis header
-        "## Program-Specific Analysis": """## Program-Specific Analysis
+        "## Program-Specific Analysis": f"""## Program-Specific Analysis
 
-![Program Comparison](visualizations/program_comparison_LATEST.png)
+![Program Comparison]({figure_path('program_comparison')})
 *Figure 5: Comparative analysis of top cultural programs showing mentions, sentiment, strengths, and areas for improvement.*
 
 """,
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Quick script to inspect Excel columns."""
 
-import pandas as pd
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import ExcelSnapshotCache
+
+snapshots = ExcelSnapshotCache()
+
 # Load survey file
 survey_file = Path("data/raw/ACME_Community_Survey.xlsx")
-df = pd.read_excel(survey_file, nrows=5)
+df = snapshots.read_excel(survey_file).head(5)
 
 print("Survey columns:")
 for i, col in enumerate(df.columns):
@@ -17,11 +23,11 @@ print(f"Shape: {df.shape}")
 
 # Load working doc
 working_file = Path("data/raw/ACME_Working_Document.xlsx") 
-xl = pd.ExcelFile(working_file)
-print(f"\nWorking document sheets: {xl.sheet_names}")
+sheet_names = snapshots.sheet_names(working_file)
+print(f"\nWorking document sheets: {sheet_names}")
 
 # Check first sheet
-df_work = pd.read_excel(working_file, sheet_name=xl.sheet_names[0], nrows=5)
-print(f"\nFirst sheet columns ({xl.sheet_names[0]}):")
+df_work = snapshots.read_excel(working_file, sheet_name=sheet_names[0]).head(5)
+print(f"\nFirst sheet columns ({sheet_names[0]}):")
 for i, col in enumerate(df_work.columns):
     print(f"{i}: {col}")
\ No newline at end of file
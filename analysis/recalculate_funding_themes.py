@@ -1,77 +1,27 @@
 #!/usr/bin/env python3
 """Recalculate cultural funding themes as percentage of unique respondents."""
 
-import pandas as pd
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.ingestion import read_excel_snapshot
+from src.tagging import KeywordTagger
 
 def analyze_funding_themes():
     """Analyze funding-specific themes by unique respondents."""
     
     print("Loading survey data...")
     survey_path = Path("/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Community_Survey.xlsx")
-    df = pd.read_excel(survey_path)
+    df = read_excel_snapshot(survey_path)
     
     print(f"Total respondents: {len(df)}")
     
-    # Define funding-specific themes and their keywords
-    funding_themes = {
-        'Increase Funding Awareness': {
-            'keywords': ['aware', 'awareness', 'know about', 'information', 'outreach', 
-                        'communication', 'marketing', 'publicize', 'promote'],
-            'description': 'Better information about funding opportunities'
-        },
-        'Support Small Organizations': {
-            'keywords': ['small organization', 'emerging', 'grassroots', 'startup', 
-                        'new organization', 'small nonprofit', 'small arts'],
-            'description': 'Targeted support for smaller organizations'
-        },
-        'Simplify Application Process': {
-            'keywords': ['application', 'apply', 'paperwork', 'process', 'bureaucracy', 
-                        'red tape', 'complex', 'difficult', 'confusing', 'simplify'],
-            'description': 'Streamline the application process'
-        },
-        'Improve Grant Access': {
-            'keywords': ['grant access', 'eligibility', 'qualify', 'requirements', 
-                        'restrictions', 'barriers to funding', 'consecutive years'],
-            'description': 'Broaden access to grants'
-        },
-        'Funding Transparency': {
-            'keywords': ['transparent', 'transparency', 'clear criteria', 'understand',
-                        'clarity', 'open', 'decision', 'why', 'feedback'],
-            'description': 'Clear funding decisions and criteria'
-        },
-        'Equitable Distribution': {
-            'keywords': ['equitable', 'equity', 'fair', 'equal', 'inclusive', 
-                        'diverse', 'underrepresented', 'marginalized'],
-            'description': 'Fair distribution across communities'
-        },
-        'Increase Funding Levels': {
-            'keywords': ['increase fund', 'more fund', 'additional fund', 'raise fund',
-                        'expand fund', 'funding increase', 'not enough', 'insufficient'],
-            'description': 'Increase available funding amounts'
-        },
-        'Multi-Year Funding': {
-            'keywords': ['multi-year', 'multiyear', 'sustainable', 'long-term', 
-                        'ongoing', 'recurring', 'stability'],
-            'description': 'Provide multi-year commitments'
-        },
-        'Fair Artist Compensation': {
-            'keywords': ['artist pay', 'fair pay', 'compensation', 'living wage', 
-                        'payment', 'stipend', 'fee', 'remuneration'],
-            'description': 'Ensure fair artist compensation'
-        },
-        'Reduce Reporting Burden': {
-            'keywords': ['reporting', 'documentation', 'report requirement', 
-                        'administrative burden', 'paperwork', 'metrics'],
-            'description': 'Streamline reporting requirements'
-        }
-    }
-    
-    # Track unique respondents per theme
-    theme_respondents = {theme: set() for theme in funding_themes}
+    # Funding-specific themes and their keywords (src/tagging/taxonomy.json)
+    tagger = KeywordTagger.from_taxonomy('funding_themes')
     
     # Columns likely to contain funding feedback
     funding_columns = [
@@ -82,19 +32,11 @@ def analyze_funding_themes():
         'What kinds of programs or services would you like ACME to offer that currently do not exist or are underrepresented? '
     ]
     
-    # Analyze each respondent's responses
-    for idx, row in df.iterrows():
-        # Check each funding-related column
-        for col in funding_columns:
-            if col in df.columns and pd.notna(row[col]):
-                response = str(row[col]).lower()
-                
-                # Check for each theme's keywords
-                for theme, theme_data in funding_themes.items():
-                    for keyword in theme_data['keywords']:
-                        if keyword.lower() in response:
-                            theme_respondents[theme].add(idx)
-                            break  # Count respondent only once per theme
+    # Tag every respondent's responses in one pass (respondent x theme matrix)
+    tag_matrix = tagger.tag_columns(df, [col for col in funding_columns if col in df.columns])
+    
+    # Count each respondent only once per theme
+    theme_respondents = tag_matrix.counts()
     
     # Calculate results
     results = {
@@ -105,18 +47,17 @@ def analyze_funding_themes():
     
     # Sort themes by number of respondents
     sorted_themes = sorted(theme_respondents.items(), 
-                          key=lambda x: len(x[1]), reverse=True)
+                          key=lambda x: x[1], reverse=True)
     
     print("\n=== FUNDING THEME ANALYSIS (by unique respondents) ===")
-    for rank, (theme, respondent_set) in enumerate(sorted_themes, 1):
-        count = len(respondent_set)
+    for rank, (theme, count) in enumerate(sorted_themes, 1):
         percentage = (count / len(df)) * 100
         
         results['funding_themes'][theme] = {
             'rank': rank,
             'count': count,
             'percentage': round(percentage, 1),
-            'description': funding_themes[theme]['description']
+            'description': tagger.descriptions[theme]
         }
         
         print(f"{rank}. {theme}: {count} respondents ({percentage:.1f}%)")
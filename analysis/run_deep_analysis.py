@@ -6,11 +6,11 @@ This script implements the analysis pipeline described in PROJECT_PLAN.md,
 processing all 10,588 responses through multiple analysis passes.
 """
 
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 
 from rich.console import Console
 from rich.panel import Panel
@@ -21,82 +21,109 @@ sys.path.append(str(Path(__file__).parent))
 
 from src.config import settings
 from src.validation.audit import AuditLogger
+from src.validation.progress import get_progress_feed
 from src.ingestion.loader import DataLoader
+from src.ingestion.streaming import MemoryMonitor
+from src.llm import LLMScheduler
+from src.storage import ResultStore
 from src.features import (
     QuestionAnalyzer,
     CrossQuestionSynthesizer,
-    ProgramAnalyzer
+    ProgramAnalyzer,
+    ResponseIndex,
+    StreamingAnalysis,
+    SURVEY_QUESTIONS,
+    build_program_tagger,
+    extract_text_responses
 )
 
 console = Console()
 
 
 def load_survey_data(audit_logger: AuditLogger) -> Dict[str, Any]:
-    """Load and prepare survey data for analysis."""
+    """
+    Load and prepare survey data for analysis.
+    
+    With INGEST_STREAMING set, only the question columns are read, in chunks
+    sized to the ingestion memory limit, and responses are indexed chunk by
+    chunk; the full survey DataFrame is then never held in memory.
+    """
     console.print("\n[bold blue]Loading Survey Data...[/bold blue]")
     
     loader = DataLoader(audit_logger)
     
-    # Load all data
-    data = loader.load_all_data()
-    survey_df = data.get("survey")
-    
-    if survey_df is None or survey_df.empty:
-        raise ValueError("No survey data found!")
-    
-    console.print(f"[green]✓[/green] Loaded {len(survey_df)} survey responses")
-    
-    # Extract text responses from survey data
-    all_responses = []
-    response_id = 1
-    
-    # Define question mappings based on actual survey columns
-    questions = [
-        {"id": "q1_org_support", "text": "How do you believe ACME should better support organizations and cultural leaders?", 
-         "column": "austins_creative_community_has_built_a_strong_foundation_of_existing_organizations_that_informs_acmes_goals_and_mission_how_do_you_believe_acme_should_better_support_these_organizations_and_cul"},
-        {"id": "q2_opportunities", "text": "What type of cultural arts or entertainment opportunities would you like to see more of in Austin?",
-         "column": "what_type_of_cultural_arts_or_entertainment_opportunities_would_you_like_to_see_more_of_in_austin"},
-        {"id": "q3_improvements", "text": "What improvements would you like to see in these cultural funding programs?",
-         "column": "what_improvements_would_you_like_to_see_in_these_cultural_funding_programs"},
-        {"id": "q4_barriers", "text": "What barriers do you or your community face in accessing support or services related to arts, culture, music and entertainment?",
-         "column": "what_barriers_do_you_or_your_community_face_in_accessing_support_or_services_related_to_arts_culture_music_and_entertainment"},
-        {"id": "q5_new_programs", "text": "What kinds of programs or services would you like ACME to offer that currently do not exist or are underrepresented?",
-         "column": "what_kinds_of_programs_or_services_would_you_like_acme_to_offer_that_currently_do_not_exist_or_are_underrepresented"},
-        {"id": "q6_feedback", "text": "Do you have any additional ideas, concerns, or feedback you would like to share to help ACME better serve the public?",
-         "column": "do_you_have_any_additional_ideas_concerns_or_feedback_you_would_like_to_share_to_help_acme_better_serve_the_public"}
-    ]
+    questions = SURVEY_QUESTIONS
     
     # Identify specific text columns to analyze
     text_columns = [q["column"] for q in questions if "column" in q]
     
     console.print(f"[dim]Found {len(text_columns)} text response columns[/dim]")
     
-    # Extract all text responses
-    for idx, row in survey_df.iterrows():
-        for question in questions:
-            col = question['column']
-            text = row.get(col, '')
-            if isinstance(text, str) and text.strip() and len(text.strip()) > 10:
-                all_responses.append({
-                    'id': f'resp_{response_id}',
-                    'text': text.strip(),
-                    'question_id': question['id'],
-                    'question_text': question['text'],
-                    'source': 'survey',
-                    'respondent_idx': idx
-                })
-                response_id += 1
+    # Index responses once by question, respondent and program mention
+    response_index = ResponseIndex(
+        [], build_program_tagger(ProgramAnalyzer.CULTURAL_PROGRAMS)
+    )
+    all_responses = []
+    
+    if settings.ingest_streaming:
+        survey_df = None
+        data = None
+        n_rows = 0
+        
+        for chunk in loader.stream_survey_data(columns=text_columns):
+            chunk_responses = extract_text_responses(chunk, questions, start_id=len(all_responses) + 1)
+            for response in chunk_responses:
+                response_index.add(response)
+            all_responses.extend(chunk_responses)
+            n_rows += len(chunk)
+        
+        if n_rows == 0:
+            raise ValueError("No survey data found!")
+        
+        console.print(f"[green]✓[/green] Streamed {n_rows} survey responses")
+    else:
+        # Load all data
+        data = loader.load_all_data()
+        survey_df = data.get("survey")
+        
+        if survey_df is None or survey_df.empty:
+            raise ValueError("No survey data found!")
+        
+        console.print(f"[green]✓[/green] Loaded {len(survey_df)} survey responses")
+        
+        # Extract all text responses
+        all_responses = extract_text_responses(survey_df, questions)
+        for response in all_responses:
+            response_index.add(response)
     
     console.print(f"\n[bold green]Total text responses found: {len(all_responses)}[/bold green]")
     
     return {
         'responses': all_responses,
+        'response_index': response_index,
         'questions': questions,
         'survey_data': survey_df,
         'all_data': data
     }
 
 
+def iter_text_responses(audit_logger: AuditLogger) -> Iterator[Dict[str, Any]]:
+    """
+    Yield text responses chunk by chunk from the survey export.
+    
+    Only the question columns are read, in chunks sized to the ingestion
+    memory limit; ids match `extract_text_responses` over the whole survey.
+    """
+    loader = DataLoader(audit_logger)
+    text_columns = [q["column"] for q in SURVEY_QUESTIONS if "column" in q]
+    next_id = 1
+    
+    for chunk in loader.stream_survey_data(columns=text_columns):
+        chunk_responses = extract_text_responses(chunk, SURVEY_QUESTIONS, start_id=next_id)
+        next_id += len(chunk_responses)
+        yield from chunk_responses
+
+
 def run_deep_analysis():
     """Execute the complete deep analysis pipeline."""
     start_time = datetime.now()
@@ -114,65 +141,99 @@ def run_deep_analysis():
         timestamp=start_time.isoformat()
     )
     
+    # Progress events for the monitors (monitor_live.py, status_dashboard.py, ...)
+    progress = get_progress_feed()
+    progress.start_run(
+        "deep_analysis",
+        run_id=audit_logger.session_id,
+        streaming=settings.deep_analysis_streaming
+    )
+    
+    # Peak RSS per stage
+    memory_monitor = MemoryMonitor(audit_logger)
+    
+    # One LLM concurrency budget for all question and program calls
+    scheduler = LLMScheduler(audit_logger=audit_logger)
+    background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="programs")
+    program_future = None
+    
     try:
-        # Load survey data
-        data = load_survey_data(audit_logger)
-        responses = data['responses']
-        questions = data['questions']
-        
-        if not responses:
-            console.print("[red]No text responses found to analyze![/red]")
-            return
-        
-        # Phase 1: Question-level analysis
-        console.print("\n[bold yellow]Phase 1: Question-Level Analysis[/bold yellow]")
-        question_analyzer = QuestionAnalyzer(audit_logger)
-        
-        question_analyses = []
-        for question in questions:
-            # Filter responses for this question
-            question_responses = [r for r in responses if r['question_id'] == question['id']]
+        if settings.deep_analysis_streaming:
+            # Phase 1: Question-level analysis, streamed from the survey export
+            console.print("\n[bold yellow]Phase 1: Question-Level Analysis (streaming)[/bold yellow]")
+            with memory_monitor.stage("streaming_question_analysis"):
+                stream = StreamingAnalysis(SURVEY_QUESTIONS, audit_logger).run(
+                    iter_text_responses(audit_logger)
+                )
+            
+            if not stream.total_responses:
+                console.print("[red]No text responses found to analyze![/red]")
+                progress.end_run(status="no_responses")
+                return
+            
+            question_analyses = stream.question_analyses
+            total_responses = stream.total_responses
+            response_index, program_features = stream.program_index, stream.program_features
+            console.print(f"\n[bold green]✓ Completed {len(question_analyses)} question analyses[/bold green]")
+        else:
+            # Load survey data
+            with memory_monitor.stage("load_survey_data"):
+                data = load_survey_data(audit_logger)
+            responses = data['responses']
+            total_responses = len(responses)
+            response_index = data['response_index']
+            questions = data['questions']
+            
+            if not responses:
+                console.print("[red]No text responses found to analyze![/red]")
+                progress.end_run(status="no_responses")
+                return
+            
+            # Program analysis (Phase 3) shares the scheduler with Phase 1, so a
+            # program's theme call starts once its own responses are extracted
+            program_features = None
+            program_future = background.submit(
+                ProgramAnalyzer(audit_logger).analyze_all_programs, response_index, None, scheduler
+            )
             
-            if question_responses:
-                console.print(f"\n[dim]Found {len(question_responses)} responses for {question['id']}[/dim]")
-                analysis = question_analyzer.analyze_question(
-                    question_id=question['id'],
-                    question_text=question['text'],
-                    all_responses=responses
+            # Phase 1: Question-level analysis
+            console.print("\n[bold yellow]Phase 1: Question-Level Analysis[/bold yellow]")
+            question_analyzer = QuestionAnalyzer(audit_logger)
+            
+            with memory_monitor.stage("question_analysis"):
+                question_analyses = question_analyzer.analyze_all_questions(
+                    questions, response_index, scheduler
                 )
-                
-                if analysis:
-                    question_analyses.append(analysis)
-        
-        console.print(f"\n[bold green]✓ Completed {len(question_analyses)} question analyses[/bold green]")
+            
+            console.print(f"\n[bold green]✓ Completed {len(question_analyses)} question analyses[/bold green]")
         
         # Phase 2: Cross-question synthesis
         console.print("\n[bold yellow]Phase 2: Cross-Question Synthesis[/bold yellow]")
         synthesizer = CrossQuestionSynthesizer(audit_logger)
         
-        synthesis_results = synthesizer.synthesize_insights(question_analyses)
+        with memory_monitor.stage("cross_question_synthesis"), progress.stage("cross_question_synthesis", total=1) as stage:
+            synthesis_results = synthesizer.synthesize_insights(question_analyses)
+            stage.advance()
         
         # Phase 3: Program-specific analysis
         console.print("\n[bold yellow]Phase 3: Program-Specific Analysis[/bold yellow]")
-        program_analyzer = ProgramAnalyzer(audit_logger)
-        
-        program_results = program_analyzer.analyze_all_programs(responses)
+        with memory_monitor.stage("program_analysis"):
+            if program_future is not None:
+                program_results = program_future.result()
+            else:
+                program_analyzer = ProgramAnalyzer(audit_logger)
+                program_results = program_analyzer.analyze_all_programs(response_index, program_features)
         
         # Save comprehensive results
-        results_dir = settings.data_dir / "results" / "deep_analysis"
-        results_dir.mkdir(exist_ok=True, parents=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_file = results_dir / f"deep_analysis_results_{timestamp}.json"
-        
         comprehensive_results = {
             'metadata': {
                 'analysis_date': datetime.now().isoformat(),
-                'total_responses': len(responses),
+                'total_responses': total_responses,
                 'questions_analyzed': len(question_analyses),
                 'programs_analyzed': len(program_results),
                 'gpt_model': 'gpt-4.1',
-                'analysis_duration': str(datetime.now() - start_time)
+                'analysis_duration': str(datetime.now() - start_time),
+                'memory_profile': memory_monitor.stages
             },
             'question_analyses': [qa.model_dump() for qa in question_analyses],
             'cross_question_synthesis': synthesis_results,
@@ -182,8 +243,17 @@ def run_deep_analysis():
             }
         }
         
-        with open(results_file, 'w') as f:
-            json.dump(comprehensive_results, f, indent=2)
+        # Run metadata (dates, durations, memory) is kept in the run manifest,
+        # so a re-run with identical analyses reuses the stored object
+        stored = ResultStore().put(
+            "deep_analysis_results",
+            comprehensive_results,
+            run_id=audit_logger.session_id,
+            volatile_keys=("metadata",)
+        )
+        results_file = stored.path
+        
+        memory_monitor.display()
         
         console.print(f"\n[bold green]✓ Analysis complete! Results saved to:[/bold green]")
         console.print(f"  {results_file}")
@@ -196,10 +266,17 @@ def run_deep_analysis():
             operation="deep_analysis_complete",
             duration=str(datetime.now() - start_time),
             results_file=str(results_file),
-            total_responses=len(responses)
+            total_responses=total_responses
         )
+        progress.end_run(results_file=str(results_file), total_responses=total_responses)
         
+    except KeyboardInterrupt:
+        # Drop the queued LLM calls instead of running them all first
+        scheduler.shutdown(cancel_pending=True)
+        progress.end_run(status="interrupted")
+        raise
     except Exception as e:
+        scheduler.shutdown(cancel_pending=True)
         console.print(f"\n[red]Error during analysis: {str(e)}[/red]")
         audit_logger.log_error(
             operation="deep_analysis_error",
@@ -207,7 +284,11 @@ def run_deep_analysis():
             error_message=str(e),
             context={}
         )
+        progress.end_run(status="failed", error_type=type(e).__name__, error_message=str(e))
         raise
+    finally:
+        background.shutdown()
+        scheduler.shutdown()
 
 
 def display_executive_summary(results: Dict[str, Any]):
@@ -20,13 +20,22 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 sys.path.append(str(Path(__file__).parent))
 
 from src.config import settings
-from src.visualization.deep_analysis_charts import DeepAnalysisVisualizer
+from src.visualization.cache import CHART_MANIFEST
+from src.visualization.render import RenderFarm, RenderJob, render_outputs
+from src.storage import ResultStore
 
 console = Console()
 
 
 def load_deep_analysis_results() -> Dict[str, Any]:
     """Load the most recent deep analysis results."""
+    store = ResultStore()
+    stored = store.ref("deep_analysis_results")
+    if stored is not None:
+        console.print(f"[dim]Loading results from: {stored.path.name}[/dim]")
+        return store.latest("deep_analysis_results")
+    
+    # Results written before the result store existed
     results_dir = settings.data_dir / "results" / "deep_analysis"
     
     if not results_dir.exists():
@@ -61,12 +70,20 @@ def generate_visualizations(results: Dict[str, Any]):
     output_dir = viz_dir / f"viz_{timestamp}"
     output_dir.mkdir(exist_ok=True)
     
-    visualizer = DeepAnalysisVisualizer()
-    generated_files = []
+    jobs = []
+    
+    def add_job(chart_id: str, method: str, path: Path, **data):
+        jobs.append(RenderJob(
+            chart_id=chart_id,
+            renderer=f"src.visualization.deep_analysis_charts:DeepAnalysisVisualizer.{method}",
+            kwargs=data,
+            outputs=[path],
+            output_arg="output_path"
+        ))
     
     try:
         # 1. Question-specific dashboards
-        console.print("\n[bold yellow]Creating Question Dashboards...[/bold yellow]")
+        console.print("\n[bold yellow]Planning Question Dashboards...[/bold yellow]")
         question_analyses = results.get('question_analyses', [])
         
         question_dir = output_dir / "questions"
@@ -74,61 +91,49 @@ def generate_visualizations(results: Dict[str, Any]):
         
         for q_analysis in question_analyses[:5]:  # Limit to first 5 for demo
             q_id = q_analysis.get('question_id', 'unknown')
-            dashboard_path = question_dir / f"dashboard_{q_id}.html"
-            
-            visualizer.create_question_dashboard(q_analysis, dashboard_path)
-            generated_files.append(str(dashboard_path))
+            add_job(f"dashboard_{q_id}", "create_question_dashboard",
+                    question_dir / f"dashboard_{q_id}.html", question_analysis=q_analysis)
         
         # 2. Theme evolution chart
-        console.print("\n[bold yellow]Creating Theme Evolution Chart...[/bold yellow]")
-        if len(question_analyses) > 1:
-            evolution_path = output_dir / "theme_evolution.html"
-            visualizer.create_theme_evolution_chart(question_analyses, evolution_path)
-            generated_files.append(str(evolution_path))
-        
         # 3. Stakeholder comparison matrix
-        console.print("\n[bold yellow]Creating Stakeholder Comparison Matrix...[/bold yellow]")
         if len(question_analyses) > 1:
-            matrix_path = output_dir / "stakeholder_matrix.html"
-            visualizer.create_stakeholder_comparison_matrix(question_analyses, matrix_path)
-            generated_files.append(str(matrix_path))
+            add_job("theme_evolution", "create_theme_evolution_chart",
+                    output_dir / "theme_evolution.html", question_analyses=question_analyses)
+            add_job("stakeholder_matrix", "create_stakeholder_comparison_matrix",
+                    output_dir / "stakeholder_matrix.html", question_analyses=question_analyses)
         
         # 4. Sentiment-urgency scatter plot
-        console.print("\n[bold yellow]Creating Sentiment-Urgency Analysis...[/bold yellow]")
         all_themes = []
         for q_analysis in question_analyses:
             all_themes.extend(q_analysis.get('dominant_themes', []))
         
         if all_themes:
-            scatter_path = output_dir / "sentiment_urgency_scatter.html"
-            visualizer.create_sentiment_urgency_scatter(all_themes, scatter_path)
-            generated_files.append(str(scatter_path))
+            add_job("sentiment_urgency_scatter", "create_sentiment_urgency_scatter",
+                    output_dir / "sentiment_urgency_scatter.html", all_themes=all_themes)
         
         # 5. Program feedback sunburst
-        console.print("\n[bold yellow]Creating Program Feedback Visualization...[/bold yellow]")
         program_analyses = results.get('program_analyses', {})
         
         if program_analyses:
-            sunburst_path = output_dir / "program_feedback_sunburst.html"
-            visualizer.create_program_feedback_sunburst(program_analyses, sunburst_path)
-            generated_files.append(str(sunburst_path))
+            add_job("program_feedback_sunburst", "create_program_feedback_sunburst",
+                    output_dir / "program_feedback_sunburst.html", program_analyses=program_analyses)
         
         # 6. Cross-question insights network
-        console.print("\n[bold yellow]Creating Insights Network Graph...[/bold yellow]")
         synthesis = results.get('cross_question_synthesis', {})
         systemic_issues = synthesis.get('systemic_issues', [])
         
         if systemic_issues:
-            network_path = output_dir / "insights_network.html"
-            visualizer.create_insight_network_graph(systemic_issues, network_path)
-            generated_files.append(str(network_path))
+            add_job("insights_network", "create_insight_network_graph",
+                    output_dir / "insights_network.html", cross_question_insights=systemic_issues)
         
         # 7. Executive summary infographic
-        console.print("\n[bold yellow]Creating Executive Summary...[/bold yellow]")
         if synthesis:
-            summary_path = output_dir / "executive_summary.png"
-            visualizer.create_executive_summary_infographic(synthesis, summary_path)
-            generated_files.append(str(summary_path))
+            add_job("executive_summary", "create_executive_summary_infographic",
+                    output_dir / "executive_summary.png", synthesis_results=synthesis)
+        
+        # Render every chart in parallel worker processes
+        console.print(f"\n[bold yellow]Rendering {len(jobs)} visualizations...[/bold yellow]")
+        generated_files = render_outputs(RenderFarm().render(jobs, manifest=output_dir / CHART_MANIFEST))
         
         # Create index file
         create_visualization_index(output_dir, generated_files)
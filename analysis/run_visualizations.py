@@ -9,11 +9,22 @@ from rich.console import Console
 from src.visualization.generator import VisualizationGenerator
 from src.reporting.generator import ReportGenerator
 from src.validation.audit import AuditLogger
+from src.storage import ResultStore
 
 console = Console()
 
 def load_latest_results():
     """Load the most recent analysis results."""
+    store = ResultStore()
+    who_results = store.latest("who_analysis")
+    what_results = store.latest("what_analysis")
+    
+    if who_results is not None and what_results is not None:
+        console.print(f"[green]Loaded WHO results: {store.ref('who_analysis').digest[:12]}[/]")
+        console.print(f"[green]Loaded WHAT results: {store.ref('what_analysis').digest[:12]}[/]")
+        return who_results, what_results
+    
+    # Results written before the result store existed
     results_dir = Path("data/results")
     
     # Find latest WHO and WHAT analysis files
@@ -33,11 +33,13 @@ class Settings(BaseSettings):
     processed_data_dir: Optional[Path] = None
     results_dir: Optional[Path] = None
     audit_dir: Optional[Path] = None
+    progress_dir: Optional[Path] = None
     
     # Analysis Parameters
     confidence_level: float = Field(default=0.95, env="CONFIDENCE_LEVEL")
     min_theme_frequency: int = Field(default=10, env="MIN_THEME_FREQUENCY")
     max_themes: int = Field(default=10, env="MAX_THEMES")
+    theme_similarity_threshold: float = Field(default=0.85, env="THEME_SIMILARITY_THRESHOLD")
     
     # Program Names
     programs: List[str] = Field(
@@ -55,12 +57,74 @@ class Settings(BaseSettings):
     max_missing_rate: float = Field(default=0.1, env="MAX_MISSING_RATE")
     min_response_length: int = Field(default=10, env="MIN_RESPONSE_LENGTH")
     
+    # Ingestion
+    ingest_streaming: bool = Field(default=False, env="INGEST_STREAMING")
+    ingest_memory_limit_mb: int = Field(default=2048, env="INGEST_MEMORY_LIMIT_MB")
+    ingest_chunk_rows: int = Field(default=10000, env="INGEST_CHUNK_ROWS")
+    
+    # Audit Logging
+    # Durability: "entry" (fsync every entry), "interval" (fsync every
+    # audit_flush_interval seconds) or "session" (fsync at session end/exit)
+    audit_durability: str = Field(default="interval", env="AUDIT_DURABILITY")
+    audit_flush_interval: float = Field(default=1.0, env="AUDIT_FLUSH_INTERVAL")
+    audit_batch_size: int = Field(default=1000, env="AUDIT_BATCH_SIZE")
+    # "standard" applies the per-operation levels below, "verbose" logs
+    # every entry in full. Levels: "full", "rollup" (periodic counter and
+    # histogram records) or "off"; unlisted operations are logged in full
+    audit_level: str = Field(default="standard", env="AUDIT_LEVEL")
+    audit_operation_levels: Dict[str, str] = Field(
+        default={
+            "llm_cache_hit": "rollup",
+            "llm_cache_save": "rollup",
+            "feature_cache_hit": "rollup",
+            "feature_cache_save": "rollup"
+        },
+        env="AUDIT_OPERATION_LEVELS"
+    )
+    audit_rollup_interval: float = Field(default=60.0, env="AUDIT_ROLLUP_INTERVAL")
+    
+    # Progress Feed
+    # Pipeline runs append progress events to progress_dir/progress.jsonl for
+    # the monitors; past progress_max_bytes the file is rotated, keeping
+    # progress_backups old files
+    progress_feed: bool = Field(default=True, env="PROGRESS_FEED")
+    progress_max_bytes: int = Field(default=5_000_000, env="PROGRESS_MAX_BYTES")
+    progress_backups: int = Field(default=3, env="PROGRESS_BACKUPS")
+    # Minimum seconds between progress events of a stage, and between
+    # console notices inside per-response loops
+    progress_interval: float = Field(default=1.0, env="PROGRESS_INTERVAL")
+    
+    # Pipeline
+    # Stages run concurrently when their inputs are ready (e.g. the
+    # quantitative and qualitative analyses)
+    pipeline_max_workers: int = Field(default=2, env="PIPELINE_MAX_WORKERS")
+    # Deep analysis: run ingest, dedup, extraction, aggregation and program
+    # tagging as concurrent stages joined by bounded queues
+    deep_analysis_streaming: bool = Field(default=False, env="DEEP_ANALYSIS_STREAMING")
+    stream_queue_size: int = Field(default=256, env="STREAM_QUEUE_SIZE")
+    stream_extract_workers: int = Field(default=4, env="STREAM_EXTRACT_WORKERS")
+    # Seconds between published snapshots of a question's running aggregate
+    aggregate_snapshot_interval: float = Field(default=30.0, env="AGGREGATE_SNAPSHOT_INTERVAL")
+    # Seconds between checks for a new survey export in watch mode
+    survey_watch_interval: float = Field(default=10.0, env="SURVEY_WATCH_INTERVAL")
+    
     # LLM Parameters
     llm_temperature: float = Field(default=0.3, env="LLM_TEMPERATURE")
     llm_max_tokens: int = Field(default=2000, env="LLM_MAX_TOKENS")
     llm_retry_attempts: int = Field(default=3, env="LLM_RETRY_ATTEMPTS")
+    # LLM calls in flight at once across all analyses (see LLMScheduler)
+    llm_max_concurrency: int = Field(default=8, env="LLM_MAX_CONCURRENCY")
     
     # Visualization Settings
+    # Worker processes rendering charts (see RenderFarm)
+    render_workers: int = Field(default=4, env="RENDER_WORKERS")
+    # How plotly HTML pages load plotly.js: "directory" (one shared copy per
+    # output directory), "cdn" or "inline" (embedded in every file)
+    plotly_html_mode: str = Field(default="directory", env="PLOTLY_HTML_MODE")
+    # Reuse rendered charts whose data, style and chart code are unchanged
+    render_cache: bool = Field(default=True, env="RENDER_CACHE")
+    # Figures kaleido exports at once in its shared session (see ImageExporter)
+    image_export_workers: int = Field(default=4, env="IMAGE_EXPORT_WORKERS")
     color_palette: Dict[str, str] = Field(
         default={
             "primary": "#1a365d",
@@ -98,6 +162,8 @@ class Settings(BaseSettings):
             self.results_dir = self.data_dir / "results"
         if self.audit_dir is None:
             self.audit_dir = self.data_dir / "audit"
+        if self.progress_dir is None:
+            self.progress_dir = self.data_dir / "progress"
     
     model_config = {
         "env_file": ".env",
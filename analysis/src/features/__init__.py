@@ -11,9 +11,15 @@ from .models import (
     ProgramFeedback
 )
 from .extractor import ResponseFeatureExtractor
+from .response_index import ResponseIndex, build_program_tagger
+from .survey import SURVEY_QUESTIONS, extract_text_responses
+from .aggregation import ThemeMatrix, ThemeAggregate, QuestionAggregate
+from .online import OnlineAggregator, AggregateSnapshot, ProportionEstimate, load_snapshots
 from .analyzer import QuestionAnalyzer
+from .canonicalization import ThemeCanonicalizer
 from .synthesizer import CrossQuestionSynthesizer
 from .program_analyzer import ProgramAnalyzer
+from .streaming import StreamingAnalysis, StreamResult
 
 __all__ = [
     'SentimentType',
@@ -25,7 +31,21 @@ __all__ = [
     'CrossQuestionInsight',
     'ProgramFeedback',
     'ResponseFeatureExtractor',
+    'ResponseIndex',
+    'build_program_tagger',
+    'SURVEY_QUESTIONS',
+    'extract_text_responses',
+    'ThemeMatrix',
+    'ThemeAggregate',
+    'QuestionAggregate',
+    'OnlineAggregator',
+    'AggregateSnapshot',
+    'ProportionEstimate',
+    'load_snapshots',
     'QuestionAnalyzer',
+    'ThemeCanonicalizer',
     'CrossQuestionSynthesizer',
-    'ProgramAnalyzer'
+    'ProgramAnalyzer',
+    'StreamingAnalysis',
+    'StreamResult'
 ]
\ No newline at end of file
@@ -0,0 +1,419 @@
+"""Array-based theme aggregation for question-level analysis."""
+
+from collections import Counter
+from typing import Dict, List, Sequence, Any, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+from scipy import sparse
+
+from .models import (
+    ResponseFeatures,
+    QuestionTheme,
+    SentimentType,
+    StakeholderType,
+    UrgencyLevel
+)
+
+
+# Integer codes for the categorical feature fields
+SENTIMENTS = list(SentimentType)
+URGENCIES = list(UrgencyLevel)
+STAKEHOLDERS = list(StakeholderType)
+
+SENTIMENT_CODES = {member: code for code, member in enumerate(SENTIMENTS)}
+URGENCY_CODES = {member: code for code, member in enumerate(URGENCIES)}
+STAKEHOLDER_CODES = {member: code for code, member in enumerate(STAKEHOLDERS)}
+
+# Urgency scores (high=1.0, medium=0.5, low=0.0) in half-units, so that
+# per-theme sums stay exact integers and the mean matches statistics.mean
+URGENCY_HALF_UNITS = np.array(
+    [{UrgencyLevel.high: 2, UrgencyLevel.medium: 1, UrgencyLevel.low: 0}[u] for u in URGENCIES],
+    dtype=np.int64
+)
+
+# Separator that cannot occur in a key phrase, used to pre-screen quote matches
+_PHRASE_SEPARATOR = "\x00"
+
+
+class ThemeMatrix:
+    """
+    Sparse response x theme matrix with precomputed integer feature codes.
+
+    Themes are exploded once into (response, theme) pairs. Theme counts,
+    sentiment, urgency and stakeholder breakdowns are then computed as grouped
+    array reductions instead of nested per-theme dictionaries. Results are
+    identical to the original loop-based aggregation, including theme order
+    (frequency, then first appearance) and dictionary key order.
+    """
+
+    def __init__(self, features_list: Sequence[ResponseFeatures]):
+        """
+        Build the matrix from extracted response features.
+
+        Args:
+            features_list: List of extracted features, one per response
+        """
+        self.response_count = len(features_list)
+
+        theme_index: Dict[str, int] = {}
+        theme_lower: List[str] = []
+        row_idx: List[int] = []
+        theme_codes: List[int] = []
+        theme_quotes: Dict[int, List[str]] = {}
+
+        sentiment_codes = np.empty(self.response_count, dtype=np.int64)
+        urgency_codes = np.empty(self.response_count, dtype=np.int64)
+        stakeholder_codes = np.empty(self.response_count, dtype=np.int64)
+
+        for row, features in enumerate(features_list):
+            sentiment_codes[row] = SENTIMENT_CODES[features.sentiment]
+            urgency_codes[row] = URGENCY_CODES[features.urgency]
+            stakeholder_codes[row] = STAKEHOLDER_CODES[features.stakeholder_type]
+
+            # Lowercase each phrase once per response rather than once per theme
+            phrases = features.key_phrases
+            phrases_lower = [phrase.lower() for phrase in phrases]
+            phrases_joined = _PHRASE_SEPARATOR.join(phrases_lower)
+
+            for theme in features.themes:
+                code = theme_index.get(theme)
+                if code is None:
+                    code = len(theme_index)
+                    theme_index[theme] = code
+                    theme_lower.append(theme.lower())
+
+                row_idx.append(row)
+                theme_codes.append(code)
+
+                # Collect representative quotes (key phrases containing the theme)
+                needle = theme_lower[code]
+                if needle in phrases_joined:
+                    quotes = theme_quotes.setdefault(code, [])
+                    for phrase, phrase_lower in zip(phrases, phrases_lower):
+                        if needle in phrase_lower:
+                            quotes.append(phrase)
+
+        self.themes = list(theme_index)
+        self.row_idx = np.asarray(row_idx, dtype=np.int64)
+        self.theme_codes = np.asarray(theme_codes, dtype=np.int64)
+        self.sentiment_codes = sentiment_codes
+        self.urgency_codes = urgency_codes
+        self.stakeholder_codes = stakeholder_codes
+        self._theme_quotes = theme_quotes
+
+        # Duplicate (response, theme) pairs are summed, matching Counter semantics
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(self.theme_codes), dtype=np.int64), (self.row_idx, self.theme_codes)),
+            shape=(self.response_count, len(self.themes))
+        )
+
+    def question_themes(self) -> List[QuestionTheme]:
+        """
+        Aggregate themes into QuestionTheme objects.
+
+        Returns:
+            List of QuestionTheme objects sorted by frequency
+        """
+        if not self.themes:
+            return []
+
+        counts, urgency_half, sentiment_breakdowns, stakeholder_breakdowns = self._theme_statistics()
+
+        # Counter.most_common order: count descending, ties by first appearance
+        order = np.argsort(-counts, kind="stable")
+        total_responses = self.response_count
+
+        question_themes = []
+        for code in order:
+            count = int(counts[code])
+            question_themes.append(QuestionTheme(
+                theme=self.themes[code],
+                count=count,
+                percentage=(count / total_responses * 100) if total_responses > 0 else 0,
+                representative_quotes=list(set(self._theme_quotes.get(code, [])))[:5],
+                sentiment_distribution=sentiment_breakdowns[code],
+                urgency_score=int(urgency_half[code]) / (2 * count),
+                stakeholder_breakdown=stakeholder_breakdowns[code]
+            ))
+
+        return question_themes
+
+    def theme_aggregates(self) -> Dict[str, "ThemeAggregate"]:
+        """
+        Per-theme aggregate state, in order of first appearance.
+
+        Returns:
+            Dictionary mapping theme names to ThemeAggregate objects
+        """
+        if not self.themes:
+            return {}
+
+        counts, urgency_half, sentiment_breakdowns, stakeholder_breakdowns = self._theme_statistics()
+
+        aggregates = {}
+        for code, theme in enumerate(self.themes):
+            aggregates[theme] = ThemeAggregate(
+                count=int(counts[code]),
+                urgency_half_units=int(urgency_half[code]),
+                sentiment_counts=sentiment_breakdowns[code],
+                stakeholder_counts=stakeholder_breakdowns[code],
+                quote_counts=dict(Counter(self._theme_quotes.get(code, [])))
+            )
+
+        return aggregates
+
+    def sentiment_distribution(self) -> Dict[SentimentType, int]:
+        """Overall sentiment breakdown across responses."""
+        return self._distribution(self.sentiment_codes, SENTIMENTS)
+
+    def urgency_distribution(self) -> Dict[UrgencyLevel, int]:
+        """Overall urgency breakdown across responses."""
+        return self._distribution(self.urgency_codes, URGENCIES)
+
+    def stakeholder_distribution(self) -> Dict[StakeholderType, int]:
+        """Overall stakeholder breakdown across responses."""
+        return self._distribution(self.stakeholder_codes, STAKEHOLDERS)
+
+    def _grouped_breakdown(self, matrix_t: sparse.csr_matrix, value_codes: np.ndarray,
+                           members: List[Any]) -> List[Dict[Any, int]]:
+        """
+        Count category values per theme, keyed in order of first appearance.
+
+        Args:
+            matrix_t: Theme x response matrix
+            value_codes: Per-response category codes
+            members: Enum members indexed by code
+
+        Returns:
+            One {member: count} dictionary per theme code
+        """
+        n_values = len(members)
+        one_hot = sparse.csr_matrix(
+            (np.ones(self.response_count, dtype=np.int64),
+             (np.arange(self.response_count), value_codes)),
+            shape=(self.response_count, n_values)
+        )
+        counts = (matrix_t @ one_hot).toarray()
+
+        # First appearance of each (theme, value) pair in exploded order
+        pair_codes = self.theme_codes * n_values + value_codes[self.row_idx]
+        unique_pairs, first_seen = np.unique(pair_codes, return_index=True)
+        order = np.lexsort((first_seen, unique_pairs // n_values))
+
+        breakdowns: List[Dict[Any, int]] = [{} for _ in self.themes]
+        for pair in unique_pairs[order]:
+            theme_code, value_code = divmod(int(pair), n_values)
+            breakdowns[theme_code][members[value_code]] = int(counts[theme_code, value_code])
+
+        return breakdowns
+
+    def _theme_statistics(self) -> Tuple[np.ndarray, np.ndarray, List[Dict[Any, int]], List[Dict[Any, int]]]:
+        """Theme counts, urgency half-unit sums and breakdowns indexed by theme code."""
+        matrix_t = self.matrix.T.tocsr()
+        counts = np.asarray(self.matrix.sum(axis=0)).ravel()
+        urgency_half = matrix_t @ URGENCY_HALF_UNITS[self.urgency_codes]
+
+        sentiment_breakdowns = self._grouped_breakdown(
+            matrix_t, self.sentiment_codes, SENTIMENTS
+        )
+        stakeholder_breakdowns = self._grouped_breakdown(
+            matrix_t, self.stakeholder_codes, STAKEHOLDERS
+        )
+
+        return counts, urgency_half, sentiment_breakdowns, stakeholder_breakdowns
+
+    @staticmethod
+    def _distribution(codes: np.ndarray, members: List[Any]) -> Dict[Any, int]:
+        """Count category codes, keyed in order of first appearance."""
+        if len(codes) == 0:
+            return {}
+
+        counts = np.bincount(codes, minlength=len(members))
+        unique_codes, first_seen = np.unique(codes, return_index=True)
+
+        return {
+            members[int(code)]: int(counts[code])
+            for code in unique_codes[np.argsort(first_seen)]
+        }
+
+
+def _add_counts(counts: Dict[Any, int], key: Any, weight: int) -> None:
+    """Add a weighted count in place, dropping keys that reach zero."""
+    total = counts.get(key, 0) + weight
+    if total:
+        counts[key] = total
+    else:
+        counts.pop(key, None)
+
+
+def _merge_counts(left: Dict[Any, int], right: Dict[Any, int]) -> Dict[Any, int]:
+    """Sum two count dictionaries, keeping the left operand's key order first."""
+    merged = dict(left)
+    for key, count in right.items():
+        _add_counts(merged, key, count)
+    return merged
+
+
+class ThemeAggregate(BaseModel):
+    """Mergeable per-theme counts behind a QuestionTheme."""
+    count: int = 0
+    urgency_half_units: int = 0
+    sentiment_counts: Dict[SentimentType, int] = Field(default_factory=dict)
+    stakeholder_counts: Dict[StakeholderType, int] = Field(default_factory=dict)
+    quote_counts: Dict[str, int] = Field(default_factory=dict)
+
+    def merge(self, other: "ThemeAggregate") -> "ThemeAggregate":
+        """Combine two theme aggregates."""
+        return ThemeAggregate(
+            count=self.count + other.count,
+            urgency_half_units=self.urgency_half_units + other.urgency_half_units,
+            sentiment_counts=_merge_counts(self.sentiment_counts, other.sentiment_counts),
+            stakeholder_counts=_merge_counts(self.stakeholder_counts, other.stakeholder_counts),
+            quote_counts=_merge_counts(self.quote_counts, other.quote_counts)
+        )
+
+
+class QuestionAggregate(BaseModel):
+    """
+    Serializable, mergeable state behind a QuestionAnalysis.
+
+    Holds the counts, distributions and urgency sums for one question, plus
+    the multiset of feature cache keys that were folded in. Cache keys hash
+    the response text and question, so diffing them against the current
+    responses identifies exactly which responses are new, changed or removed.
+    """
+    question_id: str
+    question_text: str
+    response_count: int = 0
+    actionable_count: int = 0
+    sentiment_counts: Dict[SentimentType, int] = Field(default_factory=dict)
+    urgency_counts: Dict[UrgencyLevel, int] = Field(default_factory=dict)
+    stakeholder_counts: Dict[StakeholderType, int] = Field(default_factory=dict)
+    themes: Dict[str, ThemeAggregate] = Field(default_factory=dict)
+    response_keys: Dict[str, int] = Field(default_factory=dict)
+    failed_keys: List[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_features(cls, question_id: str, question_text: str,
+                      features_list: Sequence[ResponseFeatures],
+                      cache_keys: Sequence[str]) -> "QuestionAggregate":
+        """
+        Build aggregate state for a batch of responses in one vectorized pass.
+
+        Args:
+            question_id: Unique identifier for the question
+            question_text: Full text of the question
+            features_list: Extracted features, one per response
+            cache_keys: Feature cache key of each response
+
+        Returns:
+            QuestionAggregate covering the batch
+        """
+        theme_matrix = ThemeMatrix(features_list)
+
+        return cls(
+            question_id=question_id,
+            question_text=question_text,
+            response_count=len(features_list),
+            actionable_count=sum(1 for f in features_list if f.contains_actionable_feedback),
+            sentiment_counts=theme_matrix.sentiment_distribution(),
+            urgency_counts=theme_matrix.urgency_distribution(),
+            stakeholder_counts=theme_matrix.stakeholder_distribution(),
+            themes=theme_matrix.theme_aggregates(),
+            response_keys=dict(Counter(cache_keys))
+        )
+
+    def add(self, features: ResponseFeatures, cache_key: str, weight: int = 1) -> None:
+        """
+        Fold a single response into the aggregate in place.
+
+        Args:
+            features: Extracted features of the response
+            cache_key: Feature cache key of the response
+            weight: Number of copies to add; negative values retract
+        """
+        self.response_count += weight
+        if features.contains_actionable_feedback:
+            self.actionable_count += weight
+        _add_counts(self.sentiment_counts, features.sentiment, weight)
+        _add_counts(self.urgency_counts, features.urgency, weight)
+        _add_counts(self.stakeholder_counts, features.stakeholder_type, weight)
+        _add_counts(self.response_keys, cache_key, weight)
+
+        half_units = int(URGENCY_HALF_UNITS[URGENCY_CODES[features.urgency]])
+        phrases_lower = [phrase.lower() for phrase in features.key_phrases]
+
+        for theme in features.themes:
+            aggregate = self.themes.setdefault(theme, ThemeAggregate())
+            aggregate.count += weight
+            aggregate.urgency_half_units += half_units * weight
+            _add_counts(aggregate.sentiment_counts, features.sentiment, weight)
+            _add_counts(aggregate.stakeholder_counts, features.stakeholder_type, weight)
+
+            needle = theme.lower()
+            for phrase, phrase_lower in zip(features.key_phrases, phrases_lower):
+                if needle in phrase_lower:
+                    _add_counts(aggregate.quote_counts, phrase, weight)
+
+            if aggregate.count <= 0:
+                del self.themes[theme]
+
+    def remove(self, features: ResponseFeatures, cache_key: str, weight: int = 1) -> None:
+        """Retract a previously added response in place."""
+        self.add(features, cache_key, weight=-weight)
+
+    def merge(self, other: "QuestionAggregate") -> "QuestionAggregate":
+        """
+        Combine two aggregates for the same question.
+
+        Args:
+            other: Aggregate over a different set of responses
+
+        Returns:
+            New QuestionAggregate covering both inputs
+        """
+        if other.question_id != self.question_id:
+            raise ValueError(
+                f"Cannot merge aggregates for {self.question_id} and {other.question_id}"
+            )
+
+        themes = dict(self.themes)
+        for theme, aggregate in other.themes.items():
+            themes[theme] = themes[theme].merge(aggregate) if theme in themes else aggregate
+
+        return QuestionAggregate(
+            question_id=self.question_id,
+            question_text=self.question_text,
+            response_count=self.response_count + other.response_count,
+            actionable_count=self.actionable_count + other.actionable_count,
+            sentiment_counts=_merge_counts(self.sentiment_counts, other.sentiment_counts),
+            urgency_counts=_merge_counts(self.urgency_counts, other.urgency_counts),
+            stakeholder_counts=_merge_counts(self.stakeholder_counts, other.stakeholder_counts),
+            themes=themes,
+            response_keys=_merge_counts(self.response_keys, other.response_keys),
+            failed_keys=list(dict.fromkeys(self.failed_keys + other.failed_keys))
+        )
+
+    def question_themes(self) -> List[QuestionTheme]:
+        """
+        Build QuestionTheme objects from the aggregate state.
+
+        Returns:
+            List of QuestionTheme objects sorted by frequency
+        """
+        # Stable sort keeps first-appearance order for ties
+        ranked = sorted(self.themes.items(), key=lambda item: -item[1].count)
+
+        return [
+            QuestionTheme(
+                theme=theme,
+                count=aggregate.count,
+                percentage=(aggregate.count / self.response_count * 100) if self.response_count > 0 else 0,
+                representative_quotes=list(set(aggregate.quote_counts))[:5],
+                sentiment_distribution=dict(aggregate.sentiment_counts),
+                urgency_score=aggregate.urgency_half_units / (2 * aggregate.count),
+                stakeholder_breakdown=dict(aggregate.stakeholder_counts)
+            )
+            for theme, aggregate in ranked
+        ]
@@ -2,10 +2,12 @@
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from collections import defaultdict, Counter
+from typing import Dict, List, Optional, Any, Set, Tuple
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
 from datetime import datetime
-import statistics
 
 from openai import OpenAI, AzureOpenAI
 from pydantic import ValidationError
@@ -15,7 +17,9 @@ from rich.progress import track
 
 from ..config import settings
 from ..validation.audit import AuditLogger
+from ..validation.progress import StageProgress, get_progress_feed
 from ..llm.client import LLMClient
+from ..llm.scheduler import LLMScheduler
 from .models import (
     ResponseFeatures, 
     QuestionAnalysis, 
@@ -25,10 +29,28 @@ from .models import (
     UrgencyLevel
 )
 from .extractor import ResponseFeatureExtractor
+from .aggregation import ThemeMatrix, QuestionAggregate
+from .online import OnlineAggregator
+from .response_index import ResponseIndex
 
 console = Console()
 
 
+@dataclass
+class _QuestionPlan:
+    """Work left for a question after diffing against its aggregate state."""
+    question_id: str
+    question_text: str
+    analysis: Optional[QuestionAnalysis] = None
+    needs_update: bool = True
+    cached_analysis: Optional[QuestionAnalysis] = None
+    aggregate: Optional[QuestionAggregate] = None
+    failed_keys: Set[str] = field(default_factory=set)
+    added_count: int = 0
+    removed_count: int = 0
+    pending_responses: List[Tuple[Dict[str, Any], str]] = field(default_factory=list)
+
+
 class QuestionAnalyzer:
     """
     Analyzes all responses for a specific question to identify patterns and insights.
@@ -42,6 +64,13 @@ class QuestionAnalyzer:
         self.audit_logger = audit_logger or AuditLogger()
         self.feature_extractor = ResponseFeatureExtractor(audit_logger)
         
+        # Aggregates are updated as each response's features arrive
+        self.online = OnlineAggregator(self.audit_logger)
+        
+        # Counts extracted responses per question on the progress feed
+        # while analyze_all_questions runs
+        self.progress: Optional[StageProgress] = None
+        
         # Set up question analysis cache directory
         self.question_cache_dir = settings.data_dir / "features" / "questions"
         self.question_cache_dir.mkdir(exist_ok=True, parents=True)
@@ -50,21 +79,18 @@ class QuestionAnalyzer:
         self.llm_client = LLMClient(audit_logger=self.audit_logger)
         self.model = self.llm_client.model
     
-    def load_question_responses(self, question_id: str, all_responses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def load_question_responses(self, question_id: str, response_index: ResponseIndex) -> List[Dict[str, Any]]:
         """
         Load all responses for a specific question.
         
         Args:
             question_id: The question identifier
-            all_responses: All survey responses
+            response_index: Index of all survey responses
             
         Returns:
             List of responses for this question
         """
-        question_responses = [
-            resp for resp in all_responses 
-            if resp.get('question_id') == question_id and resp.get('text', '').strip()
-        ]
+        question_responses = response_index.for_question(question_id)
         
         self.audit_logger.log_operation(
             operation="load_question_responses",
@@ -116,64 +142,13 @@ class QuestionAnalyzer:
         Returns:
             List of QuestionTheme objects sorted by frequency
         """
-        # Count theme occurrences
-        theme_counter = Counter()
-        theme_sentiments = defaultdict(lambda: defaultdict(int))
-        theme_urgencies = defaultdict(list)
-        theme_stakeholders = defaultdict(lambda: defaultdict(int))
-        theme_quotes = defaultdict(list)
-        
-        for features in features_list:
-            for theme in features.themes:
-                theme_counter[theme] += 1
-                theme_sentiments[theme][features.sentiment] += 1
-                theme_urgencies[theme].append(features.urgency)
-                theme_stakeholders[theme][features.stakeholder_type] += 1
-                
-                # Collect representative quotes (key phrases)
-                for phrase in features.key_phrases:
-                    if theme.lower() in phrase.lower():
-                        theme_quotes[theme].append(phrase)
-        
-        # Build QuestionTheme objects
-        question_themes = []
-        total_responses = len(features_list)
-        
-        for theme, count in theme_counter.most_common():
-            # Calculate urgency score (high=1.0, medium=0.5, low=0.0)
-            urgency_scores = {
-                UrgencyLevel.high: 1.0,
-                UrgencyLevel.medium: 0.5,
-                UrgencyLevel.low: 0.0
-            }
-            avg_urgency = statistics.mean([
-                urgency_scores[u] for u in theme_urgencies[theme]
-            ])
-            
-            # Get top representative quotes (limit to 5)
-            quotes = list(set(theme_quotes[theme]))[:5]
-            
-            question_theme = QuestionTheme(
-                theme=theme,
-                count=count,
-                percentage=(count / total_responses * 100) if total_responses > 0 else 0,
-                representative_quotes=quotes,
-                sentiment_distribution=dict(theme_sentiments[theme]),
-                urgency_score=avg_urgency,
-                stakeholder_breakdown=dict(theme_stakeholders[theme])
-            )
-            
-            question_themes.append(question_theme)
-        
-        return question_themes
+        return ThemeMatrix(features_list).question_themes()
     
-    def identify_contradictions_and_consensus(self, features_list: List[ResponseFeatures],
-                                            themes: List[QuestionTheme]) -> Tuple[List[str], List[str]]:
+    def identify_contradictions_and_consensus(self, themes: List[QuestionTheme]) -> Tuple[List[str], List[str]]:
         """
         Identify areas of contradiction and consensus in responses.
         
         Args:
-            features_list: List of extracted features
             themes: Aggregated themes
             
         Returns:
@@ -214,14 +189,14 @@ class QuestionAnalyzer:
     
     def generate_insights_and_recommendations(self, question_text: str, 
                                             themes: List[QuestionTheme],
-                                            features_list: List[ResponseFeatures]) -> Tuple[List[str], List[str]]:
+                                            aggregate: QuestionAggregate) -> Tuple[List[str], List[str]]:
         """
         Generate key insights and recommendations using GPT-4.1.
         
         Args:
             question_text: The question being analyzed
             themes: Aggregated themes
-            features_list: All extracted features
+            aggregate: Aggregate state for the question's responses
             
         Returns:
             Tuple of (key_insights, recommendations)
@@ -237,9 +212,9 @@ class QuestionAnalyzer:
         ])
         
         # Count key statistics
-        total_responses = len(features_list)
-        high_urgency_count = sum(1 for f in features_list if f.urgency == UrgencyLevel.high)
-        actionable_count = sum(1 for f in features_list if f.contains_actionable_feedback)
+        total_responses = aggregate.response_count
+        high_urgency_count = aggregate.urgency_counts.get(UrgencyLevel.high, 0)
+        actionable_count = aggregate.actionable_count
         
         system_prompt = """You are a senior municipal policy analyst specializing in cultural funding.
 
@@ -279,7 +254,8 @@ Generate key insights and actionable recommendations based on this analysis."""
             response = self.llm_client.generate_response(
                 prompt=json_prompt,
                 instructions=system_prompt,
-                temperature=0.4
+                temperature=0.4,
+                question_id=aggregate.question_id
             )
             
             # Parse response
@@ -299,80 +275,191 @@ Generate key insights and actionable recommendations based on this analysis."""
             return [], []
     
     def analyze_question(self, question_id: str, question_text: str,
-                        all_responses: List[Dict[str, Any]]) -> Optional[QuestionAnalysis]:
+                        response_index: ResponseIndex) -> Optional[QuestionAnalysis]:
         """
         Perform complete analysis for a single question.
         
+        Aggregates are kept as a QuestionAggregate state next to the cached
+        analysis. On later runs only new or changed responses are folded in,
+        removed ones are retracted, and insights are regenerated only when the
+        top themes change.
+        
         Args:
             question_id: Unique identifier for the question
             question_text: Full text of the question
-            all_responses: All survey responses
+            response_index: Index of all survey responses
             
         Returns:
             QuestionAnalysis object with complete analysis
         """
-        # Check if already analyzed
-        cache_file = self.question_cache_dir / f"{question_id}_analysis.json"
-        if cache_file.exists():
-            console.print(f"[dim]Loading cached analysis for question {question_id}[/dim]")
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                return QuestionAnalysis(**data)
+        plan = self._plan_question(question_id, question_text, response_index)
+        if self.progress is not None:
+            self.progress.add_total(len(plan.pending_responses), group=question_id)
+        if plan.analysis is not None or not plan.needs_update:
+            return plan.analysis
         
-        console.print(f"\n[bold blue]Analyzing Question: {question_id}[/bold blue]")
-        console.print(f"[dim]{question_text}[/dim]")
+        self._start_online(plan)
+        if plan.pending_responses:
+            self._extract_pending_features(plan.pending_responses, question_text)
+        
+        return self._complete_question(plan)
+    
+    def _plan_question(self, question_id: str, question_text: str,
+                       response_index: ResponseIndex) -> "_QuestionPlan":
+        """
+        Diff a question's responses against its aggregate state.
+        
+        Returns:
+            Plan with the responses still to extract, or with the cached
+            analysis when nothing changed
+        """
+        cached_analysis = self.load_cached_analysis(question_id)
         
         # Load responses for this question
-        question_responses = self.load_question_responses(question_id, all_responses)
+        question_responses = self.load_question_responses(question_id, response_index)
         
         if not question_responses:
             console.print(f"[yellow]No responses found for question {question_id}[/yellow]")
-            return None
+            return _QuestionPlan(question_id, question_text, needs_update=False)
+        
+        # Diff current responses against the aggregate state by feature cache key
+        aggregate = self._load_aggregate(question_id, question_text)
+        response_keys = [
+            self.feature_extractor._generate_cache_key(resp['text'], question_text)
+            for resp in question_responses
+        ]
+        current_keys = Counter(response_keys)
+        failed_keys = set(aggregate.failed_keys) & set(current_keys)
+        added_keys = current_keys - Counter(aggregate.response_keys)
+        for key in failed_keys:
+            added_keys.pop(key, None)
+        removed_keys = Counter(aggregate.response_keys) - current_keys
+        
+        if cached_analysis and not added_keys and not removed_keys:
+            console.print(f"[dim]Loading cached analysis for question {question_id}[/dim]")
+            return _QuestionPlan(question_id, question_text, analysis=cached_analysis, needs_update=False)
         
-        # Extract features from all responses
-        features_list = self.extract_all_features(question_responses, question_text)
+        console.print(f"\n[bold blue]Analyzing Question: {question_id}[/bold blue]")
+        console.print(f"[dim]{question_text}[/dim]")
         
-        if not features_list:
-            console.print(f"[red]Failed to extract features for question {question_id}[/red]")
+        # Retract removed or changed responses using their cached features
+        for key, count in removed_keys.items():
+            features = self.feature_extractor._load_features_from_cache(key, question_id)
+            if features is None:
+                console.print("[yellow]Previous features unavailable, rebuilding aggregate[/yellow]")
+                aggregate = QuestionAggregate(question_id=question_id, question_text=question_text)
+                failed_keys = set()
+                added_keys = current_keys
+                break
+            aggregate.remove(features, key, weight=count)
+        
+        # Extract features for new or changed responses only
+        pending_keys = Counter(added_keys)
+        pending_responses = []
+        for resp, key in zip(question_responses, response_keys):
+            if pending_keys[key] > 0:
+                pending_keys[key] -= 1
+                pending_responses.append((resp, key))
+        
+        if pending_responses:
+            console.print(
+                f"[dim]Folding {len(pending_responses)} new or changed responses into "
+                f"{aggregate.response_count} aggregated responses[/dim]"
+            )
+        
+        return _QuestionPlan(
+            question_id, question_text,
+            cached_analysis=cached_analysis,
+            aggregate=aggregate,
+            failed_keys=failed_keys,
+            added_count=sum(added_keys.values()),
+            removed_count=sum(removed_keys.values()),
+            pending_responses=pending_responses
+        )
+    
+    def _start_online(self, plan: "_QuestionPlan") -> None:
+        """Open the plan's aggregate for online updates."""
+        # Failed extractions are not retried until the response text changes
+        self.online.start(plan.aggregate, expected=len(plan.pending_responses), failed_keys=plan.failed_keys)
+    
+    def _complete_question(self, plan: "_QuestionPlan") -> Optional[QuestionAnalysis]:
+        """Close the plan's online aggregate and finalize the question."""
+        # Every extracted response is already folded in
+        aggregate = self.online.finish(plan.question_id)
+        
+        self.audit_logger.log_operation(
+            operation="question_aggregate_update",
+            question_id=plan.question_id,
+            added_responses=plan.added_count,
+            removed_responses=plan.removed_count,
+            response_count=aggregate.response_count
+        )
+        
+        return self.finalize_question(aggregate, plan.cached_analysis)
+    
+    def load_cached_analysis(self, question_id: str) -> Optional[QuestionAnalysis]:
+        """The analysis saved by the previous run for a question, if any."""
+        cache_file = self.question_cache_dir / f"{question_id}_analysis.json"
+        if not cache_file.exists():
             return None
+        with open(cache_file, 'r') as f:
+            return QuestionAnalysis(**json.load(f))
+    
+    def finalize_question(self, aggregate: QuestionAggregate,
+                          cached_analysis: Optional[QuestionAnalysis] = None) -> Optional[QuestionAnalysis]:
+        """
+        Build, cache and display the analysis of a complete aggregate.
         
-        # Aggregate themes
-        themes = self.aggregate_themes(features_list)
+        Args:
+            aggregate: Aggregate state over all responses to the question
+            cached_analysis: Previous analysis, whose insights are reused
+                when the top themes are unchanged
+            
+        Returns:
+            QuestionAnalysis, or None if no response could be aggregated
+        """
+        question_id = aggregate.question_id
+        question_text = aggregate.question_text
+        cache_file = self.question_cache_dir / f"{question_id}_analysis.json"
         
-        # Calculate distributions
-        sentiment_dist = defaultdict(int)
-        urgency_dist = defaultdict(int)
-        stakeholder_dist = defaultdict(int)
+        if aggregate.response_count == 0:
+            console.print(f"[red]Failed to extract features for question {question_id}[/red]")
+            return None
         
-        for features in features_list:
-            sentiment_dist[features.sentiment] += 1
-            urgency_dist[features.urgency] += 1
-            stakeholder_dist[features.stakeholder_type] += 1
+        # Build themes and distributions from the aggregate state
+        themes = aggregate.question_themes()
         
         # Identify contradictions and consensus
-        contradictions, consensus = self.identify_contradictions_and_consensus(features_list, themes)
-        
-        # Generate insights and recommendations
-        insights, recommendations = self.generate_insights_and_recommendations(
-            question_text, themes, features_list
-        )
+        contradictions, consensus = self.identify_contradictions_and_consensus(themes)
+        
+        # Regenerate insights only when the top themes changed
+        top_themes = [theme.theme for theme in themes[:15]]
+        if cached_analysis and top_themes == [theme.theme for theme in cached_analysis.dominant_themes[:15]]:
+            console.print("[dim]Top themes unchanged, reusing cached insights[/dim]")
+            insights = cached_analysis.key_insights
+            recommendations = cached_analysis.recommendations
+        else:
+            insights, recommendations = self.generate_insights_and_recommendations(
+                question_text, themes, aggregate
+            )
         
         # Create QuestionAnalysis object
         analysis = QuestionAnalysis(
             question_id=question_id,
             question_text=question_text,
-            response_count=len(features_list),
+            response_count=aggregate.response_count,
             dominant_themes=themes[:20],  # Top 20 themes
-            sentiment_distribution=dict(sentiment_dist),
-            urgency_distribution=dict(urgency_dist),
-            stakeholder_distribution=dict(stakeholder_dist),
+            sentiment_distribution=dict(aggregate.sentiment_counts),
+            urgency_distribution=dict(aggregate.urgency_counts),
+            stakeholder_distribution=dict(aggregate.stakeholder_counts),
             key_insights=insights,
             recommendations=recommendations,
             contradictions=contradictions,
             consensus_points=consensus
         )
         
-        # Save to cache
+        # Save aggregate state and analysis to cache
+        self._save_aggregate(aggregate)
         with open(cache_file, 'w') as f:
             json.dump(analysis.model_dump(), f, indent=2)
         
@@ -389,6 +476,54 @@ Generate key insights and actionable recommendations based on this analysis."""
         
         return analysis
     
+    def _extract_pending_features(self, pending_responses: List[Tuple[Dict[str, Any], str]],
+                                  question_text: str) -> None:
+        """
+        Extract features for responses that are not yet aggregated and fold
+        each one into the question's online aggregate.
+        
+        Args:
+            pending_responses: (response, feature cache key) pairs
+            question_text: The full question text
+        """
+        extracted: Dict[str, Optional[ResponseFeatures]] = {}
+        
+        for response, key in track(pending_responses, description="Extracting features"):
+            if key not in extracted:
+                extracted[key] = self.feature_extractor.extract_features(
+                    response=response['text'],
+                    question=question_text,
+                    response_id=response['id'],
+                    question_id=response['question_id']
+                )
+            
+            features = extracted[key]
+            if features:
+                self.online.add(response['question_id'], features, key)
+            else:
+                self.online.fail(response['question_id'], key)
+            if self.progress is not None:
+                self.progress.advance(group=response['question_id'], failed=not features)
+    
+    def _load_aggregate(self, question_id: str, question_text: str) -> QuestionAggregate:
+        """Load the aggregate state for a question, or start an empty one."""
+        state_file = self.question_cache_dir / f"{question_id}_state.json"
+        
+        if state_file.exists():
+            with open(state_file, 'r') as f:
+                aggregate = QuestionAggregate(**json.load(f))
+            if aggregate.question_text == question_text:
+                return aggregate
+        
+        return QuestionAggregate(question_id=question_id, question_text=question_text)
+    
+    def _save_aggregate(self, aggregate: QuestionAggregate) -> None:
+        """Persist the aggregate state for incremental updates."""
+        state_file = self.question_cache_dir / f"{aggregate.question_id}_state.json"
+        
+        with open(state_file, 'w') as f:
+            json.dump(aggregate.model_dump(mode='json'), f)
+    
     def _display_analysis_summary(self, analysis: QuestionAnalysis) -> None:
         """Display a summary of the question analysis."""
         console.print(f"\n[bold green]Analysis Complete for {analysis.question_id}[/bold green]")
@@ -423,13 +558,17 @@ Generate key insights and actionable recommendations based on this analysis."""
             console.print(f"{i}. {theme.theme} ({theme.count} mentions, {theme.percentage:.1f}%)")
     
     def analyze_all_questions(self, questions: List[Dict[str, str]], 
-                            all_responses: List[Dict[str, Any]]) -> List[QuestionAnalysis]:
+                            response_index: ResponseIndex,
+                            scheduler: Optional[LLMScheduler] = None) -> List[QuestionAnalysis]:
         """
         Analyze all questions in the survey.
         
         Args:
             questions: List of question dictionaries with 'id' and 'text'
-            all_responses: All survey responses
+            response_index: Index of all survey responses
+            scheduler: Shared LLM scheduler; extractions of all questions are
+                then queued at once, and each question's aggregation and
+                insight call starts as soon as its own features are in
             
         Returns:
             List of QuestionAnalysis objects
@@ -438,16 +577,83 @@ Generate key insights and actionable recommendations based on this analysis."""
         
         console.print(f"\n[bold]Analyzing {len(questions)} questions...[/bold]")
         
-        for question in questions:
-            analysis = self.analyze_question(
-                question_id=question['id'],
-                question_text=question['text'],
-                all_responses=all_responses
-            )
-            
-            if analysis:
-                analyses.append(analysis)
+        with get_progress_feed().stage("question_analysis") as self.progress:
+            try:
+                if scheduler is not None:
+                    analyses = [
+                        analysis
+                        for analysis in self._analyze_questions_scheduled(questions, response_index, scheduler)
+                        if analysis
+                    ]
+                else:
+                    for question in questions:
+                        analysis = self.analyze_question(
+                            question_id=question['id'],
+                            question_text=question['text'],
+                            response_index=response_index
+                        )
+                        
+                        if analysis:
+                            analyses.append(analysis)
+            finally:
+                self.progress = None
         
         console.print(f"\n[bold green]✓ Completed analysis for {len(analyses)} questions[/bold green]")
         
-        return analyses
\ No newline at end of file
+        return analyses
+    
+    def _analyze_questions_scheduled(self, questions: List[Dict[str, str]], response_index: ResponseIndex,
+                                     scheduler: LLMScheduler) -> List[Optional[QuestionAnalysis]]:
+        """Queue every question's extractions and, once they are done, its completion."""
+        futures = []
+        
+        for question in questions:
+            plan = self._plan_question(question['id'], question['text'], response_index)
+            self.progress.add_total(len(plan.pending_responses), group=question['id'])
+            if plan.analysis is not None or not plan.needs_update:
+                futures.append(scheduler.when_all([], lambda analysis: analysis, plan.analysis,
+                                                  group=question['id']))
+                continue
+            
+            self._start_online(plan)
+            extractions = [
+                scheduler.submit(
+                    self.feature_extractor.extract_features,
+                    response=resp['text'],
+                    question=question['text'],
+                    response_id=resp['id'],
+                    question_id=question['id'],
+                    group=question['id'],
+                    key=key
+                )
+                for resp, key in plan.pending_responses
+            ]
+            # Fold each response in as its extraction finishes; these callbacks
+            # are registered first, so they run before the completion is queued
+            for (_, key), extraction in zip(plan.pending_responses, extractions):
+                extraction.add_done_callback(partial(self._fold_extraction, question['id'], key))
+            futures.append(scheduler.when_all(
+                extractions, self._complete_question, plan, group=question['id']
+            ))
+        
+        return [future.result() for future in futures]
+    
+    def _fold_extraction(self, question_id: str, key: str, extraction: Future) -> None:
+        """Add a finished extraction to the question's online aggregate."""
+        if extraction.cancelled():
+            return  # The scheduler was shut down after an error
+        error = extraction.exception()
+        if error is not None:
+            self.audit_logger.log_error(
+                operation="extract_features",
+                error_type=type(error).__name__,
+                error_message=str(error),
+                context={"question_id": question_id}
+            )
+        features = extraction.result() if error is None else None
+        if features:
+            self.online.add(question_id, features, key)
+        else:
+            self.online.fail(question_id, key)
+        if self.progress is not None:
+            self.progress.advance(group=question_id, failed=not features)
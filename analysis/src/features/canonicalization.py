@@ -0,0 +1,250 @@
+"""Theme canonicalization for merging free-form LLM themes across questions."""
+
+import json
+import re
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+
+
+# Function words that do not change what a theme is about
+STOPWORDS = {
+    "a", "an", "and", "the", "to", "of", "for", "in", "on", "with", "by",
+    "at", "from", "or", "into", "about", "more", "better"
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class ThemeCanonicalizer:
+    """
+    Maps free-form theme strings onto canonical theme names.
+
+    Canonicalization runs in three passes:
+    1. Exact lookup in a persistent alias table shared across runs
+    2. An order-insensitive token key, so "funding access" and
+       "access to funding" merge without any similarity computation
+    3. Character n-gram TF-IDF similarity for the remaining new keys.
+       Candidate pairs come from a blocking index over informative n-grams,
+       so only strings sharing a rare n-gram are ever compared.
+    Candidate pairs above the similarity threshold are clustered with
+    connected components, and the result is written back to the alias table.
+    """
+
+    def __init__(self, audit_logger: Optional[AuditLogger] = None,
+                 alias_file: Optional[Path] = None,
+                 similarity_threshold: Optional[float] = None,
+                 max_block_size: int = 200):
+        """
+        Initialize the canonicalizer and load the alias table.
+
+        Args:
+            audit_logger: Audit logger for lineage
+            alias_file: Path of the persistent alias table
+            similarity_threshold: Minimum cosine similarity for a fuzzy merge
+            max_block_size: N-grams shared by more keys than this are too
+                common to be used for candidate blocking
+        """
+        self.audit_logger = audit_logger or AuditLogger()
+        self.alias_file = alias_file or settings.data_dir / "features" / "themes" / "theme_aliases.json"
+        self.similarity_threshold = (
+            similarity_threshold if similarity_threshold is not None
+            else settings.theme_similarity_threshold
+        )
+        self.max_block_size = max_block_size
+
+        # normalized theme -> canonical theme
+        self.aliases: Dict[str, str] = {}
+        # token key -> canonical theme
+        self.key_index: Dict[str, str] = {}
+        self._load_aliases()
+
+    @staticmethod
+    def normalize(theme: str) -> str:
+        """Normalize case, separators and whitespace."""
+        normalized = theme.lower().strip().replace('-', ' ').replace('_', ' ')
+        return ' '.join(normalized.split())
+
+    @staticmethod
+    def token_key(normalized: str) -> str:
+        """Order-insensitive key without stopwords or simple plurals."""
+        tokens = set()
+        for token in TOKEN_PATTERN.findall(normalized):
+            if token in STOPWORDS:
+                continue
+            if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+                token = token[:-1]
+            tokens.add(token)
+        return ' '.join(sorted(tokens)) or normalized
+
+    def canonicalize(self, theme: str) -> str:
+        """
+        Canonicalize a single theme using only the existing alias table.
+
+        Args:
+            theme: Raw theme string
+
+        Returns:
+            Canonical theme name, or the normalized theme if it is unknown
+        """
+        normalized = self.normalize(theme)
+        if normalized in self.aliases:
+            return self.aliases[normalized]
+        return self.key_index.get(self.token_key(normalized), normalized)
+
+    def canonicalize_many(self, themes: Iterable[str]) -> Dict[str, str]:
+        """
+        Canonicalize a batch of themes, clustering any new ones.
+
+        Args:
+            themes: Raw theme strings; repeats count towards choosing the
+                canonical name of a new cluster
+
+        Returns:
+            Dictionary mapping each raw theme to its canonical name
+        """
+        raw_counts = Counter(themes)
+        normalized_counts: Counter = Counter()
+        for theme, count in raw_counts.items():
+            normalized_counts[self.normalize(theme)] += count
+
+        new_themes = [t for t in normalized_counts if t not in self.aliases]
+
+        if new_themes:
+            # Pass 2: exact token key matches against known canonicals
+            unmatched: Dict[str, List[str]] = {}
+            for normalized in new_themes:
+                key = self.token_key(normalized)
+                if key in self.key_index:
+                    self.aliases[normalized] = self.key_index[key]
+                else:
+                    unmatched.setdefault(key, []).append(normalized)
+
+            # Pass 3: fuzzy clustering of keys not seen before
+            if unmatched:
+                self._cluster_new_keys(unmatched, normalized_counts)
+
+            self._save_aliases()
+
+            self.audit_logger.log_operation(
+                operation="theme_canonicalization",
+                input_themes=len(raw_counts),
+                new_themes=len(new_themes),
+                canonical_themes=len(set(self.key_index.values())),
+                alias_count=len(self.aliases)
+            )
+
+        return {theme: self.aliases[self.normalize(theme)] for theme in raw_counts}
+
+    def _cluster_new_keys(self, unmatched: Dict[str, List[str]],
+                          normalized_counts: Counter) -> None:
+        """Cluster new token keys with each other and with known canonicals."""
+        known_keys = list(self.key_index)
+        new_keys = list(unmatched)
+        keys = known_keys + new_keys
+        n_known = len(known_keys)
+
+        pairs = self._candidate_pairs(keys, n_known)
+        n_components, labels = connected_components(
+            sparse.coo_matrix(
+                (np.ones(len(pairs[0])), pairs), shape=(len(keys), len(keys))
+            ),
+            directed=False
+        )
+
+        # Known keys keep their canonical; otherwise the most frequent surface form wins
+        component_canonical: Dict[int, str] = {}
+        for idx in range(n_known):
+            component_canonical.setdefault(labels[idx], self.key_index[keys[idx]])
+
+        component_members: Dict[int, List[str]] = {}
+        for idx in range(n_known, len(keys)):
+            component_members.setdefault(labels[idx], []).extend(unmatched[keys[idx]])
+
+        for label, members in component_members.items():
+            if label not in component_canonical:
+                component_canonical[label] = min(
+                    members, key=lambda t: (-normalized_counts[t], len(t), t)
+                )
+
+        for idx in range(n_known, len(keys)):
+            canonical = component_canonical[labels[idx]]
+            self.key_index[keys[idx]] = canonical
+            for normalized in unmatched[keys[idx]]:
+                self.aliases[normalized] = canonical
+
+    def _candidate_pairs(self, keys: List[str], n_known: int) -> tuple:
+        """
+        Find key pairs above the similarity threshold.
+
+        Only pairs that share an informative character n-gram are scored, and
+        pairs of two already-known keys are skipped.
+
+        Returns:
+            Tuple of (row indices, column indices) of matching pairs
+        """
+        empty = (np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+        if len(keys) < 2:
+            return empty
+
+        vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 4), sublinear_tf=True)
+        try:
+            tfidf = vectorizer.fit_transform(keys).tocsr()
+        except ValueError:
+            # Every key is shorter than the n-gram size
+            return empty
+
+        # Blocking index: n-grams shared by at least two, but not too many, keys
+        doc_freq = np.bincount(tfidf.indices, minlength=tfidf.shape[1])
+        block_cols = np.flatnonzero((doc_freq >= 2) & (doc_freq <= self.max_block_size))
+        if len(block_cols) == 0:
+            return empty
+
+        blocks = tfidf[:, block_cols]
+        blocks.data[:] = 1
+        candidates = sparse.triu(blocks @ blocks.T, k=1).tocoo()
+
+        rows, cols = candidates.row, candidates.col
+        keep = cols >= n_known  # at least one side is a new key
+        rows, cols = rows[keep], cols[keep]
+        if len(rows) == 0:
+            return empty
+
+        similarity = np.asarray(tfidf[rows].multiply(tfidf[cols]).sum(axis=1)).ravel()
+        matched = similarity >= self.similarity_threshold
+
+        return rows[matched], cols[matched]
+
+    def _load_aliases(self) -> None:
+        """Load the alias table from disk."""
+        if not self.alias_file.exists():
+            return
+
+        with open(self.alias_file, 'r') as f:
+            data = json.load(f)
+
+        self.aliases = data.get('aliases', {})
+        for normalized, canonical in self.aliases.items():
+            self.key_index.setdefault(self.token_key(normalized), canonical)
+
+    def _save_aliases(self) -> None:
+        """Persist the alias table for reuse across runs."""
+        self.alias_file.parent.mkdir(exist_ok=True, parents=True)
+
+        data = {
+            'updated_at': datetime.now().isoformat(),
+            'canonical_count': len(set(self.aliases.values())),
+            'aliases': self.aliases
+        }
+
+        with open(self.alias_file, 'w') as f:
+            json.dump(data, f, indent=2)
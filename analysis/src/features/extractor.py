@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import hashlib
+import threading
+import time
 
 from openai import OpenAI, AzureOpenAI
 from pydantic import ValidationError
@@ -46,6 +48,11 @@ class ResponseFeatureExtractor:
         # Initialize LLM client (handles Azure OpenAI automatically)
         self.llm_client = LLMClient(audit_logger=self.audit_logger)
         self.model = self.llm_client.model
+        
+        # Cache hits are reported as a running count, not one line per response
+        self._cache_hits = 0
+        self._last_cache_notice = 0.0
+        self._cache_notice_lock = threading.Lock()
     
     def _generate_cache_key(self, response_text: str, question_text: str) -> str:
         """Generate a unique cache key for a response."""
@@ -117,6 +124,17 @@ class ResponseFeatureExtractor:
         
         return None
     
+    def _note_cache_hit(self) -> None:
+        """Print the number of cached responses used, at most every `settings.progress_interval` seconds."""
+        with self._cache_notice_lock:
+            self._cache_hits += 1
+            now = time.monotonic()
+            if now - self._last_cache_notice < settings.progress_interval:
+                return
+            self._last_cache_notice = now
+            hits = self._cache_hits
+        console.print(f"[dim]Using cached features ({hits} responses so far)[/dim]")
+    
     def extract_features(self, response: str, question: str, response_id: str,
                         question_id: str) -> Optional[ResponseFeatures]:
         """
@@ -135,7 +153,7 @@ class ResponseFeatureExtractor:
         cache_key = self._generate_cache_key(response, question)
         cached_features = self._load_features_from_cache(cache_key, question_id)
         if cached_features:
-            console.print(f"[dim]Using cached features for {response_id} (key: {cache_key[:8]}...)[/dim]")
+            self._note_cache_hit()
             return cached_features
         
         if not self.llm_client.client:
@@ -184,11 +202,13 @@ Extract comprehensive features following the schema."""
             schema_prompt = f"\n\nPlease respond with a valid JSON object that matches this schema:\n{json.dumps(ResponseFeatures.model_json_schema(), indent=2)}"
             
             # Use LLMClient with structured output format
+            started = time.perf_counter()
             response = self.llm_client.generate_response(
                 prompt=user_prompt + schema_prompt,
                 instructions=system_prompt,
                 temperature=0.3,
-                response_format=ResponseFeatures
+                response_format=ResponseFeatures,
+                question_id=question_id
             )
             
             # Parse the structured response
@@ -206,7 +226,8 @@ Extract comprehensive features following the schema."""
                 themes_count=len(features.themes),
                 sentiment=features.sentiment.value,
                 urgency=features.urgency.value,
-                tokens_used=response.tokens_used
+                tokens_used=response.tokens_used,
+                duration_ms=round((time.perf_counter() - started) * 1000, 1)
             )
             
             return features
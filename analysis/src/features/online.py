@@ -0,0 +1,245 @@
+"""Online question aggregation with periodic snapshots."""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ..config import settings
+from ..quantitative.metrics import MetricsCalculator
+from ..validation.audit import AuditLogger
+from .aggregation import QuestionAggregate
+from .models import ResponseFeatures
+
+
+class ProportionEstimate(BaseModel):
+    """Share of aggregated responses in one category, with a Wilson interval."""
+    label: str
+    count: int
+    proportion: float
+    ci_lower: float
+    ci_upper: float
+
+
+class AggregateSnapshot(BaseModel):
+    """Point-in-time view of a question's aggregate while features arrive."""
+    question_id: str
+    question_text: str
+    timestamp: str
+    final: bool = False
+    response_count: int
+    # Responses of this run whose extraction failed
+    failed_count: int
+    # Responses expected in this run (already aggregated + still pending)
+    expected_count: Optional[int] = None
+    confidence_level: float
+    sentiment: List[ProportionEstimate] = Field(default_factory=list)
+    urgency: List[ProportionEstimate] = Field(default_factory=list)
+    stakeholders: List[ProportionEstimate] = Field(default_factory=list)
+    actionable: Optional[ProportionEstimate] = None
+    themes: List[ProportionEstimate] = Field(default_factory=list)
+
+    @property
+    def progress(self) -> Optional[float]:
+        """Share of expected responses processed so far."""
+        if not self.expected_count:
+            return None
+        return min((self.response_count + self.failed_count) / self.expected_count, 1.0)
+
+
+class _Tracked:
+    __slots__ = ("aggregate", "failed", "failed_keys", "expected", "published_at", "dirty")
+
+    def __init__(self, aggregate: QuestionAggregate, expected: Optional[int], failed_keys: Iterable[str]):
+        self.aggregate = aggregate
+        self.failed = 0
+        self.failed_keys = set(failed_keys)
+        self.expected = expected
+        self.published_at = time.monotonic()
+        self.dirty = False
+
+
+class OnlineAggregator:
+    """
+    Folds features into question aggregates as each extraction finishes.
+
+    Every `add` is a constant-time update of the counts in the question's
+    QuestionAggregate (see `QuestionAggregate.add`), so when the last
+    response is in, the aggregate is complete and the question can be
+    finalized without a batch aggregation pass.
+
+    While a question is open, a snapshot of its proportions with Wilson
+    confidence intervals is published at most every
+    `settings.aggregate_snapshot_interval` seconds to
+    `<data_dir>/features/snapshots/<question_id>.json` and the audit log,
+    so partial results can be read while a long extraction is running.
+    Updates may come from several threads.
+    """
+
+    def __init__(self, audit_logger: Optional[AuditLogger] = None,
+                 snapshot_dir: Optional[Path] = None,
+                 snapshot_interval: Optional[float] = None):
+        """
+        Set up the aggregator.
+
+        Args:
+            audit_logger: Audit logger for published snapshots
+            snapshot_dir: Directory for snapshot files
+            snapshot_interval: Minimum seconds between snapshots of a question
+                (0 disables periodic snapshots; final ones are always written)
+        """
+        self.audit_logger = audit_logger or AuditLogger()
+        self.snapshot_dir = Path(snapshot_dir or settings.data_dir / "features" / "snapshots")
+        self.snapshot_interval = (
+            settings.aggregate_snapshot_interval if snapshot_interval is None else snapshot_interval
+        )
+        self._tracked: Dict[str, _Tracked] = {}
+        self._lock = threading.Lock()
+
+    def start(self, aggregate: QuestionAggregate, expected: Optional[int] = None,
+              failed_keys: Iterable[str] = ()) -> None:
+        """
+        Open a question; later updates modify `aggregate` in place.
+
+        Args:
+            aggregate: Aggregate state to extend (e.g. the previous run's)
+            expected: Responses still to be added or failed in this run
+            failed_keys: Earlier failures that still apply; new failures are
+                added to them
+        """
+        with self._lock:
+            if expected is not None:
+                expected += aggregate.response_count
+            self._tracked[aggregate.question_id] = _Tracked(aggregate, expected, failed_keys)
+
+    def add(self, question_id: str, features: ResponseFeatures, cache_key: str) -> None:
+        """Fold one response's features into an open question."""
+        with self._lock:
+            tracked = self._tracked[question_id]
+            tracked.aggregate.add(features, cache_key)
+            tracked.dirty = True
+            snapshot = self._due_snapshot(tracked)
+        if snapshot:
+            self._publish(snapshot)
+
+    def fail(self, question_id: str, cache_key: str) -> None:
+        """Record a response whose features could not be extracted."""
+        with self._lock:
+            tracked = self._tracked[question_id]
+            tracked.failed += 1
+            tracked.failed_keys.add(cache_key)
+            tracked.dirty = True
+            snapshot = self._due_snapshot(tracked)
+        if snapshot:
+            self._publish(snapshot)
+
+    def aggregate(self, question_id: str) -> QuestionAggregate:
+        """The live aggregate of an open question."""
+        return self._tracked[question_id].aggregate
+
+    def snapshot(self, question_id: str, final: bool = False) -> AggregateSnapshot:
+        """Current proportions of an open question."""
+        with self._lock:
+            return self._snapshot(self._tracked[question_id], final)
+
+    def finish(self, question_id: str) -> QuestionAggregate:
+        """
+        Close a question and publish its final snapshot.
+
+        Returns:
+            The complete aggregate
+        """
+        with self._lock:
+            tracked = self._tracked.pop(question_id)
+            tracked.aggregate.failed_keys = sorted(tracked.failed_keys)
+            snapshot = self._snapshot(tracked, final=True)
+        self._publish(snapshot)
+        return tracked.aggregate
+
+    def _due_snapshot(self, tracked: _Tracked) -> Optional[AggregateSnapshot]:
+        """Snapshot to publish if the interval has passed (caller holds the lock)."""
+        if not self.snapshot_interval:
+            return None
+        now = time.monotonic()
+        if not tracked.dirty or now - tracked.published_at < self.snapshot_interval:
+            return None
+        tracked.published_at = now
+        tracked.dirty = False
+        return self._snapshot(tracked, final=False)
+
+    def _snapshot(self, tracked: _Tracked, final: bool) -> AggregateSnapshot:
+        aggregate = tracked.aggregate
+        n = aggregate.response_count
+        top_themes = sorted(aggregate.themes.items(), key=lambda item: -item[1].count)[:settings.max_themes]
+
+        return AggregateSnapshot(
+            question_id=aggregate.question_id,
+            question_text=aggregate.question_text,
+            timestamp=datetime.now().isoformat(),
+            final=final,
+            response_count=n,
+            failed_count=tracked.failed,
+            expected_count=tracked.expected,
+            confidence_level=settings.confidence_level,
+            sentiment=self._estimates(aggregate.sentiment_counts, n),
+            urgency=self._estimates(aggregate.urgency_counts, n),
+            stakeholders=self._estimates(aggregate.stakeholder_counts, n),
+            actionable=self._estimate("actionable", aggregate.actionable_count, n),
+            themes=[self._estimate(theme, theme_aggregate.count, n) for theme, theme_aggregate in top_themes]
+        )
+
+    @classmethod
+    def _estimates(cls, counts: Dict[Any, int], n: int) -> List[ProportionEstimate]:
+        return [
+            cls._estimate(getattr(label, "value", str(label)), count, n)
+            for label, count in sorted(counts.items(), key=lambda item: -item[1])
+        ]
+
+    @staticmethod
+    def _estimate(label: str, count: int, n: int) -> ProportionEstimate:
+        ci_lower, ci_upper = MetricsCalculator.calculate_proportion_ci(
+            count, n, confidence=settings.confidence_level
+        )
+        return ProportionEstimate(
+            label=label,
+            count=count,
+            proportion=count / n if n else 0.0,
+            ci_lower=float(ci_lower),
+            ci_upper=float(ci_upper)
+        )
+
+    def _publish(self, snapshot: AggregateSnapshot) -> None:
+        """Write the snapshot file atomically and log it."""
+        self.snapshot_dir.mkdir(exist_ok=True, parents=True)
+        path = self.snapshot_dir / f"{snapshot.question_id}.json"
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(snapshot.model_dump_json(indent=2))
+        os.replace(tmp_path, path)
+
+        self.audit_logger.log_operation(
+            operation="aggregate_snapshot",
+            question_id=snapshot.question_id,
+            final=snapshot.final,
+            response_count=snapshot.response_count,
+            failed_count=snapshot.failed_count,
+            expected_count=snapshot.expected_count,
+            top_themes=[theme.label for theme in snapshot.themes[:5]]
+        )
+
+
+def load_snapshots(snapshot_dir: Optional[Path] = None) -> List[AggregateSnapshot]:
+    """Latest published snapshot of every question, ordered by question id."""
+    snapshot_dir = Path(snapshot_dir or settings.data_dir / "features" / "snapshots")
+    if not snapshot_dir.exists():
+        return []
+    snapshots = []
+    for path in sorted(snapshot_dir.glob("*.json")):
+        with open(path, 'r') as f:
+            snapshots.append(AggregateSnapshot(**json.load(f)))
+    return snapshots
@@ -1,10 +1,10 @@
 """Program-specific analyzer for extracting targeted feedback on cultural programs."""
 
 import json
-import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
 from collections import defaultdict, Counter
+from concurrent.futures import Future
 from datetime import datetime
 
 from openai import OpenAI, AzureOpenAI
@@ -15,7 +15,9 @@ from rich.progress import track
 
 from ..config import settings
 from ..validation.audit import AuditLogger
+from ..validation.progress import StageProgress, get_progress_feed
 from ..llm.client import LLMClient
+from ..llm.scheduler import LLMScheduler
 from .models import (
     ProgramFeedback,
     ResponseFeatures,
@@ -23,6 +25,7 @@ from .models import (
     StakeholderType
 )
 from .extractor import ResponseFeatureExtractor
+from .response_index import ResponseIndex, build_program_tagger
 
 console = Console()
 
@@ -61,36 +64,11 @@ class ProgramAnalyzer:
         self.model = self.llm_client.model
         
         # Create program name variations for matching
-        self._create_program_patterns()
+        self._create_program_tagger()
     
-    def _create_program_patterns(self) -> None:
-        """Create regex patterns for program name matching."""
-        self.program_patterns = {}
-        
-        for program in self.CULTURAL_PROGRAMS:
-            # Create pattern that matches various forms of the program name
-            # Handle acronyms, partial matches, and common variations
-            pattern_parts = []
-            
-            # Full name
-            pattern_parts.append(re.escape(program))
-            
-            # Acronym (if multi-word)
-            words = program.split()
-            if len(words) > 1:
-                acronym = ''.join(w[0].upper() for w in words if w[0].isupper())
-                if acronym:
-                    pattern_parts.append(acronym)
-            
-            # Common variations
-            if "Assistance" in program:
-                pattern_parts.append(program.replace("Assistance", "Assist"))
-            if "Program" in program:
-                pattern_parts.append(program.replace("Program", ""))
-            
-            # Create case-insensitive pattern
-            pattern = r'\b(' + '|'.join(pattern_parts) + r')\b'
-            self.program_patterns[program] = re.compile(pattern, re.IGNORECASE)
+    def _create_program_tagger(self) -> None:
+        """Compile program names and their variations into one tagger."""
+        self.program_tagger = build_program_tagger(self.CULTURAL_PROGRAMS)
     
     def identify_program_mentions(self, response_text: str) -> List[str]:
         """
@@ -102,39 +80,32 @@ class ProgramAnalyzer:
         Returns:
             List of program names mentioned
         """
-        mentioned_programs = []
-        
-        for program, pattern in self.program_patterns.items():
-            if pattern.search(response_text):
-                mentioned_programs.append(program)
-        
-        return mentioned_programs
+        return self.program_tagger.tag(response_text)
     
     def extract_program_specific_feedback(self, program_name: str, 
-                                        responses_with_features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                                        response_index: ResponseIndex,
+                                        features_by_id: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Extract responses that mention a specific program.
         
         Args:
             program_name: Name of the program
-            responses_with_features: List of responses with extracted features
+            response_index: Response index with program mention partitions
+            features_by_id: Extracted features keyed by response ID
             
         Returns:
             List of responses mentioning the program
         """
         program_responses = []
         
-        for resp_data in responses_with_features:
-            response_text = resp_data.get('text', '')
-            features = resp_data.get('features')
-            
-            # Check if program is mentioned
-            if self.program_patterns[program_name].search(response_text):
+        for resp in response_index.for_program(program_name):
+            features = features_by_id.get(resp['id'])
+            if features:
                 program_responses.append({
-                    'response_id': resp_data['response_id'],
-                    'text': response_text,
+                    'response_id': resp['id'],
+                    'text': resp['text'],
                     'features': features,
-                    'question_id': resp_data.get('question_id')
+                    'question_id': resp.get('question_id')
                 })
         
         return program_responses
@@ -222,37 +193,45 @@ Analyze this feedback and provide structured insights about the program."""
             List of representative quotes
         """
         quotes = []
+        program_id = self.program_tagger.tags.index(program_name)
         
         for resp in program_responses:
             text = resp['text']
+            mention_starts = [
+                start for tag_id, start, _ in self.program_tagger.find(text)
+                if tag_id == program_id
+            ]
             
             # Find sentences containing program name
-            sentences = text.split('.')
-            for sentence in sentences:
-                if self.program_patterns[program_name].search(sentence):
+            sentence_start = 0
+            for sentence in text.split('.'):
+                sentence_end = sentence_start + len(sentence)
+                if any(sentence_start <= start < sentence_end for start in mention_starts):
                     quote = sentence.strip()
                     if 20 < len(quote) < 200:  # Reasonable quote length
                         quotes.append(quote)
+                sentence_start = sentence_end + 1
         
         # Deduplicate and limit
         unique_quotes = list(set(quotes))[:10]
         
         return unique_quotes
     
-    def analyze_program(self, program_name: str,
-                       all_responses_with_features: List[Dict[str, Any]]) -> Optional[ProgramFeedback]:
+    def analyze_program(self, program_name: str, response_index: ResponseIndex,
+                       features_by_id: Dict[str, Dict[str, Any]]) -> Optional[ProgramFeedback]:
         """
         Perform complete analysis for a single program.
         
         Args:
             program_name: Name of the program to analyze
-            all_responses_with_features: All survey responses with extracted features
+            response_index: Response index with program mention partitions
+            features_by_id: Extracted features keyed by response ID
             
         Returns:
             ProgramFeedback object with analysis results
         """
         # Check cache
-        cache_file = self.program_cache_dir / f"{program_name.replace(' ', '_').lower()}_analysis.json"
+        cache_file = self._program_cache_file(program_name)
         if cache_file.exists():
             console.print(f"[dim]Loading cached analysis for {program_name}[/dim]")
             with open(cache_file, 'r') as f:
@@ -263,7 +242,7 @@ Analyze this feedback and provide structured insights about the program."""
         
         # Extract program-specific responses
         program_responses = self.extract_program_specific_feedback(
-            program_name, all_responses_with_features
+            program_name, response_index, features_by_id
         )
         
         if not program_responses:
@@ -355,33 +334,40 @@ Analyze this feedback and provide structured insights about the program."""
             for i, area in enumerate(feedback.improvement_areas[:3], 1):
                 console.print(f"{i}. {area}")
     
-    def analyze_all_programs(self, all_responses: List[Dict[str, Any]]) -> Dict[str, ProgramFeedback]:
+    def analyze_all_programs(self, response_index: ResponseIndex,
+                             features_by_id: Optional[Dict[str, Dict[str, Any]]] = None,
+                             scheduler: Optional[LLMScheduler] = None) -> Dict[str, ProgramFeedback]:
         """
         Analyze all cultural programs.
         
         Args:
-            all_responses: All survey responses with text and metadata
+            response_index: Index of all survey responses, partitioned by program mention
+            features_by_id: Features of the program-mentioning responses, when
+                already extracted (e.g. by the streaming pipeline)
+            scheduler: Shared LLM scheduler; each program's theme analysis
+                then starts as soon as its own responses are extracted
             
         Returns:
             Dictionary mapping program names to ProgramFeedback objects
         """
         console.print(f"\n[bold]Analyzing {len(self.CULTURAL_PROGRAMS)} Cultural Programs...[/bold]")
         
-        # First, extract features for all responses if not already done
-        responses_with_features = []
-        
-        with console.status("[bold green]Extracting features from responses...") as status:
-            for resp in track(all_responses, description="Processing responses"):
-                # Check if response has text
-                if resp.get('text', '').strip():
-                    # Check if any program is mentioned
-                    mentioned_programs = []
-                    for program in self.CULTURAL_PROGRAMS:
-                        if self.program_patterns[program].search(resp['text']):
-                            mentioned_programs.append(program)
-                    
-                    if mentioned_programs:
-                        # Extract features for this response
+        # Reuse the index's program partitions when they were built for the same programs
+        if response_index.programs != self.CULTURAL_PROGRAMS:
+            response_index = ResponseIndex(response_index, self.program_tagger)
+        
+        groups = {program: 1 for program in self.CULTURAL_PROGRAMS}
+        with get_progress_feed().stage("program_analysis", groups=groups) as stage:
+            if scheduler is not None and features_by_id is None:
+                program_analyses = self._analyze_programs_scheduled(response_index, scheduler, stage)
+                return self._save_program_summary(program_analyses)
+            
+            # Extract features only for responses that mention a program
+            if features_by_id is None:
+                features_by_id = {}
+                
+                with console.status("[bold green]Extracting features from responses...") as status:
+                    for resp in track(response_index.with_program_mentions(), description="Processing responses"):
                         features = self.feature_extractor.extract_features(
                             response=resp['text'],
                             question=resp.get('question_text', ''),
@@ -390,24 +376,79 @@ Analyze this feedback and provide structured insights about the program."""
                         )
                         
                         if features:
-                            responses_with_features.append({
-                                'response_id': resp['id'],
-                                'text': resp['text'],
-                                'features': features.model_dump(),
-                                'question_id': resp.get('question_id'),
-                                'mentioned_programs': mentioned_programs
-                            })
-        
-        console.print(f"[green]✓[/green] Found {len(responses_with_features)} responses mentioning programs")
+                            features_by_id[resp['id']] = features.model_dump()
+            
+            console.print(f"[green]✓[/green] Found {len(features_by_id)} responses mentioning programs")
+            
+            # Analyze each program
+            program_analyses = {}
+            
+            for program in self.CULTURAL_PROGRAMS:
+                analysis = self.analyze_program(program, response_index, features_by_id)
+                if analysis:
+                    program_analyses[program] = analysis
+                stage.advance(group=program)
         
-        # Analyze each program
-        program_analyses = {}
+        return self._save_program_summary(program_analyses)
+    
+    def _analyze_programs_scheduled(self, response_index: ResponseIndex, scheduler: LLMScheduler,
+                                    stage: StageProgress) -> Dict[str, ProgramFeedback]:
+        """Queue each program's extractions and, once they are done, its analysis."""
+        futures = {}
         
         for program in self.CULTURAL_PROGRAMS:
-            analysis = self.analyze_program(program, responses_with_features)
+            group = f"program:{program}"
+            
+            # Cached analyses need no extraction
+            if self._program_cache_file(program).exists():
+                futures[program] = scheduler.when_all(
+                    [], self.analyze_program, program, response_index, {}, group=group
+                )
+                continue
+            
+            responses = response_index.for_program(program)
+            extractions = [
+                scheduler.submit(
+                    self.feature_extractor.extract_features,
+                    response=resp['text'],
+                    question=resp.get('question_text', ''),
+                    response_id=resp['id'],
+                    question_id=resp.get('question_id', ''),
+                    group=group,
+                    # Same key as the question analysis, so shared responses are extracted once
+                    key=self.feature_extractor._generate_cache_key(resp['text'], resp.get('question_text', ''))
+                )
+                for resp in responses
+            ]
+            futures[program] = scheduler.when_all(
+                extractions, self._analyze_extracted_program, program, response_index,
+                responses, extractions, group=group
+            )
+        
+        for program, future in futures.items():
+            future.add_done_callback(lambda _, program=program: stage.advance(group=program))
+        
+        program_analyses = {}
+        for program, future in futures.items():
+            analysis = future.result()
             if analysis:
                 program_analyses[program] = analysis
-        
+        return program_analyses
+    
+    def _analyze_extracted_program(self, program_name: str, response_index: ResponseIndex,
+                                   responses: List[Dict[str, Any]], extractions: List[Future]) -> Optional[ProgramFeedback]:
+        features_by_id = {}
+        for resp, extraction in zip(responses, extractions):
+            features = extraction.result()
+            if features:
+                features_by_id[resp['id']] = features.model_dump()
+        return self.analyze_program(program_name, response_index, features_by_id)
+    
+    def _program_cache_file(self, program_name: str) -> Path:
+        return self.program_cache_dir / f"{program_name.replace(' ', '_').lower()}_analysis.json"
+    
+    def _save_program_summary(self, program_analyses: Dict[str, ProgramFeedback]) -> Dict[str, ProgramFeedback]:
+        """Report and save the summary of all program analyses."""
         # Summary report
         console.print(f"\n[bold green]✓ Completed analysis for {len(program_analyses)} programs[/bold green]")
         
@@ -0,0 +1,136 @@
+"""In-memory response index partitioned by question, respondent and program."""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..tagging import KeywordTagger
+
+
+def build_program_tagger(programs: Iterable[str]) -> KeywordTagger:
+    """
+    Create a whole-word tagger for program name matching.
+
+    Args:
+        programs: Program names
+
+    Returns:
+        KeywordTagger with one tag per program
+    """
+    taxonomy = {}
+
+    for program in programs:
+        # Match various forms of the program name:
+        # full name, acronym and common variations
+        keywords = [program]
+
+        # Acronym (if multi-word)
+        words = program.split()
+        if len(words) > 1:
+            acronym = ''.join(w[0].upper() for w in words if w[0].isupper())
+            if acronym:
+                keywords.append(acronym)
+
+        # Common variations
+        if "Assistance" in program:
+            keywords.append(program.replace("Assistance", "Assist"))
+        if "Program" in program:
+            # Name without "Program", with the spaces left around it collapsed
+            # ("Arts Program Grant" -> "Arts Grant"), so the variant matches
+            # the words themselves rather than requiring the leftover spaces
+            keywords.append(' '.join(program.replace("Program", "").split()))
+
+        taxonomy[program] = keywords
+
+    return KeywordTagger(taxonomy, whole_words=True)
+
+
+class ResponseIndex:
+    """
+    Text responses indexed once at load time.
+
+    Responses are partitioned by question_id, respondent_idx and program
+    mention, so every lookup is a dictionary access instead of a scan over all
+    responses. Lookups return new lists, so callers cannot change the index.
+    Responses with blank text are not indexed.
+    """
+
+    def __init__(self, responses: Iterable[Dict[str, Any]],
+                 program_tagger: Optional[KeywordTagger] = None):
+        """
+        Build the index.
+
+        Args:
+            responses: Response dictionaries with 'id', 'text', 'question_id'
+                and optionally 'respondent_idx'
+            program_tagger: Program name tagger used for the program partition
+        """
+        self.program_tagger = program_tagger
+
+        self._responses: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_question: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_respondent: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_program: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._programs_by_id: Dict[str, List[str]] = {}
+
+        for response in responses:
+            self.add(response)
+
+    def add(self, response: Dict[str, Any]) -> None:
+        """Index a single response."""
+        text = response.get('text', '')
+        if not text.strip():
+            return
+
+        response_id = response['id']
+        self._responses.append(response)
+        self._by_id[response_id] = response
+        self._by_question[response.get('question_id')].append(response)
+
+        if 'respondent_idx' in response:
+            self._by_respondent[response['respondent_idx']].append(response)
+
+        mentioned = self.program_tagger.tag(text) if self.program_tagger else []
+        self._programs_by_id[response_id] = mentioned
+        for program in mentioned:
+            self._by_program[program].append(response)
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._responses)
+
+    @property
+    def question_ids(self) -> List[str]:
+        """Question IDs with at least one response."""
+        return list(self._by_question)
+
+    @property
+    def programs(self) -> List[str]:
+        """Programs the index was built for."""
+        return list(self.program_tagger.tags) if self.program_tagger else []
+
+    def get(self, response_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a response by ID."""
+        return self._by_id.get(response_id)
+
+    def for_question(self, question_id: str) -> List[Dict[str, Any]]:
+        """Responses to a question, in load order."""
+        return list(self._by_question.get(question_id, ()))
+
+    def for_respondent(self, respondent_idx: Any) -> List[Dict[str, Any]]:
+        """All responses from one respondent, in load order."""
+        return list(self._by_respondent.get(respondent_idx, ()))
+
+    def for_program(self, program: str) -> List[Dict[str, Any]]:
+        """Responses mentioning a program, in load order."""
+        return list(self._by_program.get(program, ()))
+
+    def programs_mentioned(self, response_id: str) -> List[str]:
+        """Programs mentioned in a response."""
+        return list(self._programs_by_id.get(response_id, ()))
+
+    def with_program_mentions(self) -> List[Dict[str, Any]]:
+        """Responses mentioning at least one program, in load order."""
+        return [r for r in self._responses if self._programs_by_id[r['id']]]
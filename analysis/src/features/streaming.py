@@ -0,0 +1,379 @@
+"""Streaming deep analysis with bounded queues between stages."""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from rich.console import Console
+from rich.table import Table
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+from ..validation.progress import get_progress_feed
+from .aggregation import QuestionAggregate
+from .analyzer import QuestionAnalyzer
+from .models import QuestionAnalysis
+from .program_analyzer import ProgramAnalyzer
+from .response_index import ResponseIndex
+
+console = Console()
+
+# End-of-stream marker passed down each queue
+_DONE = object()
+
+
+class _Stopped(Exception):
+    """Another stage failed; unwind without reporting."""
+
+
+@dataclass
+class StageStats:
+    """Throughput of one streaming stage."""
+    name: str
+    workers: int = 1
+    items: int = 0
+    busy: float = 0.0  # seconds spent processing, summed over workers
+
+
+@dataclass
+class StreamResult:
+    """Outputs of a streaming run."""
+    question_analyses: List[QuestionAnalysis]
+    aggregates: Dict[str, QuestionAggregate]
+    program_index: ResponseIndex
+    program_features: Dict[str, Dict[str, Any]]
+    total_responses: int
+    duration: float
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+
+
+class StreamingAnalysis:
+    """
+    Question analysis as a stream of concurrent stages.
+
+    ingest → dedup → extract → aggregate → program tagging
+
+    Stages run in their own threads (extraction in
+    `settings.stream_extract_workers` threads) and hand items over through
+    queues of at most `settings.stream_queue_size` items, so a fast stage
+    blocks instead of buffering the survey in memory, and the run takes
+    about as long as its slowest stage rather than the sum of all stages.
+
+    Responses whose feature cache key was already seen are not extracted
+    again: the aggregator counts them once the first copy's features are in.
+    Only responses that mention a program are kept after aggregation.
+    """
+
+    def __init__(self, questions: List[Dict[str, Any]], audit_logger: Optional[AuditLogger] = None,
+                 queue_size: Optional[int] = None, extract_workers: Optional[int] = None):
+        """
+        Set up the stages.
+
+        Args:
+            questions: Question dictionaries with 'id' and 'text'
+            audit_logger: Audit logger shared by all stages
+            queue_size: Capacity of each queue between stages
+            extract_workers: Number of concurrent feature extraction threads
+        """
+        self.questions = questions
+        self.audit_logger = audit_logger or AuditLogger()
+        self.queue_size = queue_size or settings.stream_queue_size
+        self.extract_workers = extract_workers or settings.stream_extract_workers
+
+        self.question_analyzer = QuestionAnalyzer(self.audit_logger)
+        self.program_analyzer = ProgramAnalyzer(self.audit_logger)
+        self.feature_extractor = self.question_analyzer.feature_extractor
+        self.online = self.question_analyzer.online
+
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+
+    def run(self, responses: Iterable[Dict[str, Any]]) -> StreamResult:
+        """
+        Stream responses through extraction and aggregation.
+
+        Args:
+            responses: Response dictionaries ('id', 'text', 'question_id',
+                'question_text'); consumed lazily by the ingest stage, so a
+                generator over streamed survey chunks keeps memory bounded
+
+        Returns:
+            Question analyses, program-mentioning responses with their
+            features, and per-stage statistics
+        """
+        start = time.perf_counter()
+        self._stop.clear()
+        self._errors = []
+
+        to_dedup: queue.Queue = queue.Queue(self.queue_size)
+        to_extract: queue.Queue = queue.Queue(self.queue_size)
+        to_aggregate: queue.Queue = queue.Queue(self.queue_size)
+        to_programs: queue.Queue = queue.Queue(self.queue_size)
+
+        self.stats = {
+            name: StageStats(name=name, workers=workers)
+            for name, workers in (
+                ("ingest", 1), ("dedup", 1), ("extract", self.extract_workers),
+                ("aggregate", 1), ("programs", 1)
+            )
+        }
+        self.aggregates = {
+            question['id']: QuestionAggregate(question_id=question['id'], question_text=question['text'])
+            for question in self.questions
+        }
+        for aggregate in self.aggregates.values():
+            self.online.start(aggregate)
+        self.program_index = ResponseIndex([], self.program_analyzer.program_tagger)
+        self.program_features: Dict[str, Dict[str, Any]] = {}
+        self.total_responses = 0
+        self._extractors_left = self.extract_workers
+        self._extractors_lock = threading.Lock()
+
+        threads = [
+            threading.Thread(target=self._guard, args=(self._ingest, responses, to_dedup), name="stream-ingest"),
+            threading.Thread(target=self._guard, args=(self._dedup, to_dedup, to_extract, to_aggregate),
+                             name="stream-dedup"),
+            threading.Thread(target=self._guard, args=(self._aggregate, to_aggregate, to_programs),
+                             name="stream-aggregate"),
+            threading.Thread(target=self._guard, args=(self._tag_programs, to_programs), name="stream-programs"),
+        ] + [
+            threading.Thread(target=self._guard, args=(self._extract, to_extract, to_aggregate),
+                             name=f"stream-extract-{i}")
+            for i in range(self.extract_workers)
+        ]
+
+        console.print(
+            f"[bold]Streaming responses through {self.extract_workers} extraction workers "
+            f"(queue size {self.queue_size})...[/bold]"
+        )
+        # Totals grow as responses are read; each is done once aggregated
+        with get_progress_feed().stage(
+            "streaming_analysis", groups={question['id']: 0 for question in self.questions}
+        ) as self.progress:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if self._errors:
+                raise self._errors[0]
+
+        # Every response is folded in: turn the aggregates into analyses
+        question_analyses = []
+        for question in self.questions:
+            aggregate = self.online.finish(question['id'])
+            self.audit_logger.log_operation(
+                operation="question_aggregate_update",
+                question_id=question['id'],
+                added_responses=aggregate.response_count,
+                removed_responses=0,
+                response_count=aggregate.response_count
+            )
+            if aggregate.response_count == 0 and not aggregate.failed_keys:
+                continue
+            analysis = self.question_analyzer.finalize_question(
+                aggregate, self.question_analyzer.load_cached_analysis(question['id'])
+            )
+            if analysis:
+                question_analyses.append(analysis)
+
+        duration = time.perf_counter() - start
+        self._report_stages(duration)
+
+        return StreamResult(
+            question_analyses=question_analyses,
+            aggregates=self.aggregates,
+            program_index=self.program_index,
+            program_features=self.program_features,
+            total_responses=self.total_responses,
+            duration=duration,
+            stages=self.stats
+        )
+
+    # Queue helpers: block with a timeout so a failure elsewhere stops every stage
+
+    def _put(self, q: queue.Queue, item: Any) -> None:
+        while True:
+            if self._stop.is_set():
+                raise _Stopped()
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q: queue.Queue) -> Any:
+        while True:
+            if self._stop.is_set():
+                raise _Stopped()
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def _guard(self, target, *args) -> None:
+        try:
+            target(*args)
+        except _Stopped:
+            pass
+        except BaseException as e:
+            self._errors.append(e)
+            self._stop.set()
+            self.audit_logger.log_error(
+                operation="streaming_analysis",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                context={"stage": threading.current_thread().name}
+            )
+
+    # Stages
+
+    def _ingest(self, responses: Iterable[Dict[str, Any]], out: queue.Queue) -> None:
+        stats = self.stats["ingest"]
+        iterator = iter(responses)
+        while True:
+            started = time.perf_counter()
+            response = next(iterator, _DONE)
+            stats.busy += time.perf_counter() - started
+            if response is _DONE:
+                break
+            stats.items += 1
+            self._put(out, response)
+        self._put(out, _DONE)
+
+    def _dedup(self, inbox: queue.Queue, to_extract: queue.Queue, to_aggregate: queue.Queue) -> None:
+        stats = self.stats["dedup"]
+        seen: Set[str] = set()
+        while True:
+            response = self._get(inbox)
+            if response is _DONE:
+                break
+            started = time.perf_counter()
+            if not response.get('text', '').strip():
+                continue
+            self.progress.add_total(1, group=response['question_id'])
+            key = self.feature_extractor._generate_cache_key(response['text'], response['question_text'])
+            duplicate = key in seen
+            seen.add(key)
+            stats.busy += time.perf_counter() - started
+            stats.items += 1
+            if duplicate:
+                self._put(to_aggregate, ("duplicate", response, key, None))
+            else:
+                self._put(to_extract, (response, key))
+
+        # Duplicates are all queued before the extractors can finish
+        for _ in range(self.extract_workers):
+            self._put(to_extract, _DONE)
+
+    def _extract(self, inbox: queue.Queue, out: queue.Queue) -> None:
+        stats = self.stats["extract"]
+        while True:
+            item = self._get(inbox)
+            if item is _DONE:
+                break
+            response, key = item
+            started = time.perf_counter()
+            features = self.feature_extractor.extract_features(
+                response=response['text'],
+                question=response['question_text'],
+                response_id=response['id'],
+                question_id=response['question_id']
+            )
+            with self._extractors_lock:
+                stats.busy += time.perf_counter() - started
+                stats.items += 1
+            self._put(out, ("features", response, key, features))
+
+        # The last extractor to finish closes the aggregate queue
+        with self._extractors_lock:
+            self._extractors_left -= 1
+            last = self._extractors_left == 0
+        if last:
+            self._put(out, _DONE)
+
+    def _aggregate(self, inbox: queue.Queue, out: queue.Queue) -> None:
+        stats = self.stats["aggregate"]
+        # Keys whose features are folded in, and duplicates waiting for them
+        done_keys: Dict[str, bool] = {}
+        waiting: Dict[str, List[Dict[str, Any]]] = {}
+
+        while True:
+            item = self._get(inbox)
+            if item is _DONE:
+                break
+            kind, response, key, features = item
+            started = time.perf_counter()
+
+            if kind == "duplicate":
+                if key not in done_keys:
+                    waiting.setdefault(key, []).append(response)
+                    stats.busy += time.perf_counter() - started
+                    continue
+                # The first copy is aggregated: its features are in the feature cache
+                features = (
+                    self.feature_extractor._load_features_from_cache(key, response['question_id'])
+                    if done_keys[key] else None
+                )
+                batch = [response]
+            else:
+                done_keys[key] = features is not None
+                batch = [response] + waiting.pop(key, [])
+
+            for resp in batch:
+                self.total_responses += 1
+                self.progress.advance(group=resp['question_id'], failed=features is None)
+                if features is None:
+                    self.online.fail(resp['question_id'], key)
+                    continue
+                self.online.add(resp['question_id'], features, key)
+                stats.items += 1
+            stats.busy += time.perf_counter() - started
+
+            if features is not None:
+                for resp in batch:
+                    self._put(out, (resp, features))
+
+        self._put(out, _DONE)
+
+    def _tag_programs(self, inbox: queue.Queue) -> None:
+        stats = self.stats["programs"]
+        tagger = self.program_analyzer.program_tagger
+        while True:
+            item = self._get(inbox)
+            if item is _DONE:
+                break
+            response, features = item
+            started = time.perf_counter()
+            if tagger.tag(response['text']):
+                self.program_index.add(response)
+                self.program_features[response['id']] = features.model_dump()
+            stats.busy += time.perf_counter() - started
+            stats.items += 1
+
+    def _report_stages(self, duration: float) -> None:
+        """Show per-stage throughput; the busiest stage bounds the run time."""
+        table = Table(title=f"Streaming stages ({duration:.1f}s wall clock)")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Workers", justify="right")
+        table.add_column("Items", justify="right")
+        table.add_column("Busy (s)", justify="right")
+        table.add_column("Utilization", justify="right")
+
+        for stage in self.stats.values():
+            utilization = stage.busy / (duration * stage.workers) if duration > 0 else 0.0
+            table.add_row(
+                stage.name, str(stage.workers), f"{stage.items:,}",
+                f"{stage.busy:.1f}", f"{utilization:.0%}"
+            )
+            self.audit_logger.log_operation(
+                operation="stream_stage_stats",
+                stage=stage.name,
+                workers=stage.workers,
+                items=stage.items,
+                busy_seconds=round(stage.busy, 3),
+                utilization=round(utilization, 3)
+            )
+
+        console.print(table)
@@ -0,0 +1,75 @@
+"""Survey questions analyzed in depth and extraction of their text answers."""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+# Question mappings based on actual survey columns
+SURVEY_QUESTIONS = [
+    {"id": "q1_org_support", "text": "How do you believe ACME should better support organizations and cultural leaders?", 
+     "column": "austins_creative_community_has_built_a_strong_foundation_of_existing_organizations_that_informs_acmes_goals_and_mission_how_do_you_believe_acme_should_better_support_these_organizations_and_cul"},
+    {"id": "q2_opportunities", "text": "What type of cultural arts or entertainment opportunities would you like to see more of in Austin?",
+     "column": "what_type_of_cultural_arts_or_entertainment_opportunities_would_you_like_to_see_more_of_in_austin"},
+    {"id": "q3_improvements", "text": "What improvements would you like to see in these cultural funding programs?",
+     "column": "what_improvements_would_you_like_to_see_in_these_cultural_funding_programs"},
+    {"id": "q4_barriers", "text": "What barriers do you or your community face in accessing support or services related to arts, culture, music and entertainment?",
+     "column": "what_barriers_do_you_or_your_community_face_in_accessing_support_or_services_related_to_arts_culture_music_and_entertainment"},
+    {"id": "q5_new_programs", "text": "What kinds of programs or services would you like ACME to offer that currently do not exist or are underrepresented?",
+     "column": "what_kinds_of_programs_or_services_would_you_like_acme_to_offer_that_currently_do_not_exist_or_are_underrepresented"},
+    {"id": "q6_feedback", "text": "Do you have any additional ideas, concerns, or feedback you would like to share to help ACME better serve the public?",
+     "column": "do_you_have_any_additional_ideas_concerns_or_feedback_you_would_like_to_share_to_help_acme_better_serve_the_public"}
+]
+
+
+def extract_text_responses(survey_df: pd.DataFrame, questions: List[Dict[str, Any]],
+                           start_id: int = 1) -> List[Dict[str, Any]]:
+    """
+    Extract substantive text answers from a block of survey rows.
+    
+    Responses are ordered by row, then question, and numbered from
+    `start_id`, so extracting consecutive chunks gives the same ids as
+    extracting the whole survey at once.
+    """
+    positions, question_positions, texts = [], [], []
+    
+    for q_pos, question in enumerate(questions):
+        col = question['column']
+        if col not in survey_df.columns:
+            continue
+        values = survey_df[col]
+        if not (values.dtype == object or isinstance(values.dtype, (pd.CategoricalDtype, pd.StringDtype))):
+            continue
+        
+        # Non-string cells become NaN and drop out of the length test
+        stripped = values.astype(object).str.strip()
+        keep = (stripped.str.len() > 10).to_numpy(dtype=bool, na_value=False)
+        rows = np.flatnonzero(keep)
+        
+        positions.append(rows)
+        question_positions.append(np.full(len(rows), q_pos))
+        texts.append(stripped.to_numpy()[rows])
+    
+    if not positions:
+        return []
+    
+    positions = np.concatenate(positions)
+    question_positions = np.concatenate(question_positions)
+    texts = np.concatenate(texts)
+    order = np.lexsort((question_positions, positions))
+    labels = survey_df.index.tolist()
+    
+    responses = []
+    for response_id, i in enumerate(order, start_id):
+        question = questions[question_positions[i]]
+        responses.append({
+            'id': f'resp_{response_id}',
+            'text': texts[i],
+            'question_id': question['id'],
+            'question_text': question['text'],
+            'source': 'survey',
+            'respondent_idx': labels[positions[i]]
+        })
+    
+    return responses
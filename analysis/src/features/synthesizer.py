@@ -15,6 +15,7 @@ from rich.table import Table
 from ..config import settings
 from ..validation.audit import AuditLogger
 from ..llm.client import LLMClient
+from .canonicalization import ThemeCanonicalizer
 from .models import (
     QuestionAnalysis,
     CrossQuestionInsight,
@@ -45,6 +46,9 @@ class CrossQuestionSynthesizer:
         # Initialize LLM client (handles Azure OpenAI automatically)
         self.llm_client = LLMClient(audit_logger=self.audit_logger)
         self.model = self.llm_client.model
+        
+        # Canonical theme names, with an alias table persisted across runs
+        self.canonicalizer = ThemeCanonicalizer(self.audit_logger)
     
     def identify_recurring_themes(self, analyses: List[QuestionAnalysis]) -> Dict[str, Dict[str, Any]]:
         """
@@ -62,9 +66,14 @@ class CrossQuestionSynthesizer:
         theme_urgencies = defaultdict(list)
         theme_sentiments = defaultdict(lambda: defaultdict(int))
         
+        # Merge equivalent free-form themes before counting
+        canonical_themes = self.canonicalizer.canonicalize_many(
+            theme.theme for analysis in analyses for theme in analysis.dominant_themes
+        )
+        
         for analysis in analyses:
             for theme in analysis.dominant_themes:
-                theme_key = self._normalize_theme(theme.theme)
+                theme_key = canonical_themes[theme.theme]
                 theme_questions[theme_key].append(analysis.question_id)
                 theme_total_mentions[theme_key] += theme.count
                 theme_urgencies[theme_key].append(theme.urgency_score)
@@ -106,8 +115,7 @@ class CrossQuestionSynthesizer:
     
     def _normalize_theme(self, theme: str) -> str:
         """Normalize theme names for comparison across questions."""
-        # Simple normalization - could be enhanced with NLP
-        return theme.lower().strip().replace('-', ' ').replace('_', ' ')
+        return self.canonicalizer.canonicalize(theme)
     
     def analyze_stakeholder_perspectives(self, analyses: List[QuestionAnalysis]) -> Dict[str, Dict[str, Any]]:
         """
@@ -140,7 +148,7 @@ class CrossQuestionSynthesizer:
                 for theme in analysis.dominant_themes[:10]:  # Top 10 themes
                     estimated_mentions = int(theme.count * stakeholder_ratio)
                     if estimated_mentions > 0:
-                        data['top_themes'][theme.theme] += estimated_mentions
+                        data['top_themes'][self._normalize_theme(theme.theme)] += estimated_mentions
         
         # Convert to regular dict and process
         stakeholder_perspectives = {}
@@ -338,12 +346,14 @@ Generate strategic insights that address these cross-cutting concerns."""
             )
             return []
     
-    def synthesize_insights(self, analyses: List[QuestionAnalysis]) -> Dict[str, Any]:
+    def synthesize_insights(self, analyses: List[QuestionAnalysis], use_cache: bool = True) -> Dict[str, Any]:
         """
         Perform complete cross-question synthesis.
         
         Args:
             analyses: List of QuestionAnalysis objects from all questions
+            use_cache: Return the cached synthesis if there is one; pass
+                False when the question analyses changed
             
         Returns:
             Dictionary containing all synthesis results
@@ -352,7 +362,7 @@ Generate strategic insights that address these cross-cutting concerns."""
         
         # Check cache
         cache_file = self.synthesis_cache_dir / "cross_question_synthesis.json"
-        if cache_file.exists():
+        if use_cache and cache_file.exists():
             console.print("[dim]Loading cached synthesis results[/dim]")
             with open(cache_file, 'r') as f:
                 return json.load(f)
@@ -2,5 +2,9 @@
 
 from .loader import DataLoader
 from .validator import DataValidator
+from .snapshot import ExcelSnapshotCache, read_excel_snapshot
+from .streaming import ChunkedReader, MemoryMonitor
+from .fingerprint import DataFingerprint
 
-__all__ = ["DataLoader", "DataValidator"]
\ No newline at end of file
+__all__ = ["DataLoader", "DataValidator", "ExcelSnapshotCache", "read_excel_snapshot",
+           "ChunkedReader", "MemoryMonitor", "DataFingerprint"]
\ No newline at end of file
@@ -1,27 +1,42 @@
 """Data loading utilities for Excel files."""
 
 import json
-import hashlib
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 from rich.progress import track
 
 from ..config import settings
 from ..validation.audit import AuditLogger
+from .fingerprint import DataFingerprint
+from .snapshot import ExcelSnapshotCache
+from .streaming import ChunkedReader
 
 
 console = Console()
 
 
+def clean_column_name(col_name: str) -> str:
+    """Standardize column names: lowercase, punctuation removed, spaces to underscores."""
+    clean_name = str(col_name).lower().strip()
+    clean_name = re.sub(r'[^\w\s]', '', clean_name)
+    clean_name = re.sub(r'\s+', '_', clean_name)
+    return clean_name
+
+
 class DataLoader:
     """Handles loading and initial processing of Excel data files."""
     
     def __init__(self, audit_logger: Optional[AuditLogger] = None):
         self.audit_logger = audit_logger or AuditLogger()
+        self.snapshots = ExcelSnapshotCache(self.audit_logger)
+        # Content fingerprint of each loaded sheet, by data source name
+        self.fingerprints: Dict[str, DataFingerprint] = {}
         # Simplified filenames - we'll look for files containing these patterns
         self.survey_pattern = "ACME_Community_Survey"
         self.working_doc_pattern = "ACME_Working_Document"
@@ -50,14 +65,18 @@ class DataLoader:
         console.print("[bold green]✓ All data loaded successfully![/bold green]")
         return data
     
-    def _load_survey_data(self) -> pd.DataFrame:
-        """Load and process the community survey data."""
-        # Find the survey file
+    def load_survey(self) -> pd.DataFrame:
+        """Load only the survey export; its fingerprint is kept in `fingerprints['survey']`."""
+        return self._load_survey_data()
+    
+    def find_survey_file(self) -> Path:
+        """Locate the survey export (.xlsx, or .csv in the raw data directory)."""
         file_path = None
         
         # First check raw data directory
         console.print(f"[dim]Looking for survey file in: {settings.raw_data_dir}[/dim]")
-        for file in settings.raw_data_dir.glob("*.xlsx"):
+        candidates = sorted(settings.raw_data_dir.glob("*.xlsx")) + sorted(settings.raw_data_dir.glob("*.csv"))
+        for file in candidates:
             console.print(f"[dim]Found file: {file.name}[/dim]")
             if self.survey_pattern in file.name:
                 file_path = file
@@ -80,8 +99,41 @@ class DataLoader:
         if not file_path:
             raise FileNotFoundError(f"Survey file not found with pattern: {self.survey_pattern}")
         
-        # Load Excel file
-        df = pd.read_excel(file_path, engine='openpyxl')
+        return file_path
+    
+    def stream_survey_data(self, columns: Optional[List[str]] = None,
+                           reader: Optional[ChunkedReader] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream the survey in row chunks without loading the whole export.
+        
+        Args:
+            columns: Cleaned column names to keep (default: all)
+            reader: Chunked reader carrying the memory ceiling
+            
+        Yields:
+            DataFrames of consecutive rows with cleaned column names
+        """
+        file_path = self.find_survey_file()
+        reader = reader or ChunkedReader(audit_logger=self.audit_logger)
+        
+        self.audit_logger.log_operation(
+            operation="stream_survey_data",
+            input_file=str(file_path),
+            columns=columns,
+            memory_limit_mb=reader.memory_limit_mb
+        )
+        
+        yield from reader.iter_chunks(file_path, columns=columns, column_cleaner=clean_column_name)
+    
+    def _load_survey_data(self) -> pd.DataFrame:
+        """Load and process the community survey data."""
+        file_path = self.find_survey_file()
+        
+        # Load Excel file (parsed once, then served from the Parquet snapshot)
+        if file_path.suffix.lower() == '.csv':
+            df = pd.read_csv(file_path)
+        else:
+            df = self.snapshots.read_excel(file_path)
         
         # Standardize column names
         df.columns = [self._clean_column_name(col) for col in df.columns]
@@ -92,9 +144,10 @@ class DataLoader:
         df['record_type'] = 'survey'
         
         # Generate unique IDs for traceability
-        df['record_id'] = df.apply(
-            lambda row: self._generate_record_id('survey', row.name), axis=1
-        )
+        df['record_id'] = self._generate_record_ids('survey', len(df))
+        
+        fingerprint = DataFingerprint.from_dataframe(df)
+        self.fingerprints['survey'] = fingerprint
         
         # Log the operation
         self.audit_logger.log_operation(
@@ -102,7 +155,8 @@ class DataLoader:
             input_file=str(file_path),
             output_shape=df.shape,
             columns=[str(col) for col in df.columns],
-            data_hash=self._hash_dataframe(df)
+            data_hash=fingerprint.sheet,
+            fingerprint=fingerprint.summary()
         )
         
         return df
@@ -134,14 +188,12 @@ class DataLoader:
         if not file_path:
             raise FileNotFoundError(f"Working document not found with pattern: {self.working_doc_pattern}")
         
-        # Load all sheets
-        xl_file = pd.ExcelFile(file_path, engine='openpyxl')
+        # Load all sheets (parsed once, then served from the Parquet snapshot)
+        sheets = self.snapshots.read_excel(file_path, sheet_name=None)
         dfs = {}
         
-        for sheet_name in xl_file.sheet_names:
+        for sheet_name, df in sheets.items():
             if sheet_name != "Template - Do Not Delete":
-                df = pd.read_excel(xl_file, sheet_name=sheet_name)
-                
                 # Standardize column names
                 df.columns = [self._clean_column_name(col) for col in df.columns]
                 
@@ -151,13 +203,13 @@ class DataLoader:
                 df['load_timestamp'] = datetime.now()
                 
                 # Generate unique IDs
-                df['record_id'] = df.apply(
-                    lambda row: self._generate_record_id(f'wd_{sheet_name}', row.name), 
-                    axis=1
-                )
+                df['record_id'] = self._generate_record_ids(f'wd_{sheet_name}', len(df))
                 
                 dfs[sheet_name] = df
                 
+                fingerprint = DataFingerprint.from_dataframe(df)
+                self.fingerprints[f"working_doc_{sheet_name}"] = fingerprint
+                
                 # Log the operation
                 self.audit_logger.log_operation(
                     operation=f"load_working_doc_{sheet_name}",
@@ -165,31 +217,26 @@ class DataLoader:
                     sheet_name=sheet_name,
                     output_shape=df.shape,
                     columns=[str(col) for col in df.columns],
-                    data_hash=self._hash_dataframe(df)
+                    data_hash=fingerprint.sheet,
+                    fingerprint=fingerprint.summary()
                 )
         
         return dfs
     
     def _clean_column_name(self, col_name: str) -> str:
         """Standardize column names for consistency."""
-        import re
-        # Convert to lowercase, replace spaces with underscores
-        clean_name = str(col_name).lower().strip()
-        clean_name = re.sub(r'[^\w\s]', '', clean_name)
-        clean_name = re.sub(r'\s+', '_', clean_name)
-        return clean_name
-    
-    def _generate_record_id(self, prefix: str, index: int) -> str:
-        """Generate a unique, traceable record ID."""
-        timestamp = datetime.now().strftime("%Y%m%d")
-        return f"{prefix}_{timestamp}_{index:06d}"
+        return clean_column_name(col_name)
     
-    def _hash_dataframe(self, df: pd.DataFrame) -> str:
-        """Generate a hash of the dataframe for audit purposes."""
-        # Convert dataframe to string representation
-        df_str = df.to_json(orient='records', date_format='iso')
-        # Generate SHA256 hash
-        return hashlib.sha256(df_str.encode()).hexdigest()[:16]
+    def _generate_record_ids(self, prefix: str, n_rows: int) -> np.ndarray:
+        """
+        Record IDs for rows 0..n_rows-1 of a sheet.
+        
+        IDs depend only on the sheet and row position, so they stay the same
+        across days and runs and can serve as cache and join keys. Row
+        content changes are tracked by the sheet's fingerprint instead.
+        """
+        positions = pd.Series(np.arange(n_rows)).astype(str).str.zfill(6)
+        return (f"{prefix}_" + positions).to_numpy()
     
     def _log_data_summary(self, data: Dict[str, pd.DataFrame]) -> None:
         """Log summary statistics for all loaded data."""
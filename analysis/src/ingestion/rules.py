@@ -0,0 +1,496 @@
+"""Declarative validation rules evaluated in a single vectorized pass."""
+
+import time
+import warnings
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..config import settings
+
+
+DATE_CONVERSION_ERRORS = (TypeError, ValueError, OverflowError, pd.errors.OutOfBoundsDatetime)
+
+
+class ChunkContext:
+    """
+    One chunk of rows plus the conversions rules share.
+
+    Conversions (null masks, string forms, parsed dates, text lengths) are
+    computed on first use and reused by every later rule in the same chunk,
+    so e.g. the date columns are parsed once for all date rules.
+    """
+
+    def __init__(self, df: pd.DataFrame, timings: Dict[str, float]):
+        self.df = df
+        self._timings = timings
+        self._cache: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def _shared(self, key: Any, compute: Callable[[], Any]) -> Any:
+        if key not in self._cache:
+            started = time.perf_counter()
+            self._cache[key] = compute()
+            label = f"conversion:{key[0]}"
+            self._timings[label] = self._timings.get(label, 0.0) + time.perf_counter() - started
+        return self._cache[key]
+
+    @property
+    def notna(self) -> pd.DataFrame:
+        """Boolean non-null mask of the whole chunk."""
+        return self._shared(('notna',), self.df.notna)
+
+    def strings(self, col: str) -> pd.Series:
+        """Column values as stripped strings (missing values as 'nan')."""
+        return self._shared(('strings', col), lambda: self.df[col].astype(str).str.strip())
+
+    def text_lengths(self, col: str) -> pd.Series:
+        """String lengths of the non-null values of a column."""
+        def compute() -> pd.Series:
+            values = self.df[col][self.notna[col]]
+            return values.astype(str).str.len()
+        return self._shared(('text_lengths', col), compute)
+
+    def datetimes(self, col: str) -> pd.Series:
+        """Column parsed as datetimes; unparseable values become NaT."""
+        def compute() -> pd.Series:
+            values = self.df[col]
+            if not pd.api.types.is_datetime64_any_dtype(values):
+                try:
+                    with warnings.catch_warnings():
+                        # Format inference warnings for free-text columns
+                        warnings.simplefilter("ignore", UserWarning)
+                        values = pd.to_datetime(values, errors='coerce')
+                except DATE_CONVERSION_ERRORS:
+                    return pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+            if getattr(values.dt, 'tz', None) is not None:
+                # Compare in local wall time like naive timestamps
+                values = values.dt.tz_localize(None)
+            return values
+        return self._shared(('datetimes', col), compute)
+
+
+class ValidationRule:
+    """
+    A check that accumulates counts over chunks and reports once at the end.
+
+    Subclasses resolve their columns from the frame's columns in `bind`,
+    update a state dictionary per chunk (only sums and counts, so chunks can
+    be any size) and write statistics, warnings and issues in `finalize`.
+    """
+
+    name = "rule"
+
+    def bind(self, columns: Sequence[str]) -> None:
+        """Resolve the columns this rule reads."""
+
+    def init_state(self) -> Dict[str, Any]:
+        return {}
+
+    def update(self, state: Dict[str, Any], ctx: ChunkContext) -> None:
+        """Accumulate one chunk."""
+
+    def finalize(self, state: Dict[str, Any], n_rows: int, report: "RuleReport") -> None:
+        """Write the rule's outcome into the report."""
+
+
+class RuleReport:
+    """Outcome of a rule set: statistics, warnings, issues and timings."""
+
+    def __init__(self):
+        self.statistics: Dict[str, Any] = {}
+        self.warnings: List[str] = []
+        self.issues: List[Dict[str, Any]] = []
+        self.timings: Dict[str, float] = {}
+        self.n_rows = 0
+
+
+def _add_counts(total: Optional[pd.Series], counts: pd.Series) -> pd.Series:
+    """Merge value counts of a chunk into running totals."""
+    if total is None:
+        return counts
+    return total.add(counts, fill_value=0).astype(np.int64)
+
+
+class RequiredColumns(ValidationRule):
+    """Expected columns are present (missing ones are only noted)."""
+
+    name = "required_columns"
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        self.missing: List[str] = []
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.missing = [col for col in self.columns if col not in columns]
+
+    def finalize(self, state, n_rows, report) -> None:
+        if self.missing:
+            report.warnings.append(f"Some expected columns missing: {self.missing}")
+
+
+class CompletionRate(ValidationRule):
+    """Share of rows with a value in the completion column."""
+
+    name = "completion_rate"
+
+    def __init__(self, column: str, min_rate: float = 0.95):
+        self.column = column
+        self.min_rate = min_rate
+        self.active = False
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.active = self.column in columns
+
+    def init_state(self) -> Dict[str, Any]:
+        return {'completed': 0}
+
+    def update(self, state, ctx) -> None:
+        if self.active:
+            state['completed'] += int(ctx.notna[self.column].sum())
+
+    def finalize(self, state, n_rows, report) -> None:
+        if not self.active or n_rows == 0:
+            return
+        completion_rate = state['completed'] / n_rows
+        report.statistics['completion_rate'] = completion_rate
+        if completion_rate < self.min_rate:
+            report.warnings.append(f"Low completion rate: {completion_rate:.1%}")
+
+
+class DuplicateValues(ValidationRule):
+    """Values (e.g. emails) submitted by more than one row."""
+
+    name = "duplicate_values"
+
+    def __init__(self, column: str, issue_type: str = "duplicate_responses"):
+        self.column = column
+        self.issue_type = issue_type
+        self.active = False
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.active = self.column in columns
+
+    def init_state(self) -> Dict[str, Any]:
+        return {'counts': None}
+
+    def update(self, state, ctx) -> None:
+        if self.active:
+            state['counts'] = _add_counts(state['counts'], ctx.df[self.column].value_counts(dropna=True))
+
+    def finalize(self, state, n_rows, report) -> None:
+        counts = state['counts']
+        if counts is None:
+            return
+        duplicated = int((counts > 1).sum())
+        if duplicated > 0:
+            report.issues.append({
+                "type": self.issue_type,
+                "count": duplicated,
+                "severity": "warning"
+            })
+
+
+class ResponseLength(ValidationRule):
+    """Average length and share of short answers in open-ended questions."""
+
+    name = "response_length"
+
+    def __init__(self, keywords: Sequence[str], max_columns: int = 5,
+                 min_length: Optional[int] = None, max_short_rate: float = 0.1):
+        self.keywords = list(keywords)
+        self.max_columns = max_columns
+        self.min_length = min_length
+        self.max_short_rate = max_short_rate
+        self.columns: List[str] = []
+
+    def bind(self, columns: Sequence[str]) -> None:
+        text_columns = [
+            col for col in columns
+            if any(keyword in col.lower() for keyword in self.keywords)
+        ]
+        self.columns = text_columns[:self.max_columns]
+
+    def init_state(self) -> Dict[str, Any]:
+        return {col: {'count': 0, 'total_length': 0, 'short': 0} for col in self.columns}
+
+    def update(self, state, ctx) -> None:
+        min_length = self.min_length if self.min_length is not None else settings.min_response_length
+        for col in self.columns:
+            lengths = ctx.text_lengths(col)
+            state[col]['count'] += len(lengths)
+            state[col]['total_length'] += int(lengths.sum())
+            state[col]['short'] += int((lengths < min_length).sum())
+
+    def finalize(self, state, n_rows, report) -> None:
+        for col in self.columns:
+            totals = state[col]
+            if totals['count'] == 0:
+                continue
+            if totals['short'] > n_rows * self.max_short_rate:
+                report.warnings.append(
+                    f"High rate of short responses in question: "
+                    f"{totals['short']/n_rows:.1%}"
+                )
+            report.statistics[f"avg_response_length_{col[:30]}"] = totals['total_length'] / totals['count']
+
+
+class ZipCodes(ValidationRule):
+    """Geographic spread of valid five-digit ZIP codes."""
+
+    name = "zip_codes"
+
+    def __init__(self, top_n: int = 5):
+        self.top_n = top_n
+        self.column: Optional[str] = None
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.column = next(
+            (col for col in columns if 'zip' in col.lower() and 'code' in col.lower()), None
+        )
+
+    def init_state(self) -> Dict[str, Any]:
+        return {'counts': None}
+
+    def update(self, state, ctx) -> None:
+        if self.column is None:
+            return
+        zip_codes = ctx.strings(self.column)
+        valid = zip_codes[zip_codes.str.match(r'^\d{5}$', na=False)]
+        state['counts'] = _add_counts(state['counts'], valid.value_counts())
+
+    def finalize(self, state, n_rows, report) -> None:
+        if self.column is None:
+            return
+        counts = state['counts'] if state['counts'] is not None else pd.Series(dtype=np.int64)
+        counts = counts.sort_values(ascending=False, kind='stable')
+        report.statistics['unique_zip_codes'] = len(counts)
+        report.statistics[f'top_{self.top_n}_zips'] = counts.head(self.top_n).to_dict()
+
+
+class FutureDates(ValidationRule):
+    """Timestamps later than the validation run."""
+
+    name = "future_dates"
+
+    def __init__(self, columns: Sequence[str]):
+        self.candidates = list(columns)
+        self.columns: List[str] = []
+        self.now = pd.Timestamp.now()
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.columns = [col for col in self.candidates if col in columns]
+        self.now = pd.Timestamp.now()
+
+    def init_state(self) -> Dict[str, Any]:
+        return {col: 0 for col in self.columns}
+
+    def update(self, state, ctx) -> None:
+        for col in self.columns:
+            state[col] += int((ctx.datetimes(col) > self.now).sum())
+
+    def finalize(self, state, n_rows, report) -> None:
+        for col in self.columns:
+            if state[col] > 0:
+                report.issues.append({
+                    "type": "future_dates",
+                    "column": col,
+                    "count": state[col],
+                    "severity": "warning"
+                })
+
+
+class Completeness(ValidationRule):
+    """Share of non-missing cells."""
+
+    name = "completeness"
+
+    def __init__(self):
+        self.n_columns = 0
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.n_columns = len(columns)
+
+    def init_state(self) -> Dict[str, Any]:
+        return {'present': 0}
+
+    def update(self, state, ctx) -> None:
+        state['present'] += int(ctx.notna.to_numpy().sum())
+
+    def finalize(self, state, n_rows, report) -> None:
+        cells = n_rows * self.n_columns
+        report.statistics['completeness'] = state['present'] / cells if cells else 0.0
+
+
+class Timeliness(ValidationRule):
+    """
+    Share of rows dated within the recent window.
+
+    Uses the first time or date column that has any parseable value. Columns
+    after one already known to qualify are not parsed in later chunks.
+    """
+
+    name = "timeliness"
+
+    def __init__(self, days: int = 365):
+        self.days = days
+        self.columns: List[str] = []
+        self.cutoff = pd.Timestamp.now()
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.columns = [col for col in columns if 'time' in col.lower() or 'date' in col.lower()]
+        self.cutoff = pd.Timestamp.now() - pd.Timedelta(days=self.days)
+
+    def init_state(self) -> Dict[str, Any]:
+        return {'first': None, 'recent': [0] * len(self.columns)}
+
+    def update(self, state, ctx) -> None:
+        for i, col in enumerate(self.columns):
+            if state['first'] is not None and i > state['first']:
+                break
+            dates = ctx.datetimes(col)
+            state['recent'][i] += int((dates > self.cutoff).sum())
+            if dates.notna().any():
+                state['first'] = i if state['first'] is None else min(state['first'], i)
+
+    def finalize(self, state, n_rows, report) -> None:
+        if state['first'] is None or n_rows == 0:
+            report.statistics['timeliness'] = 1.0
+        else:
+            report.statistics['timeliness'] = state['recent'][state['first']] / n_rows
+
+
+class TextColumns(ValidationRule):
+    """Columns whose non-missing values average more than a few characters."""
+
+    name = "text_columns"
+
+    def __init__(self, min_mean_length: int = 10):
+        self.min_mean_length = min_mean_length
+        self.columns: List[str] = []
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.columns = list(columns)
+
+    def init_state(self) -> Dict[str, Any]:
+        return {col: [0, 0] for col in self.columns}
+
+    def update(self, state, ctx) -> None:
+        for col in self.columns:
+            lengths = ctx.text_lengths(col)
+            state[col][0] += len(lengths)
+            state[col][1] += int(lengths.sum())
+
+    def finalize(self, state, n_rows, report) -> None:
+        text_cols = [
+            col for col in self.columns
+            if state[col][0] > 0 and state[col][1] / state[col][0] > self.min_mean_length
+        ]
+        report.statistics['text_columns'] = len(text_cols)
+        report.statistics['total_columns'] = len(self.columns)
+
+
+class Density(ValidationRule):
+    """Share of non-missing cells, with a warning for very sparse sheets."""
+
+    name = "density"
+
+    def __init__(self, min_density: float = 0.1):
+        self.min_density = min_density
+        self.n_columns = 0
+
+    def bind(self, columns: Sequence[str]) -> None:
+        self.n_columns = len(columns)
+
+    def init_state(self) -> Dict[str, Any]:
+        return {'present': 0}
+
+    def update(self, state, ctx) -> None:
+        state['present'] += int(ctx.notna.to_numpy().sum())
+
+    def finalize(self, state, n_rows, report) -> None:
+        cells = n_rows * self.n_columns
+        density = state['present'] / cells if cells else 0.0
+        report.statistics['data_density'] = density
+        if density < self.min_density:
+            report.warnings.append("Very sparse data (>90% missing values)")
+
+
+class RuleSet:
+    """
+    Evaluates a list of rules over a frame or a stream of chunks.
+
+    Every chunk is visited once; all rules read it through a shared
+    ChunkContext. Time spent in each rule and in each shared conversion is
+    reported in seconds; a conversion's time is also part of the time of the
+    rule that triggered it.
+    """
+
+    def __init__(self, rules: Sequence[ValidationRule]):
+        self.rules = list(rules)
+
+    def run(self, frame: pd.DataFrame) -> RuleReport:
+        """Validate an in-memory frame."""
+        return self.run_chunks([frame])
+
+    def run_chunks(self, chunks: Iterable[pd.DataFrame]) -> RuleReport:
+        """Validate consecutive row chunks with identical columns."""
+        report = RuleReport()
+        timings = {rule.name: 0.0 for rule in self.rules}
+        states: List[Dict[str, Any]] = []
+
+        for chunk in chunks:
+            columns = [str(col) for col in chunk.columns]
+            if columns != list(chunk.columns):
+                chunk = chunk.set_axis(columns, axis=1, copy=False)
+            if not states:
+                for rule in self.rules:
+                    started = time.perf_counter()
+                    rule.bind(columns)
+                    states.append(rule.init_state())
+                    timings[rule.name] += time.perf_counter() - started
+
+            ctx = ChunkContext(chunk, timings)
+            for rule, state in zip(self.rules, states):
+                started = time.perf_counter()
+                rule.update(state, ctx)
+                timings[rule.name] += time.perf_counter() - started
+            report.n_rows += len(chunk)
+
+        if not states:
+            for rule in self.rules:
+                rule.bind([])
+                states.append(rule.init_state())
+
+        for rule, state in zip(self.rules, states):
+            started = time.perf_counter()
+            rule.finalize(state, report.n_rows, report)
+            timings[rule.name] += time.perf_counter() - started
+
+        report.timings = {name: round(seconds, 6) for name, seconds in timings.items()}
+        return report
+
+
+def survey_rules() -> RuleSet:
+    """Business rules for the community survey."""
+    return RuleSet([
+        RequiredColumns(['start_time', 'completion_time']),
+        CompletionRate('completion_time', min_rate=0.95),
+        DuplicateValues('email'),
+        ResponseLength(keywords=['what', 'describe', 'feedback', 'ideas', 'concerns']),
+        ZipCodes(),
+        FutureDates(['start_time', 'completion_time']),
+        Completeness(),
+        Timeliness(days=365)
+    ])
+
+
+def working_document_rules() -> RuleSet:
+    """Basic structure checks for the working document."""
+    return RuleSet([
+        TextColumns(min_mean_length=10),
+        Density(min_density=0.1)
+    ])
@@ -0,0 +1,237 @@
+"""Parquet snapshot cache for Excel workbooks."""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+from rich.console import Console
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+
+
+console = Console()
+
+SNAPSHOT_VERSION = 2
+
+# Object columns with at most this many distinct values (and repeating values
+# on average at least twice) are stored as categoricals, e.g. role, ZIP, yes/no
+CATEGORY_MAX_UNIQUE = 500
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _excel_engine() -> str:
+    """Fastest available Excel engine: calamine (Rust) if installed, else openpyxl."""
+    try:
+        import python_calamine  # noqa: F401
+        return "calamine"
+    except ImportError:
+        return "openpyxl"
+
+
+class ExcelSnapshotCache:
+    """
+    Parses each workbook once and serves later loads from typed Parquet.
+
+    Snapshots are keyed by the SHA-256 of the workbook's bytes, so an edited
+    file gets a new snapshot while a renamed or copied one reuses the old.
+    Each sheet is one Parquet file; reads are memory-mapped. Object columns
+    mixing text with other values are stored as strings, low-cardinality text
+    columns as categoricals, and other object columns (dates, times,
+    decimals) keep their type.
+    """
+
+    def __init__(self, audit_logger: Optional[AuditLogger] = None,
+                 cache_dir: Optional[Path] = None):
+        self.audit_logger = audit_logger or AuditLogger()
+        self.cache_dir = Path(cache_dir or settings.processed_data_dir / "snapshots")
+        self.cache_dir.mkdir(exist_ok=True, parents=True)
+        self._hash_index_file = self.cache_dir / "file_hashes.json"
+
+    def read_excel(self, file_path: Union[str, Path],
+                   sheet_name: Union[int, str, None] = 0) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Read a workbook through the snapshot cache.
+
+        Args:
+            file_path: Path of the .xlsx file
+            sheet_name: Sheet name, sheet position, or None for all sheets
+                (same meaning as in pandas.read_excel)
+
+        Returns:
+            A DataFrame, or a dictionary of DataFrames by sheet name for None
+        """
+        file_path = Path(file_path)
+        snapshot_dir = self.cache_dir / self.file_hash(file_path)
+        manifest = self._load_manifest(snapshot_dir)
+
+        if manifest is None:
+            manifest = self._create_snapshot(file_path, snapshot_dir)
+
+        sheet_names = [sheet['name'] for sheet in manifest['sheets']]
+        if sheet_name is None:
+            return {name: self._read_sheet(snapshot_dir, manifest, name) for name in sheet_names}
+        if isinstance(sheet_name, int):
+            sheet_name = sheet_names[sheet_name]
+        if sheet_name not in sheet_names:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found in {file_path.name}")
+        return self._read_sheet(snapshot_dir, manifest, sheet_name)
+
+    def sheet_names(self, file_path: Union[str, Path]) -> List[str]:
+        """Sheet names of a workbook, in workbook order."""
+        file_path = Path(file_path)
+        snapshot_dir = self.cache_dir / self.file_hash(file_path)
+        manifest = self._load_manifest(snapshot_dir) or self._create_snapshot(file_path, snapshot_dir)
+        return [sheet['name'] for sheet in manifest['sheets']]
+
+    def file_hash(self, file_path: Path) -> str:
+        """
+        Content hash of a file.
+
+        Hashes are remembered by (path, size, mtime) so unchanged files are
+        not re-read on every load.
+        """
+        stat = file_path.stat()
+        key = f"{file_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+        hash_index = {}
+        if self._hash_index_file.exists():
+            with open(self._hash_index_file, 'r') as f:
+                hash_index = json.load(f)
+        if key in hash_index:
+            return hash_index[key]
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        content_hash = digest.hexdigest()[:32]
+
+        hash_index[key] = content_hash
+        with open(self._hash_index_file, 'w') as f:
+            json.dump(hash_index, f, indent=2)
+
+        return content_hash
+
+    def _load_manifest(self, snapshot_dir: Path) -> Optional[Dict[str, Any]]:
+        manifest_file = snapshot_dir / "manifest.json"
+        if not manifest_file.exists():
+            return None
+        with open(manifest_file, 'r') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != SNAPSHOT_VERSION:
+            return None
+        return manifest
+
+    def _create_snapshot(self, file_path: Path, snapshot_dir: Path) -> Dict[str, Any]:
+        """Parse every sheet of the workbook once and write it as Parquet."""
+        engine = _excel_engine()
+        console.print(f"[dim]Creating Parquet snapshot of {file_path.name} ({engine})...[/dim]")
+
+        sheets = pd.read_excel(file_path, sheet_name=None, engine=engine)
+        snapshot_dir.mkdir(exist_ok=True, parents=True)
+
+        manifest = {
+            'version': SNAPSHOT_VERSION,
+            'source_file': file_path.name,
+            'engine': engine,
+            'created_at': datetime.now().isoformat(),
+            'sheets': []
+        }
+
+        for position, (name, df) in enumerate(sheets.items()):
+            typed, categorical = self._type_columns(df)
+
+            # Parquet needs unique string column names; originals go in the manifest
+            columns = [self._json_column_name(col) for col in typed.columns]
+            typed.columns = [f"c{i}" for i in range(len(columns))]
+
+            parquet_file = f"sheet_{position:02d}.parquet"
+            typed.to_parquet(snapshot_dir / parquet_file, engine='pyarrow', index=False)
+
+            manifest['sheets'].append({
+                'name': name,
+                'file': parquet_file,
+                'columns': columns,
+                'rows': len(typed),
+                'categorical_columns': [columns[i] for i in categorical]
+            })
+
+        # Written last, so an interrupted snapshot is simply rebuilt
+        with open(snapshot_dir / "manifest.json", 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        self.audit_logger.log_operation(
+            operation="create_excel_snapshot",
+            input_file=str(file_path),
+            snapshot_dir=str(snapshot_dir),
+            engine=engine,
+            sheets={sheet['name']: sheet['rows'] for sheet in manifest['sheets']}
+        )
+
+        return manifest
+
+    def _read_sheet(self, snapshot_dir: Path, manifest: Dict[str, Any], sheet_name: str) -> pd.DataFrame:
+        sheet = next(s for s in manifest['sheets'] if s['name'] == sheet_name)
+        df = pd.read_parquet(snapshot_dir / sheet['file'], engine='pyarrow', memory_map=True)
+        df.columns = sheet['columns']
+        return df
+
+    @staticmethod
+    def _json_column_name(col: Any) -> Any:
+        if isinstance(col, (str, int, float)) and not isinstance(col, bool):
+            return col
+        return str(col)
+
+    @staticmethod
+    def _type_columns(df: pd.DataFrame) -> tuple:
+        """
+        Make object columns Parquet-safe and compact.
+
+        Returns:
+            (typed DataFrame, positions of categorical columns)
+        """
+        typed = df.copy()
+        categorical = []
+
+        for i in range(typed.shape[1]):
+            values = typed.iloc[:, i]
+            if values.dtype != 'object':
+                continue
+
+            inferred = pd.api.types.infer_dtype(values, skipna=True)
+            if inferred in ('mixed', 'mixed-integer'):
+                # Text mixed with numbers or dates: store their text form
+                values = values.where(values.isna(), values.astype(str))
+                inferred = 'string'
+
+            if inferred == 'string':
+                non_null = values.count()
+                unique = values.nunique(dropna=True)
+                if (0 < unique <= CATEGORY_MAX_UNIQUE
+                        and unique <= CATEGORY_MAX_UNIQUE_RATIO * non_null):
+                    values = values.astype('category')
+                    categorical.append(i)
+
+            typed.isetitem(i, values)
+
+        return typed, categorical
+
+
+def read_excel_snapshot(file_path: Union[str, Path], sheet_name: Union[int, str, None] = 0,
+                        cache_dir: Optional[Path] = None) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Drop-in replacement for pandas.read_excel backed by the snapshot cache.
+
+    Args:
+        file_path: Path of the .xlsx file
+        sheet_name: Sheet name, sheet position, or None for all sheets
+        cache_dir: Snapshot directory, defaults to data/processed/snapshots
+
+    Returns:
+        A DataFrame, or a dictionary of DataFrames by sheet name for None
+    """
+    return ExcelSnapshotCache(cache_dir=cache_dir).read_excel(file_path, sheet_name)
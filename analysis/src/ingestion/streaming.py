@@ -0,0 +1,247 @@
+"""Chunked, bounded-memory ingestion and per-stage memory reporting."""
+
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+from rich.console import Console
+from rich.table import Table
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+
+
+console = Console()
+
+# Share of the memory ceiling a single chunk may occupy; the rest is left for
+# the index and downstream stages that accumulate results
+CHUNK_MEMORY_FRACTION = 0.1
+MIN_CHUNK_ROWS = 100
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process in MB, or None if unavailable."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+class MemoryMonitor:
+    """
+    Records peak RSS per pipeline stage.
+
+    A background thread samples RSS while a stage runs, so each stage gets
+    its own peak rather than the process-wide high-water mark.
+    """
+
+    def __init__(self, audit_logger: Optional[AuditLogger] = None, interval: float = 0.05):
+        self.audit_logger = audit_logger or AuditLogger()
+        self.interval = interval
+        self.stages: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure a stage: `with monitor.stage("load"): ...`"""
+        start_rss = current_rss_mb()
+        peak = [start_rss or 0.0]
+        stop = threading.Event()
+
+        def sample() -> None:
+            while not stop.wait(self.interval):
+                rss = current_rss_mb()
+                if rss is not None and rss > peak[0]:
+                    peak[0] = rss
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            stop.set()
+            sampler.join()
+            end_rss = current_rss_mb()
+            if end_rss is not None:
+                peak[0] = max(peak[0], end_rss)
+
+            record = {
+                'stage': name,
+                'duration_seconds': round(time.perf_counter() - started, 3),
+                'start_rss_mb': round(start_rss, 1) if start_rss is not None else None,
+                'end_rss_mb': round(end_rss, 1) if end_rss is not None else None,
+                'peak_rss_mb': round(peak[0], 1) if start_rss is not None else round(peak_rss_mb(), 1)
+            }
+            self.stages.append(record)
+            self.audit_logger.log_operation(operation="memory_stage", **record)
+
+    def display(self) -> None:
+        """Print the per-stage memory table."""
+        table = Table(title="Memory by Stage")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Duration (s)", justify="right")
+        table.add_column("Start RSS (MB)", justify="right")
+        table.add_column("Peak RSS (MB)", justify="right", style="bold")
+
+        for record in self.stages:
+            table.add_row(
+                record['stage'],
+                f"{record['duration_seconds']:.1f}",
+                f"{record['start_rss_mb']}" if record['start_rss_mb'] is not None else "-",
+                f"{record['peak_rss_mb']}"
+            )
+
+        console.print(table)
+
+
+class ChunkedReader:
+    """
+    Streams rows of .xlsx or .csv exports as DataFrame chunks.
+
+    Excel files are read with openpyxl in read-only mode (rows are parsed
+    lazily, never the whole sheet), CSV files with pandas' chunked reader.
+    Chunk size adapts to the measured size of the rows so that one chunk
+    stays within a fraction of the memory ceiling; if process RSS still
+    exceeds the ceiling, chunks are halved and a warning is logged.
+    """
+
+    def __init__(self, memory_limit_mb: Optional[int] = None, chunk_rows: Optional[int] = None,
+                 audit_logger: Optional[AuditLogger] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            memory_limit_mb: Memory ceiling for the process, in MB
+            chunk_rows: Maximum rows per chunk
+            audit_logger: Audit logger for lineage
+        """
+        self.memory_limit_mb = memory_limit_mb or settings.ingest_memory_limit_mb
+        self.max_chunk_rows = chunk_rows or settings.ingest_chunk_rows
+        self.audit_logger = audit_logger or AuditLogger()
+        self.chunk_rows = min(self.max_chunk_rows, 1000)
+        self.rows_read = 0
+        self._over_limit_logged = False
+
+    def iter_chunks(self, file_path: Path, columns: Optional[List[str]] = None,
+                    sheet_name: Optional[str] = None,
+                    column_cleaner: Optional[Callable[[Any], str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield consecutive row chunks of a file.
+
+        Args:
+            file_path: .xlsx or .csv file
+            columns: Column names (after cleaning) to keep; others are dropped
+                while reading
+            sheet_name: Worksheet to read (default: first sheet)
+            column_cleaner: Function applied to header names
+
+        Yields:
+            DataFrames whose index is the global row position
+        """
+        file_path = Path(file_path)
+        if file_path.suffix.lower() == '.csv':
+            chunks = self._iter_csv(file_path, columns, column_cleaner)
+        else:
+            chunks = self._iter_excel(file_path, columns, sheet_name, column_cleaner)
+
+        for chunk in chunks:
+            chunk.index = pd.RangeIndex(self.rows_read, self.rows_read + len(chunk))
+            self.rows_read += len(chunk)
+            yield chunk
+            self._adapt_chunk_size(chunk)
+
+    def _adapt_chunk_size(self, chunk: pd.DataFrame) -> None:
+        """Size the next chunk from this chunk's memory footprint and current RSS."""
+        if len(chunk):
+            bytes_per_row = max(chunk.memory_usage(deep=True).sum() / len(chunk), 1)
+            budget = self.memory_limit_mb * 2**20 * CHUNK_MEMORY_FRACTION
+            self.chunk_rows = int(min(self.max_chunk_rows, max(MIN_CHUNK_ROWS, budget / bytes_per_row)))
+
+        rss = current_rss_mb()
+        if rss is not None and rss > self.memory_limit_mb:
+            gc.collect()
+            self.chunk_rows = max(MIN_CHUNK_ROWS, self.chunk_rows // 2)
+            if not self._over_limit_logged:
+                self._over_limit_logged = True
+                console.print(
+                    f"[yellow]Warning: RSS {rss:.0f} MB exceeds ingestion limit "
+                    f"{self.memory_limit_mb} MB, reducing chunk size[/yellow]"
+                )
+                self.audit_logger.log_warning(
+                    operation="chunked_ingestion",
+                    message="RSS exceeds ingestion memory limit",
+                    context={"rss_mb": round(rss, 1), "limit_mb": self.memory_limit_mb,
+                             "rows_read": self.rows_read}
+                )
+
+    def _header_names(self, header: List[Any], column_cleaner: Optional[Callable[[Any], str]]) -> List[str]:
+        names = [
+            f"Unnamed: {i}" if name is None else name
+            for i, name in enumerate(header)
+        ]
+        return [column_cleaner(name) for name in names] if column_cleaner else [str(n) for n in names]
+
+    def _iter_excel(self, file_path: Path, columns: Optional[List[str]], sheet_name: Optional[str],
+                    column_cleaner: Optional[Callable[[Any], str]]) -> Iterator[pd.DataFrame]:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            rows = worksheet.iter_rows(values_only=True)
+
+            header = next(rows, None)
+            if header is None:
+                return
+            names = self._header_names(list(header), column_cleaner)
+            positions = [i for i, name in enumerate(names) if columns is None or name in columns]
+            selected = [names[i] for i in positions]
+
+            buffer: List[tuple] = []
+            for row in rows:
+                buffer.append(tuple(row[i] if i < len(row) else None for i in positions))
+                if len(buffer) >= self.chunk_rows:
+                    yield pd.DataFrame.from_records(buffer, columns=selected)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame.from_records(buffer, columns=selected)
+        finally:
+            workbook.close()
+
+    def _iter_csv(self, file_path: Path, columns: Optional[List[str]],
+                  column_cleaner: Optional[Callable[[Any], str]]) -> Iterator[pd.DataFrame]:
+        header = pd.read_csv(file_path, nrows=0).columns.tolist()
+        names = self._header_names(header, column_cleaner)
+        positions = [i for i, name in enumerate(names) if columns is None or name in columns]
+
+        with pd.read_csv(file_path, usecols=positions, dtype=object, iterator=True) as reader:
+            while True:
+                try:
+                    chunk = reader.get_chunk(self.chunk_rows)
+                except StopIteration:
+                    return
+                chunk.columns = [names[i] for i in sorted(positions)]
+                yield chunk
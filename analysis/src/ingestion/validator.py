@@ -2,7 +2,7 @@
 
 import json
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 import numpy as np
@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from ..config import settings
 from ..validation.audit import AuditLogger
+from .rules import survey_rules, working_document_rules
 
 
 console = Console()
@@ -25,6 +26,7 @@ class ValidationResult(BaseModel):
     issues: List[Dict[str, Any]] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
     statistics: Dict[str, Any] = Field(default_factory=dict)
+    rule_timings: Dict[str, float] = Field(default_factory=dict)
 
 
 class DataValidator:
@@ -55,101 +57,29 @@ class DataValidator:
     
     def _validate_survey_data(self, df: pd.DataFrame) -> ValidationResult:
         """Validate survey data with specific business rules."""
+        return self.validate_survey_chunks([df])
+    
+    def validate_survey_chunks(self, chunks: Iterable[pd.DataFrame]) -> ValidationResult:
+        """
+        Validate survey data given as consecutive row chunks.
+        
+        All survey rules are evaluated in one pass over the chunks, so the
+        survey can be validated while it is streamed in.
+        """
+        report = survey_rules().run_chunks(chunks)
+        
         result = ValidationResult(
             is_valid=True,
-            total_records=len(df),
-            valid_records=len(df)
+            total_records=report.n_rows,
+            valid_records=report.n_rows,
+            issues=report.issues,
+            warnings=report.warnings,
+            statistics=report.statistics,
+            rule_timings=report.timings
         )
         
-        # Check for required columns (using cleaned names)
-        required_cols = ['start_time', 'completion_time']
-        
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        if missing_cols:
-            # Not critical - just note it
-            result.warnings.append(f"Some expected columns missing: {missing_cols}")
-        
-        # Check completion rates
-        if 'completion_time' in df.columns:
-            completion_rate = df['completion_time'].notna().sum() / len(df)
-            result.statistics['completion_rate'] = completion_rate
-            
-            if completion_rate < 0.95:
-                result.warnings.append(
-                    f"Low completion rate: {completion_rate:.1%}"
-                )
-        
-        # Check for duplicate responses
-        if 'email' in df.columns:
-            duplicate_mask = df.duplicated(subset=['email'], keep=False)
-            if duplicate_mask.any():
-                duplicates = df[df['email'].notna()]['email'].value_counts()
-                duplicates = duplicates[duplicates > 1]
-                if len(duplicates) > 0:
-                    result.issues.append({
-                        "type": "duplicate_responses",
-                        "count": len(duplicates),
-                        "severity": "warning"
-                    })
-        
-        # Analyze response quality
-        # Look for text columns that might contain responses
-        text_columns = []
-        for col in df.columns:
-            if any(keyword in col.lower() for keyword in ['what', 'describe', 'feedback', 'ideas', 'concerns']):
-                text_columns.append(col)
-        
-        for col in text_columns[:5]:  # Limit to first 5 text columns
-            if col in df.columns:
-                # Check response lengths
-                lengths = df[col].astype(str).str.len()
-                lengths = lengths[df[col].notna()]  # Only non-null values
-                
-                if len(lengths) > 0:
-                    short_responses = (lengths < settings.min_response_length).sum()
-                    
-                    if short_responses > len(df) * 0.1:
-                        result.warnings.append(
-                            f"High rate of short responses in question: "
-                            f"{short_responses/len(df):.1%}"
-                        )
-                    
-                    result.statistics[f"avg_response_length_{col[:30]}"] = lengths.mean()
-        
-        # Check geographic distribution
-        zip_col = None
-        for col in df.columns:
-            if 'zip' in col.lower() and 'code' in col.lower():
-                zip_col = col
-                break
-        
-        if zip_col and zip_col in df.columns:
-            zip_codes = df[zip_col].astype(str).str.strip()
-            valid_zips = zip_codes[zip_codes.str.match(r'^\d{5}$', na=False)]
-            result.statistics['unique_zip_codes'] = len(valid_zips.unique())
-            result.statistics['top_5_zips'] = valid_zips.value_counts().head().to_dict()
-        
-        # Validate dates
-        date_cols = ['start_time', 'completion_time']
-        for col in date_cols:
-            if col in df.columns:
-                # Try to convert to datetime
-                try:
-                    dates = pd.to_datetime(df[col], errors='coerce')
-                    # Check for future dates
-                    future_dates = dates > pd.Timestamp.now()
-                    if future_dates.any():
-                        result.issues.append({
-                            "type": "future_dates",
-                            "column": col,
-                            "count": future_dates.sum(),
-                            "severity": "warning"
-                        })
-                except:
-                    pass
-        
         # Calculate data quality score
-        quality_score = self._calculate_quality_score(df)
+        quality_score = self._calculate_quality_score(report.statistics)
         result.statistics['quality_score'] = quality_score
         
         if quality_score < 0.8:
@@ -186,32 +116,20 @@ class DataValidator:
             result.is_valid = False
             return result
         
-        # Check for any text content
-        text_cols = []
-        for col in df.columns:
-            sample = df[col].dropna().astype(str)
-            if len(sample) > 0 and sample.str.len().mean() > 10:
-                text_cols.append(col)
-        
-        result.statistics['text_columns'] = len(text_cols)
-        result.statistics['total_columns'] = len(df.columns)
-        
-        # Basic quality check
-        non_null_percentage = df.notna().sum().sum() / (len(df) * len(df.columns))
-        result.statistics['data_density'] = non_null_percentage
-        
-        if non_null_percentage < 0.1:
-            result.warnings.append("Very sparse data (>90% missing values)")
+        report = working_document_rules().run(df)
+        result.statistics.update(report.statistics)
+        result.warnings.extend(report.warnings)
+        result.issues.extend(report.issues)
+        result.rule_timings = report.timings
         
         return result
     
-    def _calculate_quality_score(self, df: pd.DataFrame) -> float:
-        """Calculate overall data quality score (0-1)."""
+    def _calculate_quality_score(self, statistics: Dict[str, Any]) -> float:
+        """Calculate overall data quality score (0-1) from rule statistics."""
         scores = []
         
         # Completeness score
-        completeness = 1 - (df.isnull().sum().sum() / (len(df) * len(df.columns)))
-        scores.append(completeness)
+        scores.append(statistics.get('completeness', 0.0))
         
         # Consistency score (check for valid values in key columns)
         # This is simplified since we don't know exact column names
@@ -219,20 +137,9 @@ class DataValidator:
         scores.append(consistency)
         
         # Timeliness score (if we have date columns)
-        timeliness = 1.0  # Default to good
-        for col in df.columns:
-            if 'time' in col.lower() or 'date' in col.lower():
-                try:
-                    dates = pd.to_datetime(df[col], errors='coerce')
-                    if dates.notna().any():
-                        recent_mask = dates > pd.Timestamp.now() - pd.Timedelta(days=365)
-                        timeliness = recent_mask.mean()
-                        break
-                except:
-                    pass
-        scores.append(timeliness)
+        scores.append(statistics.get('timeliness', 1.0))
         
-        return np.mean(scores)
+        return float(np.mean(scores))
     
     def _display_validation_summary(self, results: Dict[str, ValidationResult]) -> None:
         """Display validation summary in a rich table."""
@@ -2,5 +2,6 @@
 
 from .client import LLMClient
 from .prompts import PromptTemplates
+from .scheduler import LLMScheduler
 
-__all__ = ["LLMClient", "PromptTemplates"]
\ No newline at end of file
+__all__ = ["LLMClient", "PromptTemplates", "LLMScheduler"]
\ No newline at end of file
@@ -14,6 +14,7 @@ from rich.console import Console
 
 from ..config import settings
 from ..validation.audit import AuditLogger
+from ..validation.progress import get_progress_feed
 
 console = Console()
 
@@ -217,7 +218,9 @@ class LLMClient:
             self.audit_logger.log_operation(
                 operation="llm_cache_hit",
                 cache_key=cache_key,
-                cached_at=data.get("cached_at")
+                cached_at=data.get("cached_at"),
+                model=data.get("model"),
+                tokens_used=data.get("tokens_used")
             )
             
             return data
@@ -234,7 +237,8 @@ class LLMClient:
         instructions: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        response_format: Optional[BaseModel] = None
+        response_format: Optional[BaseModel] = None,
+        question_id: Optional[str] = None
     ) -> LLMResponse:
         """
         Generate a response using GPT-4.1's new API.
@@ -245,6 +249,7 @@ class LLMClient:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             response_format: Optional Pydantic model for structured output
+            question_id: Survey question the call is for, recorded in the audit log
             
         Returns:
             LLMResponse object with generated content
@@ -317,6 +322,7 @@ class LLMClient:
                     
                     if usage_dict:
                         tokens_used = usage_dict
+                        get_progress_feed().add_tokens(usage_dict.get("total_tokens", 0))
                 except AttributeError:
                     pass
             
@@ -344,7 +350,8 @@ class LLMClient:
                     "max_tokens": max_tokens,
                     "has_instructions": bool(instructions)
                 },
-                tokens_used=tokens_used
+                tokens_used=tokens_used,
+                question_id=question_id
             )
             
             return LLMResponse(
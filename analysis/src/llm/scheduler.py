@@ -0,0 +1,258 @@
+"""Global scheduler for LLM-bound work."""
+
+import itertools
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, Hashable, Iterable, Optional, Tuple
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+
+
+class _Task:
+    __slots__ = ("fn", "args", "kwargs", "future", "group", "priority", "seq")
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: dict, group: str, priority: int, seq: int):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.group = group
+        self.priority = priority
+        self.seq = seq
+
+
+class LLMScheduler:
+    """
+    Runs LLM calls from all analyses under one concurrency budget.
+
+    Every task belongs to a group (a question, a program). When a worker
+    frees up it takes, in order:
+
+    1. finishing tasks (`FINISH`): aggregation, insight and program theme
+       calls, which end a group's critical path
+    2. extraction tasks (`EXTRACT`) of the group with the fewest tasks left,
+       so a nearly finished question completes and its finishing call starts
+       instead of waiting behind unrelated extraction work
+
+    Within a group tasks run in submission order. Tasks submitted with a `key`
+    that was already submitted share the first task's future, so a response
+    needed by a question and by a program is extracted once.
+
+    `shutdown()` runs every queued task first; after an error or interrupt,
+    `shutdown(cancel_pending=True)` cancels the queued tasks instead, so only
+    the calls already in flight are waited for.
+    """
+
+    FINISH = 0
+    EXTRACT = 1
+
+    def __init__(self, max_concurrency: Optional[int] = None, audit_logger: Optional[AuditLogger] = None):
+        """
+        Start the workers.
+
+        Args:
+            max_concurrency: Number of LLM calls in flight at once
+            audit_logger: Audit logger for the scheduler summary
+        """
+        self.max_concurrency = max_concurrency or settings.llm_max_concurrency
+        self.audit_logger = audit_logger or AuditLogger()
+
+        self._queues: Dict[Tuple[int, str], Deque[_Task]] = {}
+        self._remaining: Counter = Counter()  # queued + running tasks per group
+        self._by_key: Dict[Hashable, Future] = {}
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._cancelled = False
+        self._stopped = False
+
+        self._started = time.perf_counter()
+        self._tasks_run = 0
+        self._shared = 0
+        self._cancelled_tasks = 0
+        self._busy = 0.0
+        self._group_finished: Dict[str, float] = {}
+
+        self._workers = [
+            threading.Thread(target=self._work, name=f"llm-scheduler-{i}", daemon=True)
+            for i in range(self.max_concurrency)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "LLMScheduler":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown(cancel_pending=exc_type is not None)
+
+    def submit(self, fn: Callable, *args, group: str, priority: int = EXTRACT,
+               key: Optional[Hashable] = None, **kwargs) -> Future:
+        """
+        Queue a call.
+
+        Args:
+            fn: Callable making (at most) one LLM call
+            group: Question or program the call belongs to
+            priority: `FINISH` or `EXTRACT`
+            key: Deduplication key; a call with a key already submitted is
+                not queued again
+
+        Returns:
+            Future of the call's result (cancelled after a cancelling shutdown)
+        """
+        with self._condition:
+            if self._cancelled:
+                return self._cancelled_future()
+            if key is not None and key in self._by_key:
+                self._shared += 1
+                return self._by_key[key]
+            task = self._enqueue(fn, args, kwargs, group, priority)
+            if key is not None:
+                self._by_key[key] = task.future
+            return task.future
+
+    def when_all(self, futures: Iterable[Future], fn: Callable, *args, group: str,
+                 priority: int = FINISH, **kwargs) -> Future:
+        """
+        Queue a call once all `futures` are done (whether or not they failed).
+
+        Returns:
+            Future of the call's result
+        """
+        futures = list(futures)
+        with self._condition:
+            if self._cancelled:
+                return self._cancelled_future()
+            task = _Task(fn, args, kwargs, group, priority, next(self._seq))
+            # The group is not finished while its finishing call is pending
+            self._remaining[group] += 1
+
+        pending = [len(futures)]
+        lock = threading.Lock()
+
+        def release(_: Future = None) -> None:
+            with lock:
+                pending[0] -= 1
+                ready = pending[0] <= 0
+            if ready:
+                with self._condition:
+                    self._remaining[group] -= 1
+                    if not self._cancelled:
+                        self._push(task)
+                        return
+                    self._cancelled_tasks += 1
+                task.future.cancel()
+
+        if not futures:
+            pending[0] = 1
+            release()
+        for future in futures:
+            future.add_done_callback(release)
+        return task.future
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            cancel_pending: Cancel queued tasks (and finishing calls still
+                waiting for their inputs) instead of running them; calls in
+                flight are still waited for. Use after an error or interrupt.
+        """
+        with self._condition:
+            if self._stopped:
+                return
+            self._stopped = True
+            if cancel_pending:
+                self._cancelled = True
+                queued = [task for tasks in self._queues.values() for task in tasks]
+                self._queues.clear()
+                for task in queued:
+                    self._remaining[task.group] -= 1
+                self._cancelled_tasks += len(queued)
+            else:
+                while any(self._queues.values()) or sum(self._remaining.values()) > 0:
+                    self._condition.wait()
+            self._closed = True
+            self._condition.notify_all()
+
+        if cancel_pending:
+            # Outside the lock: cancelling runs done callbacks, which release
+            # (and so cancel) the finishing calls waiting on these tasks
+            for task in queued:
+                task.future.cancel()
+        for worker in self._workers:
+            worker.join()
+
+        makespan = time.perf_counter() - self._started
+        self.audit_logger.log_operation(
+            operation="llm_scheduler_summary",
+            max_concurrency=self.max_concurrency,
+            tasks_run=self._tasks_run,
+            shared_tasks=self._shared,
+            cancelled_tasks=self._cancelled_tasks,
+            makespan_seconds=round(makespan, 3),
+            utilization=round(self._busy / (makespan * self.max_concurrency), 3) if makespan > 0 else 0.0,
+            group_finished_seconds={group: round(t, 3) for group, t in self._group_finished.items()}
+        )
+
+    @staticmethod
+    def _cancelled_future() -> Future:
+        future: Future = Future()
+        future.cancel()
+        return future
+
+    def _enqueue(self, fn: Callable, args: tuple, kwargs: dict, group: str, priority: int) -> _Task:
+        """Create and queue a task (caller holds the condition)."""
+        task = _Task(fn, args, kwargs, group, priority, next(self._seq))
+        self._push(task)
+        return task
+
+    def _push(self, task: _Task) -> None:
+        self._queues.setdefault((task.priority, task.group), deque()).append(task)
+        self._remaining[task.group] += 1
+        self._condition.notify_all()
+
+    def _next_task(self) -> Optional[_Task]:
+        """Pick the next task (caller holds the condition)."""
+        best = None
+        for (priority, group), tasks in self._queues.items():
+            if not tasks:
+                continue
+            rank = (priority, self._remaining[group], tasks[0].seq)
+            if best is None or rank < best[0]:
+                best = (rank, tasks)
+        return best[1].popleft() if best else None
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                task = self._next_task()
+                while task is None:
+                    if self._closed:
+                        return
+                    self._condition.wait()
+                    task = self._next_task()
+
+            if task.future.set_running_or_notify_cancel():
+                started = time.perf_counter()
+                try:
+                    task.future.set_result(task.fn(*task.args, **task.kwargs))
+                except BaseException as e:
+                    task.future.set_exception(e)
+                elapsed = time.perf_counter() - started
+            else:
+                elapsed = 0.0
+
+            with self._condition:
+                self._tasks_run += 1
+                self._busy += elapsed
+                self._remaining[task.group] -= 1
+                if self._remaining[task.group] == 0:
+                    self._group_finished[task.group] = time.perf_counter() - self._started
+                self._condition.notify_all()
+
@@ -1,5 +1,7 @@
 """Analysis pipeline orchestration."""
 
+from .dag import Stage, StageCache, StageGraph, StageError
 from .runner import AnalysisPipeline
+from .update import SurveyUpdater, UpdateSummary
 
-__all__ = ["AnalysisPipeline"]
\ No newline at end of file
+__all__ = ["AnalysisPipeline", "Stage", "StageCache", "StageGraph", "StageError", "SurveyUpdater", "UpdateSummary"]
@@ -0,0 +1,299 @@
+"""Stage graph with content-keyed output caching."""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Set
+
+from rich.console import Console
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+from ..validation.progress import get_progress_feed
+
+
+console = Console()
+
+
+def code_digest(modules: Iterable[ModuleType]) -> str:
+    """Digest of the source of modules (a package covers all its .py files)."""
+    digest = hashlib.sha256()
+    for module in modules:
+        source = Path(inspect.getsourcefile(module))
+        files = sorted(source.parent.rglob("*.py")) if source.name == "__init__.py" else [source]
+        for path in files:
+            digest.update(str(path.relative_to(settings.analysis_root)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def settings_digest(names: Iterable[str]) -> str:
+    """Digest of the values of the named settings."""
+    values = {name: getattr(settings, name) for name in sorted(names)}
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def files_digest(paths: Iterable[Path]) -> str:
+    """Digest of file names, sizes and modification times."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+class StageError(RuntimeError):
+    """A stage raised; the original exception is the cause."""
+
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(f"Stage '{stage}' failed: {error}")
+        self.stage = stage
+        self.error = error
+
+
+@dataclass
+class Stage:
+    """
+    One step of the pipeline.
+
+    `run` receives the outputs of the stages named in `inputs` (by stage
+    name) and returns this stage's output. The cache key of the output
+    covers the input keys, the source of `code`, the values of `settings`
+    and, for stages reading files directly, `sources()`.
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Any]
+    inputs: Sequence[str] = ()
+    code: Sequence[ModuleType] = ()
+    settings: Sequence[str] = ()
+    sources: Optional[Callable[[], str]] = None
+    # Stages with side effects only (saving, lineage) always run
+    cacheable: bool = True
+    # Checks that a cached output is still usable (e.g. its files exist)
+    is_valid: Optional[Callable[[Any], bool]] = None
+
+
+@dataclass
+class StageRun:
+    """How a stage was resolved in a run."""
+    name: str
+    status: str  # "ran", "cached", "skipped" or "failed"
+    key: Optional[str] = None
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+class StageCache:
+    """Pickled stage outputs under `<cache_dir>/<stage>/<key>.pkl`."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir or settings.data_dir / "pipeline_cache")
+
+    def path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / stage / f"{key}.pkl"
+
+    def has(self, stage: str, key: str) -> bool:
+        return self.path(stage, key).exists()
+
+    def load(self, stage: str, key: str) -> Any:
+        with open(self.path(stage, key), 'rb') as f:
+            return pickle.load(f)
+
+    def save(self, stage: str, key: str, value: Any) -> None:
+        path = self.path(stage, key)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+
+@dataclass
+class GraphRun:
+    """
+    Outputs and per-stage status of a graph run.
+
+    Cached outputs are read from the cache on first access, so stages that
+    are only needed to compute keys (e.g. the loaded data when just the
+    charts change) are never unpickled.
+    """
+    cache: StageCache
+    outputs: Dict[str, Any] = field(default_factory=dict)
+    stages: Dict[str, StageRun] = field(default_factory=dict)
+
+    def get(self, name: str) -> Any:
+        """Output of a stage (None if it was skipped)."""
+        if name not in self.outputs:
+            stage_run = self.stages.get(name)
+            if stage_run is None or stage_run.status != "cached":
+                return None
+            self.outputs[name] = self.cache.load(name, stage_run.key)
+        return self.outputs[name]
+
+
+class StageGraph:
+    """
+    Runs stages in dependency order, independent stages in parallel.
+
+    A stage whose cache key is unchanged is served from the cache instead of
+    running, so e.g. editing a chart re-runs only the visualization stage and
+    what depends on it. Keys are chained: a stage's key includes the keys of
+    its inputs, so any upstream change invalidates everything below it.
+    """
+
+    def __init__(self, stages: Sequence[Stage], audit_logger: Optional[AuditLogger] = None,
+                 cache: Optional[StageCache] = None, max_workers: Optional[int] = None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = [stage.name for stage in stages]
+        self.audit_logger = audit_logger or AuditLogger()
+        self.cache = cache or StageCache()
+        self.max_workers = max_workers or settings.pipeline_max_workers
+
+        for stage in stages:
+            for name in stage.inputs:
+                if name not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{name}'")
+                if self.order.index(name) > self.order.index(stage.name):
+                    raise ValueError(f"Stage '{stage.name}' is listed before its input '{name}'")
+
+    def downstream(self, name: str) -> Set[str]:
+        """A stage and every stage that depends on it, directly or not."""
+        result = {name}
+        for stage_name in self.order:
+            if any(dep in result for dep in self.stages[stage_name].inputs):
+                result.add(stage_name)
+        return result
+
+    def upstream(self, names: Iterable[str]) -> Set[str]:
+        """Stages and everything they depend on."""
+        result: Set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in result:
+                result.add(name)
+                pending.extend(self.stages[name].inputs)
+        return result
+
+    def cache_key(self, name: str, keys: Dict[str, str]) -> str:
+        """Key of a stage's output given the keys of its inputs."""
+        stage = self.stages[name]
+        parts = {
+            "stage": name,
+            "inputs": {dep: keys[dep] for dep in stage.inputs},
+            "code": code_digest(stage.code),
+            "settings": settings_digest(stage.settings),
+            "sources": stage.sources() if stage.sources else None
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()[:32]
+
+    def run(self, only: Optional[Sequence[str]] = None, from_stage: Optional[str] = None,
+            skip: Sequence[str] = (), use_cache: bool = True) -> GraphRun:
+        """
+        Run the graph.
+
+        Args:
+            only: Run just these stages; their inputs come from the cache
+                (or are computed if not cached)
+            from_stage: Re-run this stage and everything downstream of it,
+                ignoring cached outputs; upstream stages come from the cache
+            skip: Stages not to run; dependents get no output for them
+            use_cache: Read cached outputs (outputs are always written)
+
+        Returns:
+            Outputs by stage name and how each stage was resolved
+        """
+        for name in list(only or []) + ([from_stage] if from_stage else []) + list(skip):
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage '{name}', expected one of {self.order}")
+
+        targets = set(only) if only else set(self.order)
+        needed = self.upstream(targets) - set(skip)
+        forced = set(targets) if only else set()
+        if from_stage:
+            forced |= self.downstream(from_stage)
+        if not use_cache:
+            forced |= needed
+
+        result = GraphRun(cache=self.cache)
+        keys: Dict[str, str] = {}
+        for name in self.order:
+            if name not in needed:
+                result.stages[name] = StageRun(name=name, status="skipped")
+
+        remaining = [name for name in self.order if name in needed]
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as executor:
+            while remaining or running:
+                # Submit every stage whose inputs are resolved
+                for name in list(remaining):
+                    stage = self.stages[name]
+                    if any(dep in remaining or dep in running.values() for dep in stage.inputs):
+                        continue
+                    remaining.remove(name)
+                    key = self.cache_key(name, {dep: keys.get(dep, "skipped") for dep in stage.inputs})
+                    keys[name] = key
+
+                    if stage.cacheable and name not in forced and self.cache.has(name, key):
+                        if stage.is_valid is None or stage.is_valid(self.cache.load(name, key)):
+                            result.stages[name] = StageRun(name=name, status="cached", key=key)
+                            self._log_stage(result.stages[name])
+                            get_progress_feed().emit("stage_end", stage=name, status="cached")
+                            continue
+
+                    inputs = {dep: result.get(dep) for dep in stage.inputs}
+                    console.print(f"[dim]▶ {name}[/dim]")
+                    running[executor.submit(self._run_stage, stage, inputs, key)] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        output, stage_run = future.result()
+                    except Exception as e:
+                        for pending in running:
+                            pending.cancel()
+                        result.stages[name] = StageRun(name=name, status="failed", key=keys[name],
+                                                       error=str(e))
+                        self._log_stage(result.stages[name])
+                        raise StageError(name, e) from e
+                    result.outputs[name] = output
+                    result.stages[name] = stage_run
+                    self._log_stage(stage_run)
+
+        return result
+
+    def _run_stage(self, stage: Stage, inputs: Dict[str, Any], key: str):
+        start = time.perf_counter()
+        with get_progress_feed().stage(stage.name):
+            output = stage.run(inputs)
+        duration = time.perf_counter() - start
+        if stage.cacheable:
+            self.cache.save(stage.name, key, output)
+        return output, StageRun(name=stage.name, status="ran", key=key, duration=duration)
+
+    def _log_stage(self, stage_run: StageRun) -> None:
+        if stage_run.status == "cached":
+            console.print(f"[dim]✓ {stage_run.name} (cached)[/dim]")
+        elif stage_run.status == "ran":
+            console.print(f"[green]✓[/green] {stage_run.name} [dim]({stage_run.duration:.1f}s)[/dim]")
+
+        self.audit_logger.log_operation(
+            operation="pipeline_stage",
+            stage=stage_run.name,
+            status=stage_run.status,
+            cache_key=stage_run.key,
+            duration_ms=round(stage_run.duration * 1000, 1),
+            error=stage_run.error
+        )
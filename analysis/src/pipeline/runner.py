@@ -3,20 +3,28 @@
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
+import pandas as pd
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
+from .. import ingestion, llm, qualitative, quantitative, reporting, search, tagging, visualization
 from ..config import settings
+from ..features.online import load_snapshots
 from ..ingestion import DataLoader, DataValidator
 from ..quantitative import QuantitativeAnalyzer
 from ..qualitative import QualitativeAnalyzer
-from ..validation import AuditLogger
+from ..validation import AuditLogger, AuditArchive
+from ..validation.progress import get_progress_feed
 from ..visualization import VisualizationGenerator
 from ..reporting import ReportGenerator
+from ..search import TextIndex
+from ..storage import ResultStore
+from .dag import Stage, StageGraph, files_digest
+from .update import SurveyUpdater
 
 
 console = Console()
@@ -24,16 +32,68 @@ app = typer.Typer()
 
 
 class AnalysisPipeline:
-    """Orchestrates the complete analysis pipeline."""
+    """
+    Orchestrates the complete analysis pipeline.
+    
+    The pipeline is a graph of stages (see `STAGES`); each stage declares the
+    stages it reads and the code and settings its output depends on. Outputs
+    are cached under a key of those, so only stages affected by a change
+    re-run, and the quantitative and qualitative analyses run in parallel.
+    """
+    
+    STAGES = ("load", "validate", "quantitative", "qualitative",
+              "visualizations", "report", "save", "lineage")
     
     def __init__(self, session_id: Optional[str] = None):
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.audit_logger = AuditLogger(session_id=self.session_id)
         self.data = {}
         self.results = {}
+        self.results_file: Optional[str] = None
+        self.stage_runs = {}
+        self.graph = StageGraph(self._build_stages(), self.audit_logger)
+    
+    def _build_stages(self) -> List[Stage]:
+        return [
+            Stage("load", self._load_data,
+                  code=[ingestion], settings=["ingest_streaming"],
+                  sources=self._raw_data_digest),
+            Stage("validate", self._validate_data, inputs=["load"],
+                  code=[ingestion], settings=["max_missing_rate", "min_response_length"]),
+            Stage("quantitative", self._run_quantitative_analysis, inputs=["load"],
+                  code=[quantitative, tagging], settings=["confidence_level", "programs"]),
+            Stage("qualitative", self._run_qualitative_analysis, inputs=["load"],
+                  code=[qualitative, quantitative, llm, tagging, search],
+                  settings=["openai_model", "azure_openai_deployment_name", "llm_temperature",
+                            "llm_max_tokens", "min_theme_frequency", "max_themes",
+                            "theme_similarity_threshold", "confidence_level", "programs"]),
+            Stage("visualizations", self._generate_visualizations,
+                  inputs=["quantitative", "qualitative"],
+                  code=[visualization], settings=["color_palette"],
+                  is_valid=lambda files: all(
+                      Path(path).exists() for paths in files.values() for path in paths
+                  )),
+            Stage("report", self._generate_report,
+                  inputs=["validate", "quantitative", "qualitative", "visualizations"],
+                  code=[reporting], settings=["report_title", "report_author"],
+                  is_valid=lambda report_path: Path(report_path).exists()),
+            Stage("save", self._save_results,
+                  inputs=["validate", "quantitative", "qualitative", "visualizations", "report"],
+                  cacheable=False),
+            Stage("lineage", self._generate_lineage_report, inputs=["save"], cacheable=False),
+        ]
+    
+    def run(self, only: Optional[List[str]] = None, from_stage: Optional[str] = None,
+            skip: Optional[List[str]] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Run the analysis pipeline.
         
-    def run(self) -> Dict[str, Any]:
-        """Run the complete analysis pipeline."""
+        Args:
+            only: Run just these stages (inputs from the cache)
+            from_stage: Re-run this stage and everything after it
+            skip: Stages not to run
+            use_cache: Reuse cached stage outputs
+        """
         console.print(
             Panel.fit(
                 f"[bold blue]ACME Cultural Funding Analysis Pipeline[/bold blue]\n"
@@ -42,30 +102,21 @@ class AnalysisPipeline:
             )
         )
         
+        progress = get_progress_feed()
+        progress.start_run("analysis_pipeline", run_id=self.session_id, only=only,
+                           from_stage=from_stage, skip=skip, use_cache=use_cache)
         try:
-            # Step 1: Load data
-            self._load_data()
-            
-            # Step 2: Validate data
-            self._validate_data()
-            
-            # Step 3: Quantitative analysis
-            self._run_quantitative_analysis()
-            
-            # Step 4: Qualitative analysis
-            self._run_qualitative_analysis()
-            
-            # Step 5: Generate visualizations
-            self._generate_visualizations()
-            
-            # Step 6: Generate executive report
-            self._generate_report()
-            
-            # Step 7: Save results
-            self._save_results()
-            
-            # Step 8: Generate lineage report
-            self._generate_lineage_report()
+            graph_run = self.graph.run(only=only, from_stage=from_stage,
+                                       skip=skip or [], use_cache=use_cache)
+            self.stage_runs = graph_run.stages
+            progress.end_run(
+                status="completed",
+                results_file=self.results_file,
+                stages={name: stage_run.status for name, stage_run in self.stage_runs.items()}
+            )
+            if not self.results:
+                # `save` did not run (--only): report what was computed
+                self.results = self._collect_results(graph_run.outputs)
             
             console.print(
                 Panel.fit(
@@ -79,135 +130,98 @@ class AnalysisPipeline:
         except Exception as e:
             self.audit_logger.log_error(
                 operation="pipeline_run",
-                error_type=type(e).__name__,
+                error_type=type(getattr(e, "error", e)).__name__,
                 error_message=str(e),
-                context={"step": "unknown"}
+                context={"step": getattr(e, "stage", "unknown")}
             )
+            progress.end_run(status="failed", stage=getattr(e, "stage", None),
+                             error_type=type(getattr(e, "error", e)).__name__, error_message=str(e))
             console.print(f"[bold red]Error: {e}[/bold red]")
             raise
         finally:
             self.audit_logger.close()
     
-    def _load_data(self) -> None:
+    @staticmethod
+    def _raw_data_digest() -> str:
+        """Raw files the load stage reads (a changed export invalidates the cache)."""
+        files = [
+            path for path in settings.raw_data_dir.glob("*")
+            if path.suffix.lower() in (".xlsx", ".csv")
+        ]
+        return files_digest(files)
+    
+    def _load_data(self, inputs: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
         """Load all data files."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Loading data files...", total=None)
-            
-            loader = DataLoader(self.audit_logger)
-            self.data = loader.load_all_data()
-            
-            progress.update(task, completed=True)
+        loader = DataLoader(self.audit_logger)
+        self.data = loader.load_all_data()
+        return self.data
     
-    def _validate_data(self) -> None:
+    def _validate_data(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Validate loaded data."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Validating data quality...", total=None)
-            
-            validator = DataValidator(self.audit_logger)
-            validation_results = validator.validate_all_data(self.data)
-            
-            # Check if all data is valid
-            all_valid = all(result.is_valid for result in validation_results.values())
-            
-            if not all_valid:
-                console.print("[bold red]Data validation failed![/bold red]")
-                # In production, might want to halt pipeline here
-            
-            self.results["validation"] = validation_results
-            progress.update(task, completed=True)
+        validator = DataValidator(self.audit_logger)
+        validation_results = validator.validate_all_data(inputs["load"])
+        
+        # Check if all data is valid
+        all_valid = all(result.is_valid for result in validation_results.values())
+        
+        if not all_valid:
+            console.print("[bold red]Data validation failed![/bold red]")
+            # In production, might want to halt pipeline here
+        
+        return validation_results
     
-    def _run_quantitative_analysis(self) -> None:
+    def _run_quantitative_analysis(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Run quantitative WHO analysis."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running quantitative analysis...", total=None)
-            
-            analyzer = QuantitativeAnalyzer(self.audit_logger)
-            who_results = analyzer.analyze_who_metrics(self.data)
-            
-            self.results["quantitative"] = who_results
-            progress.update(task, completed=True)
+        analyzer = QuantitativeAnalyzer(self.audit_logger)
+        return analyzer.analyze_who_metrics(inputs["load"])
     
-    def _run_qualitative_analysis(self) -> None:
+    def _run_qualitative_analysis(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Run qualitative WHAT analysis."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running qualitative analysis...", total=None)
-            
-            analyzer = QualitativeAnalyzer(self.audit_logger)
-            what_results = analyzer.analyze_what_themes(self.data)
-            
-            self.results["qualitative"] = what_results
-            progress.update(task, completed=True)
+        analyzer = QualitativeAnalyzer(self.audit_logger)
+        return analyzer.analyze_what_themes(inputs["load"])
     
-    def _generate_visualizations(self) -> None:
+    def _generate_visualizations(self, inputs: Dict[str, Any]) -> Dict[str, List[str]]:
         """Generate all visualizations."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Generating visualizations...", total=None)
-            
-            viz_gen = VisualizationGenerator(self.audit_logger)
-            viz_files = viz_gen.generate_all_visualizations(
-                self.results.get("quantitative", {}),
-                self.results.get("qualitative", {})
-            )
-            
-            self.results["visualizations"] = viz_files
-            progress.update(task, completed=True)
+        viz_gen = VisualizationGenerator(self.audit_logger)
+        return viz_gen.generate_all_visualizations(
+            inputs["quantitative"] or {},
+            inputs["qualitative"] or {}
+        )
     
-    def _generate_report(self) -> None:
+    def _generate_report(self, inputs: Dict[str, Any]) -> str:
         """Generate executive report."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Generating executive report...", total=None)
-            
-            report_gen = ReportGenerator(self.audit_logger)
-            report_path = report_gen.generate_executive_report(
-                self.results,
-                self.results.get("visualizations", {})
-            )
-            
-            self.results["report_path"] = str(report_path)
-            progress.update(task, completed=True)
+        report_gen = ReportGenerator(self.audit_logger)
+        report_path = report_gen.generate_executive_report(
+            self._collect_results(inputs),
+            inputs["visualizations"] or {}
+        )
+        return str(report_path)
     
-    def _save_results(self) -> None:
-        """Save all results to disk."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create results directory for this session
-        session_dir = settings.results_dir / f"session_{self.session_id}"
-        session_dir.mkdir(exist_ok=True, parents=True)
-        
-        # Save main results file
-        import json
-        results_file = session_dir / f"analysis_results_{timestamp}.json"
-        
-        with open(results_file, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+    @staticmethod
+    def _collect_results(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Stage outputs under the result keys used by the report and result files."""
+        names = {
+            "validate": "validation",
+            "quantitative": "quantitative",
+            "qualitative": "qualitative",
+            "visualizations": "visualizations",
+            "report": "report_path",
+        }
+        return {
+            result_key: inputs[stage]
+            for stage, result_key in names.items()
+            if inputs.get(stage) is not None
+        }
+    
+    def _save_results(self, inputs: Dict[str, Any]) -> None:
+        """Save all results to the result store under this session's run manifest."""
+        self.results = self._collect_results(inputs)
+        stored = ResultStore().put("analysis_results", self.results, run_id=self.session_id)
+        self.results_file = str(stored.path)
         
-        console.print(f"[dim]Results saved to: {results_file}[/dim]")
+        console.print(f"[dim]Results saved to: {stored.path}[/dim]")
     
-    def _generate_lineage_report(self) -> None:
+    def _generate_lineage_report(self, inputs: Dict[str, Any]) -> None:
         """Generate data lineage report."""
         lineage_file = settings.audit_dir / f"lineage_report_{self.session_id}.json"
         lineage = self.audit_logger.create_lineage_report(lineage_file)
@@ -220,12 +234,22 @@ class AnalysisPipeline:
 def run_analysis(
     session_id: Optional[str] = typer.Option(None, help="Custom session ID"),
     skip_validation: bool = typer.Option(False, help="Skip data validation"),
+    from_stage: Optional[str] = typer.Option(
+        None, "--from", help=f"Re-run this stage and everything after it ({', '.join(AnalysisPipeline.STAGES)})"
+    ),
+    only: Optional[List[str]] = typer.Option(None, "--only", help="Run only this stage (repeatable)"),
+    no_cache: bool = typer.Option(False, help="Ignore cached stage outputs"),
 ):
     """Run the ACME cultural funding analysis pipeline."""
     pipeline = AnalysisPipeline(session_id=session_id)
     
     try:
-        results = pipeline.run()
+        results = pipeline.run(
+            only=only or None,
+            from_stage=from_stage,
+            skip=["validate"] if skip_validation else None,
+            use_cache=not no_cache
+        )
         console.print("[bold green]Analysis completed successfully![/bold green]")
     except Exception as e:
         console.print(f"[bold red]Pipeline failed: {e}[/bold red]")
@@ -258,6 +282,206 @@ def validate_data():
     audit_logger.close()
 
 
+@app.command()
+def build_index():
+    """Build the full-text index over survey and working-document text."""
+    console.print("[bold blue]Building text index...[/bold blue]")
+    
+    audit_logger = AuditLogger()
+    data = DataLoader(audit_logger).load_all_data()
+    index = TextIndex.build(data)
+    
+    stats = index.stats()
+    audit_logger.log_operation(operation="build_text_index", **stats)
+    audit_logger.close()
+    
+    console.print(
+        f"[bold green]✓ Indexed {stats['documents']} text cells, "
+        f"{stats['terms']} terms[/bold green] [dim]({stats['index_dir']})[/dim]"
+    )
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(..., help='Query, e.g. \'parking AND NOT "free parking"\' or \'fund*\''),
+    limit: int = typer.Option(20, help="Maximum number of hits to show"),
+    source: Optional[str] = typer.Option(None, help="Restrict to one source, e.g. survey"),
+    respondents: bool = typer.Option(False, help="Only print the number of matching respondents"),
+):
+    """Search survey and working-document text (builds the index on first use)."""
+    try:
+        index = TextIndex.open()
+    except FileNotFoundError:
+        console.print("[yellow]No text index found, building it now...[/yellow]")
+        index = TextIndex.build(DataLoader().load_all_data())
+    
+    try:
+        if respondents:
+            rows = index.respondents(query, source=source or "survey")
+            console.print(f"{len(rows)} respondents match {query!r}")
+            return
+        
+        hits = index.search(query, limit=limit, source=source)
+        total = index.count(query, source=source)
+    except ValueError as e:
+        console.print(f"[bold red]Invalid query: {e}[/bold red]")
+        sys.exit(1)
+    
+    table = Table(title=f"{total} matching responses (showing {len(hits)})")
+    table.add_column("Score", style="cyan", justify="right")
+    table.add_column("Source", style="dim")
+    table.add_column("Row", justify="right")
+    table.add_column("Column", style="dim", max_width=30)
+    table.add_column("Text", style="white")
+    
+    for hit in hits:
+        text = hit.text
+        if hit.highlights:
+            # Show the text around the first match
+            start = max(hit.highlights[0][0] - 60, 0)
+            text = ("..." if start else "") + text[start:start + 200]
+        table.add_row(f"{hit.score:.2f}", hit.source, str(hit.row), hit.column, text)
+    
+    console.print(table)
+
+
+@app.command()
+def compact_audit(
+    min_age_hours: float = typer.Option(1.0, help="Treat sessions without session_end as closed after this many idle hours"),
+):
+    """Compact closed audit sessions into the Parquet audit archive."""
+    archive = AuditArchive()
+    archived = archive.compact(min_age_hours=min_age_hours)
+    sessions = archive.load_index()["sessions"]
+    
+    console.print(
+        f"[bold green]✓ Archived {len(archived)} sessions[/bold green] "
+        f"[dim]({len(sessions)} in archive, {archive.archive_dir})[/dim]"
+    )
+
+
+@app.command()
+def audit_tokens(
+    by: str = typer.Option("model", help="Group by model, session_id or question_id"),
+):
+    """Total LLM tokens across archived sessions."""
+    if by not in ("model", "session_id", "question_id"):
+        console.print(f"[bold red]Cannot group by {by!r}[/bold red]")
+        sys.exit(1)
+    
+    summary = AuditArchive().tokens_by(by)
+    
+    table = Table(title=f"LLM tokens by {by}")
+    table.add_column(by, style="cyan")
+    for column in ("Calls", "Input", "Output", "Total"):
+        table.add_column(column, justify="right")
+    
+    for row in summary.itertuples(index=False):
+        table.add_row(
+            str(getattr(row, by)), f"{row.calls:,}", f"{int(row.tokens_input):,}",
+            f"{int(row.tokens_output):,}", f"{int(row.tokens_total):,}"
+        )
+    
+    console.print(table)
+
+
+@app.command()
+def audit_errors(
+    question: Optional[str] = typer.Option(None, help="Only errors for this question, e.g. q4_barriers"),
+    session: Optional[str] = typer.Option(None, help="Only errors from this session"),
+    limit: int = typer.Option(50, help="Maximum number of errors to show"),
+):
+    """Errors logged across archived sessions."""
+    errors = AuditArchive().errors(question_id=question, sessions=[session] if session else None)
+    
+    table = Table(title=f"{len(errors)} errors (showing {min(len(errors), limit)})")
+    table.add_column("Time", style="dim")
+    table.add_column("Question", style="cyan")
+    table.add_column("Operation")
+    table.add_column("Type", style="red")
+    table.add_column("Message", style="white")
+    
+    for row in errors.head(limit).itertuples(index=False):
+        table.add_row(
+            row.timestamp, row.question_id or "-", row.error_operation or "-",
+            row.error_type or "-", (row.message or "")[:200]
+        )
+    
+    console.print(table)
+
+
+@app.command()
+def update(
+    force: bool = typer.Option(False, help="Re-check every question and program even if the survey is unchanged"),
+):
+    """Bring the deep analysis up to date with the latest survey export (new and changed rows only)."""
+    audit_logger = AuditLogger()
+    try:
+        summary = SurveyUpdater(audit_logger).update(force=force)
+    except Exception as e:
+        console.print(f"[bold red]Update failed: {e}[/bold red]")
+        sys.exit(1)
+    finally:
+        audit_logger.close()
+    
+    if summary.results_path:
+        console.print(f"[dim]Results saved to: {summary.results_path}[/dim]")
+
+
+@app.command()
+def watch(
+    interval: Optional[float] = typer.Option(None, help="Seconds between checks for a new export"),
+):
+    """Update the deep analysis whenever a survey export is added or replaced."""
+    audit_logger = AuditLogger()
+    try:
+        SurveyUpdater(audit_logger).watch(interval=interval)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching[/yellow]")
+    finally:
+        audit_logger.close()
+
+
+@app.command()
+def aggregate_snapshots(
+    question: Optional[str] = typer.Option(None, help="Only this question, e.g. q4_barriers"),
+):
+    """Latest running aggregates of the deep analysis, with confidence intervals."""
+    snapshots = [s for s in load_snapshots() if question is None or s.question_id == question]
+    if not snapshots:
+        console.print("[yellow]No aggregate snapshots published yet[/yellow]")
+        return
+    
+    for snapshot in snapshots:
+        progress = f", {snapshot.progress:.0%} done" if snapshot.progress is not None else ""
+        status = "final" if snapshot.final else f"running{progress}"
+        table = Table(
+            title=f"{snapshot.question_id}: {snapshot.response_count:,} responses "
+                  f"({status}, {snapshot.timestamp})"
+        )
+        table.add_column("Group", style="dim")
+        table.add_column("Value", style="cyan")
+        table.add_column("Count", justify="right")
+        table.add_column("Share", justify="right")
+        table.add_column(f"{snapshot.confidence_level:.0%} CI", justify="right")
+        
+        groups = [
+            ("Sentiment", snapshot.sentiment),
+            ("Urgency", snapshot.urgency),
+            ("Stakeholder", snapshot.stakeholders),
+            ("Actionable", [snapshot.actionable] if snapshot.actionable else []),
+            ("Theme", snapshot.themes),
+        ]
+        for group, estimates in groups:
+            for estimate in estimates:
+                table.add_row(
+                    group, estimate.label, f"{estimate.count:,}", f"{estimate.proportion:.1%}",
+                    f"{estimate.ci_lower:.1%} - {estimate.ci_upper:.1%}"
+                )
+        
+        console.print(table)
+
+
 @app.command()
 def check_config():
     """Check configuration and environment setup."""
@@ -0,0 +1,315 @@
+"""Incremental deep analysis of new survey exports."""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from ..config import settings
+from ..features import (
+    CrossQuestionSynthesizer,
+    ProgramAnalyzer,
+    QuestionAnalyzer,
+    ResponseIndex,
+    SURVEY_QUESTIONS,
+    build_program_tagger,
+    extract_text_responses
+)
+from ..ingestion import DataLoader
+from ..ingestion.fingerprint import DataFingerprint
+from ..llm import LLMScheduler
+from ..storage import ResultStore
+from ..validation.audit import AuditLogger
+from ..validation.progress import get_progress_feed
+from ..visualization import VisualizationGenerator
+
+
+console = Console()
+
+
+@dataclass
+class UpdateSummary:
+    """What an update found and redid."""
+    source_file: str
+    up_to_date: bool = False
+    changed_rows: int = 0  # new or edited
+    removed_rows: int = 0
+    new_responses: int = 0
+    changed_questions: List[str] = field(default_factory=list)
+    changed_programs: List[str] = field(default_factory=list)
+    results_path: Optional[Path] = None
+    microsite_files: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+
+class SurveyUpdater:
+    """
+    Brings the deep analysis up to date with a new survey export.
+
+    The survey's row fingerprints (see `DataFingerprint`) are kept from the
+    previous update. A new export is compared row by row and column by
+    column:
+
+    - questions whose column is unchanged keep their cached analysis (rows
+      added with the question unanswered leave the column unchanged)
+    - for the other questions, only responses whose text is new or changed
+      are extracted and folded into the stored question aggregates (removed
+      ones are retracted), so the cost follows the number of new rows
+    - programs are re-analyzed only when the set of responses mentioning
+      them changed
+    - the synthesis, the stored results and the microsite data
+      (microsite_data.json and the data bundle) are rebuilt from the merged
+      analyses; bundle shards whose content is unchanged keep their files
+    """
+
+    def __init__(self, audit_logger: Optional[AuditLogger] = None, state_dir: Optional[Path] = None):
+        self.audit_logger = audit_logger or AuditLogger()
+        self.loader = DataLoader(self.audit_logger)
+        self.state_dir = Path(state_dir or settings.data_dir / "features" / "updates")
+        self.fingerprint_file = self.state_dir / "survey_fingerprint.npz"
+        self.programs_file = self.state_dir / "program_responses.json"
+
+    def source_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Name, size and mtime of every survey export in the raw data directory."""
+        pattern = self.loader.survey_pattern
+        files = sorted(
+            path for suffix in ("*.xlsx", "*.csv") for path in settings.raw_data_dir.glob(suffix)
+            if pattern in path.name
+        )
+        return tuple((path.name, path.stat().st_size, path.stat().st_mtime_ns) for path in files)
+
+    def update(self, force: bool = False) -> UpdateSummary:
+        """
+        Process new and changed survey rows.
+
+        Args:
+            force: Re-check every question and program even if the export's
+                fingerprint is unchanged
+
+        Returns:
+            Summary of the update
+        """
+        progress = get_progress_feed()
+        progress.start_run("survey_update", run_id=self.audit_logger.session_id, force=force)
+        try:
+            summary = self._update(force)
+        except Exception as e:
+            progress.end_run(status="failed", error_type=type(e).__name__, error_message=str(e))
+            raise
+        progress.end_run(
+            status="up_to_date" if summary.up_to_date else "completed",
+            changed_rows=summary.changed_rows,
+            changed_questions=summary.changed_questions,
+            changed_programs=summary.changed_programs
+        )
+        return summary
+    
+    def _update(self, force: bool) -> UpdateSummary:
+        start = time.perf_counter()
+        survey_df = self.loader.load_survey()
+        fingerprint = self.loader.fingerprints['survey']
+        previous = self._load_fingerprint()
+        summary = UpdateSummary(source_file=str(survey_df['source_file'].iloc[0]) if len(survey_df) else "")
+
+        store = ResultStore()
+        if (not force and previous is not None and previous.sheet == fingerprint.sheet
+                and store.ref("deep_analysis_results") is not None):
+            summary.up_to_date = True
+            summary.duration = time.perf_counter() - start
+            console.print("[green]✓[/green] Survey unchanged since the last update")
+            self._log(summary)
+            return summary
+
+        changed_rows = fingerprint.changed_rows(previous)
+        summary.changed_rows = len(changed_rows)
+        summary.removed_rows = len(fingerprint.removed_rows(previous)) if previous is not None else 0
+        summary.new_responses = len(extract_text_responses(survey_df.iloc[changed_rows], SURVEY_QUESTIONS))
+        console.print(
+            f"[bold blue]{summary.changed_rows} new or edited rows, {summary.removed_rows} removed "
+            f"({summary.new_responses} text responses to extract)[/bold blue]"
+        )
+
+        responses = extract_text_responses(survey_df, SURVEY_QUESTIONS)
+        response_index = ResponseIndex(responses, build_program_tagger(ProgramAnalyzer.CULTURAL_PROGRAMS))
+
+        question_analyzer = QuestionAnalyzer(self.audit_logger)
+        program_analyzer = ProgramAnalyzer(self.audit_logger)
+
+        # Questions whose column changed (or that have no analysis yet)
+        changed_columns = set(fingerprint.changed_columns(previous))
+        cached_analyses = {}
+        for question in SURVEY_QUESTIONS:
+            if force or question['column'] in changed_columns:
+                continue
+            cached = question_analyzer.load_cached_analysis(question['id'])
+            if cached is not None:
+                cached_analyses[question['id']] = cached
+        changed_questions = [q for q in SURVEY_QUESTIONS if q['id'] not in cached_analyses]
+        summary.changed_questions = [q['id'] for q in changed_questions]
+
+        # Programs whose set of mentioning responses changed (a program without a
+        # recorded digest may have been cached from different responses)
+        program_keys = self._program_response_digests(response_index, question_analyzer)
+        previous_keys = self._load_program_digests()
+        for program, digest in program_keys.items():
+            if force or previous_keys.get(program) != digest:
+                program_analyzer._program_cache_file(program).unlink(missing_ok=True)
+                summary.changed_programs.append(program)
+
+        scheduler = LLMScheduler(audit_logger=self.audit_logger)
+        background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="programs")
+        try:
+            program_future = background.submit(
+                program_analyzer.analyze_all_programs, response_index, None, scheduler
+            )
+            updated = {
+                analysis.question_id: analysis
+                for analysis in question_analyzer.analyze_all_questions(
+                    changed_questions, response_index, scheduler
+                )
+            }
+            program_results = program_future.result()
+        except BaseException:
+            # Drop the queued LLM calls instead of running them all first
+            scheduler.shutdown(cancel_pending=True)
+            raise
+        finally:
+            background.shutdown()
+            scheduler.shutdown()
+
+        question_analyses = [
+            cached_analyses.get(q['id']) or updated.get(q['id'])
+            for q in SURVEY_QUESTIONS
+            if q['id'] in cached_analyses or q['id'] in updated
+        ]
+        synthesis_results = CrossQuestionSynthesizer(self.audit_logger).synthesize_insights(
+            question_analyses, use_cache=not changed_questions
+        )
+
+        results = {
+            'metadata': {
+                'analysis_date': datetime.now().isoformat(),
+                'total_responses': len(responses),
+                'questions_analyzed': len(question_analyses),
+                'programs_analyzed': len(program_results),
+                'gpt_model': settings.openai_model,
+                'update': {
+                    'source_file': summary.source_file,
+                    'changed_rows': summary.changed_rows,
+                    'removed_rows': summary.removed_rows,
+                    'new_responses': summary.new_responses,
+                    'changed_questions': summary.changed_questions,
+                    'changed_programs': summary.changed_programs
+                }
+            },
+            'question_analyses': [qa.model_dump() for qa in question_analyses],
+            'cross_question_synthesis': synthesis_results,
+            'program_analyses': {
+                name: feedback.model_dump()
+                for name, feedback in program_results.items()
+            }
+        }
+        stored = store.put(
+            "deep_analysis_results",
+            results,
+            run_id=self.audit_logger.session_id,
+            volatile_keys=("metadata",)
+        )
+        summary.results_path = stored.path
+        summary.microsite_files = VisualizationGenerator(self.audit_logger).export_microsite_data()
+
+        # The new export is the baseline only once everything above succeeded
+        self._save_state(fingerprint, program_keys)
+
+        summary.duration = time.perf_counter() - start
+        self._log(summary)
+        console.print(
+            f"[bold green]✓ Updated {len(summary.changed_questions)} questions and "
+            f"{len(summary.changed_programs)} programs in {summary.duration:.1f}s[/bold green]"
+        )
+        return summary
+
+    def watch(self, interval: Optional[float] = None) -> None:
+        """
+        Run `update` whenever a survey export is added or replaced.
+
+        Polls the raw data directory every `interval` seconds
+        (default: `settings.survey_watch_interval`) until interrupted. A
+        failed update is logged and retried with the next change.
+        """
+        interval = interval or settings.survey_watch_interval
+        console.print(f"[bold]Watching {settings.raw_data_dir} for survey exports (every {interval:.0f}s)...[/bold]")
+        last_signature = None
+
+        while True:
+            signature = self.source_signature()
+            if signature and signature != last_signature:
+                last_signature = signature
+                try:
+                    self.update()
+                except Exception as e:
+                    console.print(f"[red]Update failed: {e}[/red]")
+                    self.audit_logger.log_error(
+                        operation="survey_update",
+                        error_type=type(e).__name__,
+                        error_message=str(e),
+                        context={"source_files": [name for name, _, _ in signature]}
+                    )
+            time.sleep(interval)
+
+    @staticmethod
+    def _program_response_digests(response_index: ResponseIndex,
+                                  question_analyzer: QuestionAnalyzer) -> Dict[str, str]:
+        """Digest of the feature cache keys of the responses mentioning each program."""
+        digests = {}
+        for program in ProgramAnalyzer.CULTURAL_PROGRAMS:
+            keys = sorted(
+                question_analyzer.feature_extractor._generate_cache_key(resp['text'], resp.get('question_text', ''))
+                for resp in response_index.for_program(program)
+            )
+            digests[program] = hashlib.sha256("\n".join(keys).encode()).hexdigest()
+        return digests
+
+    def _load_fingerprint(self) -> Optional[DataFingerprint]:
+        if not self.fingerprint_file.exists():
+            return None
+        return DataFingerprint.load(self.fingerprint_file)
+
+    def _load_program_digests(self) -> Dict[str, str]:
+        if not self.programs_file.exists():
+            return {}
+        with open(self.programs_file, 'r') as f:
+            return json.load(f)
+
+    def _save_state(self, fingerprint: DataFingerprint, program_digests: Dict[str, str]) -> None:
+        self.state_dir.mkdir(exist_ok=True, parents=True)
+        tmp_file = self.state_dir / f".survey_fingerprint.{os.getpid()}.npz"
+        fingerprint.save(tmp_file)
+        os.replace(tmp_file, self.fingerprint_file)
+
+        tmp_file = self.programs_file.with_suffix(".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(program_digests, f, indent=2)
+        os.replace(tmp_file, self.programs_file)
+
+    def _log(self, summary: UpdateSummary) -> None:
+        self.audit_logger.log_operation(
+            operation="survey_update",
+            source_file=summary.source_file,
+            up_to_date=summary.up_to_date,
+            changed_rows=summary.changed_rows,
+            removed_rows=summary.removed_rows,
+            new_responses=summary.new_responses,
+            changed_questions=summary.changed_questions,
+            changed_programs=summary.changed_programs,
+            results_path=str(summary.results_path) if summary.results_path else None,
+            microsite_files=summary.microsite_files,
+            duration_seconds=round(summary.duration, 3)
+        )
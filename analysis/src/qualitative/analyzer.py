@@ -1,6 +1,5 @@
 """Qualitative analysis for WHAT themes using GPT-4.1."""
 
-import json
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from collections import Counter
@@ -14,6 +13,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from ..config import settings
 from ..validation.audit import AuditLogger
 from ..llm import LLMClient, PromptTemplates
+from ..tagging import KeywordTagger
+from ..search import TextIndex
+from ..storage import ResultStore
 from ..quantitative.analyzer import QuantitativeAnalyzer
 
 
@@ -28,6 +30,7 @@ class QualitativeAnalyzer:
         self.llm_client = LLMClient(audit_logger)
         self.prompts = PromptTemplates()
         self.quant_analyzer = QuantitativeAnalyzer(audit_logger)
+        self.parking_lot_tagger = KeywordTagger.from_taxonomy("parking_lot")
         
     def analyze_what_themes(self, data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         """Perform comprehensive WHAT thematic analysis."""
@@ -388,29 +391,23 @@ class QualitativeAnalyzer:
                 if len(non_null) > 50:
                     text_columns.append(col)
         
+        # Inverted index over all survey text, reused across runs while the data is unchanged
+        text_index = TextIndex.for_data(data)
+        
         for program in settings.programs:
-            # Find responses mentioning this program
+            # Find respondents mentioning this program in any text field
             program_responses = []
+            mentioning_rows = text_index.respondents(f'"{program}"', source="survey")
             
-            # Search across all text columns for program mentions
-            for idx, row in survey_df.iterrows():
-                mentions_program = False
-                
-                # Check if any field mentions this program
-                for col in survey_df.columns:
-                    if pd.notna(row[col]) and isinstance(row[col], str):
-                        if program.lower() in str(row[col]).lower():
-                            mentions_program = True
-                            break
-                
-                if mentions_program:
-                    # Collect text from relevant columns
-                    text = []
-                    for col in text_columns:
-                        if pd.notna(row[col]) and len(str(row[col])) > 20:
-                            text.append(str(row[col]))
-                    if text:
-                        program_responses.append(' '.join(text))
+            for idx in mentioning_rows:
+                # Collect text from relevant columns
+                text = []
+                for col in text_columns:
+                    value = survey_df[col].iloc[idx]
+                    if pd.notna(value) and len(str(value)) > 20:
+                        text.append(str(value))
+                if text:
+                    program_responses.append(' '.join(text))
             
             # From working document
             if 'program' in working_df.columns:
@@ -454,15 +451,6 @@ class QualitativeAnalyzer:
     
     def _analyze_parking_lot(self, data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         """Analyze transportation and parking-related feedback."""
-        # Keywords for transportation issues
-        transport_keywords = [
-            'parking', 'transportation', 'transit', 'bus', 'drive', 'car',
-            'uber', 'lyft', 'bike', 'walk', 'distance', 'location', 'access'
-        ]
-        
-        # Collect transportation-related responses
-        transport_responses = []
-        
         # From survey
         survey_df = data["survey"]
         
@@ -477,27 +465,32 @@ class QualitativeAnalyzer:
                 if len(non_null) > 50:
                     text_columns.append(col)
         
-        for col in text_columns:
-            for idx, text in enumerate(survey_df[col].dropna()):
-                text_lower = str(text).lower()
-                if any(keyword in text_lower for keyword in transport_keywords):
-                    transport_responses.append({
-                        'id': f"R{idx:04d}",
-                        'text': str(text),
-                        'source': 'survey'
-                    })
+        text_sources = [(survey_df[col].dropna(), "R", 'survey') for col in text_columns]
         
         # From working document
         working_df = data["working_doc_main"]
         if 'recommendation_comment' in working_df.columns:
-            for idx, text in enumerate(working_df['recommendation_comment'].dropna()):
-                text_lower = str(text).lower()
-                if any(keyword in text_lower for keyword in transport_keywords):
-                    transport_responses.append({
-                        'id': f"W{idx:04d}",
-                        'text': str(text),
-                        'source': 'working_doc'
-                    })
+            text_sources.append((working_df['recommendation_comment'].dropna(), "W", 'working_doc'))
+        
+        # Collect transportation-related responses, tagging transportation,
+        # parking and transit keywords in a single pass per column
+        transport_responses = []
+        parking_count = 0
+        transit_count = 0
+        
+        for texts, id_prefix, source in text_sources:
+            tags = self.parking_lot_tagger.tag_texts(texts.tolist())
+            is_transport = tags.has('transportation')
+            counts = tags.counts(is_transport)
+            parking_count += counts['parking']
+            transit_count += counts['transit']
+            
+            for idx in np.flatnonzero(is_transport):
+                transport_responses.append({
+                    'id': f"{id_prefix}{idx:04d}",
+                    'text': str(texts.iloc[idx]),
+                    'source': source
+                })
         
         # Analyze if we have enough responses
         if len(transport_responses) >= 5:
@@ -507,12 +500,12 @@ class QualitativeAnalyzer:
                 "total_mentions": len(transport_responses),
                 "categories": {
                     "parking": {
-                        "count": sum(1 for r in transport_responses if 'parking' in r['text'].lower()),
+                        "count": parking_count,
                         "key_issues": ["Parking availability", "Parking cost"],
                         "affected_areas": []
                     },
                     "transit": {
-                        "count": sum(1 for r in transport_responses if any(word in r['text'].lower() for word in ['bus', 'transit', 'transportation'])),
+                        "count": transit_count,
                         "key_issues": ["Transit access", "Route availability"],
                         "affected_areas": []
                     }
@@ -609,11 +602,7 @@ class QualitativeAnalyzer:
                         console.print(f"  • {theme.get('theme', 'Unknown')}")
     
     def _save_what_results(self, results: Dict[str, Any]) -> None:
-        """Save WHAT analysis results."""
-        output_file = settings.results_dir / f"what_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        output_file.parent.mkdir(exist_ok=True, parents=True)
-        
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        """Save WHAT analysis results (stored once per distinct content)."""
+        stored = ResultStore().put("what_analysis", results, run_id=self.audit_logger.session_id)
         
-        console.print(f"[dim]WHAT analysis results saved to: {output_file}[/dim]")
\ No newline at end of file
+        console.print(f"[dim]WHAT analysis results saved to: {stored.path}[/dim]")
\ No newline at end of file
@@ -1,6 +1,5 @@
 """Quantitative analysis for WHO metrics with statistical rigor."""
 
-import json
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
@@ -12,6 +11,8 @@ from rich.table import Table
 
 from ..config import settings
 from ..validation.audit import AuditLogger
+from ..tagging import KeywordTagger
+from ..storage import ResultStore
 from .metrics import MetricsCalculator
 
 
@@ -24,6 +25,7 @@ class QuantitativeAnalyzer:
     def __init__(self, audit_logger: Optional[AuditLogger] = None):
         self.audit_logger = audit_logger or AuditLogger()
         self.metrics_calculator = MetricsCalculator()
+        self.role_tagger = KeywordTagger.from_taxonomy("role_categories")
         
     def analyze_who_metrics(self, data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         """Perform comprehensive WHO analysis with confidence intervals."""
@@ -126,13 +128,7 @@ class QuantitativeAnalyzer:
         roles = survey_df[role_column].dropna().str.strip().value_counts()
         
         # Map to standard categories
-        category_mapping = {
-            'creative': ['artist', 'musician', 'performer', 'creative', 'maker'],
-            'organizational': ['organization', 'nonprofit', 'staff', 'employee', 'director'],
-            'community': ['resident', 'patron', 'audience', 'community', 'visitor']
-        }
-        
-        categorized = self._categorize_roles(survey_df[role_column], category_mapping)
+        categorized = self._categorize_roles(survey_df[role_column], self.role_tagger)
         category_counts = pd.Series(categorized).value_counts()
         
         # Calculate proportions with confidence intervals
@@ -255,12 +251,17 @@ class QuantitativeAnalyzer:
             if name not in ["survey", "working_doc_main"]:
                 continue
                 
+            # One null mask and one row-hash pass instead of repeated full scans
+            present = df.notna()
+            complete_records = int(present.all(axis=1).sum())
+            row_hashes = pd.util.hash_pandas_object(df, index=False)
+            
             metrics = {
                 "total_records": len(df),
-                "complete_records": len(df.dropna()),
-                "completeness_rate": (len(df.dropna()) / len(df)) if len(df) > 0 else 0,
-                "missing_data_by_column": df.isnull().sum().to_dict(),
-                "duplicate_records": df.duplicated().sum()
+                "complete_records": complete_records,
+                "completeness_rate": (complete_records / len(df)) if len(df) > 0 else 0,
+                "missing_data_by_column": (~present).sum().to_dict(),
+                "duplicate_records": int(row_hashes.duplicated().sum())
             }
             
             # Add specific quality checks
@@ -313,28 +314,15 @@ class QuantitativeAnalyzer:
             "span_days": (dates.max() - dates.min()).days
         }
     
-    def _categorize_roles(self, roles: pd.Series, mapping: Dict[str, List[str]]) -> List[str]:
-        """Categorize roles into standard categories."""
-        categorized = []
-        
-        for role in roles:
-            if pd.isna(role):
-                categorized.append("uncategorized")
-                continue
-                
-            role_lower = str(role).lower()
-            category_found = False
-            
-            for category, keywords in mapping.items():
-                if any(keyword in role_lower for keyword in keywords):
-                    categorized.append(category)
-                    category_found = True
-                    break
-            
-            if not category_found:
-                categorized.append("other")
-        
-        return categorized
+    def _categorize_roles(self, roles: pd.Series, tagger: KeywordTagger) -> List[str]:
+        """Categorize roles into standard categories (first matching category wins)."""
+        categorized = tagger.tag_texts(roles.tolist()).first_tags(default="other")
+        missing = roles.isna().to_numpy()
+        
+        return [
+            "uncategorized" if is_missing else category
+            for category, is_missing in zip(categorized, missing)
+        ]
     
     def _wilson_score_interval(self, successes: int, n: int, confidence: float) -> Tuple[float, float]:
         """Calculate Wilson score confidence interval for binomial proportion."""
@@ -433,11 +421,7 @@ class QuantitativeAnalyzer:
             console.print(voice_table)
     
     def _save_who_results(self, results: Dict[str, Any]) -> None:
-        """Save WHO analysis results."""
-        output_file = settings.results_dir / f"who_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        output_file.parent.mkdir(exist_ok=True, parents=True)
-        
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        """Save WHO analysis results (stored once per distinct content)."""
+        stored = ResultStore().put("who_analysis", results, run_id=self.audit_logger.session_id)
         
-        console.print(f"[dim]WHO analysis results saved to: {output_file}[/dim]")
\ No newline at end of file
+        console.print(f"[dim]WHO analysis results saved to: {stored.path}[/dim]")
\ No newline at end of file
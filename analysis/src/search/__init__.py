@@ -0,0 +1,5 @@
+"""Full-text search module for survey and working-document text."""
+
+from .index import QueryParser, SearchHit, TextIndex, tokenize
+
+__all__ = ["QueryParser", "SearchHit", "TextIndex", "tokenize"]
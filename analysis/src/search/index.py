@@ -0,0 +1,579 @@
+"""Persistent full-text inverted index over survey and working-document text."""
+
+import hashlib
+import json
+import math
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, Field
+
+from ..config import settings
+from ..ingestion.fingerprint import METADATA_COLUMNS
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Data frames indexed by default, as returned by DataLoader.load_all_data
+DEFAULT_SOURCES = ("survey", "working_doc_main", "working_doc_aipp")
+
+INDEX_VERSION = 1
+
+
+def tokenize(text: str) -> List[Tuple[str, int]]:
+    """Split text into lowercase alphanumeric tokens with their character offsets."""
+    return [(m.group(), m.start()) for m in TOKEN_PATTERN.finditer(text.lower())]
+
+
+class SearchHit(BaseModel):
+    """A single matching text cell."""
+    source: str
+    row: int = Field(..., description="Positional row in the source data frame")
+    column: str
+    score: float = Field(default=0.0, description="BM25 score")
+    text: str
+    highlights: List[Tuple[int, int]] = Field(default_factory=list, description="Character spans of matched terms")
+
+
+class QueryParser:
+    """
+    Parses boolean text queries.
+
+    Supported syntax: bare terms, prefix terms (`fund*`), quoted phrases
+    (`"multi year"`), AND, OR, NOT and parentheses. Adjacent terms are ANDed.
+    Operators must be upper case; everything else is case-insensitive.
+    """
+
+    QUERY_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+    def parse(self, query: str) -> Tuple:
+        self._tokens = []
+        for match in self.QUERY_TOKEN.finditer(query):
+            lparen, rparen, phrase, word = match.groups()
+            if lparen:
+                self._tokens.append(('(', None))
+            elif rparen:
+                self._tokens.append((')', None))
+            elif phrase is not None:
+                self._tokens.append(('phrase', phrase))
+            elif word in ('AND', 'OR', 'NOT'):
+                self._tokens.append((word, None))
+            elif word:
+                self._tokens.append(('word', word))
+        self._position = 0
+
+        if not self._tokens:
+            raise ValueError("Empty query")
+
+        node = self._parse_or()
+        if self._position != len(self._tokens):
+            raise ValueError(f"Unexpected token in query: {query!r}")
+        return node
+
+    def _peek(self) -> Optional[str]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position][0]
+        return None
+
+    def _parse_or(self) -> Tuple:
+        node = self._parse_and()
+        while self._peek() == 'OR':
+            self._position += 1
+            node = ('or', node, self._parse_and())
+        return node
+
+    def _parse_and(self) -> Tuple:
+        node = self._parse_not()
+        while self._peek() not in (None, 'OR', ')'):
+            if self._peek() == 'AND':
+                self._position += 1
+            node = ('and', node, self._parse_not())
+        return node
+
+    def _parse_not(self) -> Tuple:
+        if self._peek() == 'NOT':
+            self._position += 1
+            return ('not', self._parse_not())
+        return self._parse_atom()
+
+    def _parse_atom(self) -> Tuple:
+        kind = self._peek()
+        if kind is None:
+            raise ValueError("Query ends unexpectedly")
+
+        _, value = self._tokens[self._position]
+        self._position += 1
+
+        if kind == '(':
+            node = self._parse_or()
+            if self._peek() != ')':
+                raise ValueError("Unbalanced parentheses in query")
+            self._position += 1
+            return node
+
+        if kind == 'phrase':
+            tokens = [token for token, _ in tokenize(value)]
+            if not tokens:
+                raise ValueError(f"Phrase has no searchable terms: {value!r}")
+            return ('phrase', tokens) if len(tokens) > 1 else ('term', tokens[0])
+
+        if kind == 'word':
+            if value.endswith('*') and len(value) > 1:
+                return ('prefix', value[:-1].lower())
+            tokens = [token for token, _ in tokenize(value)]
+            if not tokens:
+                raise ValueError(f"Term has no searchable characters: {value!r}")
+            # Hyphenated or punctuated words search as phrases
+            return ('phrase', tokens) if len(tokens) > 1 else ('term', tokens[0])
+
+        raise ValueError(f"Unexpected {kind} in query")
+
+
+class TextIndex:
+    """
+    Memory-mappable inverted index over free-text cells.
+
+    Every non-empty text cell (source, row, column) is one document. Postings
+    store, per term, the document, token position and character offset, so
+    boolean, phrase and prefix queries are answered from sorted integer arrays
+    without touching the source spreadsheets. Ranked search uses BM25.
+
+    On disk the index is a directory of .npy arrays (opened with mmap) plus a
+    small JSON file of metadata.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, index_dir: Path, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]):
+        self.index_dir = index_dir
+        self.meta = meta
+        self.sources: List[str] = meta['sources']
+        self.fields: List[Tuple[str, str]] = [tuple(f) for f in meta['fields']]
+
+        self._terms = arrays['terms']
+        self._term_offsets = arrays['term_offsets']
+        self._post_doc = arrays['post_doc']
+        self._post_pos = arrays['post_pos']
+        self._post_start = arrays['post_start']
+        self._doc_field = arrays['doc_field']
+        self._doc_row = arrays['doc_row']
+        self._doc_length = arrays['doc_length']
+        self._text_offsets = arrays['text_offsets']
+        self._text = arrays['text']
+
+        self._field_source = np.array([self.sources.index(s) for s, _ in self.fields], dtype=np.int32)
+        self.doc_count = len(self._doc_row)
+        self.avg_doc_length = float(self._doc_length.mean()) if self.doc_count else 0.0
+        self._parser = QueryParser()
+
+    # ------------------------------------------------------------------
+    # Construction and persistence
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def default_dir() -> Path:
+        return settings.data_dir / "index" / "text"
+
+    @staticmethod
+    def text_columns(df: pd.DataFrame) -> List[str]:
+        """Columns holding text (object or categorical) other than loader metadata."""
+        return [
+            col for col in df.columns
+            if (df[col].dtype == 'object' or isinstance(df[col].dtype, pd.CategoricalDtype))
+            and col not in METADATA_COLUMNS
+        ]
+
+    @classmethod
+    def fingerprint(cls, data: Dict[str, pd.DataFrame],
+                    sources: Sequence[str] = DEFAULT_SOURCES) -> str:
+        """Content hash of the text that would be indexed."""
+        digest = hashlib.sha256(f"v{INDEX_VERSION}".encode())
+        for source in sources:
+            if source not in data:
+                continue
+            df = data[source]
+            columns = cls.text_columns(df)
+            digest.update(json.dumps([source, [str(c) for c in columns]]).encode())
+            if columns:
+                hashed = pd.util.hash_pandas_object(df[columns].astype(str), index=False)
+                digest.update(hashed.to_numpy().tobytes())
+        return digest.hexdigest()[:16]
+
+    @classmethod
+    def build(cls, data: Dict[str, pd.DataFrame], index_dir: Optional[Path] = None,
+              sources: Sequence[str] = DEFAULT_SOURCES) -> "TextIndex":
+        """
+        Build the index from loaded data frames and write it to disk.
+
+        Args:
+            data: Data frames keyed by source name (DataLoader output)
+            index_dir: Directory for the index files
+            sources: Which data frames to index
+
+        Returns:
+            The opened index
+        """
+        index_dir = Path(index_dir or cls.default_dir())
+        present = [s for s in sources if s in data]
+
+        fields: List[Tuple[str, str]] = []
+        doc_field, doc_row, doc_length, text_offsets = [], [], [], [0]
+        text_parts: List[bytes] = []
+        term_ids: Dict[str, int] = {}
+        post_term, post_doc, post_pos, post_start = [], [], [], []
+
+        for source in present:
+            df = data[source]
+            for col in cls.text_columns(df):
+                field_id = len(fields)
+                fields.append((source, str(col)))
+
+                values = df[col]
+                for row in np.flatnonzero(values.notna().to_numpy()):
+                    text = str(values.iloc[row])
+                    tokens = tokenize(text)
+                    if not tokens:
+                        continue
+
+                    doc_id = len(doc_row)
+                    doc_field.append(field_id)
+                    doc_row.append(row)
+                    doc_length.append(len(tokens))
+
+                    encoded = text.encode('utf-8')
+                    text_parts.append(encoded)
+                    text_offsets.append(text_offsets[-1] + len(encoded))
+
+                    for position, (token, start) in enumerate(tokens):
+                        post_term.append(term_ids.setdefault(token, len(term_ids)))
+                        post_doc.append(doc_id)
+                        post_pos.append(position)
+                        post_start.append(start)
+
+        # Renumber terms alphabetically so lookups are a binary search
+        vocabulary = sorted(term_ids)
+        remap = np.empty(len(term_ids), dtype=np.int64)
+        for new_id, term in enumerate(vocabulary):
+            remap[term_ids[term]] = new_id
+
+        post_term = remap[np.asarray(post_term, dtype=np.int64)] if post_term else np.array([], dtype=np.int64)
+        post_doc = np.asarray(post_doc, dtype=np.int32)
+        post_pos = np.asarray(post_pos, dtype=np.int32)
+        order = np.lexsort((post_pos, post_doc, post_term))
+
+        width = max((len(t) for t in vocabulary), default=1)
+        arrays = {
+            'terms': np.array(vocabulary, dtype=f'<U{width}'),
+            'term_offsets': np.concatenate((
+                [0], np.cumsum(np.bincount(post_term, minlength=len(vocabulary)))
+            )).astype(np.int64),
+            'post_doc': post_doc[order],
+            'post_pos': post_pos[order],
+            'post_start': np.asarray(post_start, dtype=np.int32)[order],
+            'doc_field': np.asarray(doc_field, dtype=np.int32),
+            'doc_row': np.asarray(doc_row, dtype=np.int32),
+            'doc_length': np.asarray(doc_length, dtype=np.int32),
+            'text_offsets': np.asarray(text_offsets, dtype=np.int64),
+            'text': np.frombuffer(b''.join(text_parts), dtype=np.uint8)
+        }
+        meta = {
+            'version': INDEX_VERSION,
+            'created_at': datetime.now().isoformat(),
+            'fingerprint': cls.fingerprint(data, sources),
+            'sources': present,
+            'fields': fields,
+            'documents': len(doc_row),
+            'terms': len(vocabulary),
+            'postings': int(len(post_doc))
+        }
+
+        # Write to a sibling directory first so readers never see a partial index
+        tmp_dir = index_dir.with_name(index_dir.name + ".tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+        for name, array in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", array)
+        with open(tmp_dir / "meta.json", 'w') as f:
+            json.dump(meta, f, indent=2)
+
+        if index_dir.exists():
+            shutil.rmtree(index_dir)
+        tmp_dir.rename(index_dir)
+
+        return cls.open(index_dir)
+
+    @classmethod
+    def open(cls, index_dir: Optional[Path] = None) -> "TextIndex":
+        """Open a saved index; arrays are memory-mapped, not read into memory."""
+        index_dir = Path(index_dir or cls.default_dir())
+        meta_file = index_dir / "meta.json"
+        if not meta_file.exists():
+            raise FileNotFoundError(f"No text index at {index_dir}")
+
+        with open(meta_file, 'r') as f:
+            meta = json.load(f)
+
+        arrays = {
+            path.stem: np.load(path, mmap_mode='r')
+            for path in index_dir.glob("*.npy")
+        }
+        return cls(index_dir, arrays, meta)
+
+    @classmethod
+    def for_data(cls, data: Dict[str, pd.DataFrame], index_dir: Optional[Path] = None,
+                 sources: Sequence[str] = DEFAULT_SOURCES) -> "TextIndex":
+        """Open the saved index if it matches `data`, otherwise rebuild it."""
+        index_dir = Path(index_dir or cls.default_dir())
+        try:
+            index = cls.open(index_dir)
+            if (index.meta.get('version') == INDEX_VERSION
+                    and index.meta.get('fingerprint') == cls.fingerprint(data, sources)):
+                return index
+        except FileNotFoundError:
+            pass
+        return cls.build(data, index_dir, sources)
+
+    # ------------------------------------------------------------------
+    # Postings access
+    # ------------------------------------------------------------------
+
+    def _term_range(self, term: str) -> Tuple[int, int]:
+        term_id = int(np.searchsorted(self._terms, term))
+        if term_id < len(self._terms) and self._terms[term_id] == term:
+            return int(self._term_offsets[term_id]), int(self._term_offsets[term_id + 1])
+        return 0, 0
+
+    def _prefix_ranges(self, prefix: str) -> List[Tuple[int, int]]:
+        first = int(np.searchsorted(self._terms, prefix, side='left'))
+        last = int(np.searchsorted(self._terms, prefix + '\U0010ffff', side='left'))
+        return [
+            (int(self._term_offsets[i]), int(self._term_offsets[i + 1]))
+            for i in range(first, last)
+        ]
+
+    def _occurrences(self, node: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Occurrences of a term, prefix or phrase.
+
+        Returns:
+            (doc ids, character starts), one entry per occurrence
+        """
+        kind = node[0]
+        if kind == 'term':
+            start, end = self._term_range(node[1])
+            return np.asarray(self._post_doc[start:end]), np.asarray(self._post_start[start:end])
+
+        if kind == 'prefix':
+            ranges = self._prefix_ranges(node[1])
+            if not ranges:
+                return np.array([], dtype=np.int32), np.array([], dtype=np.int32)
+            docs = np.concatenate([self._post_doc[s:e] for s, e in ranges])
+            starts = np.concatenate([self._post_start[s:e] for s, e in ranges])
+            return docs, starts
+
+        # Phrase: each following token must sit at the next position in the same doc
+        tokens = node[1]
+        start, end = self._term_range(tokens[0])
+        docs = np.asarray(self._post_doc[start:end], dtype=np.int64)
+        positions = np.asarray(self._post_pos[start:end], dtype=np.int64)
+        starts = np.asarray(self._post_start[start:end])
+        keys = (docs << 32) | positions
+
+        for offset, token in enumerate(tokens[1:], 1):
+            if len(keys) == 0:
+                break
+            s, e = self._term_range(token)
+            next_keys = (np.asarray(self._post_doc[s:e], dtype=np.int64) << 32) | \
+                np.asarray(self._post_pos[s:e], dtype=np.int64)
+            keep = np.isin(keys + offset, next_keys, assume_unique=True)
+            keys, docs, starts = keys[keep], docs[keep], starts[keep]
+
+        return docs.astype(np.int32), starts
+
+    # ------------------------------------------------------------------
+    # Query evaluation
+    # ------------------------------------------------------------------
+
+    def _evaluate(self, node: Tuple) -> np.ndarray:
+        """Sorted unique doc ids matching a query node."""
+        kind = node[0]
+        if kind == 'and':
+            left, right = node[1], node[2]
+            if right[0] == 'not':
+                return np.setdiff1d(self._evaluate(left), self._evaluate(right[1]), assume_unique=True)
+            if left[0] == 'not':
+                return np.setdiff1d(self._evaluate(right), self._evaluate(left[1]), assume_unique=True)
+            return np.intersect1d(self._evaluate(left), self._evaluate(right), assume_unique=True)
+        if kind == 'or':
+            return np.union1d(self._evaluate(node[1]), self._evaluate(node[2]))
+        if kind == 'not':
+            return np.setdiff1d(np.arange(self.doc_count, dtype=np.int32),
+                                self._evaluate(node[1]), assume_unique=True)
+        return np.unique(self._occurrences(node)[0])
+
+    def _positive_leaves(self, node: Tuple, negated: bool = False) -> List[Tuple]:
+        """Terms, prefixes and phrases that count towards ranking."""
+        kind = node[0]
+        if kind in ('and', 'or'):
+            return self._positive_leaves(node[1], negated) + self._positive_leaves(node[2], negated)
+        if kind == 'not':
+            return self._positive_leaves(node[1], not negated)
+        return [] if negated else [node]
+
+    def _filter_docs(self, docs: np.ndarray, source: Optional[str],
+                     columns: Optional[Sequence[str]]) -> np.ndarray:
+        if source is not None:
+            if source not in self.sources:
+                return docs[:0]
+            docs = docs[self._field_source[self._doc_field[docs]] == self.sources.index(source)]
+        if columns is not None:
+            wanted = set(columns)
+            field_ids = [i for i, (_, col) in enumerate(self.fields) if col in wanted]
+            docs = docs[np.isin(self._doc_field[docs], field_ids)]
+        return docs
+
+    def match(self, query: str, source: Optional[str] = None,
+              columns: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Evaluate a boolean query.
+
+        Args:
+            query: Query string (see QueryParser)
+            source: Restrict to one data frame, e.g. "survey"
+            columns: Restrict to these columns
+
+        Returns:
+            Sorted doc ids of matching cells
+        """
+        docs = self._evaluate(self._parser.parse(query))
+        return self._filter_docs(docs, source, columns)
+
+    def count(self, query: str, source: Optional[str] = None,
+              columns: Optional[Sequence[str]] = None) -> int:
+        """Number of matching cells."""
+        return len(self.match(query, source, columns))
+
+    def respondents(self, query: str, source: str = "survey",
+                    columns: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Sorted positional rows of `source` with at least one matching cell."""
+        docs = self.match(query, source, columns)
+        return np.unique(self._doc_row[docs])
+
+    def bm25(self, query: str, docs: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        BM25 scores of matching docs.
+
+        Args:
+            query: Query string; terms under NOT do not contribute
+            docs: Candidate docs, defaults to the docs matching the query
+
+        Returns:
+            (doc ids, scores) sorted by descending score
+        """
+        node = self._parser.parse(query)
+        if docs is None:
+            docs = self._evaluate(node)
+        scores = np.zeros(len(docs))
+        if len(docs) == 0:
+            return docs, scores
+
+        lengths = self._doc_length[docs].astype(float)
+        norm = self.K1 * (1 - self.B + self.B * lengths / max(self.avg_doc_length, 1e-9))
+
+        for leaf in self._positive_leaves(node):
+            occurrence_docs, _ = self._occurrences(leaf)
+            if len(occurrence_docs) == 0:
+                continue
+            leaf_docs, tf = np.unique(occurrence_docs, return_counts=True)
+            df = len(leaf_docs)
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+
+            positions = np.searchsorted(leaf_docs, docs)
+            positions[positions >= len(leaf_docs)] = 0
+            doc_tf = np.where(leaf_docs[positions] == docs, tf[positions], 0).astype(float)
+            scores += idf * doc_tf * (self.K1 + 1) / (doc_tf + norm)
+
+        order = np.argsort(-scores, kind='stable')
+        return docs[order], scores[order]
+
+    def search(self, query: str, limit: Optional[int] = 20, source: Optional[str] = None,
+               columns: Optional[Sequence[str]] = None) -> List[SearchHit]:
+        """
+        Ranked search.
+
+        Args:
+            query: Query string (see QueryParser)
+            limit: Maximum number of hits, None for all
+            source: Restrict to one data frame, e.g. "survey"
+            columns: Restrict to these columns
+
+        Returns:
+            Hits ordered by BM25 score
+        """
+        docs, scores = self.bm25(query, self.match(query, source, columns))
+        if limit is not None:
+            docs, scores = docs[:limit], scores[:limit]
+
+        # Occurrences of each leaf sorted by doc, so a hit's starts are one slice
+        leaves = self._positive_leaves(self._parser.parse(query))
+        occurrences = []
+        for leaf in leaves:
+            occurrence_docs, starts = self._occurrences(leaf)
+            order = np.argsort(occurrence_docs, kind='stable')
+            occurrences.append((occurrence_docs[order], starts[order], leaf))
+
+        hits = []
+        for doc, score in zip(docs, scores):
+            source_name, column = self.fields[self._doc_field[doc]]
+            highlights = []
+            for occurrence_docs, starts, leaf in occurrences:
+                lo, hi = np.searchsorted(occurrence_docs, [doc, doc + 1])
+                for start in starts[lo:hi]:
+                    highlights.append((int(start), int(start) + self._leaf_length(leaf, doc, int(start))))
+            hits.append(SearchHit(
+                source=source_name,
+                row=int(self._doc_row[doc]),
+                column=column,
+                score=round(float(score), 4),
+                text=self.text(int(doc)),
+                highlights=sorted(set(highlights))
+            ))
+        return hits
+
+    def _leaf_length(self, leaf: Tuple, doc: int, start: int) -> int:
+        """Character length of a matched term or phrase occurrence."""
+        if leaf[0] != 'phrase':
+            match = TOKEN_PATTERN.match(self.text(doc).lower(), start)
+            return len(match.group()) if match else 0
+        text = self.text(doc).lower()
+        end = start
+        for token in leaf[1]:
+            match = TOKEN_PATTERN.search(text, end)
+            if not match:
+                break
+            end = match.end()
+        return end - start
+
+    def text(self, doc: int) -> str:
+        """Original text of a document."""
+        start, end = self._text_offsets[doc], self._text_offsets[doc + 1]
+        return bytes(self._text[start:end]).decode('utf-8')
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size and provenance."""
+        return {
+            'index_dir': str(self.index_dir),
+            'created_at': self.meta.get('created_at'),
+            'fingerprint': self.meta.get('fingerprint'),
+            'documents': self.doc_count,
+            'terms': len(self._terms),
+            'postings': len(self._post_doc),
+            'sources': self.sources
+        }
@@ -0,0 +1,5 @@
+"""Content-addressed storage for analysis results."""
+
+from .results import ResultStore, StoredResult
+
+__all__ = ["ResultStore", "StoredResult"]
@@ -0,0 +1,169 @@
+"""Deduplicated result store with named pointers and run manifests."""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from ..config import settings
+
+
+# Run manifests are read-modify-write; stages running in parallel threads
+# (and stores created per call) add to the same run's manifest
+_manifest_lock = threading.Lock()
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(exist_ok=True, parents=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+class StoredResult(BaseModel):
+    """Reference to a stored result object."""
+    name: str
+    digest: str
+    path: Path
+    run_id: Optional[str] = None
+    created_at: str
+    deduplicated: bool = False
+    # Per-run fields kept out of the content hash, e.g. analysis_timestamp
+    volatile: Dict[str, Any] = {}
+
+
+class ResultStore:
+    """
+    Stores result documents once per distinct content.
+
+    Layout under `root` (default: data/results/store):
+
+    - `objects/<ab>/<digest>.json`: the serialized result, named by the
+      SHA-256 of its bytes, so identical outputs share one file
+    - `refs/<name>.json`: pointer to the newest object for a result name
+      (e.g. "who_analysis"), so "latest" is one small read, not a glob
+    - `runs/<run_id>.json`: manifest of every result a run produced
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.results_dir / "store")
+        self.objects_dir = self.root / "objects"
+        self.refs_dir = self.root / "refs"
+        self.runs_dir = self.root / "runs"
+
+    @staticmethod
+    def serialize(data: Any) -> bytes:
+        """Serialization used for storage and hashing."""
+        return json.dumps(data, indent=2, default=str).encode()
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json"
+
+    def put(self, name: str, data: Any, run_id: Optional[str] = None,
+            metadata: Optional[Dict[str, Any]] = None,
+            volatile_keys: Sequence[str] = ("analysis_timestamp",)) -> StoredResult:
+        """
+        Store a result and point `name` at it.
+
+        Args:
+            name: Result name, e.g. "who_analysis"
+            data: JSON-serializable result
+            run_id: Run that produced it; recorded in the run's manifest
+            metadata: Extra fields for the run manifest entry
+            volatile_keys: Top-level keys that change on every run; they are
+                kept in the pointer and manifest instead of the object, so
+                otherwise identical results are stored once
+
+        Returns:
+            Reference to the stored object
+        """
+        volatile = {}
+        if isinstance(data, dict):
+            volatile = {key: data[key] for key in volatile_keys if key in data}
+            data = {key: value for key, value in data.items() if key not in volatile}
+
+        payload = self.serialize(data)
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.object_path(digest)
+
+        deduplicated = path.exists()
+        if not deduplicated:
+            _atomic_write(path, payload)
+
+        stored = StoredResult(
+            name=name,
+            digest=digest,
+            path=path,
+            run_id=run_id,
+            created_at=datetime.now().isoformat(),
+            deduplicated=deduplicated,
+            volatile=json.loads(json.dumps(volatile, default=str))
+        )
+        _atomic_write(self.refs_dir / f"{name}.json", stored.model_dump_json(indent=2).encode())
+
+        if run_id:
+            self._add_to_manifest(run_id, stored, metadata or {})
+
+        return stored
+
+    def _add_to_manifest(self, run_id: str, stored: StoredResult, metadata: Dict[str, Any]) -> None:
+        entry = {
+            'digest': stored.digest,
+            'path': str(stored.path.relative_to(self.root)),
+            'bytes': stored.path.stat().st_size,
+            **stored.volatile,
+            **metadata
+        }
+        with _manifest_lock:
+            manifest = self.manifest(run_id) or {
+                'run_id': run_id,
+                'created_at': stored.created_at,
+                'outputs': {}
+            }
+            manifest['updated_at'] = stored.created_at
+            manifest['outputs'][stored.name] = entry
+            _atomic_write(self.runs_dir / f"{run_id}.json", json.dumps(manifest, indent=2).encode())
+
+    def ref(self, name: str) -> Optional[StoredResult]:
+        """Pointer to the latest object stored under `name`, if any."""
+        ref_file = self.refs_dir / f"{name}.json"
+        if not ref_file.exists():
+            return None
+        with open(ref_file, 'r') as f:
+            return StoredResult(**json.load(f))
+
+    def get(self, digest: str) -> Any:
+        """Load a stored object by digest."""
+        with open(self.object_path(digest), 'r') as f:
+            return json.load(f)
+
+    def latest(self, name: str) -> Optional[Any]:
+        """Latest result stored under `name` (with its per-run fields), or None."""
+        stored = self.ref(name)
+        if stored is None:
+            return None
+        data = self.get(stored.digest)
+        if isinstance(data, dict) and stored.volatile:
+            data = {**stored.volatile, **data}
+        return data
+
+    def manifest(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Manifest of a run, or None."""
+        manifest_file = self.runs_dir / f"{run_id}.json"
+        if not manifest_file.exists():
+            return None
+        with open(manifest_file, 'r') as f:
+            return json.load(f)
+
+    def runs(self) -> List[str]:
+        """Ids of all recorded runs, oldest first."""
+        if not self.runs_dir.exists():
+            return []
+        manifests = sorted(self.runs_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        return [path.stem for path in manifests]
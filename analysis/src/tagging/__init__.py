@@ -0,0 +1,5 @@
+"""Keyword tagging module for taxonomy-driven text classification."""
+
+from .tagger import KeywordTagger, TagMatrix, load_taxonomy
+
+__all__ = ["KeywordTagger", "TagMatrix", "load_taxonomy"]
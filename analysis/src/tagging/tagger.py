@@ -0,0 +1,334 @@
+"""Compiled multi-pattern keyword tagger driven by a declarative taxonomy."""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+TAXONOMY_FILE = Path(__file__).parent / "taxonomy.json"
+
+
+def load_taxonomy(name: str, taxonomy_file: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Load a named taxonomy from the taxonomy file.
+
+    Args:
+        name: Taxonomy name (top-level key of the file)
+        taxonomy_file: Path of the taxonomy file, defaults to taxonomy.json
+
+    Returns:
+        Taxonomy definition with 'tags' and optional 'whole_words'
+    """
+    with open(taxonomy_file or TAXONOMY_FILE, 'r') as f:
+        taxonomies = json.load(f)
+
+    if name not in taxonomies:
+        raise KeyError(f"Unknown taxonomy: {name}")
+
+    return taxonomies[name]
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation that shares common prefixes and prefers the longest word."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def to_pattern(node: Dict[str, Any]) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + to_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1:
+            body = branches[0]
+            if terminal:
+                return f"(?:{body})?"
+            return body
+        body = '(?:' + '|'.join(branches) + ')'
+        return body + '?' if terminal else body
+
+    return to_pattern(trie)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class TagMatrix:
+    """
+    Sparse row x tag matrix of keyword matches.
+
+    `matrix[row, tag]` holds the number of keyword matches. Every match is also
+    kept as an offset record (row, source, tag, start, end), where source is the
+    column or document the text came from and offsets refer to the text itself.
+    """
+
+    def __init__(self, tags: List[str], n_rows: int, rows: np.ndarray,
+                 tag_ids: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                 source_ids: np.ndarray, sources: List[Any]):
+        self.tags = tags
+        self.sources = sources
+        self.n_rows = n_rows
+        self._tag_index = {tag: i for i, tag in enumerate(tags)}
+
+        self.offsets = {
+            'row': rows,
+            'source': source_ids,
+            'tag': tag_ids,
+            'start': starts,
+            'end': ends
+        }
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, tag_ids)),
+            shape=(n_rows, len(tags))
+        )
+        self.matrix.sum_duplicates()
+
+        # Boolean presence view used by the queries below
+        self._presence = self.matrix.tocsc(copy=True)
+        self._presence.data[:] = 1
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def has(self, tag: str) -> np.ndarray:
+        """Boolean mask of rows tagged with `tag`."""
+        column = self._presence[:, self._tag_index[tag]]
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[column.indices] = True
+        return mask
+
+    def any(self, tags: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Boolean mask of rows tagged with any of `tags` (default: any tag)."""
+        columns = [self._tag_index[t] for t in tags] if tags is not None else slice(None)
+        return np.asarray(self._presence[:, columns].sum(axis=1)).ravel() > 0
+
+    def rows(self, tag: str) -> np.ndarray:
+        """Row positions tagged with `tag`, in ascending order."""
+        return np.flatnonzero(self.has(tag))
+
+    def counts(self, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """
+        Number of rows carrying each tag, in taxonomy order.
+
+        Args:
+            mask: Optional boolean row mask restricting which rows are counted
+        """
+        presence = self._presence if mask is None else self._presence[np.flatnonzero(mask)]
+        totals = np.asarray(presence.sum(axis=0)).ravel()
+        return {tag: int(total) for tag, total in zip(self.tags, totals)}
+
+    def first_tags(self, default: Optional[str] = None) -> List[Optional[str]]:
+        """First matching tag of each row in taxonomy order, or `default`."""
+        presence = self._presence.tocsr()
+        first = np.full(self.n_rows, len(self.tags), dtype=np.int64)
+        row_ids = np.repeat(np.arange(self.n_rows), np.diff(presence.indptr))
+        np.minimum.at(first, row_ids, presence.indices)
+        labels = self.tags + [default]
+        return [labels[i] for i in first]
+
+    def row_tags(self, row: int) -> List[str]:
+        """Tags of one row, in taxonomy order."""
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        return [self.tags[i] for i in np.sort(self.matrix.indices[start:end])]
+
+    def spans(self, row: int, tag: Optional[str] = None) -> List[Tuple[str, Any, int, int]]:
+        """Matches in one row as (tag, source, start, end) tuples."""
+        selected = self.offsets['row'] == row
+        if tag is not None:
+            selected &= self.offsets['tag'] == self._tag_index[tag]
+        return [
+            (self.tags[t], self.sources[s], int(start), int(end))
+            for t, s, start, end in zip(
+                self.offsets['tag'][selected], self.offsets['source'][selected],
+                self.offsets['start'][selected], self.offsets['end'][selected]
+            )
+        ]
+
+
+class KeywordTagger:
+    """
+    Tags text with every taxonomy keyword it contains.
+
+    All keywords of a taxonomy are compiled into one prefix-sharing regex, so
+    each text is scanned once regardless of how many tags or keywords there
+    are. Keywords match case-insensitively as substrings, or only on word
+    boundaries when `whole_words` is set. A keyword may belong to several tags,
+    and a match of a keyword also counts for every shorter keyword it starts
+    with, so overlapping keywords tag exactly like independent substring checks.
+    """
+
+    def __init__(self, taxonomy: Dict[str, Any], whole_words: bool = False):
+        """
+        Compile a taxonomy.
+
+        Args:
+            taxonomy: Mapping of tag to a keyword list or to a dictionary with
+                'keywords' and optional 'description'
+            whole_words: Only match keywords on word boundaries
+        """
+        self.whole_words = whole_words
+        self.tags: List[str] = list(taxonomy)
+        self.keywords: Dict[str, List[str]] = {}
+        self.descriptions: Dict[str, str] = {}
+
+        keyword_tags: Dict[str, List[int]] = {}
+        for tag_id, (tag, definition) in enumerate(taxonomy.items()):
+            if isinstance(definition, dict):
+                keywords = definition.get('keywords', [])
+                self.descriptions[tag] = definition.get('description', '')
+            else:
+                keywords = definition
+            self.keywords[tag] = list(keywords)
+
+            for keyword in keywords:
+                keyword = keyword.lower().strip()
+                if keyword:
+                    tag_ids = keyword_tags.setdefault(keyword, [])
+                    if tag_id not in tag_ids:
+                        tag_ids.append(tag_id)
+
+        # Keywords a matched keyword starts with, longest first: (length, tag ids)
+        self._prefixes: Dict[str, List[Tuple[int, List[int]]]] = {
+            keyword: sorted(
+                ((len(other), tag_ids) for other, tag_ids in keyword_tags.items()
+                 if keyword.startswith(other)),
+                reverse=True
+            )
+            for keyword in keyword_tags
+        }
+
+        alternation = _trie_pattern(keyword_tags) if keyword_tags else '(?!)'
+        if whole_words:
+            # Longest keyword at this position that ends on a word boundary
+            self._pattern = re.compile(rf"(?=\b({alternation})\b)")
+        else:
+            self._pattern = re.compile(rf"(?=({alternation}))")
+
+    @classmethod
+    def from_taxonomy(cls, name: str, taxonomy_file: Optional[Path] = None) -> "KeywordTagger":
+        """Build a tagger for a named taxonomy in the taxonomy file."""
+        definition = load_taxonomy(name, taxonomy_file)
+        return cls(definition['tags'], whole_words=definition.get('whole_words', False))
+
+    def _at_boundary(self, text: str, end: int) -> bool:
+        before = _is_word_char(text[end - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        return before != after
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Find all keyword matches in a text.
+
+        Returns:
+            List of (tag id, start, end) tuples ordered by start offset
+        """
+        normalized = text.lower()
+        matches = []
+
+        for match in self._pattern.finditer(normalized):
+            start = match.start()
+            word = match.group(1)
+            for length, tag_ids in self._prefixes[word]:
+                end = start + length
+                if (self.whole_words and length < len(word)
+                        and not self._at_boundary(normalized, end)):
+                    continue
+                for tag_id in tag_ids:
+                    matches.append((tag_id, start, end))
+
+        return matches
+
+    def tag(self, text: str) -> List[str]:
+        """Tags present in a text, in taxonomy order."""
+        found = {tag_id for tag_id, _, _ in self.find(text)}
+        return [self.tags[i] for i in sorted(found)]
+
+    def tag_texts(self, texts: Iterable[Any], rows: Optional[Sequence[int]] = None,
+                  n_rows: Optional[int] = None, sources: Optional[Sequence[Any]] = None) -> TagMatrix:
+        """
+        Tag a batch of texts into a sparse row x tag matrix.
+
+        Args:
+            texts: Texts to tag; missing values (None/NaN) are skipped
+            rows: Row of each text, so several texts (e.g. the answers of one
+                respondent) can be folded into one row; defaults to position
+            n_rows: Number of rows in the matrix
+            sources: Source label of each text, kept with the match offsets
+
+        Returns:
+            TagMatrix over the rows
+        """
+        texts = list(texts)
+        rows = np.arange(len(texts)) if rows is None else np.asarray(rows, dtype=np.int64)
+        if n_rows is None:
+            n_rows = int(rows.max()) + 1 if len(rows) else 0
+
+        source_labels: List[Any] = []
+        source_codes: Dict[Any, int] = {}
+        if sources is None:
+            source_labels.append(None)
+            text_sources = np.zeros(len(texts), dtype=np.int64)
+        else:
+            text_sources = np.empty(len(texts), dtype=np.int64)
+            for i, source in enumerate(sources):
+                if source not in source_codes:
+                    source_codes[source] = len(source_labels)
+                    source_labels.append(source)
+                text_sources[i] = source_codes[source]
+
+        match_rows, match_sources, match_tags, starts, ends = [], [], [], [], []
+        for i, text in enumerate(texts):
+            if text is None or (not isinstance(text, str) and pd.isna(text)):
+                continue
+            for tag_id, start, end in self.find(str(text)):
+                match_rows.append(rows[i])
+                match_sources.append(text_sources[i])
+                match_tags.append(tag_id)
+                starts.append(start)
+                ends.append(end)
+
+        return TagMatrix(
+            tags=self.tags,
+            n_rows=n_rows,
+            rows=np.asarray(match_rows, dtype=np.int64),
+            tag_ids=np.asarray(match_tags, dtype=np.int64),
+            starts=np.asarray(starts, dtype=np.int64),
+            ends=np.asarray(ends, dtype=np.int64),
+            source_ids=np.asarray(match_sources, dtype=np.int64),
+            sources=source_labels
+        )
+
+    def tag_columns(self, df: pd.DataFrame, columns: Sequence[str]) -> TagMatrix:
+        """
+        Tag several text columns into one respondent x tag matrix.
+
+        Rows are the positional rows of `df`; match offsets record the column
+        each match was found in.
+        """
+        texts: List[Any] = []
+        rows: List[np.ndarray] = []
+        sources: List[str] = []
+
+        for col in columns:
+            values = df[col]
+            present = np.flatnonzero(values.notna().to_numpy())
+            texts.extend(values.iloc[present].tolist())
+            rows.append(present)
+            sources.extend([col] * len(present))
+
+        return self.tag_texts(
+            texts,
+            rows=np.concatenate(rows) if rows else np.array([], dtype=np.int64),
+            n_rows=len(df),
+            sources=sources
+        )
@@ -1,5 +1,18 @@
 """Validation and audit trail module."""
 
 from .audit import AuditLogger
+from .sink import AuditSink, get_sink
+from .archive import AuditArchive
+from .progress import ProgressFeed, ProgressState, follow_progress, get_progress_feed, progress_table
 
-__all__ = ["AuditLogger"]
\ No newline at end of file
+__all__ = [
+    "AuditLogger",
+    "AuditSink",
+    "get_sink",
+    "AuditArchive",
+    "ProgressFeed",
+    "ProgressState",
+    "follow_progress",
+    "get_progress_feed",
+    "progress_table"
+]
@@ -0,0 +1,278 @@
+"""Columnar archive of closed audit sessions."""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from ..config import settings
+
+
+ARCHIVE_VERSION = 1
+
+# One row per audit entry; the full entry data is kept as JSON text
+ENTRY_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("session_id", pa.string()),
+    ("timestamp", pa.string()),
+    ("question_id", pa.string()),
+    ("model", pa.string()),
+    ("error_type", pa.string()),
+    ("error_operation", pa.string()),
+    ("message", pa.string()),
+    ("tokens_input", pa.int64()),
+    ("tokens_output", pa.int64()),
+    ("tokens_total", pa.int64()),
+    ("data", pa.string()),
+    ("operation", pa.string()),
+])
+
+PARTITIONING = ds.partitioning(pa.schema([("operation", pa.string())]), flavor="hive")
+
+
+def iter_audit_entries(audit_file: Path) -> Iterator[Dict[str, Any]]:
+    """Entries of a session file, one at a time (malformed lines are skipped)."""
+    with open(audit_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut off by a crash mid-write
+                continue
+
+
+def _tokens(tokens_used: Any) -> Dict[str, Optional[int]]:
+    if not isinstance(tokens_used, dict):
+        return {"tokens_input": None, "tokens_output": None, "tokens_total": None}
+    tokens_input = tokens_used.get("input_tokens", tokens_used.get("prompt_tokens"))
+    tokens_output = tokens_used.get("output_tokens", tokens_used.get("completion_tokens"))
+    tokens_total = tokens_used.get("total_tokens")
+    if tokens_total is None and tokens_input is not None and tokens_output is not None:
+        tokens_total = tokens_input + tokens_output
+    return {"tokens_input": tokens_input, "tokens_output": tokens_output, "tokens_total": tokens_total}
+
+
+def entry_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten an audit entry into an archive row."""
+    data = entry.get("data") or {}
+    context = data.get("context") if isinstance(data.get("context"), dict) else {}
+
+    row = {
+        "id": entry.get("id"),
+        "session_id": entry.get("session_id"),
+        "timestamp": entry.get("timestamp"),
+        "operation": entry.get("operation"),
+        "question_id": data.get("question_id", context.get("question_id")),
+        "model": data.get("model", data.get("deployment")),
+        "error_type": data.get("error_type"),
+        "error_operation": data.get("error_operation"),
+        "message": data.get("error_message", data.get("message")),
+        "data": json.dumps(data, default=str)
+    }
+    row.update(_tokens(data.get("tokens_used")))
+
+    for field in ("question_id", "model", "error_type", "error_operation", "message"):
+        if row[field] is not None:
+            row[field] = str(row[field])
+    return row
+
+
+class AuditArchive:
+    """
+    Parquet archive of audit entries, partitioned by operation.
+
+    Each closed session is compacted once into
+    `operation=<name>/<session_id>-<batch>-<n>.parquet` files, reading the
+    JSONL file in bounded batches. `index.json` records every archived
+    session (source file, size, time range, entries per operation).
+    Queries filtered by operation only open that operation's partition;
+    other filters skip files through Parquet column statistics, so a query
+    never scans raw JSONL.
+    """
+
+    def __init__(self, archive_dir: Optional[Path] = None, audit_dir: Optional[Path] = None):
+        self.audit_dir = Path(audit_dir or settings.audit_dir)
+        self.archive_dir = Path(archive_dir or self.audit_dir / "archive")
+        self.entries_dir = self.archive_dir / "entries"
+        self.index_file = self.archive_dir / "index.json"
+
+    def load_index(self) -> Dict[str, Any]:
+        if self.index_file.exists():
+            with open(self.index_file, 'r') as f:
+                index = json.load(f)
+            if index.get("version") == ARCHIVE_VERSION:
+                return index
+        return {"version": ARCHIVE_VERSION, "sessions": {}}
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        self.archive_dir.mkdir(exist_ok=True, parents=True)
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_file, self.index_file)
+
+    def is_closed(self, audit_file: Path, min_age_hours: float) -> bool:
+        """A session is closed if it logged session_end or has not been written to recently."""
+        if time.time() - audit_file.stat().st_mtime >= min_age_hours * 3600:
+            return True
+        with open(audit_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - 4096, 0))
+            tail = f.read().decode('utf-8', errors='ignore').strip().splitlines()
+        return bool(tail) and '"operation": "session_end"' in tail[-1]
+
+    def compact(self, min_age_hours: float = 1.0, batch_rows: int = 50000) -> List[str]:
+        """
+        Archive closed sessions that are not archived yet (or changed since).
+
+        Args:
+            min_age_hours: Sessions without session_end count as closed after
+                this long without writes
+            batch_rows: Entries read before a batch is written
+
+        Returns:
+            Session ids archived by this call
+        """
+        index = self.load_index()
+        archived = []
+
+        for audit_file in sorted(self.audit_dir.glob("audit_log_*.jsonl")):
+            stat = audit_file.stat()
+            known = next(
+                (s for s in index["sessions"].values() if s["source_file"] == audit_file.name), None
+            )
+            if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+                continue
+            if not self.is_closed(audit_file, min_age_hours):
+                continue
+
+            session = self._compact_session(audit_file, batch_rows, known)
+            session.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            index["sessions"][session["session_id"]] = session
+            archived.append(session["session_id"])
+
+        if archived:
+            index["updated_at"] = datetime.now().isoformat()
+            self._save_index(index)
+        return archived
+
+    def _compact_session(self, audit_file: Path, batch_rows: int,
+                         previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        session_id = audit_file.stem.replace("audit_log_", "", 1)
+        if previous:
+            # The file grew after it was archived: replace its partitions
+            self._remove_session_files(previous["session_id"])
+
+        operations: Dict[str, int] = {}
+        first_timestamp = last_timestamp = None
+        rows: List[Dict[str, Any]] = []
+        batch = 0
+
+        for entry in iter_audit_entries(audit_file):
+            row = entry_row(entry)
+            row["session_id"] = row["session_id"] or session_id
+            rows.append(row)
+            operations[row["operation"]] = operations.get(row["operation"], 0) + 1
+            first_timestamp = first_timestamp or row["timestamp"]
+            last_timestamp = row["timestamp"] or last_timestamp
+            if len(rows) >= batch_rows:
+                self._write_batch(rows, session_id, batch)
+                rows, batch = [], batch + 1
+        if rows:
+            self._write_batch(rows, session_id, batch)
+
+        return {
+            "session_id": session_id,
+            "source_file": audit_file.name,
+            "entries": sum(operations.values()),
+            "operations": operations,
+            "start_time": first_timestamp,
+            "end_time": last_timestamp,
+            "archived_at": datetime.now().isoformat()
+        }
+
+    def _write_batch(self, rows: List[Dict[str, Any]], session_id: str, batch: int) -> None:
+        table = pa.Table.from_pylist(rows, schema=ENTRY_SCHEMA)
+        ds.write_dataset(
+            table,
+            self.entries_dir,
+            format="parquet",
+            partitioning=PARTITIONING,
+            basename_template=f"{session_id}-{batch}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+
+    def _remove_session_files(self, session_id: str) -> None:
+        for path in self.entries_dir.glob(f"operation=*/{session_id}-*.parquet"):
+            path.unlink()
+
+    def query(self, operations: Optional[Sequence[str]] = None,
+              sessions: Optional[Sequence[str]] = None,
+              question_id: Optional[str] = None,
+              columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Archived entries matching all given filters.
+
+        Args:
+            operations: Operation names (prunes partitions)
+            sessions: Session ids (prunes files)
+            question_id: Question the entry refers to
+            columns: Columns to read (default: all)
+        """
+        if not self.entries_dir.exists():
+            return pd.DataFrame(columns=list(columns or ENTRY_SCHEMA.names))
+
+        dataset = ds.dataset(
+            self.entries_dir,
+            format="parquet",
+            partitioning=PARTITIONING,
+            schema=ENTRY_SCHEMA
+        )
+
+        condition = None
+        for expression in (
+            ds.field("operation").isin(list(operations)) if operations else None,
+            ds.field("session_id").isin(list(sessions)) if sessions else None,
+            ds.field("question_id") == question_id if question_id else None,
+        ):
+            if expression is not None:
+                condition = expression if condition is None else condition & expression
+
+        table = dataset.to_table(columns=list(columns) if columns else None, filter=condition)
+        return table.to_pandas()
+
+    def tokens_by(self, group_by: str = "model") -> pd.DataFrame:
+        """Tokens of actual LLM calls (cache hits excluded), summed per group."""
+        df = self.query(
+            operations=["llm_call"],
+            columns=[group_by, "tokens_input", "tokens_output", "tokens_total"]
+        )
+        if df.empty:
+            return pd.DataFrame(columns=[group_by, "calls", "tokens_input", "tokens_output", "tokens_total"])
+        df[group_by] = df[group_by].fillna("unknown")
+        summary = df.groupby(group_by).agg(
+            calls=("tokens_total", "size"),
+            tokens_input=("tokens_input", "sum"),
+            tokens_output=("tokens_output", "sum"),
+            tokens_total=("tokens_total", "sum")
+        )
+        return summary.sort_values("tokens_total", ascending=False).reset_index()
+
+    def errors(self, question_id: Optional[str] = None,
+               sessions: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Logged errors, optionally for one question or session."""
+        return self.query(
+            operations=["error"],
+            sessions=sessions,
+            question_id=question_id,
+            columns=["timestamp", "session_id", "question_id", "error_operation", "error_type", "message"]
+        ).sort_values("timestamp")
@@ -1,13 +1,31 @@
 """Audit logging system for full traceability."""
 
+import atexit
 import json
 import hashlib
+import threading
+import time
 import uuid
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ..config import settings
+from .sink import get_sink
+from .rollup import OperationRollup, operation_level
+from .archive import iter_audit_entries
+from .progress import get_progress_feed
+
+
+# Loggers with roll-ups still to be written at exit
+_open_loggers: "weakref.WeakSet[AuditLogger]" = weakref.WeakSet()
+_exit_hook_registered = False
+
+
+def _flush_open_loggers() -> None:
+    for audit_logger in list(_open_loggers):
+        audit_logger.flush_rollups()
 
 
 class AuditLogger:
@@ -17,6 +35,14 @@ class AuditLogger:
         self.session_id = session_id or str(uuid.uuid4())
         self.audit_file = settings.audit_dir / f"audit_log_{self.session_id}.jsonl"
         self.audit_file.parent.mkdir(exist_ok=True, parents=True)
+        # Entries are written by the shared background sink
+        self._sink = get_sink()
+        
+        # High-frequency operations accumulate here between roll-up records
+        self._rollups: Dict[str, OperationRollup] = {}
+        self._rollup_lock = threading.Lock()
+        self._last_rollup = time.monotonic()
+        self._register_exit_hook()
         
         # Initialize session
         self.log_operation(
@@ -27,7 +53,19 @@ class AuditLogger:
         )
     
     def log_operation(self, operation: str, **kwargs) -> str:
-        """Log an operation with full context."""
+        """
+        Log an operation with full context.
+        
+        Operations configured at the "rollup" level are not written one by
+        one; they are counted into a periodic "audit_rollup" record, and the
+        returned id is that of the roll-up they will be part of.
+        """
+        level = operation_level(operation)
+        if level == "off":
+            return ""
+        if level == "rollup":
+            return self._add_to_rollup(operation, kwargs)
+        
         entry = {
             "id": str(uuid.uuid4()),
             "session_id": self.session_id,
@@ -40,9 +78,9 @@ class AuditLogger:
         if "data_hash" not in entry["data"] and "data" in kwargs:
             entry["data"]["data_hash"] = self._hash_data(kwargs["data"])
         
-        # Write to audit log
-        with open(self.audit_file, 'a') as f:
-            f.write(json.dumps(entry, default=str) + '\n')
+        # Queue for the audit log; encoded now so later changes to the
+        # logged objects do not alter the entry
+        self._sink.write(self.audit_file, json.dumps(entry, default=str))
         
         return entry["id"]
     
@@ -68,12 +106,14 @@ class AuditLogger:
         response: str,
         model: str,
         parameters: Dict[str, Any],
-        tokens_used: Optional[Dict[str, int]] = None
+        tokens_used: Optional[Dict[str, int]] = None,
+        question_id: Optional[str] = None
     ) -> str:
-        """Log LLM API calls for reproducibility."""
+        """Log LLM API calls for reproducibility (and token totals per question)."""
         return self.log_operation(
             operation="llm_call",
             model=model,
+            question_id=question_id,
             prompt_hash=self._hash_data(prompt),
             response_hash=self._hash_data(response),
             parameters=parameters,
@@ -105,6 +145,8 @@ class AuditLogger:
         context: Dict[str, Any]
     ) -> str:
         """Log errors with context."""
+        # Monitors follow error counts on the progress feed
+        get_progress_feed().record_error(operation, error_type)
         return self.log_operation(
             operation="error",
             error_operation=operation,
@@ -128,26 +170,32 @@ class AuditLogger:
         )
     
     def create_lineage_report(self, output_file: Optional[Path] = None) -> Dict[str, Any]:
-        """Create a data lineage report from audit logs."""
-        entries = []
+        """
+        Create a data lineage report from audit logs.
         
-        with open(self.audit_file, 'r') as f:
-            for line in f:
-                entries.append(json.loads(line))
+        The session file is read one entry at a time; only the lineage
+        events themselves are kept.
+        """
+        self.flush()
         
         # Build lineage graph
         lineage = {
             "session_id": self.session_id,
-            "start_time": entries[0]["timestamp"] if entries else None,
-            "end_time": entries[-1]["timestamp"] if entries else None,
-            "operations": len(entries),
+            "start_time": None,
+            "end_time": None,
+            "operations": 0,
             "transformations": [],
             "validations": [],
             "llm_calls": [],
+            "rollups": [],
             "errors": []
         }
         
-        for entry in entries:
+        for entry in iter_audit_entries(self.audit_file):
+            lineage["start_time"] = lineage["start_time"] or entry["timestamp"]
+            lineage["end_time"] = entry["timestamp"]
+            lineage["operations"] += 1
+            
             if entry["data"].get("transformation_type") == "data_transformation":
                 lineage["transformations"].append({
                     "operation": entry["operation"],
@@ -168,6 +216,12 @@ class AuditLogger:
                     "timestamp": entry["timestamp"],
                     "tokens": entry["data"].get("tokens_used")
                 })
+            elif entry["operation"] == "audit_rollup":
+                lineage["rollups"].append({
+                    "operation": entry["data"]["rolled_up_operation"],
+                    "count": entry["data"]["count"],
+                    "timestamp": entry["timestamp"]
+                })
             elif entry["operation"] == "error":
                 lineage["errors"].append({
                     "operation": entry["data"]["error_operation"],
@@ -201,10 +255,54 @@ class AuditLogger:
                 config[key] = value
         return config
     
+    def _register_exit_hook(self) -> None:
+        # Registered after the sink's own hook, so it runs first at exit
+        global _exit_hook_registered
+        _open_loggers.add(self)
+        if not _exit_hook_registered:
+            atexit.register(_flush_open_loggers)
+            _exit_hook_registered = True
+    
+    def _add_to_rollup(self, operation: str, data: Dict[str, Any]) -> str:
+        with self._rollup_lock:
+            rollup = self._rollups.get(operation)
+            if rollup is None:
+                rollup = self._rollups[operation] = OperationRollup(operation)
+            rollup.add(datetime.now().isoformat(), data)
+            due = time.monotonic() - self._last_rollup >= settings.audit_rollup_interval
+        
+        if due:
+            self.flush_rollups()
+        return f"rollup:{operation}"
+    
+    def flush_rollups(self) -> None:
+        """Write one roll-up record per operation accumulated since the last one."""
+        with self._rollup_lock:
+            rollups = list(self._rollups.values())
+            self._rollups = {}
+            self._last_rollup = time.monotonic()
+        
+        for rollup in rollups:
+            entry = {
+                "id": str(uuid.uuid4()),
+                "session_id": self.session_id,
+                "timestamp": datetime.now().isoformat(),
+                "operation": "audit_rollup",
+                "data": rollup.to_record()
+            }
+            self._sink.write(self.audit_file, json.dumps(entry, default=str))
+    
     def close(self):
         """Close the audit session."""
+        self.flush_rollups()
         self.log_operation(
             operation="session_end",
             session_id=self.session_id,
             timestamp=datetime.now().isoformat()
-        )
\ No newline at end of file
+        )
+        self._sink.flush(self.audit_file, sync=True)
+    
+    def flush(self, sync: bool = False):
+        """Write pending roll-ups and wait until all entries are written (and fsynced if `sync`)."""
+        self.flush_rollups()
+        self._sink.flush(self.audit_file, sync=sync)
\ No newline at end of file
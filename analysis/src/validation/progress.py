@@ -0,0 +1,437 @@
+"""Structured progress events of pipeline runs on a rotating JSONL feed."""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from rich.table import Table
+
+from ..config import settings
+
+
+EVENT_TYPES = ("run_start", "run_end", "stage_start", "progress", "stage_end", "error")
+
+# File name of the feed in `settings.progress_dir`; rotated files get .1, .2, ...
+PROGRESS_FEED = "progress.jsonl"
+
+
+class StageProgress:
+    """
+    Item counts of one pipeline stage.
+
+    `advance` is cheap enough for per-response loops: it only updates
+    counters, and a "progress" event is written at most every
+    `settings.progress_interval` seconds. Items can be counted per group
+    (e.g. per question) so subscribers see exact per-group totals.
+    """
+
+    def __init__(self, feed: "ProgressFeed", name: str, total: Optional[int] = None,
+                 groups: Optional[Dict[str, int]] = None):
+        self.feed = feed
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.groups: Dict[str, Dict[str, int]] = {
+            group: {"done": 0, "failed": 0, "total": count} for group, count in (groups or {}).items()
+        }
+        if total is None and groups:
+            self.total = sum(groups.values())
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._start_tokens = feed.tokens
+        self._start_errors = feed.errors
+        self._last_emit = 0.0
+
+    def __enter__(self) -> "StageProgress":
+        self.feed.emit("stage_start", stage=self.name, total=self.total,
+                       groups={group: counts["total"] for group, counts in self.groups.items()})
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        status = "completed" if exc_type is None else "failed"
+        self.feed.emit("stage_end", status=status, **self.snapshot())
+
+    def add_total(self, count: int, group: Optional[str] = None) -> None:
+        """Add items to the stage's (and a group's) total, e.g. once they are known."""
+        with self._lock:
+            self.total = (self.total or 0) + count
+            if group is not None:
+                self.groups.setdefault(group, {"done": 0, "failed": 0, "total": 0})["total"] += count
+
+    def advance(self, count: int = 1, group: Optional[str] = None, failed: bool = False) -> None:
+        """Count finished items; `failed` ones count as done and as failed."""
+        with self._lock:
+            self.done += count
+            if failed:
+                self.failed += count
+            if group is not None:
+                counts = self.groups.setdefault(group, {"done": 0, "failed": 0, "total": 0})
+                counts["done"] += count
+                if failed:
+                    counts["failed"] += count
+            now = time.monotonic()
+            if now - self._last_emit < settings.progress_interval:
+                return
+            self._last_emit = now
+        self.feed.emit("progress", **self.snapshot())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counts, throughput, ETA and token rate of the stage so far."""
+        with self._lock:
+            elapsed = time.monotonic() - self._started
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+            remaining = None if self.total is None else max(self.total - self.done, 0)
+            # Tokens and errors of the whole run while this stage was active
+            tokens = self.feed.tokens - self._start_tokens
+            return {
+                "stage": self.name,
+                "done": self.done,
+                "failed": self.failed,
+                "total": self.total,
+                "elapsed_seconds": round(elapsed, 1),
+                "items_per_second": round(rate, 3),
+                "eta_seconds": round(remaining / rate, 1) if remaining is not None and rate > 0 else None,
+                "tokens": tokens,
+                "tokens_per_second": round(tokens / elapsed, 1) if elapsed > 0 else 0.0,
+                "errors": self.feed.errors - self._start_errors,
+                "run_tokens": self.feed.tokens,
+                "run_errors": self.feed.errors,
+                "groups": {group: dict(counts) for group, counts in self.groups.items()}
+            }
+
+
+class ProgressFeed:
+    """
+    Publishes pipeline progress as JSON lines for monitors to follow.
+
+    Events ("run_start", "stage_start", "progress", "stage_end", "error",
+    "run_end") carry the run id and process id and are appended to
+    `settings.progress_dir/progress.jsonl`. A file grown past
+    `settings.progress_max_bytes` is rotated to progress.1.jsonl and so on,
+    keeping `settings.progress_backups` old files. Subscribers read the
+    file (see `follow_progress` and `ProgressState`) instead of scanning
+    cache directories, so monitoring costs the pipeline nothing but these
+    writes.
+
+    One feed serves a whole process; use `get_progress_feed()`. Token and
+    error counts are process-wide and reported with each stage.
+    """
+
+    def __init__(self, path: Optional[Path] = None, enabled: Optional[bool] = None):
+        self.path = Path(path or settings.progress_dir / PROGRESS_FEED)
+        self.enabled = settings.progress_feed if enabled is None else enabled
+        self.run_id: Optional[str] = None
+        self.tokens = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._last_error_emit = 0.0
+        self._suppressed_errors = 0
+
+    def start_run(self, name: str, run_id: Optional[str] = None, **fields: Any) -> None:
+        """Announce a pipeline run; later events carry its id."""
+        self.run_id = run_id
+        self.tokens = 0
+        self.errors = 0
+        self.emit("run_start", name=name, **fields)
+
+    def end_run(self, status: str = "completed", **fields: Any) -> None:
+        """Announce the end of the run, with its token and error totals."""
+        self.emit("run_end", status=status, tokens=self.tokens, errors=self.errors, **fields)
+
+    def stage(self, name: str, total: Optional[int] = None,
+              groups: Optional[Dict[str, int]] = None) -> StageProgress:
+        """
+        Progress of a stage: `with feed.stage("extract", groups=totals) as stage: ...`
+
+        Args:
+            name: Stage name
+            total: Number of items, if known
+            groups: Number of items per group (e.g. per question); the total
+                defaults to their sum
+        """
+        return StageProgress(self, name, total, groups)
+
+    def add_tokens(self, count: int) -> None:
+        """Count LLM tokens used."""
+        with self._lock:
+            self.tokens += count
+
+    def record_error(self, operation: str, error_type: str) -> None:
+        """
+        Count an error. Error events are throttled like progress events; one
+        that follows suppressed errors reports how many were skipped.
+        """
+        with self._lock:
+            self.errors += 1
+            now = time.monotonic()
+            if now - self._last_error_emit < settings.progress_interval:
+                self._suppressed_errors += 1
+                return
+            self._last_error_emit = now
+            suppressed, self._suppressed_errors = self._suppressed_errors, 0
+        self.emit("error", operation=operation, error_type=error_type,
+                  errors=self.errors, suppressed=suppressed)
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Append one event to the feed."""
+        if not self.enabled:
+            return
+        entry = {
+            "event": event,
+            "timestamp": datetime.now().isoformat(),
+            "run_id": self.run_id,
+            "pid": os.getpid(),
+            **fields
+        }
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(exist_ok=True, parents=True)
+            if self.path.exists() and self.path.stat().st_size + len(line) > settings.progress_max_bytes:
+                self._rotate()
+            with open(self.path, 'a') as f:
+                f.write(line)
+
+    def _rotate(self) -> None:
+        """Shift progress.jsonl to progress.1.jsonl, ... (caller holds the lock)."""
+        backups = rotated_paths(self.path)
+        if backups:
+            backups[-1].unlink(missing_ok=True)
+            for older, newer in zip(reversed(backups[1:]), reversed(backups[:-1])):
+                if newer.exists():
+                    os.replace(newer, older)
+            os.replace(self.path, backups[0])
+        else:
+            self.path.unlink()
+
+
+def rotated_paths(path: Path) -> List[Path]:
+    """Rotated files of a feed, newest first."""
+    return [
+        path.with_name(f"{path.stem}.{i}{path.suffix}")
+        for i in range(1, settings.progress_backups + 1)
+    ]
+
+
+_feed: Optional[ProgressFeed] = None
+_feed_lock = threading.Lock()
+
+
+def get_progress_feed() -> ProgressFeed:
+    """Process-wide progress feed."""
+    global _feed
+    with _feed_lock:
+        if _feed is None:
+            _feed = ProgressFeed()
+        return _feed
+
+
+def read_progress_file(path: Path) -> List[Dict[str, Any]]:
+    """Events of one feed file."""
+    events = []
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A line being written right now
+                continue
+    return events
+
+
+def read_progress(path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Every event still on disk, oldest first (rotated files included)."""
+    path = Path(path or settings.progress_dir / PROGRESS_FEED)
+    events = []
+    for file in list(reversed(rotated_paths(path))) + [path]:
+        if file.exists():
+            events.extend(read_progress_file(file))
+    return events
+
+
+def follow_progress(path: Optional[Path] = None, poll_interval: float = 0.5,
+                    from_start: bool = True) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Follow the feed like `tail -F`, across rotations.
+
+    Yields events as they are written, and None after each poll that found
+    nothing new, so a subscriber can refresh its display or stop.
+
+    Args:
+        path: Feed file (default: the settings' feed)
+        poll_interval: Seconds to wait at the end of the file
+        from_start: Start with the events already on disk
+    """
+    path = Path(path or settings.progress_dir / PROGRESS_FEED)
+    if from_start:
+        # Rotated files are complete; the current one is read through the handle below
+        for file in reversed(rotated_paths(path)):
+            if file.exists():
+                yield from read_progress_file(file)
+    handle = None
+    inode = None
+    partial = ""
+
+    while True:
+        if handle is None and path.exists():
+            handle = open(path, 'r')
+            inode = os.fstat(handle.fileno()).st_ino
+            if not from_start:
+                handle.seek(0, os.SEEK_END)
+            from_start = True  # a file created or rotated in later is read from its start
+
+        chunk = handle.read() if handle is not None else ""
+        if chunk:
+            partial += chunk
+            *lines, partial = partial.split("\n")
+            for line in lines:
+                if line:
+                    yield json.loads(line)
+            continue
+
+        # Rotated: the rest of the old file is read above, continue with the new one
+        if handle is not None and (not path.exists() or os.stat(path).st_ino != inode):
+            handle.close()
+            handle = None
+            partial = ""
+            continue
+
+        yield None
+        time.sleep(poll_interval)
+
+
+class ProgressState:
+    """
+    Latest state of the most recent run, folded from feed events.
+
+    Attributes:
+        run: The run's "run_start" event, updated with its "run_end"
+        stages: Latest snapshot of each stage, with its "status"
+        tokens: LLM tokens used in the run
+        errors: Errors counted in the run
+        last_event: Timestamp of the latest event
+    """
+
+    def __init__(self):
+        self._reset()
+        self.last_event: Optional[str] = None
+
+    def _reset(self) -> None:
+        self.run: Dict[str, Any] = {}
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.tokens = 0
+        self.errors = 0
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "ProgressState":
+        """State of the feed's latest run."""
+        state = cls()
+        for event in read_progress(path):
+            state.apply(event)
+        return state
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """Fold one event into the state."""
+        kind = event.get("event")
+        self.last_event = event.get("timestamp")
+        if kind == "run_start":
+            self._reset()
+            self.run = {**event, "status": "running"}
+        elif kind == "run_end":
+            self.run.update({key: value for key, value in event.items() if key not in ("event", "timestamp")})
+            self.run["ended_at"] = event.get("timestamp")
+            self.tokens = event.get("tokens", self.tokens)
+            self.errors = event.get("errors", self.errors)
+        elif kind == "stage_start":
+            self.stages[event["stage"]] = {
+                "stage": event["stage"],
+                "status": "running",
+                "done": 0,
+                "failed": 0,
+                "total": event.get("total"),
+                "groups": {
+                    group: {"done": 0, "failed": 0, "total": total}
+                    for group, total in (event.get("groups") or {}).items()
+                }
+            }
+        elif kind in ("progress", "stage_end"):
+            stage = self.stages.setdefault(event["stage"], {"stage": event["stage"]})
+            stage.update({key: value for key, value in event.items()
+                          if key not in ("event", "timestamp", "run_id", "pid")})
+            stage["status"] = event.get("status", "completed") if kind == "stage_end" else "running"
+            self.tokens = max(self.tokens, event.get("run_tokens", 0))
+            self.errors = max(self.errors, event.get("run_errors", 0))
+        elif kind == "error":
+            self.errors = max(self.errors, event.get("errors", 0))
+
+    @property
+    def running(self) -> bool:
+        """Whether the run has not ended and its process is alive."""
+        if self.run.get("status") != "running":
+            return False
+        try:
+            os.kill(self.run["pid"], 0)
+            return True
+        except (OSError, KeyError):
+            return False
+
+
+def _bar(done: int, total: Optional[int], width: int = 20) -> str:
+    if not total:
+        return "░" * width
+    filled = min(int(width * done / total), width)
+    return "█" * filled + "░" * (width - filled)
+
+
+def _eta(seconds: Optional[float]) -> str:
+    return str(timedelta(seconds=int(seconds))) if seconds is not None else "-"
+
+
+def progress_table(state: ProgressState) -> Table:
+    """Stages of a run (and their groups) with counts, throughput and ETA."""
+    status = state.run.get("status", "no run")
+    if status == "running" and not state.running:
+        status = "stopped"
+    table = Table(
+        title=f"{state.run.get('name', 'pipeline')} ({status})",
+        caption=(
+            f"Run {state.run.get('run_id') or '-'} | started {state.run.get('timestamp', '-')} | "
+            f"tokens {state.tokens:,} | errors {state.errors} | last event {state.last_event or '-'}"
+        )
+    )
+    table.add_column("Stage", style="cyan")
+    table.add_column("Progress")
+    table.add_column("Done", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Items/s", justify="right")
+    table.add_column("Tokens/s", justify="right")
+    table.add_column("ETA", justify="right")
+    table.add_column("Status")
+
+    for stage in state.stages.values():
+        done, total = stage.get("done", 0), stage.get("total")
+        percent = f" {done / total * 100:5.1f}%" if total else ""
+        table.add_row(
+            stage["stage"],
+            _bar(done, total) + percent,
+            f"{done:,}/{total:,}" if total is not None else f"{done:,}",
+            str(stage.get("failed", 0)),
+            f"{stage.get('items_per_second', 0):.2f}",
+            f"{stage.get('tokens_per_second', 0):.0f}",
+            _eta(stage.get("eta_seconds")) if stage.get("status") == "running" else "-",
+            stage.get("status", "")
+        )
+        for group, counts in stage.get("groups", {}).items():
+            table.add_row(
+                f"  {group}",
+                _bar(counts["done"], counts["total"]),
+                f"{counts['done']:,}/{counts['total']:,}",
+                str(counts["failed"]),
+                "", "", "",
+                "done" if counts["total"] and counts["done"] >= counts["total"] else ""
+            )
+    return table
@@ -0,0 +1,120 @@
+"""Counter and histogram roll-ups for high-frequency audit operations."""
+
+import hashlib
+import math
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from ..config import settings
+
+
+AUDIT_LEVELS = ("full", "rollup", "off")
+
+# Fields whose values are counted per value in a roll-up; other text fields
+# (cache keys, file paths, timestamps) are summarized by the key digest only
+GROUP_FIELDS = ("question_id", "model", "provider", "deployment", "sentiment", "urgency")
+
+
+def operation_level(operation: str) -> str:
+    """
+    Audit level of an operation.
+
+    With AUDIT_LEVEL=verbose every operation is logged in full; otherwise the
+    per-operation table in `settings.audit_operation_levels` applies and
+    unlisted operations are logged in full.
+    """
+    if settings.audit_level == "verbose":
+        return "full"
+    level = settings.audit_operation_levels.get(operation, "full")
+    return level if level in AUDIT_LEVELS else "full"
+
+
+def _bucket(value: float) -> str:
+    """Power-of-two histogram bucket label (upper bound) of a value."""
+    if value <= 0:
+        return "<=0"
+    return f"<={2 ** math.ceil(math.log2(value)):g}"
+
+
+class MetricSummary:
+    """Count, sum, min, max and power-of-two histogram of a numeric field."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.histogram: Counter = Counter()
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.histogram[_bucket(value)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+            "histogram": dict(self.histogram)
+        }
+
+
+class OperationRollup:
+    """
+    Summary of one operation's entries over a time window.
+
+    Keeps the entry count, first and last timestamp, counts per value of the
+    grouping fields, a histogram per numeric field (nested dictionaries such
+    as tokens_used are flattened to tokens_used.total_tokens etc.) and a
+    running digest of cache keys, so the individual entries can be matched
+    against cache files without being logged one by one.
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.count = 0
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+        self.groups: Dict[str, Counter] = {}
+        self.metrics: Dict[str, MetricSummary] = {}
+        self._keys = hashlib.sha256()
+
+    def add(self, timestamp: str, data: Dict[str, Any]) -> None:
+        self.count += 1
+        self.first_timestamp = self.first_timestamp or timestamp
+        self.last_timestamp = timestamp
+
+        cache_key = data.get("cache_key")
+        if cache_key:
+            self._keys.update(str(cache_key).encode())
+
+        for field in GROUP_FIELDS:
+            if data.get(field) is not None:
+                self.groups.setdefault(field, Counter())[str(data[field])] += 1
+
+        self._add_metrics("", data)
+
+    def _add_metrics(self, prefix: str, data: Dict[str, Any]) -> None:
+        for name, value in data.items():
+            if isinstance(value, bool):
+                continue
+            if isinstance(value, (int, float)):
+                self.metrics.setdefault(prefix + name, MetricSummary()).add(float(value))
+            elif isinstance(value, dict):
+                self._add_metrics(f"{prefix}{name}.", value)
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "rolled_up_operation": self.operation,
+            "count": self.count,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "counts_by": {field: dict(counts) for field, counts in self.groups.items()},
+            "metrics": {name: summary.to_dict() for name, summary in self.metrics.items()},
+            "cache_keys_digest": self._keys.hexdigest()[:16]
+        }
@@ -0,0 +1,233 @@
+"""Buffered background writer for audit logs."""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, IO, List, Optional, Tuple
+
+from ..config import settings
+
+
+DURABILITY_POLICIES = ("entry", "interval", "session")
+
+
+class AuditSink:
+    """
+    Appends audit lines to .jsonl files from a background thread.
+
+    Callers only enqueue an encoded line; the writer thread drains the queue
+    in batches, keeps one open handle per file and writes each batch with a
+    single call. Durability follows `settings.audit_durability`:
+
+    - "entry": every line is written and fsynced before `write` returns
+    - "interval": lines are written in batches and fsynced every
+      `settings.audit_flush_interval` seconds
+    - "session": lines are written in batches and fsynced when a session is
+      closed, on `flush(sync=True)` and at interpreter exit
+
+    If the writer thread fails (e.g. the disk is full), the error is kept in
+    `error`, and lines are then written synchronously by the caller, so
+    the next failure is raised to the caller rather than lost.
+
+    One sink serves all AuditLogger instances in a process; use `get_sink()`.
+    """
+
+    def __init__(self, durability: Optional[str] = None, flush_interval: Optional[float] = None,
+                 batch_size: Optional[int] = None):
+        self.durability = durability or settings.audit_durability
+        if self.durability not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"Unknown audit durability '{self.durability}', expected one of {DURABILITY_POLICIES}"
+            )
+        self.flush_interval = flush_interval if flush_interval is not None else settings.audit_flush_interval
+        self.batch_size = batch_size or settings.audit_batch_size
+
+        self._queue: "queue.Queue[Tuple[Optional[Path], object]]" = queue.Queue()
+        self._handles: Dict[Path, IO[str]] = {}
+        self._unsynced: set = set()
+        self._lock = threading.Lock()
+        # Guards the hand-off to the writer thread against it failing meanwhile
+        self._state_lock = threading.Lock()
+        self._closed = False
+        self.error: Optional[BaseException] = None
+        # Items the writer thread has taken off the queue and not yet handled
+        self._batch_items: List[Tuple[Optional[Path], object]] = []
+        self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._thread.start()
+
+    def write(self, path: Path, line: str) -> None:
+        """Append one line (without newline) to a file."""
+        if self.durability != "entry":
+            with self._state_lock:
+                if self._writer_running():
+                    self._queue.put((path, line))
+                    return
+
+        # Entry durability, after shutdown (e.g. logging from other atexit
+        # hooks) or after the writer thread failed: write directly
+        with self._lock:
+            self._write_batch({path: [line]}, sync=True)
+
+    def flush(self, path: Optional[Path] = None, sync: bool = False) -> None:
+        """
+        Block until every line enqueued so far has been written.
+
+        Args:
+            path: Only needed for readers of one file; all files are flushed
+            sync: Also fsync the written files
+        """
+        with self._state_lock:
+            running = self._writer_running()
+            if running:
+                done = threading.Event()
+                self._queue.put((None, (done, sync)))
+        if running:
+            done.wait()
+        elif sync and not self._closed:
+            with self._lock:
+                self._sync()
+
+    def close(self) -> None:
+        """Write and fsync everything, then stop the writer thread."""
+        if self._closed:
+            return
+        self.flush(sync=True)
+        self._closed = True
+        self._queue.put((None, None))
+        self._thread.join(timeout=5)
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+    def _writer_running(self) -> bool:
+        return not self._closed and self.error is None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        try:
+            self._process_queue()
+        except Exception as e:
+            self._fail(e)
+
+    def _fail(self, error: Exception) -> None:
+        """Stop taking lines and write what is still queued synchronously."""
+        with self._state_lock:
+            # From here on write() and flush() do not enqueue
+            self.error = error
+        # Lines of the failed batch are lost with it; release its waiting flush() calls
+        for path, payload in self._batch_items:
+            if path is None and payload is not None:
+                payload[0].set()
+        while True:
+            try:
+                path, payload = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if path is None:
+                if payload is not None:
+                    payload[0].set()  # Release a waiting flush()
+                continue
+            try:
+                with self._lock:
+                    self._write_batch({path: [payload]}, sync=False)
+            except OSError:
+                pass  # Same failure; callers see it on their next write
+
+    def _process_queue(self) -> None:
+        last_sync = time.monotonic()
+
+        while True:
+            timeout = self.flush_interval if self.durability == "interval" else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                if self._unsynced:
+                    with self._lock:
+                        self._sync()
+                    last_sync = time.monotonic()
+                continue
+
+            # Drain whatever else is already queued into the same batch
+            items = [item]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._batch_items = items
+
+            batch: Dict[Path, List[str]] = {}
+            stop = False
+            for path, payload in items:
+                if path is not None:
+                    batch.setdefault(path, []).append(payload)
+                    continue
+
+                # Control message: write what came before it, then act on it
+                with self._lock:
+                    self._write_batch(batch, sync=False)
+                batch = {}
+                if payload is None:
+                    stop = True
+                    continue
+                done, sync = payload
+                if sync:
+                    with self._lock:
+                        self._sync()
+                    last_sync = time.monotonic()
+                done.set()
+
+            with self._lock:
+                self._write_batch(batch, sync=False)
+                if (self.durability == "interval"
+                        and time.monotonic() - last_sync >= self.flush_interval):
+                    self._sync()
+                    last_sync = time.monotonic()
+            self._batch_items = []
+
+            if stop:
+                return
+
+    def _write_batch(self, batch: Dict[Path, List[str]], sync: bool) -> None:
+        """Write lines grouped by file (caller holds the lock)."""
+        for path, lines in batch.items():
+            if not lines:
+                continue
+            handle = self._handles.get(path)
+            if handle is None:
+                path.parent.mkdir(exist_ok=True, parents=True)
+                handle = open(path, 'a')
+                self._handles[path] = handle
+            handle.write('\n'.join(lines) + '\n')
+            handle.flush()
+            self._unsynced.add(path)
+        if sync:
+            self._sync()
+
+    def _sync(self) -> None:
+        """fsync files written since the last sync (caller holds the lock)."""
+        for path in self._unsynced:
+            handle = self._handles.get(path)
+            if handle is not None:
+                os.fsync(handle.fileno())
+        self._unsynced.clear()
+
+
+_sink: Optional[AuditSink] = None
+_sink_pid: Optional[int] = None
+_sink_lock = threading.Lock()
+
+
+def get_sink() -> AuditSink:
+    """Process-wide audit sink, started on first use and flushed at exit."""
+    global _sink, _sink_pid
+    with _sink_lock:
+        # A forked worker inherits the sink object but not its thread
+        if _sink is None or _sink_pid != os.getpid():
+            _sink = AuditSink()
+            _sink_pid = os.getpid()
+            atexit.register(_sink.close)
+        return _sink
@@ -9,6 +9,12 @@ from .charts import (
     ConfidenceIntervalChart
 )
 from .deep_analysis_charts import DeepAnalysisVisualizer
+from .microsite import MicrositeExporter
+from .bundles import DataBundleWriter
+from .cache import RenderCache, load_manifest, resolve_chart
+from .export import ImageExporter, ImageRequest
+from .plotly_html import write_dashboard, write_plotly_html
+from .render import RenderFarm, RenderJob, RenderResult
 
 __all__ = [
     'VisualizationGenerator',
@@ -17,5 +23,17 @@ __all__ = [
     'ProgramAnalysisChart',
     'GeographicChart',
     'ConfidenceIntervalChart',
-    'DeepAnalysisVisualizer'
+    'DeepAnalysisVisualizer',
+    'MicrositeExporter',
+    'DataBundleWriter',
+    'RenderCache',
+    'load_manifest',
+    'resolve_chart',
+    'ImageExporter',
+    'ImageRequest',
+    'write_dashboard',
+    'write_plotly_html',
+    'RenderFarm',
+    'RenderJob',
+    'RenderResult'
 ]
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""Content-hashed, precompressed data shards for the microsite."""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from rich.console import Console
+
+from ..validation.audit import AuditLogger
+
+console = Console()
+
+# File name of the bundle manifest; the only file in a bundle without a hash
+BUNDLE_MANIFEST = "manifest.json"
+
+
+def _brotli():
+    """The brotli module if installed; brotli copies are skipped otherwise."""
+    try:
+        import brotli
+        return brotli
+    except ImportError:
+        return None
+
+
+class DataBundleWriter:
+    """
+    Writes microsite data as shards the site fetches per view.
+
+    Every shard (e.g. "summary", "themes", "programs/<program>") is written
+    as minified JSON named by its content hash, `themes.<hash>.json`, with a
+    gzip copy (`.json.gz`) and, if brotli is installed, a brotli copy
+    (`.json.br`) for servers that serve precompressed files. A hashed file
+    never changes, so browsers and CDNs can cache it indefinitely, and an
+    unchanged shard keeps its name across runs.
+
+    `manifest.json` maps each shard to its files and sizes; it is written
+    after the shards, so it never lists a missing file. A page loads the
+    manifest and then only the shards it shows. Files no longer listed are
+    removed.
+    """
+
+    def __init__(self, output_dir: Path, audit_logger: Optional[AuditLogger] = None):
+        self.output_dir = Path(output_dir)
+        self.audit_logger = audit_logger or AuditLogger()
+
+    def write(self, shards: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write a bundle.
+
+        Args:
+            shards: Document of each shard, keyed by shard name; names may
+                contain "/" to group shards in subdirectories
+
+        Returns:
+            The manifest
+        """
+        brotli = _brotli()
+        # Encoding -> (file suffix, compressor); mtime=0 keeps gzip output
+        # identical for identical content
+        encoders = {"gzip": (".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))}
+        if brotli is not None:
+            encoders["br"] = (".br", lambda data: brotli.compress(data, quality=11))
+
+        entries = {}
+        keep = {BUNDLE_MANIFEST}
+        written = 0
+        total_bytes = compressed_bytes = 0
+
+        for name, document in shards.items():
+            payload = json.dumps(document, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+            digest = hashlib.sha256(payload).hexdigest()[:12]
+            file_name = f"{name}.{digest}.json"
+
+            variants = {"identity": (file_name, None)}
+            for encoding, (suffix, compress) in encoders.items():
+                variants[encoding] = (file_name + suffix, compress)
+
+            files = {}
+            for encoding, (variant_name, compress) in variants.items():
+                path = self.output_dir / variant_name
+                if not path.exists():
+                    self._atomic_write(path, compress(payload) if compress else payload)
+                    written += 1
+                files[encoding] = {"file": variant_name, "bytes": path.stat().st_size}
+                keep.add(variant_name)
+
+            entries[name] = {"hash": digest, **files.pop("identity"), "encodings": files}
+            total_bytes += entries[name]["bytes"]
+            compressed_bytes += files["gzip"]["bytes"]
+
+        manifest = {
+            "generatedAt": datetime.now().isoformat(),
+            "encodings": ["gzip"] + (["br"] if brotli is not None else []),
+            "shards": entries
+        }
+        self._atomic_write(
+            self.output_dir / BUNDLE_MANIFEST,
+            json.dumps(manifest, indent=2).encode()
+        )
+
+        removed = 0
+        for path in self.output_dir.rglob("*"):
+            if path.is_file() and path.relative_to(self.output_dir).as_posix() not in keep:
+                path.unlink()
+                removed += 1
+
+        self.audit_logger.log_operation(
+            operation="microsite_bundle",
+            output_dir=str(self.output_dir),
+            shards=len(entries),
+            files_written=written,
+            files_removed=removed,
+            bytes=total_bytes,
+            gzip_bytes=compressed_bytes,
+            brotli=brotli is not None
+        )
+        console.print(
+            f"[dim]Microsite bundle: {len(entries)} shards, {total_bytes / 1024:.1f} KB "
+            f"({compressed_bytes / 1024:.1f} KB gzipped), {written} files written ({self.output_dir})[/dim]"
+        )
+        return manifest
+
+    @staticmethod
+    def _atomic_write(path: Path, payload: bytes) -> None:
+        path.parent.mkdir(exist_ok=True, parents=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
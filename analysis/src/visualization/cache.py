@@ -0,0 +1,188 @@
+"""Content-addressed cache of rendered charts and per-directory chart manifests."""
+
+import hashlib
+import importlib.util
+import json
+import os
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+from ..config import settings
+from .export import link_or_copy
+
+if TYPE_CHECKING:
+    from .render import RenderJob, RenderResult
+
+# Bump to invalidate every cached chart, e.g. after a change in how outputs are written
+RENDERER_VERSION = "1"
+
+# Libraries whose upgrade can change how a chart looks
+_RENDERING_PACKAGES = ("matplotlib", "seaborn", "plotly", "wordcloud", "kaleido")
+
+# File name of the chart manifest written next to rendered charts
+CHART_MANIFEST = "charts_manifest.json"
+
+_module_versions: Dict[str, str] = {}
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(exist_ok=True, parents=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def renderer_version(renderer: str) -> str:
+    """
+    Version of a renderer: a hash of its module's source, the rendering
+    libraries' versions and `RENDERER_VERSION`.
+
+    Any edit to the module holding the chart code therefore invalidates its
+    cached charts, without importing the module in this process.
+    """
+    module_name = renderer.partition(":")[0]
+    if module_name not in _module_versions:
+        digest = hashlib.sha256(RENDERER_VERSION.encode())
+        spec = importlib.util.find_spec(module_name)
+        if spec is not None and spec.origin and os.path.exists(spec.origin):
+            digest.update(Path(spec.origin).read_bytes())
+        for package in _RENDERING_PACKAGES:
+            try:
+                digest.update(f"{package}={metadata.version(package)}".encode())
+            except metadata.PackageNotFoundError:
+                pass
+        _module_versions[module_name] = digest.hexdigest()[:16]
+    return _module_versions[module_name]
+
+
+def cache_key(job: "RenderJob") -> Tuple[str, Dict[str, Any]]:
+    """
+    Cache key of a job and the parts it is made of.
+
+    Returns:
+        (key, {"chart_type", "data_hash", "style_hash", "renderer_version", "formats",
+        and "plotly_html_mode" for HTML outputs})
+    """
+    parts = {
+        "chart_type": job.renderer,
+        "data_hash": job.data_hash(),
+        "style_hash": job.style_hash(),
+        "renderer_version": renderer_version(job.renderer),
+        "formats": sorted({Path(path).suffix for path in job.outputs})
+    }
+    if ".html" in parts["formats"]:
+        # Pages embed or reference plotly.js depending on the mode
+        parts["plotly_html_mode"] = settings.plotly_html_mode
+    key = hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+    return key, parts
+
+
+class RenderCache:
+    """
+    Rendered charts stored by cache key.
+
+    Layout under `root` (default: data/results/render_cache):
+
+    - `objects/<ab>/<key>/chart<suffix>`: one artifact per output format
+    - `objects/<ab>/<key>/entry.json`: the key's parts; written last, so an
+      entry without it is incomplete and ignored
+
+    Artifacts are hardlinks of the rendered files where possible, so the
+    cache costs little space, and a hit links them back into place.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.results_dir / "render_cache")
+        self.objects_dir = self.root / "objects"
+
+    def entry_dir(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / key
+
+    def restore(self, job: "RenderJob", key: str) -> bool:
+        """
+        Link a cached chart to the job's outputs.
+
+        Returns:
+            Whether the chart was cached
+        """
+        entry_dir = self.entry_dir(key)
+        if not (entry_dir / "entry.json").exists():
+            return False
+        artifacts = {Path(path).suffix: entry_dir / f"chart{Path(path).suffix}" for path in job.outputs}
+        if not all(artifact.exists() for artifact in artifacts.values()):
+            return False
+        for path in job.outputs:
+            link_or_copy(artifacts[Path(path).suffix], Path(path))
+        return True
+
+    def store(self, key: str, parts: Dict[str, Any], result: "RenderResult") -> None:
+        """Add a successfully rendered chart's files."""
+        entry_dir = self.entry_dir(key)
+        stored = set()
+        for path in result.outputs:
+            path = Path(path)
+            if path.suffix not in stored:
+                link_or_copy(path, entry_dir / f"chart{path.suffix}")
+                stored.add(path.suffix)
+        entry = {**parts, "chart_id": result.chart_id, "created_at": datetime.now().isoformat()}
+        _atomic_write(entry_dir / "entry.json", json.dumps(entry, indent=2).encode())
+
+
+def update_manifest(manifest_path: Path, entries: Iterable[Tuple[str, str, Dict[str, Any], "RenderResult"]]) -> None:
+    """
+    Record rendered charts in a directory's chart manifest.
+
+    The manifest maps chart ids to their files (relative to the manifest)
+    and cache key, so reports and the microsite can find a chart by id
+    instead of by file name. Entries of charts not in `entries` are kept,
+    so several scripts can render into one directory.
+
+    Args:
+        manifest_path: Manifest file, usually `<output dir>/charts_manifest.json`
+        entries: (chart id, cache key, key parts, result) of each job
+    """
+    manifest_path = Path(manifest_path)
+    manifest = load_manifest(manifest_path)
+    now = datetime.now().isoformat()
+    for chart_id, key, parts, result in entries:
+        if result.error:
+            continue
+        manifest["charts"][chart_id] = {
+            "files": [os.path.relpath(path, manifest_path.parent) for path in result.outputs],
+            "key": key,
+            **parts,
+            "cached": result.cached,
+            "updated_at": now
+        }
+    manifest["updated_at"] = now
+    _atomic_write(manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode())
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """A chart manifest, or an empty one."""
+    manifest_path = Path(manifest_path)
+    if not manifest_path.exists():
+        return {"charts": {}}
+    with open(manifest_path, 'r') as f:
+        return json.load(f)
+
+
+def resolve_chart(manifest_path: Path, chart_id: str, suffix: str) -> Optional[str]:
+    """
+    File of a chart in one format, relative to the manifest's directory.
+
+    Returns:
+        The first existing file of the chart with `suffix`, or None
+    """
+    manifest_path = Path(manifest_path)
+    entry = load_manifest(manifest_path)["charts"].get(chart_id)
+    if entry is None:
+        return None
+    for relative_path in entry["files"]:
+        if relative_path.endswith(suffix) and (manifest_path.parent / relative_path).exists():
+            return relative_path
+    return None
+
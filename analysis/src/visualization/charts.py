@@ -11,6 +11,8 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 import pandas as pd
 
+from .plotly_html import write_plotly_html
+
 
 class BaseChart:
     """Base class for all chart generators."""
@@ -20,9 +22,8 @@ class BaseChart:
         self.font_family = "Arial"
         
     def save_plotly_figure(self, fig: go.Figure, output_path: Path) -> Path:
-        """Save plotly figure as HTML."""
-        fig.write_html(str(output_path))
-        return output_path
+        """Save plotly figure as HTML (see `settings.plotly_html_mode`)."""
+        return write_plotly_html(fig, output_path)
     
     def save_matplotlib_figure(self, fig: plt.Figure, output_path: Path, dpi: int = 300) -> Path:
         """Save matplotlib figure as PNG."""
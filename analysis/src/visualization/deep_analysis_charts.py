@@ -15,6 +15,8 @@ from plotly.subplots import make_subplots
 from wordcloud import WordCloud
 from rich.console import Console
 
+from .plotly_html import write_plotly_html
+
 console = Console()
 
 
@@ -148,7 +150,7 @@ class DeepAnalysisVisualizer:
         fig.update_yaxes(showticklabels=False, row=1, col=1)
         
         # Save
-        fig.write_html(str(output_path))
+        write_plotly_html(fig, output_path)
         console.print(f"[green]✓[/green] Created question dashboard: {output_path.name}")
         
         return output_path
@@ -200,7 +202,7 @@ class DeepAnalysisVisualizer:
             template='plotly_white'
         )
         
-        fig.write_html(str(output_path))
+        write_plotly_html(fig, output_path)
         console.print(f"[green]✓[/green] Created theme evolution chart: {output_path.name}")
         
         return output_path
@@ -249,7 +251,7 @@ class DeepAnalysisVisualizer:
             xaxis={'tickangle': -45}
         )
         
-        fig.write_html(str(output_path))
+        write_plotly_html(fig, output_path)
         console.print(f"[green]✓[/green] Created stakeholder comparison matrix: {output_path.name}")
         
         return output_path
@@ -333,7 +335,7 @@ class DeepAnalysisVisualizer:
             yaxis=dict(range=[-0.1, 1.1])
         )
         
-        fig.write_html(str(output_path))
+        write_plotly_html(fig, output_path)
         console.print(f"[green]✓[/green] Created sentiment-urgency scatter: {output_path.name}")
         
         return output_path
@@ -384,7 +386,7 @@ class DeepAnalysisVisualizer:
             template='plotly_white'
         )
         
-        fig.write_html(str(output_path))
+        write_plotly_html(fig, output_path)
         console.print(f"[green]✓[/green] Created program feedback sunburst: {output_path.name}")
         
         return output_path
@@ -469,7 +471,7 @@ class DeepAnalysisVisualizer:
             yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
         )
         
-        fig.write_html(str(output_path))
+        write_plotly_html(fig, output_path)
         console.print(f"[green]✓[/green] Created insight network graph: {output_path.name}")
         
         return output_path
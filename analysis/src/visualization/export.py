@@ -0,0 +1,187 @@
+"""Batch static image export of plotly figures through one kaleido session."""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from plotly.utils import PlotlyJSONEncoder
+from rich.console import Console
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+
+console = Console()
+
+
+@dataclass
+class ImageRequest:
+    """
+    Static images of one figure.
+
+    Every path gets the figure in the format given by its suffix (".png",
+    ".svg", ".pdf", ...); paths with the same format, such as a timestamped
+    file and its _LATEST alias, share one exported image.
+    """
+    chart_id: str
+    fig: Dict[str, Any]
+    paths: List[Path] = field(default_factory=list)
+    width: Optional[int] = None
+    height: Optional[int] = None
+    scale: Optional[float] = None
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """
+    Make `target` a hardlink of `source`, falling back to a symlink and
+    then a copy (e.g. across file systems).
+
+    An existing `target` is replaced rather than written through, so files
+    linked to it are not modified.
+    """
+    target.parent.mkdir(exist_ok=True, parents=True)
+    if target.exists() or target.is_symlink():
+        if target.exists() and os.path.samefile(source, target):
+            return
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        try:
+            os.symlink(source.resolve(), target)
+        except OSError:
+            shutil.copyfile(source, target)
+
+
+class ImageExporter:
+    """
+    Exports plotly figures to static images with one warm kaleido session.
+
+    `fig.write_image` starts a headless browser for each call, which costs
+    more than rendering a chart. The exporter starts kaleido's sync server
+    once (with `settings.image_export_workers` tabs rendering in parallel)
+    and sends every figure of a batch in a single request.
+
+    Images are stored once per content hash (figure, format, size and
+    scale) under `store_dir`; requested paths are links to the stored
+    files, so an image that did not change since an earlier export is not
+    rendered again and aliases cost no extra space.
+    """
+
+    def __init__(self, store_dir: Optional[Path] = None, workers: Optional[int] = None,
+                 audit_logger: Optional[AuditLogger] = None):
+        """
+        Set up the exporter; kaleido starts with the first export.
+
+        Args:
+            store_dir: Directory of the content-addressed images
+            workers: Number of figures kaleido renders at once
+            audit_logger: Audit logger for export summaries
+        """
+        self.store_dir = Path(store_dir or settings.results_dir / "images")
+        self.workers = workers or settings.image_export_workers
+        self.audit_logger = audit_logger or AuditLogger()
+        self._server_started = False
+
+    @staticmethod
+    def available() -> bool:
+        """Whether kaleido is installed."""
+        try:
+            import kaleido  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def __enter__(self) -> "ImageExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the kaleido session if it is not running."""
+        if self._server_started:
+            return
+        import kaleido
+        # Older kaleido releases start a session per batch instead
+        if hasattr(kaleido, "start_sync_server"):
+            kaleido.start_sync_server(n=self.workers, silence_warnings=True)
+            self._server_started = True
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Stop the kaleido session."""
+        if not self._server_started:
+            return
+        import kaleido
+        kaleido.stop_sync_server(silence_warnings=True)
+        self._server_started = False
+
+    def export(self, requests: List[ImageRequest]) -> List[str]:
+        """
+        Write the images of a batch of figures.
+
+        Args:
+            requests: Figures and the image paths to write
+
+        Returns:
+            Paths written
+        """
+        start = time.perf_counter()
+        self.store_dir.mkdir(exist_ok=True, parents=True)
+
+        pending: Dict[Path, Dict[str, Any]] = {}  # stored image -> kaleido request
+        links = []
+        for request in requests:
+            spec = json.dumps(request.fig, sort_keys=True, cls=PlotlyJSONEncoder)
+            for path in request.paths:
+                path = Path(path)
+                image_format = path.suffix.lstrip(".")
+                opts = {
+                    "format": image_format,
+                    "width": request.width,
+                    "height": request.height,
+                    "scale": request.scale
+                }
+                digest = hashlib.sha256(
+                    (spec + json.dumps(opts, sort_keys=True)).encode()
+                ).hexdigest()[:32]
+                stored = self.store_dir / f"{digest}.{image_format}"
+                if not stored.exists() and stored not in pending:
+                    pending[stored] = {
+                        "fig": request.fig,
+                        "path": self.store_dir / f".{digest}.{os.getpid()}.{image_format}",
+                        "opts": {key: value for key, value in opts.items() if value is not None}
+                    }
+                links.append((stored, path))
+
+        if pending:
+            import kaleido
+            self.start()
+            kaleido.write_fig_from_object_sync(list(pending.values()))
+            for stored, item in pending.items():
+                os.replace(item["path"], stored)
+
+        for stored, path in links:
+            link_or_copy(stored, path)
+
+        duration = time.perf_counter() - start
+        self.audit_logger.log_operation(
+            operation="image_export",
+            figures=len(requests),
+            images=len(links),
+            rendered=len(pending),
+            reused=len(links) - len(pending),
+            workers=self.workers,
+            duration_seconds=round(duration, 3)
+        )
+        console.print(
+            f"[dim]Exported {len(links)} images of {len(requests)} figures "
+            f"({len(pending)} rendered, {len(links) - len(pending)} reused) in {duration:.1f}s[/dim]"
+        )
+        return [str(path) for _, path in links]
@@ -5,22 +5,19 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 from rich.console import Console
 
 from ..config import settings
+from ..storage import ResultStore
 from ..validation.audit import AuditLogger
-from .charts import (
-    ShareOfVoiceChart,
-    ThemeChart,
-    ProgramAnalysisChart,
-    GeographicChart,
-    ConfidenceIntervalChart
-)
+from . import charts
+from .bundles import BUNDLE_MANIFEST, DataBundleWriter
+from .cache import CHART_MANIFEST
+from .microsite import MicrositeExporter, _slug
+from .render import RenderFarm, RenderJob, render_outputs
 
 console = Console()
 
@@ -33,16 +30,11 @@ class VisualizationGenerator:
         self.output_dir = settings.results_dir / "visualizations"
         self.output_dir.mkdir(exist_ok=True, parents=True)
         
-        # Set style
-        plt.style.use('seaborn-v0_8-darkgrid')
-        sns.set_palette("husl")
+        # Matplotlib style of the static charts
+        self.style = 'seaborn-v0_8-darkgrid'
         
-        # Chart generators
-        self.share_of_voice_chart = ShareOfVoiceChart()
-        self.theme_chart = ThemeChart()
-        self.program_chart = ProgramAnalysisChart()
-        self.geographic_chart = GeographicChart()
-        self.confidence_chart = ConfidenceIntervalChart()
+        # Charts are rendered in worker processes
+        self.render_farm = RenderFarm(audit_logger=self.audit_logger)
     
     def generate_all_visualizations(
         self,
@@ -59,43 +51,23 @@ class VisualizationGenerator:
         }
         
         try:
-            # 1. Share of Voice visualizations
-            console.print("[dim]Creating share of voice charts...[/dim]")
-            sov_files = self._generate_share_of_voice_charts(
-                quantitative_results.get("share_of_voice", {}),
-                qualitative_results.get("share_of_voice_refined", {})
-            )
-            generated_files["static"].extend(sov_files.get("static", []))
-            generated_files["interactive"].extend(sov_files.get("interactive", []))
-            
-            # 2. Theme visualizations
-            console.print("[dim]Creating theme analysis charts...[/dim]")
-            theme_files = self._generate_theme_charts(
-                qualitative_results.get("major_themes", [])
-            )
-            generated_files["static"].extend(theme_files.get("static", []))
-            generated_files["interactive"].extend(theme_files.get("interactive", []))
-            
-            # 3. Program analysis visualizations
-            console.print("[dim]Creating program analysis charts...[/dim]")
-            program_files = self._generate_program_charts(
-                qualitative_results.get("program_analysis", {})
-            )
-            generated_files["static"].extend(program_files.get("static", []))
-            generated_files["interactive"].extend(program_files.get("interactive", []))
-            
-            # 4. Geographic visualizations
-            console.print("[dim]Creating geographic distribution charts...[/dim]")
-            geo_files = self._generate_geographic_charts(
-                quantitative_results.get("geographic_distribution", {})
+            # 1-5. Describe every chart, then render them in parallel
+            console.print("[dim]Planning share of voice, theme, program, geographic and confidence charts...[/dim]")
+            jobs = (
+                self._share_of_voice_jobs(
+                    quantitative_results.get("share_of_voice", {}),
+                    qualitative_results.get("share_of_voice_refined", {})
+                )
+                + self._theme_jobs(qualitative_results.get("major_themes", []))
+                + self._program_jobs(qualitative_results.get("program_analysis", {}))
+                + self._geographic_jobs(quantitative_results.get("geographic_distribution", {}))
+                + self._confidence_jobs(quantitative_results)
             )
-            generated_files["static"].extend(geo_files.get("static", []))
-            generated_files["interactive"].extend(geo_files.get("interactive", []))
             
-            # 5. Statistical confidence visualizations
-            console.print("[dim]Creating statistical confidence charts...[/dim]")
-            conf_files = self._generate_confidence_charts(quantitative_results)
-            generated_files["static"].extend(conf_files.get("static", []))
+            console.print(f"[dim]Rendering {len(jobs)} charts...[/dim]")
+            for path in render_outputs(self.render_farm.render(jobs, manifest=self.output_dir / CHART_MANIFEST)):
+                kind = "interactive" if path.endswith(".html") else "static"
+                generated_files[kind].append(path)
             
             # 6. Export data for microsite
             console.print("[dim]Exporting data for microsite...[/dim]")
@@ -128,161 +100,153 @@ class VisualizationGenerator:
             
         return generated_files
     
-    def _generate_share_of_voice_charts(
+    def export_microsite_data(
+        self,
+        quantitative_results: Optional[Dict[str, Any]] = None,
+        qualitative_results: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Re-export the microsite data without rendering charts, e.g. after
+        the deep analysis was updated.
+        
+        Args:
+            quantitative_results: WHO results (default: the latest stored)
+            qualitative_results: WHAT results (default: the latest stored)
+        
+        Returns:
+            Exported files
+        """
+        store = ResultStore()
+        if quantitative_results is None:
+            quantitative_results = store.latest("who_analysis") or {}
+        if qualitative_results is None:
+            qualitative_results = store.latest("what_analysis") or {}
+        return self._export_visualization_data(quantitative_results, qualitative_results)
+    
+    def _job(self, chart_id: str, method: str, output_file: str, **data: Any) -> RenderJob:
+        """Job for a chart method that writes its own output file."""
+        return RenderJob(
+            chart_id=chart_id,
+            renderer=f"{charts.__name__}:{method}",
+            kwargs=data,
+            outputs=[self.output_dir / output_file],
+            output_arg="output_path",
+            style=self.style
+        )
+    
+    def _share_of_voice_jobs(
         self,
         basic_sov: Dict[str, Any],
         refined_sov: Dict[str, Any]
-    ) -> Dict[str, List[str]]:
-        """Generate share of voice visualizations."""
-        files = {"static": [], "interactive": []}
+    ) -> List[RenderJob]:
+        """Share of voice visualizations."""
+        jobs = []
         
         # Basic share of voice pie chart
         if basic_sov:
-            static_file = self.share_of_voice_chart.create_pie_chart(
-                basic_sov,
-                self.output_dir / "share_of_voice_basic.png"
-            )
-            files["static"].append(str(static_file))
+            jobs.append(self._job(
+                "share_of_voice_basic", "ShareOfVoiceChart.create_pie_chart",
+                "share_of_voice_basic.png", data=basic_sov
+            ))
         
-        # Refined share of voice with confidence
+        # Refined share of voice with confidence, static and interactive
         if refined_sov.get("refined_categories"):
-            # Static version
-            static_file = self.share_of_voice_chart.create_refined_chart(
-                refined_sov["refined_categories"],
-                self.output_dir / "share_of_voice_refined.png"
-            )
-            files["static"].append(str(static_file))
-            
-            # Interactive version
-            interactive_file = self.share_of_voice_chart.create_interactive_chart(
-                refined_sov["refined_categories"],
-                self.output_dir / "share_of_voice_interactive.html"
-            )
-            files["interactive"].append(str(interactive_file))
+            jobs.append(self._job(
+                "share_of_voice_refined", "ShareOfVoiceChart.create_refined_chart",
+                "share_of_voice_refined.png", data=refined_sov["refined_categories"]
+            ))
+            jobs.append(self._job(
+                "share_of_voice_interactive", "ShareOfVoiceChart.create_interactive_chart",
+                "share_of_voice_interactive.html", data=refined_sov["refined_categories"]
+            ))
         
-        return files
+        return jobs
     
-    def _generate_theme_charts(self, themes: List[Dict[str, Any]]) -> Dict[str, List[str]]:
-        """Generate theme analysis visualizations."""
-        files = {"static": [], "interactive": []}
-        
+    def _theme_jobs(self, themes: List[Dict[str, Any]]) -> List[RenderJob]:
+        """Theme analysis visualizations."""
         if not themes:
-            return files
-        
-        # Top themes bar chart
-        static_file = self.theme_chart.create_theme_bar_chart(
-            themes[:10],
-            self.output_dir / "top_themes.png"
-        )
-        files["static"].append(str(static_file))
-        
-        # Theme sentiment distribution
-        static_file = self.theme_chart.create_sentiment_distribution(
-            themes,
-            self.output_dir / "theme_sentiments.png"
-        )
-        files["static"].append(str(static_file))
+            return []
         
-        # Interactive theme explorer
-        interactive_file = self.theme_chart.create_interactive_theme_explorer(
-            themes,
-            self.output_dir / "theme_explorer.html"
-        )
-        files["interactive"].append(str(interactive_file))
-        
-        # Theme word cloud
-        static_file = self.theme_chart.create_theme_word_cloud(
-            themes,
-            self.output_dir / "theme_wordcloud.png"
-        )
-        files["static"].append(str(static_file))
-        
-        return files
+        return [
+            # Top themes bar chart
+            self._job("top_themes", "ThemeChart.create_theme_bar_chart", "top_themes.png", themes=themes[:10]),
+            # Theme sentiment distribution
+            self._job("theme_sentiments", "ThemeChart.create_sentiment_distribution",
+                      "theme_sentiments.png", themes=themes),
+            # Interactive theme explorer
+            self._job("theme_explorer", "ThemeChart.create_interactive_theme_explorer",
+                      "theme_explorer.html", themes=themes),
+            # Theme word cloud
+            self._job("theme_wordcloud", "ThemeChart.create_theme_word_cloud", "theme_wordcloud.png", themes=themes)
+        ]
     
-    def _generate_program_charts(self, program_data: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Generate program-specific visualizations."""
-        files = {"static": [], "interactive": []}
-        
+    def _program_jobs(self, program_data: Dict[str, Any]) -> List[RenderJob]:
+        """Program-specific visualizations."""
         if not program_data:
-            return files
+            return []
         
-        # Program comparison chart
-        static_file = self.program_chart.create_program_comparison(
-            program_data,
-            self.output_dir / "program_comparison.png"
-        )
-        files["static"].append(str(static_file))
-        
-        # Interactive program dashboard
-        interactive_file = self.program_chart.create_program_dashboard(
-            program_data,
-            self.output_dir / "program_dashboard.html"
-        )
-        files["interactive"].append(str(interactive_file))
+        jobs = [
+            # Program comparison chart
+            self._job("program_comparison", "ProgramAnalysisChart.create_program_comparison",
+                      "program_comparison.png", program_data=program_data),
+            # Interactive program dashboard
+            self._job("program_dashboard", "ProgramAnalysisChart.create_program_dashboard",
+                      "program_dashboard.html", program_data=program_data)
+        ]
         
         # Individual program reports
         for program_name, data in program_data.items():
             if data.get("themes"):
-                static_file = self.program_chart.create_program_detail_chart(
-                    program_name,
-                    data,
-                    self.output_dir / f"program_{program_name.lower().replace(' ', '_')}.png"
-                )
-                files["static"].append(str(static_file))
+                slug = program_name.lower().replace(' ', '_')
+                jobs.append(self._job(
+                    f"program_{slug}", "ProgramAnalysisChart.create_program_detail_chart",
+                    f"program_{slug}.png", program_name=program_name, data=data
+                ))
         
-        return files
+        return jobs
     
-    def _generate_geographic_charts(self, geo_data: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Generate geographic distribution visualizations."""
-        files = {"static": [], "interactive": []}
-        
+    def _geographic_jobs(self, geo_data: Dict[str, Any]) -> List[RenderJob]:
+        """Geographic distribution visualizations."""
         if not geo_data or not geo_data.get("zip_codes"):
-            return files
-        
-        # Static choropleth map
-        static_file = self.geographic_chart.create_zip_code_map(
-            geo_data["zip_codes"],
-            self.output_dir / "geographic_distribution.png"
-        )
-        files["static"].append(str(static_file))
-        
-        # Interactive map
-        interactive_file = self.geographic_chart.create_interactive_map(
-            geo_data["zip_codes"],
-            self.output_dir / "geographic_interactive.html"
-        )
-        files["interactive"].append(str(interactive_file))
+            return []
         
-        return files
+        return [
+            # Static choropleth map
+            self._job("geographic_distribution", "GeographicChart.create_zip_code_map",
+                      "geographic_distribution.png", zip_data=geo_data["zip_codes"]),
+            # Interactive map
+            self._job("geographic_interactive", "GeographicChart.create_interactive_map",
+                      "geographic_interactive.html", zip_data=geo_data["zip_codes"])
+        ]
     
-    def _generate_confidence_charts(self, quant_results: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Generate statistical confidence visualizations."""
-        files = {"static": []}
+    def _confidence_jobs(self, quant_results: Dict[str, Any]) -> List[RenderJob]:
+        """Statistical confidence visualizations."""
+        jobs = []
         
         # Confidence intervals for key metrics
         if quant_results.get("share_of_voice"):
-            static_file = self.confidence_chart.create_confidence_interval_chart(
-                quant_results["share_of_voice"],
-                self.output_dir / "confidence_intervals.png"
-            )
-            files["static"].append(str(static_file))
+            jobs.append(self._job(
+                "confidence_intervals", "ConfidenceIntervalChart.create_confidence_interval_chart",
+                "confidence_intervals.png", sov_data=quant_results["share_of_voice"]
+            ))
         
         # Statistical summary dashboard
-        static_file = self.confidence_chart.create_statistical_summary(
-            quant_results,
-            self.output_dir / "statistical_summary.png"
-        )
-        files["static"].append(str(static_file))
+        jobs.append(self._job(
+            "statistical_summary", "ConfidenceIntervalChart.create_statistical_summary",
+            "statistical_summary.png", quant_results=quant_results
+        ))
         
-        return files
+        return jobs
     
     def _export_visualization_data(
         self,
         quantitative_results: Dict[str, Any],
         qualitative_results: Dict[str, Any]
     ) -> List[str]:
-        """Export processed data for microsite consumption."""
+        """Export processed data (and the latest deep analysis) for microsite consumption."""
         export_files = []
+        deep_results = ResultStore().latest("deep_analysis_results")
+        microsite = MicrositeExporter()
         
         # Combined data export
         combined_data = {
@@ -307,14 +271,84 @@ class VisualizationGenerator:
             quantitative_results,
             qualitative_results
         )
+        if deep_results:
+            microsite_data["deepAnalysis"] = microsite.summary(deep_results)
         
         microsite_file = self.output_dir / "microsite_data.json"
         with open(microsite_file, 'w') as f:
-            json.dump(microsite_data, f, indent=2)
+            json.dump(microsite_data, f, separators=(",", ":"))
         export_files.append(str(microsite_file))
         
+        # Per-view shards the microsite loads on demand
+        bundle_dir = self.output_dir / "bundles"
+        shards = self._microsite_shards(microsite_data, qualitative_results)
+        if deep_results:
+            shards["summary"]["deepAnalysis"] = "deep/summary"
+            shards.update(microsite.shards(deep_results))
+        DataBundleWriter(bundle_dir, self.audit_logger).write(shards)
+        export_files.append(str(bundle_dir / BUNDLE_MANIFEST))
+        
         return export_files
     
+    def _microsite_shards(
+        self,
+        microsite_data: Dict[str, Any],
+        qualitative_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Split microsite data into the shards of a `DataBundleWriter` bundle.
+        
+        The summary shard is all the landing page needs: totals, share of
+        voice and the list of programs. Themes, geography and quotes are
+        one shard each, and every program has its own shard with its full
+        theme analysis. The export time is left to the manifest's
+        `generatedAt`, so shards of unchanged data keep their file names.
+        """
+        program_analysis = qualitative_results.get("program_analysis", {})
+        summary = {key: value for key, value in microsite_data["summary"].items() if key != "lastUpdated"}
+        shards: Dict[str, Any] = {
+            "summary": {
+                **summary,
+                "shareOfVoice": microsite_data["shareOfVoice"],
+                "programs": [
+                    {
+                        "name": program["name"],
+                        "shard": f"programs/{_slug(program['name'])}",
+                        "responseCount": program["responseCount"]
+                    }
+                    for program in microsite_data["programs"]
+                ]
+            },
+            "themes": microsite_data["themes"],
+            "geography": microsite_data["geographic"],
+            "quotes": [
+                {
+                    "themeId": f"theme_{i}",
+                    "theme": theme.get("theme", ""),
+                    "quotes": theme.get("supporting_evidence", [])
+                }
+                for i, theme in enumerate(
+                    qualitative_results.get("major_themes", [])[:10]
+                )
+            ]
+        }
+        for program, data in program_analysis.items():
+            shards[f"programs/{_slug(program)}"] = {
+                "name": program,
+                "responseCount": data.get("response_count", 0),
+                "themes": [
+                    {
+                        "theme": t.get("theme", ""),
+                        "sentiment": t.get("sentiment", "neutral"),
+                        "frequency": t.get("frequency", 0),
+                        "keyPoints": t.get("key_points", []),
+                        "recommendation": t.get("recommendation", "")
+                    }
+                    for t in data.get("themes", [])
+                ]
+            }
+        return shards
+    
     def _prepare_microsite_data(
         self,
         quantitative_results: Dict[str, Any],
@@ -0,0 +1,120 @@
+"""Microsite data of the deep analysis results."""
+
+import re
+from typing import Any, Dict
+
+
+def _slug(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+class MicrositeExporter:
+    """
+    Turns the deep analysis into microsite data.
+
+    The microsite loads `microsite_data.json` and the shards of the data
+    bundle (see `DataBundleWriter`); `VisualizationGenerator` writes both
+    and adds the deep analysis to them:
+
+    - `summary()`: totals, recurring themes and strategic insights, embedded
+      in microsite_data.json
+    - `shards()`: `deep/summary` (the summary plus the shard of every
+      question and program), `deep/questions/<question_id>` and
+      `deep/programs/<program>`
+
+    Shards are named by content hash, so after an update that touched two
+    questions only those shards and the summary get new files.
+    """
+
+    def summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Overview of deep analysis results.
+
+        Args:
+            results: Deep analysis results as stored under "deep_analysis_results"
+        """
+        return self._summary(results)
+
+    def shards(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Bundle shards of deep analysis results.
+
+        Args:
+            results: Deep analysis results as stored under "deep_analysis_results"
+
+        Returns:
+            Document of each shard, keyed by shard name
+        """
+        shards: Dict[str, Any] = {}
+        for analysis in results.get('question_analyses', []):
+            shards[f"deep/questions/{analysis['question_id']}"] = self._question(analysis)
+        for name, feedback in results.get('program_analyses', {}).items():
+            shards[f"deep/programs/{_slug(name)}"] = self._program(feedback)
+        shards["deep/summary"] = {
+            **self._summary(results),
+            "questions": [
+                {"id": analysis['question_id'], "shard": f"deep/questions/{analysis['question_id']}"}
+                for analysis in results.get('question_analyses', [])
+            ],
+            "programs": [
+                {"name": name, "shard": f"deep/programs/{_slug(name)}"}
+                for name in results.get('program_analyses', {})
+            ]
+        }
+        return shards
+
+    @staticmethod
+    def _summary(results: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = results.get('metadata', {})
+        synthesis = results.get('cross_question_synthesis') or {}
+        return {
+            "totalResponses": metadata.get('total_responses', 0),
+            "questionsAnalyzed": metadata.get('questions_analyzed', 0),
+            "programsAnalyzed": metadata.get('programs_analyzed', 0),
+            "recurringThemes": [
+                {
+                    "name": theme,
+                    "mentions": data.get('total_mentions', 0),
+                    "questionCount": data.get('question_count', 0)
+                }
+                for theme, data in list(synthesis.get('recurring_themes', {}).items())[:10]
+            ],
+            "strategicInsights": synthesis.get('strategic_insights', [])
+        }
+
+    @staticmethod
+    def _question(analysis: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": analysis['question_id'],
+            "question": analysis['question_text'],
+            "responseCount": analysis['response_count'],
+            "themes": [
+                {
+                    "name": theme['theme'],
+                    "count": theme['count'],
+                    "percentage": theme['percentage'],
+                    "urgencyScore": theme['urgency_score'],
+                    "sentiment": theme['sentiment_distribution'],
+                    # Quotes come from a set; sort them so unchanged themes export identically
+                    "quotes": sorted(theme['representative_quotes'])[:3]
+                }
+                for theme in analysis['dominant_themes']
+            ],
+            "sentiment": analysis['sentiment_distribution'],
+            "urgency": analysis['urgency_distribution'],
+            "stakeholders": analysis['stakeholder_distribution'],
+            "insights": analysis['key_insights'],
+            "recommendations": analysis['recommendations']
+        }
+
+    @staticmethod
+    def _program(feedback: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "name": feedback['program_name'],
+            "mentionCount": feedback['mention_count'],
+            "sentiment": feedback['sentiment_summary'],
+            "strengths": feedback['strengths'],
+            "improvementAreas": feedback['improvement_areas'],
+            "requests": feedback['specific_requests'],
+            "quotes": sorted(feedback['representative_quotes'])
+        }
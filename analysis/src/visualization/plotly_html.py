@@ -0,0 +1,140 @@
+"""HTML export of plotly figures with a shared plotly.js bundle."""
+
+import html
+import json
+import os
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+from plotly.utils import PlotlyJSONEncoder
+
+from ..config import settings
+
+# settings.plotly_html_mode values
+INLINE = "inline"        # every file embeds plotly.js (several MB each)
+DIRECTORY = "directory"  # one plotly.js file per output directory, referenced by each chart
+CDN = "cdn"              # charts load plotly.js from the plotly CDN
+
+
+def plotly_js_name() -> str:
+    """File name of the shared bundle; versioned, so an upgrade never reuses a stale copy."""
+    return f"plotly-{get_plotlyjs_version()}.min.js"
+
+
+def ensure_plotly_js(directory: Path) -> Path:
+    """Write the shared plotly.js bundle to `directory` unless it is there."""
+    bundle = Path(directory) / plotly_js_name()
+    if not bundle.exists():
+        bundle.parent.mkdir(exist_ok=True, parents=True)
+        tmp_path = bundle.with_name(f".{bundle.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(get_plotlyjs())
+        os.replace(tmp_path, bundle)
+    return bundle
+
+
+def _script_tag(directory: Path, mode: str) -> str:
+    """<script> loading plotly.js for a page in `directory`."""
+    if mode == INLINE:
+        return f"<script>{get_plotlyjs()}</script>"
+    if mode == CDN:
+        return f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+    ensure_plotly_js(directory)
+    return f'<script src="{plotly_js_name()}"></script>'
+
+
+def write_plotly_html(fig: Any, output_path: Union[str, Path], mode: Optional[str] = None) -> Path:
+    """
+    Write a figure as a standalone HTML page.
+
+    Args:
+        fig: Plotly figure
+        output_path: HTML file to write
+        mode: How the page loads plotly.js (default: `settings.plotly_html_mode`)
+
+    Returns:
+        Path of the HTML file
+    """
+    output_path = Path(output_path)
+    mode = mode or settings.plotly_html_mode
+    if mode == INLINE:
+        include_plotlyjs: Union[bool, str] = True
+    elif mode == CDN:
+        include_plotlyjs = "cdn"
+    else:
+        ensure_plotly_js(output_path.parent)
+        include_plotlyjs = plotly_js_name()
+    fig.write_html(str(output_path), include_plotlyjs=include_plotlyjs)
+    return output_path
+
+
+def write_dashboard(output_path: Union[str, Path], charts: List[Tuple[str, Path]], title: str,
+                    mode: Optional[str] = None) -> Path:
+    """
+    Write one page showing many charts that loads plotly.js once.
+
+    Args:
+        output_path: HTML file to write
+        charts: (heading, JSON spec written by `fig.write_json`) of each chart
+        title: Page title
+        mode: How the page loads plotly.js (default: `settings.plotly_html_mode`)
+
+    Returns:
+        Path of the dashboard
+    """
+    output_path = Path(output_path)
+    mode = mode or settings.plotly_html_mode
+
+    sections = []
+    specs = []
+    for i, (heading, spec_path) in enumerate(charts):
+        with open(spec_path, 'r') as f:
+            specs.append(json.load(f))
+        sections.append(
+            f'    <section class="chart">\n'
+            f'        <h2>{html.escape(heading)}</h2>\n'
+            f'        <div id="chart-{i}"></div>\n'
+            f'    </section>'
+        )
+    # Specs are inlined so the page also works from the file system
+    specs_json = json.dumps(specs, cls=PlotlyJSONEncoder).replace("</", "<\\/")
+    sections_html = "\n".join(sections)
+
+    page = f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{html.escape(title)}</title>
+    <style>
+        body {{
+            font-family: Arial, sans-serif;
+            max-width: 1400px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }}
+        .chart {{
+            background: white;
+            border-radius: 8px;
+            padding: 20px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+    </style>
+    {_script_tag(output_path.parent, mode)}
+</head>
+<body>
+    <h1>{html.escape(title)}</h1>
+{sections_html}
+    <script>
+        const specs = {specs_json};
+        specs.forEach((spec, i) => Plotly.newPlot(`chart-${{i}}`, spec.data, spec.layout, {{responsive: true}}));
+    </script>
+</body>
+</html>
+"""
+    output_path.parent.mkdir(exist_ok=True, parents=True)
+    with open(output_path, 'w') as f:
+        f.write(page)
+    return output_path
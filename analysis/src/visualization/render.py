@@ -0,0 +1,408 @@
+"""Parallel rendering of charts described as serializable jobs."""
+
+import hashlib
+import importlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import matplotlib.pyplot as plt
+from rich.console import Console
+from rich.table import Table
+
+from ..config import settings
+from ..validation.audit import AuditLogger
+from .cache import RenderCache, cache_key, update_manifest
+from .export import ImageExporter, ImageRequest, link_or_copy
+from .plotly_html import DIRECTORY, ensure_plotly_js, write_plotly_html
+
+console = Console()
+
+# Plotly outputs written by the figure itself; other suffixes are images
+PLOTLY_DOCUMENTS = (".html", ".json")
+
+# Chart classes instantiated in this process, by renderer path
+_instances: Dict[str, Any] = {}
+
+
+@dataclass
+class RenderJob:
+    """
+    One chart to render.
+
+    `renderer` names the function that builds the chart as
+    "module:function" or "module:Class.method" (the class is instantiated
+    without arguments once per worker process). It is called with `kwargs`
+    and either
+
+    - writes the chart itself, when `output_arg` names the keyword that
+      receives the first output path (e.g. the `output_path` of the chart
+      classes); any other outputs must be in the same format, or
+    - returns a plotly or matplotlib figure, which is saved to every path
+      in `outputs` by suffix. `options` are passed to `savefig`, or give the
+      `width`, `height` and `scale` of plotly images; these are exported by
+      the farm's ImageExporter in one batch after all jobs have rendered,
+      and skipped when kaleido is not installed.
+
+    `style` is a matplotlib style applied while the job renders, since
+    worker processes do not share the caller's global style. Outputs in a
+    format already written are links to the first file of that format.
+    Jobs are pickled to the worker processes, so `kwargs` must hold plain
+    data (dicts, lists, DataFrames), not open figures or clients.
+    """
+    chart_id: str
+    renderer: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    outputs: List[Path] = field(default_factory=list)
+    output_arg: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+    style: Optional[str] = None
+
+    def data_hash(self) -> str:
+        """Hash of the canonicalized chart data."""
+        return _hash(canonical(self.kwargs))
+
+    def style_hash(self) -> str:
+        """Hash of everything besides the data that changes how the chart looks."""
+        return _hash({"options": canonical(self.options), "style": self.style, "output_arg": self.output_arg})
+
+    def digest(self) -> str:
+        """Identity of the chart: renderer, data, style and output formats."""
+        return _hash({
+            "renderer": self.renderer,
+            "data": self.data_hash(),
+            "style": self.style_hash(),
+            "formats": [Path(path).suffix for path in self.outputs]
+        })
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a render job."""
+    chart_id: str
+    outputs: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+    # Chart id of an identical job whose files were linked instead of rendering
+    shared_with: Optional[str] = None
+    # Files restored from the render cache
+    cached: bool = False
+    error: Optional[str] = None
+    # Plotly images left for the farm's batch export
+    images: Optional[ImageRequest] = None
+    # Plotly images not written because kaleido is not installed
+    skipped: List[str] = field(default_factory=list)
+
+
+def _hash(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def canonical(value: Any) -> Any:
+    """JSON-compatible form of chart data with a stable order, for hashing."""
+    if isinstance(value, dict):
+        return {str(key): canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonical(item) for item in value), key=repr)
+    if hasattr(value, "to_json"):  # pandas objects
+        return value.to_json(orient="split", date_format="iso")
+    if hasattr(value, "tolist"):  # numpy arrays and scalars
+        return value.tolist()
+    if hasattr(value, "model_dump"):
+        return canonical(value.model_dump())
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def resolve_renderer(renderer: str) -> Callable:
+    """Callable named by a "module:function" or "module:Class.method" path."""
+    module_name, _, qualname = renderer.partition(":")
+    target = importlib.import_module(module_name)
+    owner, _, method = qualname.rpartition(".")
+    if not owner:
+        return getattr(target, qualname)
+    if renderer not in _instances:
+        for name in owner.split("."):
+            target = getattr(target, name)
+        _instances[renderer] = target()
+    return getattr(_instances[renderer], method)
+
+
+def save_figure(fig: Any, path: Path, options: Dict[str, Any]) -> None:
+    """Save a matplotlib figure, or a plotly figure as HTML or JSON."""
+    if hasattr(fig, "write_html"):
+        if path.suffix == ".html":
+            write_plotly_html(fig, path)
+        else:
+            fig.write_json(str(path))
+    else:
+        fig.savefig(str(path), **{"dpi": 300, "bbox_inches": "tight", **options})
+
+
+def render_job(job: RenderJob) -> RenderResult:
+    """Render one job in the current process."""
+    started = time.perf_counter()
+    outputs = [Path(path) for path in job.outputs]
+    if job.output_arg:
+        # The renderer writes one file; only outputs in its format can link to it
+        other_formats = sorted({path.suffix for path in outputs[1:]} - {outputs[0].suffix})
+        if other_formats:
+            raise ValueError(
+                f"{job.chart_id} writes {outputs[0].suffix} files through {job.output_arg}; "
+                f"cannot produce {', '.join(other_formats)}"
+            )
+    for path in outputs:
+        path.parent.mkdir(exist_ok=True, parents=True)
+        # Outputs may be links from an earlier run; never write through them
+        path.unlink(missing_ok=True)
+
+    result = RenderResult(chart_id=job.chart_id)
+    renderer = resolve_renderer(job.renderer)
+    with plt.style.context(job.style or {}):
+        if job.output_arg:
+            renderer(**job.kwargs, **{job.output_arg: outputs[0]})
+            for path in outputs[1:]:
+                link_or_copy(outputs[0], path)
+            result.outputs = [str(path) for path in outputs]
+        else:
+            fig = renderer(**job.kwargs)
+            is_plotly = hasattr(fig, "write_html")
+            written: Dict[str, Path] = {}
+            for path in outputs:
+                if is_plotly and path.suffix not in PLOTLY_DOCUMENTS:
+                    if result.images is None:
+                        result.images = ImageRequest(chart_id=job.chart_id, fig=fig.to_dict(), **job.options)
+                    result.images.paths.append(path)
+                    continue
+                if path.suffix in written:
+                    link_or_copy(written[path.suffix], path)
+                else:
+                    save_figure(fig, path, job.options)
+                    written[path.suffix] = path
+                result.outputs.append(str(path))
+            if not is_plotly:
+                plt.close(fig)
+
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _init_worker() -> None:
+    """Worker processes render off-screen."""
+    plt.switch_backend("Agg")
+
+
+class RenderFarm:
+    """
+    Renders chart jobs in a pool of worker processes.
+
+    Matplotlib rendering is CPU-bound and holds the GIL, so charts are
+    rendered in separate processes with the Agg backend. Plotly images are
+    not exported in the workers (each would start its own kaleido browser):
+    the workers return the figures and the farm's ImageExporter writes all
+    of them in one batch. Jobs with the same renderer, data and options
+    (see `RenderJob.digest`) are rendered once; the other jobs' outputs are
+    links to its files. A failed job is reported in its result and does not
+    stop the others.
+
+    Charts whose cache key (see `cache_key`) is in the render cache are not
+    rendered at all: their cached files are linked into place, so
+    re-running a script on unchanged data costs little more than hashing it.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, audit_logger: Optional[AuditLogger] = None,
+                 image_exporter: Optional[ImageExporter] = None, cache: Optional[RenderCache] = None):
+        """
+        Set up the farm.
+
+        Args:
+            max_workers: Number of worker processes (1 renders in this process)
+            audit_logger: Audit logger for the render summary
+            image_exporter: Exporter for plotly images (kept warm across renders)
+            cache: Render cache (default: a RenderCache when
+                `settings.render_cache` is on)
+        """
+        self.max_workers = max_workers or settings.render_workers
+        self.audit_logger = audit_logger or AuditLogger()
+        self.image_exporter = image_exporter or ImageExporter(audit_logger=self.audit_logger)
+        self.cache = cache or (RenderCache() if settings.render_cache else None)
+
+    def render(self, jobs: List[RenderJob], manifest: Optional[Path] = None) -> List[RenderResult]:
+        """
+        Render jobs, in parallel where possible.
+
+        Args:
+            jobs: Charts to render
+            manifest: Chart manifest to record the jobs' files in (see
+                `update_manifest`)
+
+        Returns:
+            One result per job, in job order
+        """
+        start = time.perf_counter()
+        digests = [job.digest() for job in jobs]
+        unique: Dict[str, RenderJob] = {}
+        for digest, job in zip(digests, jobs):
+            unique.setdefault(digest, job)
+        keys = {digest: cache_key(job) for digest, job in unique.items()}
+
+        results: Dict[str, RenderResult] = {}
+        pending: Dict[str, RenderJob] = {}
+        for digest, job in unique.items():
+            if self.cache and self.cache.restore(job, keys[digest][0]):
+                results[digest] = RenderResult(
+                    chart_id=job.chart_id, outputs=[str(path) for path in job.outputs], cached=True
+                )
+            else:
+                pending[digest] = job
+
+        workers = min(self.max_workers, len(pending))
+        if workers <= 1:
+            for digest, job in pending.items():
+                results[digest] = self._run(partial(render_job, job), job)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = {pool.submit(render_job, job): digest for digest, job in pending.items()}
+                for future in as_completed(futures):
+                    digest = futures[future]
+                    results[digest] = self._run(future.result, pending[digest])
+
+        self._export_images([results[digest] for digest in pending])
+
+        if self.cache:
+            for digest in pending:
+                if not results[digest].error:
+                    self.cache.store(*keys[digest], results[digest])
+
+        ordered = [
+            results[digest] if unique[digest] is job else self._copy_outputs(job, results[digest])
+            for digest, job in zip(digests, jobs)
+        ]
+
+        # Cached or linked pages need the shared plotly.js next to them too
+        if settings.plotly_html_mode == DIRECTORY:
+            for directory in {Path(path).parent for path in render_outputs(ordered) if path.endswith(".html")}:
+                ensure_plotly_js(directory)
+
+        if manifest is not None:
+            update_manifest(manifest, (
+                (job.chart_id, *keys[digest], result)
+                for digest, job, result in zip(digests, jobs, ordered)
+            ))
+
+        self._report(ordered, time.perf_counter() - start, workers)
+        return ordered
+
+    def _run(self, call: Callable[[], RenderResult], job: RenderJob) -> RenderResult:
+        """Get a job's result, turning a failure into a failed result."""
+        try:
+            return call()
+        except Exception as e:
+            self.audit_logger.log_error(
+                operation="render_job",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                context={"chart_id": job.chart_id, "renderer": job.renderer}
+            )
+            console.print(f"[red]Failed to render {job.chart_id}: {e}[/red]")
+            return RenderResult(chart_id=job.chart_id, error=str(e))
+
+    def _export_images(self, results: List[RenderResult]) -> None:
+        """
+        Export the plotly images of all rendered jobs in one batch.
+
+        Without kaleido the images are skipped: the jobs keep their other
+        outputs, so they are still recorded and cached.
+        """
+        pending = [result for result in results if result.images and not result.error]
+        if not pending:
+            return
+        if not self.image_exporter.available():
+            for result in pending:
+                result.skipped = [str(path) for path in result.images.paths]
+                result.images = None
+            console.print(
+                f"[yellow]kaleido is not installed; skipped static images of {len(pending)} charts[/yellow]"
+            )
+            return
+        try:
+            self.image_exporter.export([result.images for result in pending])
+        except Exception as e:
+            self.audit_logger.log_error(
+                operation="image_export",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                context={"chart_ids": [result.chart_id for result in pending]}
+            )
+            console.print(f"[red]Failed to export images: {e}[/red]")
+            for result in pending:
+                result.error = str(e)
+            return
+        for result in pending:
+            result.outputs.extend(str(path) for path in result.images.paths)
+            result.images = None
+
+    @staticmethod
+    def _copy_outputs(job: RenderJob, original: RenderResult) -> RenderResult:
+        """Result of a duplicate job: links to the rendered job's files."""
+        if original.error:
+            return RenderResult(chart_id=job.chart_id, shared_with=original.chart_id, error=original.error)
+        sources = {Path(path).suffix: Path(path) for path in original.outputs}
+        result = RenderResult(chart_id=job.chart_id, shared_with=original.chart_id)
+        for path in job.outputs:
+            if Path(path).suffix in sources:
+                link_or_copy(sources[Path(path).suffix], Path(path))
+                result.outputs.append(str(path))
+            else:
+                # An image format the original skipped
+                result.skipped.append(str(path))
+        return result
+
+    def _report(self, results: List[RenderResult], duration: float, workers: int) -> None:
+        """Show per-chart render times; the slowest chart bounds the run time."""
+        table = Table(title=f"Rendered {len(results)} charts ({duration:.1f}s wall clock, {workers} workers)")
+        table.add_column("Chart", style="cyan")
+        table.add_column("Files", justify="right")
+        table.add_column("Render (s)", justify="right")
+        table.add_column("Status")
+
+        for result in sorted(results, key=lambda r: -r.seconds):
+            if result.error:
+                status = "[red]failed[/red]"
+            elif result.cached:
+                status = "[blue]cached[/blue]"
+            elif result.shared_with:
+                status = f"[dim]copy of {result.shared_with}[/dim]"
+            else:
+                status = "[green]rendered[/green]"
+            if result.skipped:
+                status += f" [yellow]({len(result.skipped)} images skipped)[/yellow]"
+            table.add_row(result.chart_id, str(len(result.outputs)), f"{result.seconds:.2f}", status)
+        console.print(table)
+
+        self.audit_logger.log_operation(
+            operation="render_summary",
+            workers=workers,
+            jobs=len(results),
+            rendered=sum(1 for r in results if not r.shared_with and not r.cached and not r.error),
+            cached=sum(1 for r in results if r.cached),
+            shared=sum(1 for r in results if r.shared_with),
+            failed=sum(1 for r in results if r.error),
+            skipped_images=sum(len(r.skipped) for r in results),
+            wall_seconds=round(duration, 3),
+            render_seconds={
+                r.chart_id: round(r.seconds, 3) for r in results if not r.shared_with and not r.cached
+            }
+        )
+
+
+def render_outputs(results: List[RenderResult]) -> List[str]:
+    """Paths of every file written by successful jobs."""
+    return [path for result in results if not result.error for path in result.outputs]
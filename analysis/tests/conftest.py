@@ -0,0 +1,14 @@
+"""Test configuration: point every data directory at a throwaway location."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Settings are read once at import, so set the directories before src is imported
+_data_dir = Path(tempfile.mkdtemp(prefix="acme-analysis-tests-"))
+os.environ["DATA_DIR"] = str(_data_dir)
+os.environ["AUDIT_DIR"] = str(_data_dir / "audit")
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
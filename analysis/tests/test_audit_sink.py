@@ -0,0 +1,51 @@
+"""Audit sink behaviour when the writer thread fails."""
+
+import threading
+
+import pytest
+
+from src.validation.sink import AuditSink
+
+
+def _fail_in_writer_thread(sink: AuditSink, error: OSError):
+    write_batch = sink._write_batch
+
+    def failing_write_batch(batch, sync):
+        if threading.current_thread() is sink._thread and any(batch.values()):
+            raise error
+        return write_batch(batch, sync)
+
+    sink._write_batch = failing_write_batch
+
+
+def test_flush_returns_and_writes_fall_back_after_writer_failure(tmp_path):
+    sink = AuditSink(durability="session")
+    _fail_in_writer_thread(sink, OSError(28, "No space left on device"))
+    path = tmp_path / "audit.jsonl"
+
+    sink.write(path, "lost with the failed batch")
+    sink.flush(sync=True)  # Must not block on the dead writer thread
+
+    assert isinstance(sink.error, OSError)
+    assert not sink._thread.is_alive()
+
+    sink.write(path, "written by the caller")
+    sink.flush(sync=True)
+    sink.close()
+    assert path.read_text().splitlines() == ["written by the caller"]
+
+
+def test_write_raises_once_writer_failed_and_disk_still_fails(tmp_path):
+    sink = AuditSink(durability="session")
+    error = OSError(13, "Permission denied")
+    _fail_in_writer_thread(sink, error)
+
+    sink.write(tmp_path / "audit.jsonl", "first")
+    sink.flush()
+
+    def always_failing_write_batch(batch, sync):
+        raise error
+
+    sink._write_batch = always_failing_write_batch
+    with pytest.raises(OSError):
+        sink.write(tmp_path / "audit.jsonl", "second")
@@ -0,0 +1,21 @@
+"""LLM token totals from the audit archive."""
+
+from src.config import settings
+from src.validation import AuditArchive, AuditLogger
+
+
+def test_tokens_by_question_id(tmp_path):
+    audit_logger = AuditLogger(session_id="tokens_by_question")
+    for question_id, total in (("q1_arts", 100), ("q1_arts", 50), ("q2_barriers", 30)):
+        audit_logger.log_llm_call(
+            prompt="prompt", response="response", model="gpt-4.1", parameters={},
+            tokens_used={"input_tokens": total - 10, "output_tokens": 10, "total_tokens": total},
+            question_id=question_id
+        )
+    audit_logger.close()
+
+    archive = AuditArchive(archive_dir=tmp_path / "archive", audit_dir=settings.audit_dir)
+    archive.compact(min_age_hours=0)
+    totals = archive.tokens_by("question_id").set_index("question_id")["tokens_total"]
+
+    assert totals.to_dict() == {"q1_arts": 150, "q2_barriers": 30}
@@ -0,0 +1,36 @@
+"""Changed columns between survey exports."""
+
+import numpy as np
+import pandas as pd
+
+from src.ingestion import DataFingerprint
+
+
+def _survey():
+    return pd.DataFrame({
+        "q1": ["More funding for small arts groups", None, "Free parking downtown"],
+        "q2": ["Music in the parks", "Longer museum hours", ""],
+        "zip": [12345.0, 12346.0, np.nan],
+    })
+
+
+def test_appended_rows_change_only_the_columns_they_fill():
+    before = _survey()
+    appended = pd.DataFrame({"q1": [None], "q2": ["   "], "zip": [12347.0]})
+    after = pd.concat([before, appended], ignore_index=True)
+
+    previous, current = DataFingerprint.from_dataframe(before), DataFingerprint.from_dataframe(after)
+
+    assert current.changed_columns(previous) == ["zip"]
+    assert current.changed_rows(previous).tolist() == [3]
+    assert current.sheet != previous.sheet
+
+
+def test_edited_answer_changes_its_column():
+    before = _survey()
+    after = before.copy()
+    after.loc[1, "q1"] = "Better transit to the theatre district"
+
+    changed = DataFingerprint.from_dataframe(after).changed_columns(DataFingerprint.from_dataframe(before))
+
+    assert changed == ["q1"]
@@ -0,0 +1,45 @@
+"""Shutting down the LLM scheduler."""
+
+import threading
+import time
+
+from src.llm.scheduler import LLMScheduler
+
+
+def test_cancelling_shutdown_drops_queued_tasks_and_releases_waiters():
+    scheduler = LLMScheduler(max_concurrency=1)
+    in_flight = threading.Event()
+    release = threading.Event()
+    ran = []
+
+    def slow(i):
+        in_flight.set()
+        release.wait(timeout=10)
+        ran.append(i)
+        return i
+
+    first = scheduler.submit(slow, 0, group="q1")
+    queued = [scheduler.submit(slow, i, group="q1") for i in range(1, 50)]
+    finishing = scheduler.when_all([first] + queued, lambda: "done", group="q1")
+    in_flight.wait(timeout=10)
+
+    stopper = threading.Thread(target=scheduler.shutdown, kwargs={"cancel_pending": True})
+    stopper.start()
+    time.sleep(0.1)
+    release.set()
+    stopper.join(timeout=10)
+
+    assert not stopper.is_alive()
+    assert first.result() == 0
+    assert all(future.cancelled() for future in queued)
+    assert finishing.cancelled()
+    assert ran == [0]
+    assert scheduler.submit(slow, 99, group="q2").cancelled()
+
+
+def test_shutdown_runs_every_queued_task():
+    scheduler = LLMScheduler(max_concurrency=2)
+    futures = [scheduler.submit(lambda i=i: i, group="q1") for i in range(20)]
+    total = scheduler.when_all(futures, lambda: sum(f.result() for f in futures), group="q1")
+    scheduler.shutdown()
+    assert total.result() == sum(range(20))
@@ -0,0 +1,69 @@
+"""Result writes from pipeline stages running in parallel."""
+
+import threading
+
+import pandas as pd
+
+from src.ingestion import DataLoader
+from src.pipeline.runner import AnalysisPipeline
+from src.qualitative import QualitativeAnalyzer
+from src.quantitative import QuantitativeAnalyzer
+from src.storage import ResultStore
+
+
+def test_concurrent_puts_keep_every_manifest_entry(tmp_path):
+    store_root = tmp_path / "store"
+    errors = []
+
+    def put_many(worker: int):
+        try:
+            for i in range(200):
+                ResultStore(store_root).put(f"result_{worker}_{i % 5}", {"worker": worker, "i": i},
+                                            run_id="r1")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=put_many, args=(worker,)) for worker in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    outputs = ResultStore(store_root).manifest("r1")["outputs"]
+    assert sorted(outputs) == [f"result_{worker}_{i}" for worker in range(2) for i in range(5)]
+
+
+def test_quantitative_and_qualitative_stages_save_concurrently(monkeypatch):
+    # Both analyses wait here, so the test fails instead of passing if they do not overlap
+    both_running = threading.Barrier(2, timeout=30)
+
+    def analyze_who_metrics(self, data):
+        both_running.wait()
+        for i in range(100):
+            self._save_who_results({"analysis_timestamp": str(i), "respondents": i})
+        return {"respondents": 99}
+
+    def analyze_what_themes(self, data):
+        both_running.wait()
+        for i in range(100):
+            self._save_what_results({"analysis_timestamp": str(i), "themes": [i]})
+        return {"themes": [99]}
+
+    monkeypatch.setattr(DataLoader, "load_all_data", lambda self: {"survey": pd.DataFrame()})
+    monkeypatch.setattr(QuantitativeAnalyzer, "analyze_who_metrics", analyze_who_metrics)
+    monkeypatch.setattr(QualitativeAnalyzer, "analyze_what_themes", analyze_what_themes)
+
+    pipeline = AnalysisPipeline(session_id="concurrent_stages")
+    results = pipeline.run(only=["quantitative", "qualitative"], use_cache=False)
+
+    assert results["quantitative"] == {"respondents": 99}
+    assert results["qualitative"] == {"themes": [99]}
+    assert pipeline.stage_runs["quantitative"].status == "ran"
+    assert pipeline.stage_runs["qualitative"].status == "ran"
+
+    store = ResultStore()
+    outputs = store.manifest("concurrent_stages")["outputs"]
+    assert {"who_analysis", "what_analysis"} <= set(outputs)
+    assert store.latest("who_analysis")["respondents"] == 99
+    assert store.latest("what_analysis")["themes"] == [99]
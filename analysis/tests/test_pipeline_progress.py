@@ -0,0 +1,54 @@
+"""Progress events published by the analysis pipeline."""
+
+import pandas as pd
+import pytest
+
+from src.ingestion import DataLoader
+from src.pipeline.dag import StageError
+from src.pipeline.runner import AnalysisPipeline
+from src.qualitative import QualitativeAnalyzer
+from src.quantitative import QuantitativeAnalyzer
+from src.validation.progress import ProgressState, read_progress
+
+
+@pytest.fixture
+def analyzers(monkeypatch):
+    monkeypatch.setattr(DataLoader, "load_all_data", lambda self: {"survey": pd.DataFrame()})
+    monkeypatch.setattr(QuantitativeAnalyzer, "analyze_who_metrics", lambda self, data: {"respondents": 1})
+    monkeypatch.setattr(QualitativeAnalyzer, "analyze_what_themes", lambda self, data: {"themes": []})
+
+
+def _run_events(run_id):
+    return [event for event in read_progress() if event.get("run_id") == run_id]
+
+
+def test_pipeline_publishes_run_and_stage_events(analyzers):
+    AnalysisPipeline(session_id="progress_run").run(only=["quantitative", "qualitative"], use_cache=False)
+
+    events = _run_events("progress_run")
+    assert events[0]["event"] == "run_start"
+    assert events[-1]["event"] == "run_end"
+    assert events[-1]["status"] == "completed"
+
+    state = ProgressState()
+    for event in events:
+        state.apply(event)
+    assert {name: stage["status"] for name, stage in state.stages.items()} == {
+        "load": "completed", "quantitative": "completed", "qualitative": "completed"
+    }
+
+
+def test_failed_stage_ends_run_as_failed(analyzers, monkeypatch):
+    def fail(self, data):
+        raise RuntimeError("no model")
+
+    monkeypatch.setattr(QualitativeAnalyzer, "analyze_what_themes", fail)
+    with pytest.raises(StageError):
+        AnalysisPipeline(session_id="progress_failed").run(only=["qualitative"], use_cache=False)
+
+    events = _run_events("progress_failed")
+    stage_ends = {event["stage"]: event["status"] for event in events if event["event"] == "stage_end"}
+    assert stage_ends["qualitative"] == "failed"
+    assert events[-1]["event"] == "run_end"
+    assert events[-1]["status"] == "failed"
+    assert events[-1]["stage"] == "qualitative"
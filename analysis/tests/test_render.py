@@ -0,0 +1,62 @@
+"""Render farm behaviour without kaleido and with self-writing renderers."""
+
+import plotly.graph_objects as go
+
+from src.visualization.cache import RenderCache, cache_key
+from src.visualization.export import ImageExporter
+from src.visualization.render import RenderFarm, RenderJob
+
+
+class NoKaleido(ImageExporter):
+    @staticmethod
+    def available() -> bool:
+        return False
+
+    def export(self, requests):
+        raise AssertionError("export called without kaleido")
+
+
+def bar_chart(values):
+    return go.Figure(go.Bar(y=values))
+
+
+def write_text(values, output_path):
+    output_path.write_text(",".join(map(str, values)))
+
+
+def test_images_are_skipped_without_kaleido(tmp_path):
+    job = RenderJob(
+        chart_id="bars",
+        renderer=f"{__name__}:bar_chart",
+        kwargs={"values": [1, 2, 3]},
+        outputs=[tmp_path / "bars.html", tmp_path / "bars.png"]
+    )
+    cache = RenderCache(tmp_path / "cache")
+    farm = RenderFarm(max_workers=1, image_exporter=NoKaleido(), cache=cache)
+
+    result, duplicate = farm.render([job, RenderJob(**{**vars(job), "chart_id": "bars_copy"})])
+
+    assert result.error is None
+    assert result.outputs == [str(tmp_path / "bars.html")]
+    assert result.skipped == [str(tmp_path / "bars.png")]
+    assert duplicate.shared_with == "bars" and duplicate.skipped == result.skipped
+    assert (cache.entry_dir(cache_key(job)[0]) / "chart.html").exists()
+
+
+def test_output_arg_only_aliases_its_own_format(tmp_path):
+    farm = RenderFarm(max_workers=1, image_exporter=NoKaleido(), cache=RenderCache(tmp_path / "cache"))
+    same_format = RenderJob(
+        chart_id="text",
+        renderer=f"{__name__}:write_text",
+        kwargs={"values": [1, 2]},
+        outputs=[tmp_path / "a.txt", tmp_path / "b.txt"],
+        output_arg="output_path"
+    )
+    mixed = RenderJob(**{**vars(same_format), "chart_id": "mixed", "outputs": [tmp_path / "c.txt", tmp_path / "c.png"]})
+
+    linked, failed = farm.render([same_format, mixed])
+
+    assert linked.error is None and (tmp_path / "b.txt").read_text() == "1,2"
+    assert ".png" in failed.error
+    assert not (tmp_path / "c.png").exists()
+
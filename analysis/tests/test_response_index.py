@@ -0,0 +1,31 @@
+"""Lookups on the response index."""
+
+from src.features.response_index import ResponseIndex, build_program_tagger
+
+
+def _index():
+    return ResponseIndex([
+        {"id": "r1", "text": "Love the Arts Grant Program", "question_id": "q1", "respondent_idx": 0},
+        {"id": "r2", "text": "   ", "question_id": "q1", "respondent_idx": 1},
+        {"id": "r3", "text": "More AGP funding please", "question_id": "q2", "respondent_idx": 0},
+    ], program_tagger=build_program_tagger(["Arts Grant Program"]))
+
+
+def test_lookups_partition_non_blank_responses():
+    index = _index()
+
+    assert [r["id"] for r in index.for_question("q1")] == ["r1"]
+    assert [r["id"] for r in index.for_respondent(0)] == ["r1", "r3"]
+    assert [r["id"] for r in index.for_program("Arts Grant Program")] == ["r1", "r3"]
+
+
+def test_callers_cannot_change_the_index():
+    index = _index()
+
+    index.for_question("q1").clear()
+    index.for_program("Arts Grant Program").append({"id": "x"})
+    index.programs_mentioned("r1").clear()
+
+    assert len(index.for_question("q1")) == 1
+    assert len(index.for_program("Arts Grant Program")) == 2
+    assert index.programs_mentioned("r1") == ["Arts Grant Program"]
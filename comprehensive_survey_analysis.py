@@ -4,10 +4,16 @@ from collections import Counter
 import re
 import matplotlib.pyplot as plt
 import seaborn as sns
+import sys
+from pathlib import Path
 
-# Read the Excel file
+sys.path.append(str(Path(__file__).parent / "analysis"))
+
+from src.ingestion import read_excel_snapshot
+
+# Read the Excel file (parsed once, then served from the Parquet snapshot)
 file_path = '/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Community_Survey.xlsx'
-df = pd.read_excel(file_path)
+df = read_excel_snapshot(file_path)
 
 # Get the barriers column
 barriers_col = 'What barriers, if any, prevent you from participating in arts and culture events in Austin? (Select all that apply.)'
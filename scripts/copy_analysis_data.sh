@@ -3,56 +3,59 @@
 
 echo "Copying analysis data to microsite..."
 
-# Source and destination paths
-ANALYSIS_DIR="../analysis/data/results"
-MICROSITE_PUBLIC_DIR="../microsite/public/data"
+# Source and destination paths (relative to the repository, not the caller's directory)
+REPO_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+ANALYSIS_DIR="${ANALYSIS_DIR:-$REPO_DIR/analysis/data/results}"
+MICROSITE_PUBLIC_DIR="${MICROSITE_PUBLIC_DIR:-$REPO_DIR/microsite/public/data}"
 
 # Create data directory if it doesn't exist
 mkdir -p "$MICROSITE_PUBLIC_DIR"
 
-# Find the most recent analysis results
-LATEST_SESSION=$(ls -td "$ANALYSIS_DIR"/session_* 2>/dev/null | head -1)
-
-if [ -z "$LATEST_SESSION" ]; then
-    echo "No analysis results found. Please run the analysis first."
-    exit 1
-fi
-
-echo "Using analysis results from: $LATEST_SESSION"
+# The visualization stage writes the microsite data next to the charts
+VIZ_DIR="$ANALYSIS_DIR/visualizations"
 
 # Find microsite data file
-MICROSITE_DATA=$(find "$LATEST_SESSION" -name "microsite_data.json" 2>/dev/null | head -1)
+MICROSITE_DATA="$VIZ_DIR/microsite_data.json"
 
-if [ -z "$MICROSITE_DATA" ]; then
-    echo "No microsite_data.json found in the latest session."
+if [ ! -f "$MICROSITE_DATA" ]; then
+    echo "No microsite_data.json found in $VIZ_DIR."
     echo "Looking for visualization data..."
     
     # Try to find visualization data as fallback
-    VIZ_DATA=$(find "$LATEST_SESSION" -name "analysis_data.json" 2>/dev/null | head -1)
+    VIZ_DATA="$VIZ_DIR/analysis_data.json"
     
-    if [ -z "$VIZ_DATA" ]; then
-        echo "No analysis data found. Please ensure the analysis pipeline completed successfully."
+    if [ ! -f "$VIZ_DATA" ]; then
+        echo "No analysis data found. Please run the analysis first."
         exit 1
     fi
     
     echo "Using analysis_data.json as fallback"
     cp "$VIZ_DATA" "$MICROSITE_PUBLIC_DIR/microsite_data.json"
 else
+    echo "Using analysis results from: $VIZ_DIR"
     cp "$MICROSITE_DATA" "$MICROSITE_PUBLIC_DIR/microsite_data.json"
 fi
 
 # Copy visualization files if they exist
-VIZ_DIR="$LATEST_SESSION/visualizations"
 if [ -d "$VIZ_DIR" ]; then
     echo "Copying visualization files..."
     mkdir -p "$MICROSITE_PUBLIC_DIR/visualizations"
     
-    # Copy only web-friendly formats
-    find "$VIZ_DIR" -name "*.html" -o -name "*.json" | while read -r file; do
+    # Copy only web-friendly formats (the data bundle is copied below)
+    find "$VIZ_DIR" -maxdepth 1 \( -name "*.html" -o -name "*.json" -o -name "*.js" \) | while read -r file; do
         cp "$file" "$MICROSITE_PUBLIC_DIR/visualizations/"
     done
 fi
 
+# Copy the sharded data bundle; its files are named by content hash, so
+# shards that did not change keep their names and cached copies
+BUNDLE_DIR="$ANALYSIS_DIR/visualizations/bundles"
+if [ -f "$BUNDLE_DIR/manifest.json" ]; then
+    echo "Copying data bundle..."
+    rm -rf "$MICROSITE_PUBLIC_DIR/bundles"
+    cp -R "$BUNDLE_DIR" "$MICROSITE_PUBLIC_DIR/bundles"
+fi
+
 echo "Data copy complete!"
 echo "Files copied to: $MICROSITE_PUBLIC_DIR"
 
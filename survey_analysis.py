@@ -1,11 +1,16 @@
-import pandas as pd
 import numpy as np
 from collections import Counter
 import re
+import sys
+from pathlib import Path
 
-# Read the Excel file
+sys.path.append(str(Path(__file__).parent / "analysis"))
+
+from src.ingestion import read_excel_snapshot
+
+# Read the Excel file (parsed once, then served from the Parquet snapshot)
 file_path = '/Users/aiml/Downloads/ACME2/NEW_Data/ACME_Community_Survey.xlsx'
-df = pd.read_excel(file_path)
+df = read_excel_snapshot(file_path)
 
 # First, let's examine the structure of the data
 print("=== SURVEY DATA STRUCTURE ===")